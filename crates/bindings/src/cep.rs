@@ -1,8 +1,7 @@
 use numpy::PyReadwriteArrayDyn;
-use pyo3::{exceptions::PyValueError, prelude::*};
-
-use rayon::prelude::*;
+use pyo3::prelude::*;
 
+use crate::common::par_map_array;
 use memory::{
     BitBuffer,
     encoding::embedded_parity::{decode, encode},
@@ -86,23 +85,6 @@ impl<const N: usize, const M: usize> Scheme<N, M> {
     }
 }
 
-fn par_map_array<B, F>(mut arr: PyReadwriteArrayDyn<B>, f: F) -> PyResult<()>
-where
-    B: BitBuffer + numpy::Element,
-    F: std::marker::Sync + Fn(&mut B),
-{
-    let slice = arr
-        .as_slice_mut()
-        .map_err(|_| PyValueError::new_err("`arr` is not contiguous."))?;
-    // Clippy false positive: closure is not redundant — capturing f by ref
-    // makes the closure Send when F: Sync; passing f directly would require F:
-    // Send.
-    #[allow(clippy::redundant_closure)]
-    slice.par_iter_mut().for_each(|item| f(item));
-
-    Ok(())
-}
-
 #[pyclass(eq, skip_from_py_object, name = "Scheme")]
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum PyScheme {
@@ -123,14 +105,18 @@ pub fn encode_f32(arr: PyReadwriteArrayDyn<f32>, scheme: &PyScheme) -> PyResult<
     )
 }
 
-#[pyfunction]
-pub fn decode_f32(arr: PyReadwriteArrayDyn<f32>, scheme: &PyScheme) -> PyResult<()> {
-    let f = match scheme {
+/// Get the element-wise decoding function for float32 buffers.
+pub fn decoder_f32(scheme: &PyScheme) -> fn(&mut f32) {
+    match scheme {
         PyScheme::D3P1 => |item: &mut f32| B32D3P1.decode(item),
         PyScheme::D7P1 => |item: &mut f32| B32D7P1.decode(item),
         PyScheme::D15P1 => |item: &mut f32| B32D15P1.decode(item),
-    };
-    par_map_array(arr, f)
+    }
+}
+
+#[pyfunction]
+pub fn decode_f32(arr: PyReadwriteArrayDyn<f32>, scheme: &PyScheme) -> PyResult<()> {
+    par_map_array(arr, decoder_f32(scheme))
 }
 
 #[pyfunction]
@@ -145,12 +131,16 @@ pub fn encode_u16(arr: PyReadwriteArrayDyn<u16>, scheme: &PyScheme) -> PyResult<
     )
 }
 
-#[pyfunction]
-pub fn decode_u16(arr: PyReadwriteArrayDyn<u16>, scheme: &PyScheme) -> PyResult<()> {
-    let f = match scheme {
+/// Get the element-wise decoding function for 16 bit buffers.
+pub fn decoder_u16(scheme: &PyScheme) -> fn(&mut u16) {
+    match scheme {
         PyScheme::D3P1 => |item: &mut u16| B16D3P1.decode(item),
         PyScheme::D7P1 => |item: &mut u16| B16D7P1.decode(item),
         PyScheme::D15P1 => |item: &mut u16| B16D15P1.decode(item),
-    };
-    par_map_array(arr, f)
+    }
+}
+
+#[pyfunction]
+pub fn decode_u16(arr: PyReadwriteArrayDyn<u16>, scheme: &PyScheme) -> PyResult<()> {
+    par_map_array(arr, decoder_u16(scheme))
 }
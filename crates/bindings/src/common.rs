@@ -1,29 +1,29 @@
-use memory::sequence::NonUniformSequence;
-use numpy::{PyArray1, PyReadonlyArrayDyn};
-use pyo3::prelude::*;
+use crate::threads;
+use memory::BitBuffer;
+use numpy::{PyArray1, PyReadonlyArrayDyn, PyReadwriteArrayDyn};
+use pyo3::{exceptions::PyValueError, prelude::*};
+use rayon::prelude::*;
 
 pub type OutputArr<'py, T> = Bound<'py, PyArray1<T>>;
 pub type InputArr<'py, T> = PyReadonlyArrayDyn<'py, T>;
 
-/// Helper for transforming numpy arrays received from python.
-pub fn prep_input_array<'py, T>(input: InputArr<'py, T>) -> Vec<T>
+/// Apply `f` to every element of `arr` in parallel.
+///
+/// The GIL is released while `f` runs, see `threads` for the thread pool.
+pub fn par_map_array<B, F>(mut arr: PyReadwriteArrayDyn<B>, f: F) -> PyResult<()>
 where
-    T: numpy::Element + Copy,
+    B: BitBuffer + numpy::Element + Send,
+    F: std::marker::Sync + Fn(&mut B),
 {
-    input.as_array().into_iter().copied().collect::<Vec<T>>()
-}
+    let py = arr.py();
+    let slice = arr
+        .as_slice_mut()
+        .map_err(|_| PyValueError::new_err("`arr` is not contiguous."))?;
+    // Clippy false positive: closure is not redundant — capturing f by ref
+    // makes the closure Send when F: Sync; passing f directly would require F:
+    // Send.
+    #[allow(clippy::redundant_closure)]
+    py.detach(|| threads::install(|| slice.par_iter_mut().for_each(|item| f(item))));
 
-/// Helper for transforming lists of numpy arrays received from python.
-pub fn prep_input_array_list<'py, T>(
-    input: Vec<InputArr<'py, T>>,
-) -> NonUniformSequence<Vec<Vec<T>>>
-where
-    T: numpy::Element + Copy,
-{
-    NonUniformSequence(
-        input
-            .into_iter()
-            .map(prep_input_array)
-            .collect::<Vec<Vec<T>>>(),
-    )
+    Ok(())
 }
@@ -1,31 +1,60 @@
 use crate::fault::PyFault;
-use memory::{BitBuffer, SizedBitBuffer, sequence::NonUniformSequence};
-use numpy::PyArrayDyn;
+use memory::{BitBuffer, Fault, SizedBitBuffer, sequence::NonUniformSequence};
+use numpy::{PyArrayDyn, PyArrayMethods, PyUntypedArrayMethods};
 use pyo3::{exceptions::PyIndexError, prelude::*};
 
 type InputArr<'py, T> = Bound<'py, PyArrayDyn<T>>;
 
-fn list_of_array_inject_fault_generic<'py, T>(
-    _py: Python<'py>,
-    input: Vec<InputArr<T>>,
-    fault: PyFault,
-    target_bit: usize,
+/// Apply `faults` to the arrays in `input`.
+///
+/// If all arrays are contiguous, the faults are applied to borrowed slices with
+/// the GIL released. Otherwise this falls back to indexing the arrays through
+/// numpy, which requires holding the GIL.
+fn apply_faults_to_arrays<'py, T>(
+    py: Python<'py>,
+    input: Vec<InputArr<'py, T>>,
+    faults: Vec<(Fault, usize)>,
 ) -> PyResult<()>
 where
-    T: numpy::Element + Copy + SizedBitBuffer,
+    T: numpy::Element + Copy + SizedBitBuffer + Send,
 {
-    let mut buffer = NonUniformSequence(input);
-
-    let bit_count = buffer.bit_count();
-    if target_bit >= bit_count {
-        return Err(PyIndexError::new_err("target_bit is out of bounds"));
+    let bit_count = input.iter().map(|array| array.len()).sum::<usize>() * T::BITS_COUNT;
+    for (_, target_bit) in &faults {
+        if *target_bit >= bit_count {
+            return Err(PyIndexError::new_err("target_bit is out of bounds"));
+        }
     }
 
-    buffer.apply_fault(fault.0, target_bit);
+    if input.iter().all(|array| array.is_contiguous()) {
+        let mut borrows = input
+            .iter()
+            .map(|array| array.try_readwrite())
+            .collect::<Result<Vec<_>, _>>()?;
+        let slices = borrows
+            .iter_mut()
+            .map(|borrow| borrow.as_slice_mut())
+            .collect::<Result<Vec<_>, _>>()?;
+
+        py.detach(|| NonUniformSequence(slices).apply_faults(faults.into_iter()));
+    } else {
+        NonUniformSequence(input).apply_faults(faults.into_iter());
+    }
 
     Ok(())
 }
 
+fn list_of_array_inject_fault_generic<'py, T>(
+    py: Python<'py>,
+    input: Vec<InputArr<'py, T>>,
+    fault: PyFault,
+    target_bit: usize,
+) -> PyResult<()>
+where
+    T: numpy::Element + Copy + SizedBitBuffer + Send,
+{
+    apply_faults_to_arrays(py, input, vec![(fault.0, target_bit)])
+}
+
 /// Applies a batch of faults to a list of arrays.
 ///
 /// The caller-side numpy conversion (see `tensor_list_faults` in
@@ -35,29 +64,21 @@ where
 /// via a precomputed offset table rather than rescanning the whole array list
 /// per fault.
 fn list_of_array_inject_faults_generic<'py, T>(
-    _py: Python<'py>,
-    input: Vec<InputArr<T>>,
+    py: Python<'py>,
+    input: Vec<InputArr<'py, T>>,
     faults: Vec<(PyFault, usize)>,
 ) -> PyResult<()>
 where
-    T: numpy::Element + Copy + SizedBitBuffer,
+    T: numpy::Element + Copy + SizedBitBuffer + Send,
 {
-    let mut buffer = NonUniformSequence(input);
-    let bit_count = buffer.bit_count();
-
-    for (_, target_bit) in &faults {
-        if *target_bit >= bit_count {
-            return Err(PyIndexError::new_err("target_bit is out of bounds"));
-        }
-    }
-
-    buffer.apply_faults(
+    apply_faults_to_arrays(
+        py,
+        input,
         faults
             .into_iter()
-            .map(|(fault, bit_index)| (fault.0, bit_index)),
-    );
-
-    Ok(())
+            .map(|(fault, bit_index)| (fault.0, bit_index))
+            .collect(),
+    )
 }
 
 #[pyfunction]
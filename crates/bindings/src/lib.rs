@@ -7,6 +7,7 @@ mod fault_injection;
 mod mset;
 mod picker;
 mod secded;
+mod threads;
 
 use pyo3::pymodule;
 
@@ -19,6 +20,8 @@ mod _rust {
         #[pymodule_export]
         use crate::secded::PyEncoding;
         #[pymodule_export]
+        use crate::secded::PyHead;
+        #[pymodule_export]
         use crate::secded::encode_f32;
         #[pymodule_export]
         use crate::secded::encode_u16;
@@ -56,6 +59,11 @@ mod _rust {
     #[pymodule_export]
     use crate::picker::PyPicker;
 
+    #[pymodule_export]
+    use crate::threads::set_thread_count;
+    #[pymodule_export]
+    use crate::threads::thread_count;
+
     #[pymodule_export]
     use crate::fault_injection::list_of_array_fault_f32;
     #[pymodule_export]
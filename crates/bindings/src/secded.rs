@@ -1,65 +1,112 @@
-use crate::{common::*, fault::PyFault};
+use crate::{cep, cep::PyScheme, common::*, fault::PyFault, mset, threads};
 use memory::{
-    BitBuffer, ByteBuffer, Limited, SizedBitBuffer,
-    chunks::{Chunks, ChunksCreationError, DecodeError, DynChunks},
-    encoding::secded::encoded_bit_count,
-    sequence::NonUniformSequence,
+    BitBuffer, ByteBuffer, SizedBitBuffer, arena::EncodedArena, chunks::ChunksCreationError,
 };
-use numpy::PyArray1;
+use numpy::{PyArray1, PyReadwriteArrayDyn};
 use pyo3::{
     exceptions::{PyIndexError, PyValueError},
     prelude::*,
-    types::{PyBytes, PyList},
 };
 
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Head {
+    Mset,
+    Cep(PyScheme),
+}
+
+/// An element-wise encoding which is decoded in the same pass as SECDED.
+#[pyclass(eq, from_py_object, name = "Head")]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct PyHead(Head);
+
+#[pymethods]
+impl PyHead {
+    #[staticmethod]
+    fn mset() -> PyHead {
+        PyHead(Head::Mset)
+    }
+
+    #[staticmethod]
+    fn cep(scheme: &PyScheme) -> PyHead {
+        PyHead(Head::Cep(*scheme))
+    }
+}
+
+fn no_op<T>(_item: &mut T) {}
+
+fn head_f32(head: Option<PyHead>) -> fn(&mut f32) {
+    match head.map(|head| head.0) {
+        None => no_op,
+        Some(Head::Mset) => mset::decode_item_f32,
+        Some(Head::Cep(scheme)) => cep::decoder_f32(&scheme),
+    }
+}
+
+fn head_u16(head: Option<PyHead>) -> fn(&mut u16) {
+    match head.map(|head| head.0) {
+        None => no_op,
+        Some(Head::Mset) => mset::decode_item_u16,
+        Some(Head::Cep(scheme)) => cep::decoder_u16(&scheme),
+    }
+}
+
+/// SECDED encoded data owned by Rust.
+///
+/// All methods which process the encoded data release the GIL while doing so,
+/// so different instances (e.g. clones) can be decoded or faulted
+/// concurrently from multiple Python threads. Access to a single instance is
+/// checked at runtime instead: methods which modify the instance
+/// (`decode_into_*`, `apply_fault(s)`) raise `RuntimeError` if another thread
+/// is using the same instance at the same time, rather than blocking.
 #[pyclass(name = "Encoding")]
 pub struct PyEncoding {
-    /// A list of the encoded chunks. Guaranteed to store [`PyBytes`] elements.
-    encoded_chunks: Py<PyList>,
-    /// The number of data bits per chunk, used for bounds in `Limited`.
-    data_bit_count: usize,
+    /// The encoded chunks.
+    arena: EncodedArena,
     /// The number of items in each array in the input list for the encoding
     /// function.
     item_counts: Vec<usize>,
+    /// Chunks which have been faulted since the last `decode_into_*` call.
+    dirty_chunks: Vec<usize>,
 }
 
 impl PyEncoding {
+    pub fn new(arena: EncodedArena, item_counts: Vec<usize>) -> Self {
+        PyEncoding {
+            arena,
+            item_counts,
+            dirty_chunks: Vec::new(),
+        }
+    }
+
     pub fn decode_generic<'py, T>(
         &self,
         py: Python<'py>,
-        mut output_buffer: NonUniformSequence<Vec<Vec<T>>>,
     ) -> PyResult<(Vec<OutputArr<'py, T>>, Vec<bool>)>
     where
-        T: SizedBitBuffer + numpy::Element + ByteBuffer,
+        T: SizedBitBuffer + numpy::Element + ByteBuffer + Copy + Default + Send,
     {
-        let input_chunks = self.to_rust(py)?;
-
-        let (output_chunks, decoding_results) = input_chunks
-            .decode_chunks(self.data_bit_count)
-            .unwrap_or_else(|err| match err {
-                DecodeError::InvalidDataBitsCount(_) => {
-                    panic!("The data bits count is immutable from the python side and should be correct yet: {}", err);
-                }
-            });
-
-        let bits_copied = match output_chunks {
-            Chunks::Byte(byte_chunks) => {
-                byte_chunks
-                    .copy_into_chunked(&mut output_buffer)
-                    .units_copied
-                    * 8
-            }
-            Chunks::Dyn(dyn_chunks) => dyn_chunks.copy_into(&mut output_buffer).units_copied,
-        };
-        assert_eq!(
-            bits_copied,
-            output_buffer.bit_count(),
-            "these must match because the chunked buffer can potentially only have more bits, not less.",
-        );
+        let (output_buffer, decoding_results) = py.detach(|| {
+            let mut output_buffer = self
+                .item_counts
+                .iter()
+                .map(|&numel| vec![T::default(); numel])
+                .collect::<Vec<_>>();
+
+            let mut outputs = output_buffer
+                .iter_mut()
+                .map(|output| output.as_mut_slice())
+                .collect::<Vec<_>>();
+            let double_errors = threads::install(|| self.arena.decode_into(&mut outputs, no_op));
+
+            let decoding_results = (0..self.arena.chunk_count())
+                .map(|chunk| double_errors.binary_search(&chunk).is_err())
+                .collect::<Vec<_>>();
+
+            (output_buffer, decoding_results)
+        });
 
         Ok((
             output_buffer
-                .0
                 .into_iter()
                 .map(|vec| PyArray1::from_vec(py, vec))
                 .collect(),
@@ -67,60 +114,65 @@ impl PyEncoding {
         ))
     }
 
-    pub fn from_rust<'py>(
+    /// Decode into preallocated arrays, applying `head` to every element.
+    ///
+    /// If `only_dirty` is set, only the elements stored in chunks which have
+    /// been faulted since the previous call are decoded. This requires the
+    /// outputs to already store the result of the previous call.
+    pub fn decode_into_generic<'py, T, F>(
+        &mut self,
         py: Python<'py>,
-        encoded_chunks: DynChunks,
-        data_bit_count: usize,
-        item_counts: Vec<usize>,
-    ) -> PyResult<Self> {
-        let bytes = encoded_chunks.into_raw().into_iter().map(|chunk| {
-            assert_eq!(
-                chunk.bit_count(),
-                encoded_bit_count(data_bit_count)
-                    .expect("chunk creation will fail before this for empty buffers.")
-            );
-            let chunk_bytes = chunk.into_inner();
-            PyBytes::new(py, &chunk_bytes).unbind()
-        });
-
-        let encoded_chunks = PyList::new(py, bytes)?.unbind();
-
-        Ok(PyEncoding {
-            encoded_chunks,
-            data_bit_count,
-            item_counts,
-        })
-    }
+        mut outputs: Vec<PyReadwriteArrayDyn<'py, T>>,
+        head: F,
+        only_dirty: bool,
+    ) -> PyResult<Vec<usize>>
+    where
+        T: SizedBitBuffer + numpy::Element + ByteBuffer + Send,
+        F: Fn(&mut T) + Sync,
+    {
+        if outputs.len() != self.item_counts.len() {
+            return Err(PyValueError::new_err(format!(
+                "expected {} output arrays, got {}",
+                self.item_counts.len(),
+                outputs.len()
+            )));
+        }
 
-    pub fn to_rust<'py>(&self, py: Python<'py>) -> PyResult<DynChunks> {
-        let encoded_bit_count = encoded_bit_count(self.data_bit_count)
-            .expect("Known to be correct. Checked during initialization.");
-
-        let raw_chunks = self
-            .encoded_chunks
-            .bind(py)
-            .iter()
-            .map(|chunk| {
-                let py_bytes = chunk.cast_into::<PyBytes>().expect(
-                    "It was created as `PyBytes` and it should not be possible to modify it after.",
-                );
-
-                Limited::new(Vec::from(py_bytes.as_bytes()), encoded_bit_count).unwrap_or_else(
-                    || {
-                        panic!(
-                            "`bits_per_chunk` {} doesn't match the encoded chunks.",
-                            encoded_bit_count
-                        )
-                    },
-                )
+        let mut slices = outputs
+            .iter_mut()
+            .map(|output| {
+                output
+                    .as_slice_mut()
+                    .map_err(|_| PyValueError::new_err("output arrays must be contiguous"))
             })
-            .collect::<Vec<_>>();
+            .collect::<PyResult<Vec<_>>>()?;
+
+        for (slice, &expected) in slices.iter().zip(&self.item_counts) {
+            if slice.len() != expected {
+                return Err(PyValueError::new_err(format!(
+                    "expected an output array with {} elements, got {}",
+                    expected,
+                    slice.len()
+                )));
+            }
+        }
+
+        let double_errors = py.detach(|| {
+            let element_count = self.item_counts.iter().sum();
+            let ranges = if only_dirty {
+                self.arena
+                    .element_ranges(&self.dirty_chunks, T::BITS_COUNT, element_count)
+            } else {
+                vec![0..element_count]
+            };
+
+            let double_errors =
+                threads::install(|| self.arena.decode_ranges_into(&mut slices, &ranges, head));
+            self.dirty_chunks.clear();
+            double_errors
+        });
 
-        Ok(
-            DynChunks::from_raw(raw_chunks).expect(
-                "There's no reason recreating the chunks should fail assuming the data remains immutable."
-            )
-        )
+        Ok(double_errors)
     }
 }
 
@@ -131,33 +183,48 @@ impl PyEncoding {
         &self,
         py: Python<'py>,
     ) -> PyResult<(Vec<OutputArr<'py, f32>>, Vec<bool>)> {
-        let output_buffer = NonUniformSequence(
-            self.item_counts
-                .iter()
-                .map(|&numel| vec![0f32; numel])
-                .collect::<Vec<_>>(),
-        );
-
-        self.decode_generic(py, output_buffer)
+        self.decode_generic(py)
     }
 
     pub fn decode_u16<'py>(
         &self,
         py: Python<'py>,
     ) -> PyResult<(Vec<OutputArr<'py, u16>>, Vec<bool>)> {
-        let output_buffer = NonUniformSequence(
-            self.item_counts
-                .iter()
-                .map(|&numel| vec![0u16; numel])
-                .collect::<Vec<_>>(),
-        );
+        self.decode_generic(py)
+    }
 
-        self.decode_generic(py, output_buffer)
+    /// Decode float32 values into preallocated arrays.
+    ///
+    /// SECDED and the optional `head` encoding are decoded in a single pass.
+    /// Returns the indices of the chunks where a double error was detected.
+    #[pyo3(signature = (outputs, head=None, only_dirty=false))]
+    pub fn decode_into_f32<'py>(
+        &mut self,
+        py: Python<'py>,
+        outputs: Vec<PyReadwriteArrayDyn<'py, f32>>,
+        head: Option<PyHead>,
+        only_dirty: bool,
+    ) -> PyResult<Vec<usize>> {
+        self.decode_into_generic(py, outputs, head_f32(head), only_dirty)
     }
 
-    pub fn apply_fault<'py>(
+    /// Decode 16 bit values into preallocated arrays.
+    ///
+    /// See `decode_into_f32`.
+    #[pyo3(signature = (outputs, head=None, only_dirty=false))]
+    pub fn decode_into_u16<'py>(
         &mut self,
         py: Python<'py>,
+        outputs: Vec<PyReadwriteArrayDyn<'py, u16>>,
+        head: Option<PyHead>,
+        only_dirty: bool,
+    ) -> PyResult<Vec<usize>> {
+        self.decode_into_generic(py, outputs, head_u16(head), only_dirty)
+    }
+
+    pub fn apply_fault(
+        &mut self,
+        py: Python<'_>,
         fault: PyFault,
         target_bit: usize,
     ) -> PyResult<()> {
@@ -166,16 +233,11 @@ impl PyEncoding {
 
     /// Apply multiple faults at once.
     ///
-    /// This is much cheaper than calling `apply_fault` in a loop: the whole
-    /// encoded buffer is round-tripped through Python objects (`to_rust`/
-    /// `from_rust`) exactly once for the batch instead of once per fault,
-    /// even though flipping a single bit is itself O(1).
-    pub fn apply_faults<'py>(
-        &mut self,
-        py: Python<'py>,
-        faults: Vec<(PyFault, usize)>,
-    ) -> PyResult<()> {
-        let bit_count = self.bit_count(py);
+    /// The faults are applied to the encoded chunks in place and the affected
+    /// chunks are recorded for the next `decode_into_*` call with
+    /// `only_dirty` set.
+    pub fn apply_faults(&mut self, py: Python<'_>, faults: Vec<(PyFault, usize)>) -> PyResult<()> {
+        let bit_count = self.bit_count();
         for (_, target_bit) in &faults {
             if *target_bit >= bit_count {
                 return Err(PyIndexError::new_err(format!(
@@ -185,94 +247,85 @@ impl PyEncoding {
             }
         }
 
-        let mut encoding = self.to_rust(py)?;
-        encoding.apply_faults(faults.into_iter().map(|(fault, target_bit)| (fault.0, target_bit)));
-
-        *self = PyEncoding::from_rust(py, encoding, self.data_bit_count, self.item_counts.clone())?;
+        py.detach(|| {
+            self.dirty_chunks.extend(
+                faults
+                    .iter()
+                    .map(|(_, target_bit)| self.arena.chunk_of(*target_bit)),
+            );
+            self.arena.apply_faults(
+                faults
+                    .into_iter()
+                    .map(|(fault, target_bit)| (fault.0, target_bit)),
+            );
+        });
 
         Ok(())
     }
 
     /// Return a new instance with cloned data.
-    pub fn clone<'py>(&self, py: Python<'py>) -> PyResult<PyEncoding> {
-        let encoding_clone = self.encoded_chunks.bind(py).iter().map(|chunk| {
-            let bytes = chunk
-                .cast_into::<PyBytes>()
-                .expect("Was constructed as PyBytes and is immutable.");
-
-            let cloned = bytes.as_bytes().to_owned();
-
-            PyBytes::new(py, &cloned).unbind()
-        });
-
-        Ok(PyEncoding {
-            encoded_chunks: PyList::new(py, encoding_clone)?.unbind(),
-            data_bit_count: self.data_bit_count,
+    pub fn clone(&self, py: Python<'_>) -> PyEncoding {
+        py.detach(|| PyEncoding {
+            arena: self.arena.clone(),
             item_counts: self.item_counts.clone(),
+            dirty_chunks: self.dirty_chunks.clone(),
         })
     }
 
-    pub fn bit_count<'py>(&self, py: Python<'py>) -> usize {
-        self.encoded_chunks.bind(py).len()
-            * encoded_bit_count(self.data_bit_count)
-                .expect("the data bits count must be checked during initialization")
+    pub fn bit_count(&self) -> usize {
+        self.arena.bit_count()
     }
 }
 
-fn encode_generic<'py, T>(
-    py: Python<'py>,
-    buffer: NonUniformSequence<Vec<Vec<T>>>,
+fn encode_generic<T>(
+    py: Python<'_>,
+    input: Vec<InputArr<T>>,
     bits_per_chunk: usize,
 ) -> PyResult<PyEncoding>
 where
-    T: ByteBuffer + SizedBitBuffer,
+    T: SizedBitBuffer + numpy::Element + Sync,
 {
-    let item_counts = buffer.0.iter().map(|chunk| chunk.len()).collect::<Vec<_>>();
+    let items = input
+        .iter()
+        .map(|array| {
+            array
+                .as_slice()
+                .map_err(|_| PyValueError::new_err("input arrays must be contiguous"))
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    let item_counts = items.iter().map(|item| item.len()).collect::<Vec<_>>();
 
-    let encoded_chunks = buffer
-        .to_chunks(bits_per_chunk)
+    let arena = py
+        .detach(|| threads::install(|| EncodedArena::encode(&items, bits_per_chunk)))
         .map_err(|err| match err {
             ChunksCreationError::Empty | ChunksCreationError::ZeroChunksize => {
                 PyValueError::new_err(err.to_string())
             }
-        })?
-        .encode_chunks();
+        })?;
 
-    PyEncoding::from_rust(py, encoded_chunks, bits_per_chunk, item_counts)
+    Ok(PyEncoding::new(arena, item_counts))
 }
 
 /// Encode a all bits of a buffer of 32 bit floats.
 ///
-/// Returns a tuple containing:
-/// - A uint8 array with the encoded bits
-/// - The number of useful bits in the encoded buffer
-///
-/// These need to be given to the decoding function to restore the original representation.
+/// The input arrays are read in place and must be contiguous.
 #[pyfunction]
-pub fn encode_f32<'py>(
-    py: Python<'py>,
+pub fn encode_f32(
+    py: Python<'_>,
     input: Vec<InputArr<f32>>,
     bits_per_chunk: usize,
 ) -> PyResult<PyEncoding> {
-    let buffer = prep_input_array_list(input);
-
-    encode_generic(py, buffer, bits_per_chunk)
+    encode_generic(py, input, bits_per_chunk)
 }
 
 /// Encode a all bits of a buffer of 16 bit unsigned integers.
 ///
-/// Returns a tuple containing:
-/// - A uint8 array with the encoded bits
-/// - The number of useful bits in the encoded buffer
-///
-/// These need to be given to the decoding function to restore the original representation.
+/// The input arrays are read in place and must be contiguous.
 #[pyfunction]
-pub fn encode_u16<'py>(
-    py: Python<'py>,
+pub fn encode_u16(
+    py: Python<'_>,
     input: Vec<InputArr<u16>>,
     bits_per_chunk: usize,
 ) -> PyResult<PyEncoding> {
-    let buffer = prep_input_array_list(input);
-
-    encode_generic(py, buffer, bits_per_chunk)
+    encode_generic(py, input, bits_per_chunk)
 }
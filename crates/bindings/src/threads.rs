@@ -0,0 +1,56 @@
+//! Sizing of the thread pool used by the parallel codecs.
+
+use pyo3::{exceptions::PyRuntimeError, prelude::*};
+use rayon::{ThreadPool, ThreadPoolBuilder};
+use std::sync::{Arc, PoisonError, RwLock};
+
+/// The pool set by `set_thread_count`, `None` means rayon's global pool.
+static POOL: RwLock<Option<Arc<ThreadPool>>> = RwLock::new(None);
+
+/// Run `f` in the configured thread pool.
+///
+/// All parallel work in the bindings should go through this so it respects
+/// `set_thread_count`.
+pub fn install<R, F>(f: F) -> R
+where
+    R: Send,
+    F: FnOnce() -> R + Send,
+{
+    let pool = POOL.read().unwrap_or_else(PoisonError::into_inner).clone();
+
+    match pool {
+        Some(pool) => pool.install(f),
+        None => f(),
+    }
+}
+
+/// Set the number of threads used by the parallel encoding and decoding
+/// functions.
+///
+/// `None` restores the default, which uses all available cores unless
+/// overridden by the `RAYON_NUM_THREADS` environment variable. Work that is
+/// already running keeps using the previous pool.
+#[pyfunction]
+#[pyo3(signature = (threads=None))]
+pub fn set_thread_count(threads: Option<usize>) -> PyResult<()> {
+    let pool = match threads {
+        Some(threads) => Some(Arc::new(
+            ThreadPoolBuilder::new()
+                .num_threads(threads)
+                .thread_name(|index| format!("faultforge-codec-{index}"))
+                .build()
+                .map_err(|err| PyRuntimeError::new_err(err.to_string()))?,
+        )),
+        None => None,
+    };
+
+    *POOL.write().unwrap_or_else(PoisonError::into_inner) = pool;
+
+    Ok(())
+}
+
+/// The number of threads used by the parallel encoding and decoding functions.
+#[pyfunction]
+pub fn thread_count() -> usize {
+    install(rayon::current_num_threads)
+}
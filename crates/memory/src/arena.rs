@@ -0,0 +1,472 @@
+//! SECDED encoded chunks stored back to back in a single allocation.
+//!
+//! [`DynChunks`] keeps every chunk in its own heap allocation which makes fault
+//! injection and partial decoding expensive for large buffers. An
+//! [`EncodedArena`] stores chunk `i` at bytes `[i * B, (i + 1) * B)` where `B`
+//! is the number of bytes required for a single encoded chunk. Faults are
+//! applied in place and any subset of the original elements can be decoded
+//! without touching the rest of the arena.
+
+#[cfg(test)]
+mod tests;
+
+use std::ops::Range;
+
+use rayon::prelude::*;
+
+use crate::{
+    BitBuffer, ByteBuffer, Limited, SizedBitBuffer,
+    chunks::{ChunksCreationError, DynChunks},
+    encoding::secded::{decode_into, encode_into, encoded_bit_count},
+};
+
+/// The minimum number of data bits decoded by a single parallel task.
+///
+/// Smaller tasks are only created at the boundaries of the output arrays and
+/// the requested ranges.
+const MIN_BLOCK_BITS: usize = 1 << 15;
+
+/// SECDED encoded chunks in one contiguous byte buffer.
+///
+/// The bit indices of the [`BitBuffer`] implementation match the ones of
+/// [`DynChunks`]: bit `t` addresses bit `t % E` of chunk `t / E` where `E` is
+/// the number of encoded bits per chunk. Padding bits between chunks are not
+/// addressable.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub struct EncodedArena {
+    bytes: Vec<u8>,
+    data_bit_count: usize,
+    encoded_bit_count: usize,
+    bytes_per_chunk: usize,
+    chunk_count: usize,
+}
+
+impl EncodedArena {
+    /// Encode `items` in parallel, reading the source slices in place.
+    ///
+    /// The items are viewed as one continuous buffer which is split into
+    /// chunks of `data_bit_count` bits. The last chunk is padded with zeros.
+    /// Apart from the arena itself, only a constant amount of scratch memory
+    /// is used per thread.
+    pub fn encode<T>(items: &[&[T]], data_bit_count: usize) -> Result<Self, ChunksCreationError>
+    where
+        T: SizedBitBuffer + Sync,
+    {
+        if data_bit_count == 0 {
+            return Err(ChunksCreationError::ZeroChunksize);
+        }
+        let element_count: usize = items.iter().map(|item| item.len()).sum();
+        if element_count == 0 {
+            return Err(ChunksCreationError::Empty);
+        }
+
+        let encoded_bit_count =
+            encoded_bit_count(data_bit_count).expect("the data bit count is non-zero");
+        let bytes_per_chunk = encoded_bit_count.div_ceil(8);
+        let chunk_count = (element_count * T::BITS_COUNT).div_ceil(data_bit_count);
+
+        let mut offsets = Vec::with_capacity(items.len());
+        let mut offset = 0;
+        for item in items {
+            offsets.push(offset);
+            offset += item.len();
+        }
+
+        let mut bytes = vec![0u8; chunk_count * bytes_per_chunk];
+        bytes
+            .par_chunks_mut(bytes_per_chunk)
+            .enumerate()
+            .for_each_init(
+                || (Limited::bytes(data_bit_count), Vec::new()),
+                |(source, scratch), (chunk, output)| {
+                    gather(items, &offsets, chunk * data_bit_count, source);
+
+                    scratch.clear();
+                    scratch.resize(bytes_per_chunk, 0);
+                    let mut dest = Limited::new(std::mem::take(scratch), encoded_bit_count)
+                        .expect("the scratch buffer stores enough bytes for the encoded bits");
+                    encode_into(source, &mut dest)
+                        .expect("the buffer sizes are known to match the data bit count");
+
+                    *scratch = dest.into_inner();
+                    output.copy_from_slice(scratch);
+                },
+            );
+
+        Ok(Self {
+            bytes,
+            data_bit_count,
+            encoded_bit_count,
+            bytes_per_chunk,
+            chunk_count,
+        })
+    }
+
+    /// Create an arena from already encoded chunks.
+    ///
+    /// `data_bit_count` is the number of data bits each chunk was encoded from.
+    ///
+    /// # Panics
+    ///
+    /// If the chunks don't have the encoded size that corresponds to
+    /// `data_bit_count`.
+    pub fn from_chunks(
+        chunks: DynChunks,
+        data_bit_count: usize,
+    ) -> Result<Self, ChunksCreationError> {
+        let encoded_bit_count =
+            encoded_bit_count(data_bit_count).ok_or(ChunksCreationError::ZeroChunksize)?;
+        let bytes_per_chunk = encoded_bit_count.div_ceil(8);
+        let chunk_count = chunks.chunk_count();
+
+        let mut bytes = Vec::with_capacity(chunk_count * bytes_per_chunk);
+        for chunk in chunks.into_raw() {
+            assert_eq!(
+                chunk.bit_count(),
+                encoded_bit_count,
+                "the chunks don't match the data bit count"
+            );
+            bytes.extend_from_slice(&chunk.into_inner());
+        }
+
+        Ok(Self {
+            bytes,
+            data_bit_count,
+            encoded_bit_count,
+            bytes_per_chunk,
+            chunk_count,
+        })
+    }
+
+    /// Get the number of chunks.
+    #[must_use]
+    pub fn chunk_count(&self) -> usize {
+        self.chunk_count
+    }
+
+    /// Get the number of data bits per chunk.
+    #[must_use]
+    pub fn data_bit_count(&self) -> usize {
+        self.data_bit_count
+    }
+
+    /// Get the number of encoded bits per chunk.
+    #[must_use]
+    pub fn encoded_bit_count(&self) -> usize {
+        self.encoded_bit_count
+    }
+
+    /// Get the index of the chunk which stores the encoded bit `bit_index`.
+    #[must_use]
+    pub fn chunk_of(&self, bit_index: usize) -> usize {
+        bit_index / self.encoded_bit_count
+    }
+
+    /// Get the raw bytes of the arena.
+    #[must_use]
+    pub fn as_bytes(&self) -> &[u8] {
+        &self.bytes
+    }
+
+    /// Map an encoded bit index to an index in the underlying byte buffer.
+    fn raw_index(&self, bit_index: usize) -> usize {
+        if bit_index >= self.bit_count() {
+            panic!("{bit_index} is out of bounds");
+        }
+        let chunk = bit_index / self.encoded_bit_count;
+        chunk * self.bytes_per_chunk * 8 + bit_index % self.encoded_bit_count
+    }
+
+    /// Compute the element ranges which are affected by the given chunks.
+    ///
+    /// The result is sorted, non-overlapping and limited to `element_count`.
+    /// `chunks` doesn't need to be sorted and may contain duplicates.
+    #[must_use]
+    pub fn element_ranges(
+        &self,
+        chunks: &[usize],
+        element_bit_count: usize,
+        element_count: usize,
+    ) -> Vec<Range<usize>> {
+        let mut chunks = chunks.to_vec();
+        chunks.sort_unstable();
+        chunks.dedup();
+
+        let mut ranges: Vec<Range<usize>> = Vec::new();
+        for chunk in chunks {
+            let start = chunk * self.data_bit_count / element_bit_count;
+            let end = ((chunk + 1) * self.data_bit_count)
+                .div_ceil(element_bit_count)
+                .min(element_count);
+            if start >= end {
+                continue;
+            }
+
+            match ranges.last_mut() {
+                Some(last) if last.end >= start => last.end = last.end.max(end),
+                _ => ranges.push(start..end),
+            }
+        }
+
+        ranges
+    }
+
+    /// Decode the elements in `ranges` into `outputs` in parallel.
+    ///
+    /// `outputs` are viewed as one continuous buffer, the ranges are element
+    /// indices into this buffer. Elements outside of the ranges are left
+    /// untouched. `ranges` must be sorted and non-overlapping, see
+    /// [`EncodedArena::element_ranges`].
+    ///
+    /// `post` is called on every decoded element right after it has been
+    /// written. This can be used to decode an additional element-wise
+    /// encoding in the same pass.
+    ///
+    /// Returns the sorted indices of the chunks where a double error was
+    /// detected.
+    ///
+    /// # Panics
+    ///
+    /// If the outputs store more bits than the arena or the ranges are out of
+    /// bounds.
+    pub fn decode_ranges_into<T, F>(
+        &self,
+        outputs: &mut [&mut [T]],
+        ranges: &[Range<usize>],
+        post: F,
+    ) -> Vec<usize>
+    where
+        T: SizedBitBuffer + ByteBuffer + Send,
+        F: Fn(&mut T) + Sync,
+    {
+        let element_count: usize = outputs.iter().map(|output| output.len()).sum();
+        assert!(
+            element_count * T::BITS_COUNT <= self.chunk_count * self.data_bit_count,
+            "the outputs are larger than the encoded buffer"
+        );
+        if let Some(last) = ranges.last() {
+            assert!(last.end <= element_count, "the ranges are out of bounds");
+        }
+
+        let block = self.block_size::<T>();
+        let pieces = split_pieces(outputs, ranges, block);
+
+        let mut double_errors = pieces
+            .into_par_iter()
+            .map(|(start, piece)| self.decode_piece(start, piece, &post))
+            .collect::<Vec<_>>()
+            .into_iter()
+            .flatten()
+            .collect::<Vec<_>>();
+
+        double_errors.sort_unstable();
+        double_errors.dedup();
+        double_errors
+    }
+
+    /// Decode all elements into `outputs`.
+    ///
+    /// See [`EncodedArena::decode_ranges_into`].
+    pub fn decode_into<T, F>(&self, outputs: &mut [&mut [T]], post: F) -> Vec<usize>
+    where
+        T: SizedBitBuffer + ByteBuffer + Send,
+        F: Fn(&mut T) + Sync,
+    {
+        let element_count: usize = outputs.iter().map(|output| output.len()).sum();
+        self.decode_ranges_into(outputs, std::slice::from_ref(&(0..element_count)), post)
+    }
+
+    /// The number of elements decoded per parallel task.
+    ///
+    /// Blocks start at chunk boundaries so neighboring blocks never need to
+    /// decode the same chunk.
+    fn block_size<T>(&self) -> usize
+    where
+        T: SizedBitBuffer,
+    {
+        let lcm = lcm(self.data_bit_count, T::BITS_COUNT);
+        lcm / T::BITS_COUNT * (MIN_BLOCK_BITS / lcm).max(1)
+    }
+
+    /// Decode the elements starting from the global element index `start`.
+    fn decode_piece<T, F>(&self, start: usize, piece: &mut [T], post: &F) -> Vec<usize>
+    where
+        T: SizedBitBuffer + ByteBuffer,
+        F: Fn(&mut T),
+    {
+        let data_bits = self.data_bit_count;
+        let bit_start = start * T::BITS_COUNT;
+        let bit_end = bit_start + piece.len() * T::BITS_COUNT;
+        let first_chunk = bit_start / data_bits;
+        let last_chunk = bit_end.div_ceil(data_bits);
+        let byte_aligned = data_bits.is_multiple_of(8) && T::BITS_COUNT.is_multiple_of(8);
+
+        let mut double_errors = Vec::new();
+        let mut source = Vec::with_capacity(self.bytes_per_chunk);
+        let mut dest = Limited::bytes(data_bits);
+
+        for chunk in first_chunk..last_chunk {
+            source.clear();
+            source.extend_from_slice(
+                &self.bytes[chunk * self.bytes_per_chunk..(chunk + 1) * self.bytes_per_chunk],
+            );
+            let mut encoded = Limited::new(std::mem::take(&mut source), self.encoded_bit_count)
+                .expect("the chunk stores enough bytes for the encoded bits");
+
+            let success = decode_into(&mut encoded, &mut dest)
+                .expect("the chunk sizes are known to match the data bit count");
+            if !success {
+                double_errors.push(chunk);
+            }
+            source = encoded.into_inner();
+
+            let chunk_start = chunk * data_bits;
+            let from = chunk_start.max(bit_start);
+            let to = (chunk_start + data_bits).min(bit_end);
+
+            if byte_aligned {
+                let decoded = dest.inner();
+                for byte in from / 8..to / 8 {
+                    piece.set_byte(byte - bit_start / 8, decoded[byte - chunk_start / 8]);
+                }
+            } else {
+                for bit in from..to {
+                    if dest.is_1(bit - chunk_start) {
+                        piece.set_1(bit - bit_start);
+                    } else {
+                        piece.set_0(bit - bit_start);
+                    }
+                }
+            }
+        }
+
+        piece.iter_mut().for_each(post);
+
+        double_errors
+    }
+}
+
+impl BitBuffer for EncodedArena {
+    fn bit_count(&self) -> usize {
+        self.chunk_count * self.encoded_bit_count
+    }
+
+    fn set_1(&mut self, bit_index: usize) {
+        let raw = self.raw_index(bit_index);
+        self.bytes.set_1(raw);
+    }
+
+    fn set_0(&mut self, bit_index: usize) {
+        let raw = self.raw_index(bit_index);
+        self.bytes.set_0(raw);
+    }
+
+    fn is_1(&self, bit_index: usize) -> bool {
+        self.bytes.is_1(self.raw_index(bit_index))
+    }
+
+    fn flip_bit(&mut self, bit_index: usize) {
+        let raw = self.raw_index(bit_index);
+        self.bytes.flip_bit(raw);
+    }
+}
+
+/// Copy the bits starting from the global bit `bit_start` of `items` into
+/// `dest`.
+///
+/// `offsets` stores the global element index of the first element of each
+/// item. Bits past the end of the items are set to zero.
+fn gather<T>(items: &[&[T]], offsets: &[usize], bit_start: usize, dest: &mut Limited<Vec<u8>>)
+where
+    T: SizedBitBuffer,
+{
+    let bits = T::BITS_COUNT;
+    let dest_bits = dest.bit_count();
+
+    let mut element = bit_start / bits;
+    let mut item = offsets.partition_point(|&offset| offset <= element) - 1;
+    let mut bit_in_element = bit_start % bits;
+    let mut written = 0;
+
+    while written < dest_bits {
+        // Skip over finished and empty items.
+        while item < items.len() && element - offsets[item] >= items[item].len() {
+            item += 1;
+        }
+        if item >= items.len() {
+            break;
+        }
+        let source = &items[item][element - offsets[item]];
+
+        let end = bits.min(bit_in_element + dest_bits - written);
+        for bit in bit_in_element..end {
+            if source.is_1(bit) {
+                dest.set_1(written);
+            } else {
+                dest.set_0(written);
+            }
+            written += 1;
+        }
+
+        element += 1;
+        bit_in_element = 0;
+    }
+
+    for bit in written..dest_bits {
+        dest.set_0(bit);
+    }
+}
+
+fn gcd(mut a: usize, mut b: usize) -> usize {
+    while b != 0 {
+        (a, b) = (b, a % b);
+    }
+    a
+}
+
+fn lcm(a: usize, b: usize) -> usize {
+    a / gcd(a, b) * b
+}
+
+/// Split `outputs` into disjoint pieces which cover `ranges`.
+///
+/// Pieces never cross output or range boundaries and are otherwise aligned to
+/// multiples of `block` in the global element index space. Each piece is
+/// returned together with the global index of its first element.
+fn split_pieces<'a, T>(
+    outputs: &'a mut [&mut [T]],
+    ranges: &[Range<usize>],
+    block: usize,
+) -> Vec<(usize, &'a mut [T])> {
+    let mut pieces = Vec::new();
+    let mut offset = 0;
+
+    for output in outputs.iter_mut() {
+        let len = output.len();
+        let mut rest: &mut [T] = output;
+        let mut cursor = offset;
+
+        for range in ranges {
+            let start = range.start.max(offset);
+            let end = range.end.min(offset + len);
+            if start >= end {
+                continue;
+            }
+
+            let mut pos = start;
+            while pos < end {
+                let next = ((pos / block + 1) * block).min(end);
+                let (_, tail) = std::mem::take(&mut rest).split_at_mut(pos - cursor);
+                let (piece, tail) = tail.split_at_mut(next - pos);
+                pieces.push((pos, piece));
+                rest = tail;
+                cursor = next;
+                pos = next;
+            }
+        }
+
+        offset += len;
+    }
+
+    pieces
+}
@@ -0,0 +1,170 @@
+use super::*;
+
+fn encode_arena(source: &[u16], data_bit_count: usize) -> EncodedArena {
+    let chunks = source
+        .to_vec()
+        .to_dyn_chunks(data_bit_count)
+        .unwrap()
+        .encode_chunks();
+    EncodedArena::from_chunks(chunks, data_bit_count).unwrap()
+}
+
+fn source(len: usize) -> Vec<u16> {
+    (0..len)
+        .map(|i| (i as u16).wrapping_mul(40503).rotate_left(3))
+        .collect()
+}
+
+#[test]
+fn matches_dyn_chunks_layout() {
+    let source = source(37);
+    let chunks = source.to_dyn_chunks(13).unwrap().encode_chunks();
+    let arena = EncodedArena::from_chunks(chunks.clone(), 13).unwrap();
+
+    assert_eq!(arena.chunk_count(), chunks.chunk_count());
+    assert_eq!(arena.bit_count(), chunks.bit_count());
+    assert!(arena.bits().eq(chunks.bits()));
+}
+
+#[test]
+fn decode_round_trip() {
+    for data_bit_count in [7, 8, 13, 16, 64, 1024] {
+        let source = source(1000);
+        let arena = encode_arena(&source, data_bit_count);
+
+        let mut first = vec![0u16; 600];
+        let mut second = vec![0u16; 400];
+        let double_errors = arena.decode_into(&mut [&mut first, &mut second], |_| {});
+
+        assert!(double_errors.is_empty());
+        assert_eq!(first, source[..600]);
+        assert_eq!(second, source[600..]);
+    }
+}
+
+#[test]
+fn single_faults_are_corrected() {
+    let source = source(100);
+    let mut arena = encode_arena(&source, 24);
+
+    let encoded_bit_count = arena.encoded_bit_count();
+    for chunk in 0..arena.chunk_count() {
+        // Flips in bit zero always trigger a double error detection.
+        arena.flip_bit(chunk * encoded_bit_count + 1 + chunk % (encoded_bit_count - 1));
+    }
+
+    let mut output = vec![0u16; 100];
+    let double_errors = arena.decode_into(&mut [&mut output], |_| {});
+
+    assert!(double_errors.is_empty());
+    assert_eq!(output, source);
+}
+
+#[test]
+fn double_faults_are_reported() {
+    let source = source(100);
+    let mut arena = encode_arena(&source, 32);
+    let encoded_bit_count = arena.encoded_bit_count();
+
+    arena.flip_bit(3 * encoded_bit_count + 5);
+    arena.flip_bit(3 * encoded_bit_count + 6);
+
+    let mut output = vec![0u16; 100];
+    let double_errors = arena.decode_into(&mut [&mut output], |_| {});
+
+    assert_eq!(double_errors, vec![3]);
+}
+
+#[test]
+fn ranges_leave_other_elements_untouched() {
+    let source = source(200);
+    let mut arena = encode_arena(&source, 13);
+    let encoded_bit_count = arena.encoded_bit_count();
+
+    // Two faults in chunk 5 corrupt the elements stored in it.
+    arena.flip_bit(5 * encoded_bit_count + 5);
+    arena.flip_bit(5 * encoded_bit_count + 6);
+
+    let ranges = arena.element_ranges(&[5, 5], 16, 200);
+    assert_eq!(ranges, vec![4..5]);
+
+    let mut output = vec![0u16; 200];
+    arena.decode_ranges_into(&mut [&mut output], &ranges, |_| {});
+
+    for (i, (&decoded, &original)) in output.iter().zip(&source).enumerate() {
+        if ranges.iter().any(|range| range.contains(&i)) {
+            assert_ne!(decoded, original);
+        } else {
+            assert_eq!(decoded, 0);
+        }
+    }
+}
+
+#[test]
+fn element_ranges_merge() {
+    let arena = encode_arena(&source(100), 13);
+
+    // Chunk 0 covers bits 0..13, chunk 1 covers 13..26, chunk 3 covers 39..52.
+    assert_eq!(arena.element_ranges(&[1, 0], 16, 100), vec![0..2]);
+    assert_eq!(arena.element_ranges(&[3, 0], 16, 100), vec![0..1, 2..4]);
+    // The final chunk is padded beyond the elements.
+    let last = arena.chunk_count() - 1;
+    assert_eq!(arena.element_ranges(&[last], 16, 100), vec![99..100]);
+}
+
+#[test]
+fn post_is_applied_once_per_element() {
+    let source = source(5000);
+    let arena = encode_arena(&source, 64);
+
+    let mut first = vec![0u16; 1234];
+    let mut second = vec![0u16; 3766];
+    arena.decode_into(&mut [&mut first, &mut second], |item| {
+        *item = item.wrapping_add(1)
+    });
+
+    let expected = source.iter().map(|item| item.wrapping_add(1));
+    assert!(first.iter().chain(&second).copied().eq(expected));
+}
+
+#[test]
+fn split_pieces_respect_boundaries() {
+    let mut first = vec![0u8; 10];
+    let mut second = vec![0u8; 10];
+    let mut outputs = [first.as_mut_slice(), second.as_mut_slice()];
+
+    let pieces = split_pieces(&mut outputs, &[2..7, 8..15], 4);
+    let layout = pieces
+        .iter()
+        .map(|(start, piece)| (*start, piece.len()))
+        .collect::<Vec<_>>();
+
+    assert_eq!(layout, vec![(2, 2), (4, 3), (8, 2), (10, 2), (12, 3)]);
+}
+
+#[test]
+fn encode_matches_chunked_encoding() {
+    for data_bit_count in [7, 8, 13, 16, 64, 1024] {
+        let first = source(37);
+        let second = source(100);
+        let joined = first.iter().chain(&second).copied().collect::<Vec<_>>();
+
+        let encoded = EncodedArena::encode(&[&first, &[], &second], data_bit_count).unwrap();
+        let expected = encode_arena(&joined, data_bit_count);
+
+        assert_eq!(encoded, expected);
+    }
+}
+
+#[test]
+fn encode_empty() {
+    let empty: [&[u16]; 2] = [&[], &[]];
+    assert_eq!(
+        EncodedArena::encode(&empty, 8),
+        Err(ChunksCreationError::Empty)
+    );
+    assert_eq!(
+        EncodedArena::encode(&[&source(3)], 0),
+        Err(ChunksCreationError::ZeroChunksize)
+    );
+}
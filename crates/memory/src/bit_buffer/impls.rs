@@ -175,3 +175,28 @@ where
         self.as_mut_slice().flip_bit(bit_index);
     }
 }
+
+impl<B> BitBuffer for &mut B
+where
+    B: BitBuffer + ?Sized,
+{
+    fn bit_count(&self) -> usize {
+        (**self).bit_count()
+    }
+
+    fn set_1(&mut self, bit_index: usize) {
+        (**self).set_1(bit_index);
+    }
+
+    fn set_0(&mut self, bit_index: usize) {
+        (**self).set_0(bit_index);
+    }
+
+    fn is_1(&self, bit_index: usize) -> bool {
+        (**self).is_1(bit_index)
+    }
+
+    fn flip_bit(&mut self, bit_index: usize) {
+        (**self).flip_bit(bit_index);
+    }
+}
@@ -272,3 +272,18 @@ fn array_flip_bit() {
     arr.flip_bit(8);
     assert_eq!(arr, [1u8, 0u8]);
 }
+
+#[test]
+fn mutable_reference_sequence() {
+    let mut first = [0u8; 2];
+    let mut second = [0u8; 1];
+    let mut sequence =
+        crate::sequence::NonUniformSequence(vec![first.as_mut_slice(), second.as_mut_slice()]);
+
+    sequence.flip_bit(9);
+    sequence.flip_bit(17);
+    assert_eq!(sequence.bit_count(), 24);
+
+    assert_eq!(first, [0, 2]);
+    assert_eq!(second, [2]);
+}
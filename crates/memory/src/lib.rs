@@ -15,6 +15,7 @@
 //! | `[T; N]` where `T: SizedBitBuffer` | ✓ | ✓ | ✓† |
 //! | `[T]` where `T: SizedBitBuffer` | ✓ | | ✓† |
 //! | `Vec<T>` where `T: SizedBitBuffer` | ✓ | | ✓† |
+//! | `&mut B` where `B: BitBuffer` | ✓ | | |
 //!
 //! † [`ByteBuffer`] on sequence types additionally requires `T: ByteBuffer`.
 //!
@@ -24,6 +25,7 @@
 #![cfg_attr(not(test), deny(clippy::unwrap_used))]
 #![warn(clippy::must_use_candidate)]
 
+pub mod arena;
 mod bit_buffer;
 mod byte_buffer;
 pub mod chunks;
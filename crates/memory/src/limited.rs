@@ -43,6 +43,11 @@ where
     pub fn into_inner(self) -> T {
         self.buffer
     }
+
+    /// Get a reference to the original bitbuffer.
+    pub fn inner(&self) -> &T {
+        &self.buffer
+    }
 }
 
 impl<T> BitBuffer for Limited<T>
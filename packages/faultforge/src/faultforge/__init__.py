@@ -20,6 +20,10 @@ submodules for details.
   with its evaluation dataset.
 - `faultforge.progress`: `Progress`, for reporting on long-running operations
   (dataset loading, encoding, fault injection, ...) via periodic log messages.
+- `faultforge.threads`: `ThreadBudget`, for sizing the Rust codec and torch
+  thread pools together so they don't oversubscribe the CPU.
+- `faultforge.bits`: vectorized histograms and counts over recorded xor
+  bitmasks.
 
 To add a new kind of experiment, subclass `Experiment` and reuse
 `faultforge.loading`/`faultforge.dataset` for model and data handling.
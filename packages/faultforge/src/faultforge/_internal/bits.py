@@ -0,0 +1,79 @@
+"""Vectorized analytics over bitmasks of xor values.
+
+A bitmask (see `DetailedRunResult.bitmask`) holds the nonzero xor values
+between faulty and golden parameters, one per affected element. These
+functions accept one as any `Sequence[int]` but work on unsigned numpy arrays
+internally, which is what `EncodedFaultInjection` records and what columnar
+result files map, so they don't iterate over Python ints.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from faultforge._internal.experiments.columnar import ColumnView
+
+
+def bit_array(bitmask: Sequence[int] | np.ndarray) -> np.ndarray:
+    """`bitmask` as an unsigned numpy array, without a copy where possible."""
+    if isinstance(bitmask, ColumnView):
+        bitmask = bitmask.array()
+    if isinstance(bitmask, np.ndarray) and bitmask.dtype.kind == "u":
+        return bitmask
+    return np.asarray(bitmask, dtype=np.uint64)
+
+
+def popcount_counts(bitmask: Sequence[int] | np.ndarray, width: int) -> np.ndarray:
+    """How many elements have each number of set bits, from 0 to `width`.
+
+    A fixed-size (`width + 1`) array, for values at most `width` bits wide.
+    """
+    return np.bincount(np.bitwise_count(bit_array(bitmask)), minlength=width + 1)
+
+
+def position_counts(
+    bitmask: Sequence[int] | np.ndarray, width: int, *, skip_multi_bit: bool = False
+) -> np.ndarray:
+    """How many elements have each bit position (0 is the LSB) set.
+
+    A fixed-size (`width`) array, for values at most `width` bits wide. With
+    `skip_multi_bit`, elements with more than one set bit are left out.
+    """
+    values = bit_array(bitmask)
+    if skip_multi_bit:
+        values = values[np.bitwise_count(values) <= 1]
+    counts = np.zeros(width, dtype=np.int64)
+    if values.size == 0:
+        return counts
+    for position in range(min(width, int(values.max()).bit_length())):
+        counts[position] = np.count_nonzero(values & values.dtype.type(1 << position))
+    return counts
+
+
+def popcount_histogram(bitmask: Sequence[int] | np.ndarray) -> dict[int, int]:
+    """Map a number of set bits to how many elements have that many."""
+    return _nonzero_entries(np.bincount(np.bitwise_count(bit_array(bitmask))))
+
+
+def bit_position_histogram(
+    bitmask: Sequence[int] | np.ndarray, *, skip_multi_bit: bool = False
+) -> dict[int, int]:
+    """Map a bit position (0 is the LSB) to how many elements have it set.
+
+    Like `position_counts`, but only listing the positions some element has
+    set.
+    """
+    values = bit_array(bitmask)
+    width = int(values.max()).bit_length() if values.size else 0
+    return _nonzero_entries(
+        position_counts(values, width, skip_multi_bit=skip_multi_bit)
+    )
+
+
+def residual_fault_count(bitmask: Sequence[int] | np.ndarray) -> int:
+    """The total number of set bits, i.e. bits that differ from golden."""
+    return int(np.bitwise_count(bit_array(bitmask)).sum(dtype=np.int64))
+
+
+def _nonzero_entries(counts: np.ndarray) -> dict[int, int]:
+    return {int(index): int(counts[index]) for index in np.flatnonzero(counts)}
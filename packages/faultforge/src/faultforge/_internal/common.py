@@ -41,3 +41,15 @@ def open_text(path: AnyPath, mode: Literal["rt", "wt"], *, compressed: bool) ->
     if compressed:
         return zstd.open(resolved, mode)
     return open(resolved, mode)
+
+
+def open_binary_reader(path: AnyPath, *, compressed: bool) -> IO[bytes]:
+    """Open `path` for reading bytes, transparently through zstd if `compressed`.
+
+    The binary counterpart of `open_text`, for callers that parse the
+    content incrementally.
+    """
+    resolved = Path(path).expanduser()
+    if compressed:
+        return zstd.open(resolved, "rb")
+    return open(resolved, "rb")
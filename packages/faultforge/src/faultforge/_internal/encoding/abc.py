@@ -17,10 +17,12 @@ from faultforge._internal.fault import Fault
 from faultforge._internal.fingerprint import Fingerprint
 from faultforge._internal.progress import Progress, stage
 from faultforge._internal.tensor import (
+    is_host_contiguous,
     tensor_list_dtype,
     tensor_list_fault,
     tensor_list_faults,
 )
+from faultforge._rust import secded
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,26 @@ class Encoding:
         """Decode to a list of tensors."""
         ...
 
+    def decode_into(self, targets: list[Tensor], *, incremental: bool = False) -> None:
+        """Decode directly into existing tensors.
+
+        `targets` must match the shapes and data type of the tensors returned
+        by `decode`, e.g. the parameters of the module that was encoded.
+
+        If `incremental` is set, `targets` are expected to already hold the
+        result of the previous decode of this encoding (or of the encoding it
+        was cloned from). Encodings which track the faulted regions then only
+        update those, others ignore the flag.
+
+        The default implementation copies the result of `decode`. Encodings
+        which can write into `targets` without intermediate buffers should
+        override this.
+        """
+        _ = incremental
+        with torch.no_grad():
+            for target, decoded in zip(targets, self.decode(), strict=True):
+                _ = target.copy_(decoded)
+
     @abc.abstractmethod
     def clone(self) -> Encoding:
         """Clone the encoded data."""
@@ -190,10 +212,32 @@ class InPlaceEncoding(TensorEncoding):
     @abc.abstractmethod
     def decode_float16(self, t: Tensor) -> Tensor: ...
 
+    def decode_float32_in_place(self, t: Tensor) -> None:
+        """Decode a float32 tensor in place.
+
+        `t` is always a contiguous CPU tensor. The default implementation
+        copies the result of `decode_float32`.
+        """
+        _ = t.copy_(self.decode_float32(t))
+
+    def decode_float16_in_place(self, t: Tensor) -> None:
+        """Decode a float16 tensor in place.
+
+        See `decode_float32_in_place`.
+        """
+        _ = t.copy_(self.decode_float16(t))
+
     @override
     def encoded_tensors(self) -> list[Tensor]:
         return self._encoded_data
 
+    def _secded_head(self) -> secded.Head | None:
+        """Return the matching head for fused decoding with `SecdedEncoding`.
+
+        Encodings which return `None` are decoded separately.
+        """
+        return None
+
     @override
     def trigger_recompute(self) -> None:
         self._decoded_tensors = None
@@ -218,6 +262,28 @@ class InPlaceEncoding(TensorEncoding):
         self._decoded_tensors = decoded
         return decoded
 
+    @override
+    def decode_into(self, targets: list[Tensor], *, incremental: bool = False) -> None:
+        if self._decoded_tensors is not None:
+            super().decode_into(targets, incremental=incremental)
+            return
+
+        match self._dtype:
+            case EncodingDtype.F16:
+                decode = self.decode_float16
+                decode_in_place = self.decode_float16_in_place
+            case EncodingDtype.F32:
+                decode = self.decode_float32
+                decode_in_place = self.decode_float32_in_place
+
+        with torch.no_grad():
+            for encoded, target in zip(self._encoded_data, targets, strict=True):
+                if is_host_contiguous(target):
+                    _ = target.copy_(encoded)
+                    decode_in_place(target)
+                else:
+                    _ = target.copy_(decode(encoded))
+
     def _invalidate_decoded_cache(self) -> None:
         if self._decoded_tensors is not None:
             logger.debug("Invalidating decoded tensors due to fault injection")
@@ -15,7 +15,8 @@ from faultforge._internal.encoding.abc import (
     TensorEncoding,
 )
 from faultforge._internal.fingerprint import Fingerprint
-from faultforge._rust import cep
+from faultforge._internal.tensor import host_copy
+from faultforge._rust import cep, secded
 
 _logger = logging.getLogger(__name__)
 
@@ -98,6 +99,10 @@ class CepEncoding(InPlaceEncoding):
 
     _scheme: CepScheme
 
+    @override
+    def _secded_head(self) -> secded.Head:
+        return secded.Head.cep(self._scheme._to_rust())
+
     @override
     def clone(self) -> CepEncoding:
         cloned_data = [t.clone() for t in self._encoded_data]
@@ -116,12 +121,20 @@ class CepEncoding(InPlaceEncoding):
 
     @override
     def decode_float16(self, t: Tensor) -> Tensor:
-        encoded_np = t.view(torch.uint16).numpy(force=True).copy()
-        cep.decode_u16(encoded_np, self._scheme._to_rust())
-        return torch.from_numpy(encoded_np).view(torch.float16)
+        decoded = host_copy(t)
+        self.decode_float16_in_place(decoded)
+        return decoded
 
     @override
     def decode_float32(self, t: Tensor) -> Tensor:
-        encoded_np = t.numpy(force=True).copy()
-        cep.decode_f32(encoded_np, self._scheme._to_rust())
-        return torch.from_numpy(encoded_np)
+        decoded = host_copy(t)
+        self.decode_float32_in_place(decoded)
+        return decoded
+
+    @override
+    def decode_float16_in_place(self, t: Tensor) -> None:
+        cep.decode_u16(t.view(torch.uint16).numpy(), self._scheme._to_rust())
+
+    @override
+    def decode_float32_in_place(self, t: Tensor) -> None:
+        cep.decode_f32(t.numpy(), self._scheme._to_rust())
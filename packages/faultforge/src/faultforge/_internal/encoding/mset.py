@@ -16,7 +16,8 @@ from faultforge._internal.encoding.abc import (
     TensorEncoding,
 )
 from faultforge._internal.fingerprint import Fingerprint
-from faultforge._rust import mset
+from faultforge._internal.tensor import host_copy
+from faultforge._rust import mset, secded
 
 _logger = logging.getLogger(__name__)
 
@@ -68,17 +69,29 @@ class MsetEncoder(InPlaceEncoder):
 class MsetEncoding(InPlaceEncoding):
     """The encoding produced by `MsetEncoder`. See `MsetEncoder` for details."""
 
+    @override
+    def _secded_head(self) -> secded.Head:
+        return secded.Head.mset()
+
     @override
     def decode_float16(self, t: Tensor) -> Tensor:
-        encoded_np = t.view(torch.uint16).numpy(force=True).copy()
-        mset.decode_u16(encoded_np)
-        return torch.from_numpy(encoded_np).view(torch.float16)
+        decoded = host_copy(t)
+        self.decode_float16_in_place(decoded)
+        return decoded
 
     @override
     def decode_float32(self, t: Tensor) -> Tensor:
-        encoded_np = t.numpy(force=True).copy()
-        mset.decode_f32(encoded_np)
-        return torch.from_numpy(encoded_np)
+        decoded = host_copy(t)
+        self.decode_float32_in_place(decoded)
+        return decoded
+
+    @override
+    def decode_float16_in_place(self, t: Tensor) -> None:
+        mset.decode_u16(t.view(torch.uint16).numpy())
+
+    @override
+    def decode_float32_in_place(self, t: Tensor) -> None:
+        mset.decode_f32(t.numpy())
 
     @override
     def clone(self) -> MsetEncoding:
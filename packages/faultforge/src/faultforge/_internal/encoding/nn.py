@@ -27,6 +27,11 @@ class EncodedModule(nn.Module):
     """The decoded module will be sent to this device."""
     _dirty: bool
     """Whether the decoded data needs to be refreshed."""
+    _synced: bool
+    """Whether the parameters hold the result of the previous decode.
+
+    Allows the next decode to only update the parameters affected by faults.
+    """
 
     def __init__(
         self,
@@ -47,6 +52,7 @@ class EncodedModule(nn.Module):
 
         self._memory = encoder.encode(parameters, progress=progress)
         self._dirty = True
+        self._synced = False
 
     @classmethod
     def _from_parts(
@@ -54,6 +60,7 @@ class EncodedModule(nn.Module):
         module: nn.Module,
         data: Encoding,
         device: torch.device | None,
+        synced: bool,
     ) -> EncodedModule:
         instance = cls.__new__(cls)
         nn.Module.__init__(instance)
@@ -61,19 +68,21 @@ class EncodedModule(nn.Module):
         instance._memory = data
         instance._device = device
         instance._dirty = True
+        instance._synced = synced
         return instance
 
     def force_decode(self) -> nn.Module:
-        """Force a decode of the memory."""
-        decoded = self._memory.decode()
-        for param, decoded_param in zip(self._module.parameters(), decoded):
-            assert param.shape == decoded_param.shape
-            assert param.dtype == decoded_param.dtype
+        """Force a decode of the memory.
 
-            with torch.no_grad():
-                param.copy_(decoded_param)
+        The decoded values are written directly into the parameters of the
+        wrapped module.
+        """
+        with torch.no_grad():
+            targets = [param.detach() for param in self._module.parameters()]
+            self._memory.decode_into(targets, incremental=self._synced)
 
         self._dirty = False
+        self._synced = True
 
         if self._device is not None:
             return self._module.to(self._device)
@@ -92,10 +101,14 @@ class EncodedModule(nn.Module):
         The underlying `nn.Module` is deep-copied too, not just the encoded
         memory: `force_decode` writes decoded parameters into it in place, so
         sharing it between clones would let one clone's fault corrupt the
-        other's decoded output.
+        other's decoded output. The copied parameters let the clone decode
+        incrementally if this module is already decoded.
         """
         return EncodedModule._from_parts(
-            copy.deepcopy(self._module), self._memory.clone(), self._device
+            copy.deepcopy(self._module),
+            self._memory.clone(),
+            self._device,
+            synced=self._synced and not self._dirty,
         )
 
     def apply_fault(self, fault: Fault, target_bit: int) -> None:
@@ -119,6 +132,14 @@ class EncodedModule(nn.Module):
         """Return the number of bits in the encoded data."""
         return self._memory.bit_count()
 
+    def encoding(self) -> Encoding:
+        """The encoded memory, e.g. to inspect its layout.
+
+        Use `apply_fault(s)` rather than injecting faults into it directly,
+        which would go unnoticed by `decode`.
+        """
+        return self._memory
+
     @override
     def forward(self, t: Tensor) -> Tensor:
         result = self.decode().forward(t)
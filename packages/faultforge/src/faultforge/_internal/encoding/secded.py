@@ -17,7 +17,7 @@ from faultforge._internal.fault import (
 )
 from faultforge._internal.fingerprint import Fingerprint
 from faultforge._internal.progress import Progress, stage
-from faultforge._internal.tensor import tensor_list_dtype
+from faultforge._internal.tensor import is_host_contiguous, tensor_list_dtype
 from faultforge._rust import secded
 
 logger = logging.getLogger(__name__)
@@ -55,25 +55,23 @@ class SecdedEncoder(Encoder):
             raise ValueError("Cannot encode an empty buffer")
         dtype = EncodingDtype.from_torch(dtype)
 
-        # Store decoded tensor copies
-        decoded_tensors = [t.clone() for t in ts]
-
-        with stage(progress, "Encoding (SECDED)"):
+        with stage(progress, "Encoding (SECDED)"), torch.no_grad():
+            # The arrays share memory with `ts` where possible. They're only
+            # read during encoding.
             match dtype:
                 case EncodingDtype.F32:
-                    with torch.no_grad():
-                        rust_input = [t.flatten().numpy(force=True) for t in ts]
+                    rust_input = [t.detach().reshape(-1).numpy(force=True) for t in ts]
                     encoded_data = secded.encode_f32(rust_input, self.bits_per_chunk)
                 case EncodingDtype.F16:
-                    with torch.no_grad():
-                        rust_input = [
-                            t.flatten().view(torch.uint16).numpy(force=True) for t in ts
-                        ]
+                    rust_input = [
+                        t.detach().reshape(-1).view(torch.uint16).numpy(force=True)
+                        for t in ts
+                    ]
                     encoded_data = secded.encode_u16(rust_input, self.bits_per_chunk)
 
         return SecdedEncoding(
             encoded_data,
-            decoded_tensors,
+            [t.shape for t in ts],
             dtype,
         )
 
@@ -84,48 +82,127 @@ class SecdedEncoding(Encoding):
 
     _encoded_data: secded.Encoding
     """The blob that stores raw encoded data."""
-    _decoded_tensors: list[torch.Tensor]
-    """These are updated in-place during decoding."""
+    _shapes: list[torch.Size]
+    """The shapes of the encoded tensors."""
     _dtype: EncodingDtype
+    _decoded_tensors: list[torch.Tensor] | None = None
+    """Allocated on the first `decode` and updated in-place after."""
     _needs_recompute: bool = False
+    """Whether faults have been applied since the last decode."""
+    _decoded_head: secded.Head | None = None
+    """The head encoding which was decoded together with the cached tensors.
+
+    See `_decode_with_head`.
+    """
+    _cache_synced: bool = True
+    """Whether the faulted chunks are tracked relative to the cached tensors.
+
+    This is no longer the case after decoding directly into other tensors.
+    """
 
     @override
     def decode(self) -> list[torch.Tensor]:
-        if not self._needs_recompute:
-            logger.debug("Using cached decoded tensors")
-            return self._decoded_tensors
+        return self._decode_with_head(None)
+
+    @override
+    def decode_into(
+        self, targets: list[torch.Tensor], *, incremental: bool = False
+    ) -> None:
+        self._decode_into_with_head(targets, None, incremental=incremental)
+
+    def _decode_with_head(self, head: secded.Head | None) -> list[torch.Tensor]:
+        """Decode SECDED and an element-wise `head` encoding in a single pass.
+
+        The cached tensors are reused across calls. Only the chunks that were
+        faulted since the previous decode are decoded again, unless `head`
+        differs from the previous call, in which case everything is decoded.
+        """
+        if self._decoded_tensors is None:
+            self._decoded_tensors = [
+                torch.empty(shape, dtype=self._dtype.to_torch())
+                for shape in self._shapes
+            ]
+            incremental = False
+        else:
+            incremental = self._cache_synced and head == self._decoded_head
+            if incremental and not self._needs_recompute:
+                logger.debug("Using cached decoded tensors")
+                return self._decoded_tensors
         logger.debug("Recomputing decoded tensors")
 
-        match self._dtype:
-            case EncodingDtype.F32:
-                decoded, ded_results = self._encoded_data.decode_f32()
-                torch_decoded = [torch.from_numpy(t) for t in decoded]
+        self._decode_rust(self._decoded_tensors, head, only_dirty=incremental)
 
-            case EncodingDtype.F16:
-                decoded, ded_results = self._encoded_data.decode_u16()
-                torch_decoded = [
-                    torch.from_numpy(t).view(torch.float16) for t in decoded
-                ]
+        self._needs_recompute = False
+        self._decoded_head = head
+        self._cache_synced = True
+        return self._decoded_tensors
 
-        # Update cached decoded tensors in-place
-        for cached, decoded in zip(self._decoded_tensors, torch_decoded, strict=True):
+    def _decode_into_with_head(
+        self,
+        targets: list[torch.Tensor],
+        head: secded.Head | None,
+        *,
+        incremental: bool,
+    ) -> None:
+        """Like `_decode_with_head` but writes into `targets`.
+
+        Falls back to copying from the cached tensors if any of the targets
+        can't be written to directly, e.g. because it's on the GPU.
+        """
+        if not all(is_host_contiguous(t) for t in targets):
+            decoded = self._decode_with_head(head)
             with torch.no_grad():
-                _ = cached.flatten().copy_(decoded)
+                for target, cached in zip(targets, decoded, strict=True):
+                    _ = target.copy_(cached)
+            return
+
+        # The faulted chunks are consumed by this decode, the cache can't be
+        # updated incrementally anymore.
+        self._cache_synced = False
+        self._decode_rust(targets, head, only_dirty=incremental)
+
+    def _decode_rust(
+        self,
+        outputs: list[torch.Tensor],
+        head: secded.Head | None,
+        *,
+        only_dirty: bool,
+    ) -> None:
+        """Decode into contiguous CPU tensors."""
+        with torch.no_grad():
+            match self._dtype:
+                case EncodingDtype.F32:
+                    arrays = [t.detach().view(-1).numpy() for t in outputs]
+                    ded_results = self._encoded_data.decode_into_f32(
+                        arrays, head, only_dirty=only_dirty
+                    )
+                case EncodingDtype.F16:
+                    arrays = [
+                        t.detach().view(-1).view(torch.uint16).numpy() for t in outputs
+                    ]
+                    ded_results = self._encoded_data.decode_into_u16(
+                        arrays, head, only_dirty=only_dirty
+                    )
 
         # We're discarding the double error detection results for now but may
         # want to do something with them in the future.
         _ = ded_results
 
-        self._needs_recompute = False
-        return self._decoded_tensors
-
     @override
     def clone(self) -> SecdedEncoding:
+        if self._decoded_tensors is not None:
+            cloned_decoded = [t.clone() for t in self._decoded_tensors]
+        else:
+            cloned_decoded = None
+
         return SecdedEncoding(
             self._encoded_data.clone(),
-            [t.clone() for t in self._decoded_tensors],
+            self._shapes,
             self._dtype,
+            cloned_decoded,
             self._needs_recompute,
+            self._decoded_head,
+            self._cache_synced,
         )
 
     def _invalidate_decoded_cache(self) -> None:
@@ -9,12 +9,15 @@ from torch import Tensor
 from faultforge._internal.encoding.abc import (
     Encoder,
     Encoding,
+    InPlaceEncoding,
     TensorEncoder,
     TensorEncoding,
 )
+from faultforge._internal.encoding.secded import SecdedEncoding
 from faultforge._internal.fault import Fault
 from faultforge._internal.fingerprint import Fingerprint
 from faultforge._internal.progress import Progress
+from faultforge._rust import secded
 
 
 @dataclass(slots=True)
@@ -59,11 +62,34 @@ class EncodingSequence(Encoding):
     _head: list[TensorEncoding]
     _tail: Encoding
 
+    def _fused_head(self) -> secded.Head | None:
+        """Return the head for decoding the last head encoding with SECDED.
+
+        The last head encoding can be decoded in the same pass as SECDED if
+        it's an element-wise encoding supported by the fused decoder.
+        """
+        if not self._head or not isinstance(self._tail, SecdedEncoding):
+            return None
+
+        last = self._head[-1]
+        if not isinstance(last, InPlaceEncoding):
+            return None
+
+        return last._secded_head()
+
     @override
     def decode(self) -> list[Tensor]:
-        ts = self._tail.decode()
+        head = self._head
 
-        for encoding in reversed(self._head):
+        fused_head = self._fused_head()
+        if fused_head is not None:
+            assert isinstance(self._tail, SecdedEncoding)
+            ts = self._tail._decode_with_head(fused_head)
+            head = head[:-1]
+        else:
+            ts = self._tail.decode()
+
+        for encoding in reversed(head):
             for original, updated in zip(encoding.encoded_tensors(), ts, strict=True):
                 _ = original.copy_(updated)
             encoding.trigger_recompute()
@@ -72,6 +98,17 @@ class EncodingSequence(Encoding):
 
         return ts
 
+    @override
+    def decode_into(self, targets: list[Tensor], *, incremental: bool = False) -> None:
+        fused_head = self._fused_head()
+        if fused_head is not None and len(self._head) == 1:
+            assert isinstance(self._tail, SecdedEncoding)
+            self._tail._decode_into_with_head(
+                targets, fused_head, incremental=incremental
+            )
+        else:
+            super().decode_into(targets, incremental=incremental)
+
     @override
     def apply_fault(self, fault: Fault, target_bit: int) -> None:
         self._tail.apply_fault(fault, target_bit)
@@ -4,14 +4,21 @@ See `faultforge.experiment` for a general overview.
 """
 
 import abc
+import contextlib
+import functools
+import json
 import logging
+import math
 import os
+import queue
 import signal
 import tempfile
+import threading
 import time
 import types
 from collections.abc import (
     Callable,
+    Iterable,
     Sequence,
 )
 from dataclasses import (
@@ -22,11 +29,18 @@ from pathlib import Path
 from typing import (
     IO,
     Self,
+    override,
 )
 
 import scipy.stats
 
 from faultforge._internal.common import AnyPath, is_compressed, open_text
+from faultforge._internal.journal import (
+    append_records,
+    create_journal,
+    is_journal,
+    read_journal,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +53,10 @@ def _warn_on_extension_mismatch(path: AnyPath, *, compressed: bool) -> None:
     Never changes what path is actually written to - purely a hint that the
     file's contents and its name disagree about whether it's zstd-compressed,
     which would otherwise confuse tools like `cat`/`jq` reading it later.
+    Directories are skipped, the experiment names the files saved in them.
     """
+    if Path(path).expanduser().is_dir():
+        return
     looks_compressed = Path(path).name.endswith(_COMPRESSED_SUFFIXES)
     if compressed and not looks_compressed:
         logger.warning(
@@ -61,7 +78,17 @@ class SaveConfig:
     """How many seconds between saves. None means save only at the end."""
     compressed: bool = False
     """Whether to save through zstd compression; passed straight through to
-    `Experiment.save_atomic`."""
+    `Experiment.save_atomic`. Ignored for journals."""
+    journal: bool = False
+    """Append each new run to a journal (see `Experiment.save_journal`)
+    instead of rewriting every recorded run on each save. Requires the
+    experiment to implement `serialize_run`/`deserialize_run`."""
+    background: bool = True
+    """Write saves on a background thread while the next runs continue.
+
+    Only capturing the results (`Experiment.checkpoint`) happens between runs.
+    At most one save is written at a time, and `run_loop` waits for the last
+    one before returning, including when stopped by Ctrl+C."""
 
 
 def relative_margin_of_error(
@@ -81,6 +108,54 @@ def relative_margin_of_error(
     return margin_of_error / mean * 100
 
 
+@dataclass(slots=True)
+class ScoreStatistics:
+    """Running statistics over a sequence of scores, see `Experiment.statistics`.
+
+    Updated in constant time per score (Welford's algorithm), so checking them
+    doesn't go over every recorded score again.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    """`0.0` while `count` is `0`."""
+    last: float | None = None
+    """The most recently added score."""
+    _m2: float = field(default=0.0, init=False, repr=False)
+    """The sum of squared differences from the mean."""
+
+    @classmethod
+    def of(cls, scores: Iterable[float]) -> ScoreStatistics:
+        statistics = cls()
+        for score in scores:
+            statistics.add(score)
+        return statistics
+
+    def add(self, score: float) -> None:
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        self.last = score
+
+    def variance(self) -> float | None:
+        """The sample variance. None if there are less than 2 scores."""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+
+    def margin_of_error(self) -> float | None:
+        """The half-width of the 95% confidence interval for the mean.
+
+        None if there are less than 2 scores.
+        """
+        variance = self.variance()
+        if variance is None:
+            return None
+        t = scipy.stats.t.ppf(0.975, df=self.count - 1)
+        return float(t * math.sqrt(variance / self.count))
+
+
 class ExperimentDisplay:
     """Formats an `Experiment`'s status line for `run_loop`.
 
@@ -202,6 +277,9 @@ class Experiment(abc.ABC):
       `save_atomic`/`load_from`/`load_from_file` handle the file mechanics
       (atomic writes, path expansion, reading a path or an already-open file,
       optional zstd compression) generically on top of these two.
+      Optionally, `serialize_run` / `deserialize_run` do the same for a single
+      run, which enables journaled saving (`save_journal`,
+      `SaveConfig.journal`).
       Fingerprinting isn't part of this contract either: if you want to
       verify a loaded file against your current configuration, include your
       own `Fingerprint` in `serialize`'s output and check it in `deserialize`
@@ -229,6 +307,18 @@ class Experiment(abc.ABC):
     def scores(self) -> Sequence[float]:
         """Every score recorded so far, in the order the runs happened."""
 
+    def statistics(self) -> ScoreStatistics:
+        """Running statistics over `scores()`.
+
+        What `run_count`, `mean_score`, `margin_of_error`, `format_status` and
+        the stop conditions are computed from, several times per `run_loop`
+        iteration. The default goes over every score on each call; override it
+        to return statistics updated as runs are recorded (and rebuilt in
+        `deserialize`), so long campaigns don't do quadratic work. Callers must
+        not modify the returned object.
+        """
+        return ScoreStatistics.of(self.scores())
+
     def display(self) -> ExperimentDisplay:
         """Describes how `format_status` should render this experiment's score."""
         return ExperimentDisplay()
@@ -255,6 +345,55 @@ class Experiment(abc.ABC):
     def deserialize(self, content: str) -> None:
         """Restore results from a string previously produced by `serialize`."""
 
+    def serialize_run(self, index: int) -> str:
+        """Serialize only the run at `index`, for journaled saving.
+
+        Optional, the default raises `NotImplementedError`. `deserialize_run`
+        must be able to append the output to results restored by
+        `deserialize`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support journaled saving"
+        )
+
+    def deserialize_run(self, content: str) -> None:
+        """Append a run previously serialized by `serialize_run` to the results."""
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support journaled saving"
+        )
+
+    def save_journal(self, path: AnyPath) -> None:
+        """Start a new journal at `path` holding the current results, atomically.
+
+        Further runs can then be appended cheaply with `append_to_journal`,
+        instead of rewriting all results like `save_atomic` does. `load_from`
+        reads journals too, dropping a partially written last run left behind
+        by a crash.
+        """
+        meta = json.dumps({"base_runs": self.run_count()})
+        create_journal(path, [meta.encode(), self.serialize().encode()])
+
+    def append_to_journal(self, path: AnyPath, start: int) -> None:
+        """Append the runs from `start` onwards to the journal at `path`."""
+        append_records(
+            path,
+            [
+                self.serialize_run(index).encode()
+                for index in range(start, self.run_count())
+            ],
+        )
+
+    def load_journal(self, path: AnyPath) -> None:
+        """Restore results from a journal written by `save_journal`.
+
+        Truncates a partially written record at the end of the file, so the
+        journal can be appended to again.
+        """
+        _, base, *runs = read_journal(path, repair=True)
+        self.deserialize(base.decode())
+        for run in runs:
+            self.deserialize_run(run.decode())
+
     def save(self, path: AnyPath, *, compressed: bool = False) -> None:
         """Save current results to `path`.
 
@@ -281,22 +420,46 @@ class Experiment(abc.ABC):
         as `save`.
         """
         _warn_on_extension_mismatch(path, compressed=compressed)
-        destination = Path(path).expanduser()
-        fd, temp_name = tempfile.mkstemp(dir=destination.parent)
-        os.close(fd)
-        with open_text(temp_name, "wt", compressed=compressed) as temp:
-            temp.write(self.serialize())
-        os.replace(temp_name, destination)
+        _write_atomic(path, self.serialize(), compressed=compressed)
+
+    def snapshot(self) -> Callable[[], str]:
+        """Capture the current results, to be `serialize`d later.
+
+        `run_loop` calls this between runs and calls the returned function
+        on a background thread (see `SaveConfig.background`), so it must not
+        be affected by runs recorded in the meantime. The default serializes
+        right away, only leaving compression and writing to the background;
+        override it if something cheaper (e.g. copying the result containers)
+        is enough.
+        """
+        content = self.serialize()
+        return lambda: content
+
+    def checkpoint(self, path: AnyPath, *, compressed: bool) -> Callable[[], None]:
+        """Capture the current results, returning a function that saves them
+        to `path` like `save_atomic` does.
+
+        This is how `run_loop` saves on a background thread; the default
+        writes a `snapshot`. Override it, along with `save_atomic`, if results
+        aren't saved as a single file.
+        """
+        return functools.partial(
+            _write_atomic, path, self.snapshot(), compressed=compressed
+        )
 
     def load_from(self, path: AnyPath) -> None:
         """Restore results from `path`, previously written by `save`/`save_atomic`.
 
         Auto-detects whether `path` is zstd-compressed, so this works on a
         file saved with either `compressed=True` or `compressed=False`
-        without the caller needing to know which.
+        without the caller needing to know which. Journals written by
+        `save_journal` are detected as well, see `load_journal`.
 
         See `load_from_file` for a version that takes a file-like object.
         """
+        if is_journal(path):
+            self.load_journal(path)
+            return
         with open_text(path, "rt", compressed=is_compressed(path)) as f:
             self.load_from_file(f)
 
@@ -309,31 +472,91 @@ class Experiment(abc.ABC):
 
     def run_count(self) -> int:
         """Return the number of recorded runs."""
-        return len(self.scores())
+        return self.statistics().count
 
     def run_loop(
         self,
         *,
         stop_conditions: Sequence[StopCondition] = (),
         save_config: SaveConfig | None = None,
-    ) -> None:
-        """Keep running until a stop condition is met, including Ctrl+C."""
+        pipeline_depth: int = 0,
+    ) -> bool:
+        """Keep running until a stop condition is met, including Ctrl+C.
+
+        With a positive `pipeline_depth`, upcoming runs are prepared on a
+        background thread while the current one finishes, with at most
+        `pipeline_depth` prepared runs waiting at a time. Only supported by
+        `PipelinedExperiment`s, see there for details.
+
+        Returns `False` if stopped by Ctrl+C, so a caller running several
+        loops in a row can stop as well, and `True` otherwise.
+        """
+        if pipeline_depth < 0:
+            raise ValueError(
+                f"`pipeline_depth` ({pipeline_depth}) must not be negative"
+            )
+
+        pipeline: _Pipeline[object] | None = None
+        if pipeline_depth > 0:
+            if not isinstance(self, PipelinedExperiment):
+                raise TypeError(
+                    f"{type(self).__name__} doesn't support pipelined runs, "
+                    "it needs to be a `PipelinedExperiment`"
+                )
+            pipeline = _Pipeline(self, pipeline_depth)
 
         interrupted = _Interrupted()
         all_conditions = [*self.stop_conditions(), *stop_conditions, interrupted]
 
+        journal: _Journal | None = None
+        checkpointer: _Checkpointer | None = None
+        if save_config is not None:
+            if save_config.journal:
+                journal = _Journal(self, save_config.path)
+            elif save_config.background:
+                _warn_on_extension_mismatch(
+                    save_config.path, compressed=save_config.compressed
+                )
+            if save_config.background:
+                checkpointer = _Checkpointer()
+
+        def save() -> None:
+            assert save_config is not None
+            if journal is not None:
+                journal.record()
+                write = journal.flush
+            elif checkpointer is not None:
+                write = self.checkpoint(
+                    save_config.path, compressed=save_config.compressed
+                )
+            else:
+                self.save_atomic(save_config.path, compressed=save_config.compressed)
+                return
+
+            if checkpointer is None:
+                write()
+            else:
+                checkpointer.submit(write)
+
         dirty = False
         passed_seconds = 0.0
         start = time.monotonic()
 
-        with interrupted:
+        with (
+            interrupted,
+            checkpointer or contextlib.nullcontext(),
+            pipeline or contextlib.nullcontext(),
+        ):
             while True:
                 reason = _first_stop_reason(all_conditions, self)
                 if reason is not None:
                     logger.info(reason)
                     break
 
-                self.run()
+                if pipeline is None:
+                    self.run()
+                else:
+                    pipeline.run_next()
                 print(self.format_status(all_conditions))
                 dirty = True
 
@@ -346,13 +569,15 @@ class Experiment(abc.ABC):
                         logger.debug(
                             f"Passed {save_config.interval_seconds}s ({passed_seconds}) since last save"
                         )
-                        self.save_atomic(
-                            save_config.path, compressed=save_config.compressed
-                        )
+                        save()
                         passed_seconds = 0.0
 
-        if dirty and save_config is not None:
-            self.save_atomic(save_config.path, compressed=save_config.compressed)
+            # Still inside the `with`, so the checkpointer writes this last
+            # save before `run_loop` returns.
+            if dirty and save_config is not None:
+                save()
+
+        return not interrupted.triggered()
 
     def margin_of_error(self) -> float | None:
         """Return the margin of error (half-width of the 95% confidence interval)
@@ -360,22 +585,17 @@ class Experiment(abc.ABC):
 
         None if there are less than 2 results.
         """
-        scores = self.scores()
-        n = len(scores)
-        if n < 2:
-            return None
-        t = scipy.stats.t.ppf(0.975, df=n - 1)
-        return float(t * scipy.stats.sem(scores))
+        return self.statistics().margin_of_error()
 
     def mean_score(self) -> float | None:
         """Return the mean of the current set of scores.
 
         None if there are no results yet.
         """
-        scores = self.scores()
-        if not scores:
+        statistics = self.statistics()
+        if statistics.count == 0:
             return None
-        return float(sum(scores) / len(scores))
+        return statistics.mean
 
     def format_status(
         self, stop_conditions: Sequence[StopCondition] = ()
@@ -387,18 +607,292 @@ class Experiment(abc.ABC):
         it's `()` if called standalone, which `ExperimentDisplay` treats as
         "nothing configured" rather than anything meaningful to report on.
         """
-        scores = self.scores()
-        if not scores:
+        statistics = self.statistics()
+        if statistics.last is None:
             return None
         return self.display().format(
-            run_count=len(scores),
-            score=scores[-1],
-            mean=self.mean_score(),
-            margin_of_error=self.margin_of_error(),
+            run_count=statistics.count,
+            score=statistics.last,
+            mean=statistics.mean,
+            margin_of_error=statistics.margin_of_error(),
             stop_conditions=stop_conditions,
         )
 
 
+class PipelinedExperiment[T](Experiment):
+    """An `Experiment` whose runs are split into a preparation and a finishing step.
+
+    `run_loop(pipeline_depth=n)` calls `prepare_run` on a background thread,
+    keeping up to `n` prepared runs ahead of the one currently being finished
+    by `finish_run` on the calling thread. E.g. fault injection and decoding
+    for the next run can then overlap with inference for the current one. The
+    prepared runs are finished in the order they were prepared, so results are
+    recorded in the same order as with a plain `run`.
+
+    Because the two steps run concurrently:
+
+    - `prepare_run` must not record anything; runs that were prepared but not
+      finished when a stop condition fires are passed to `discard_run`
+      instead, in the order they were prepared.
+    - `prepare_run` and `finish_run` must not touch the same mutable state,
+      except through the prepared value handed from one to the other. Calls
+      to `prepare_run` never overlap each other, neither do calls to
+      `finish_run`.
+    - Stop conditions are only checked between calls to `finish_run`.
+
+    `run` simply calls both in sequence.
+    """
+
+    @abc.abstractmethod
+    def prepare_run(self) -> T:
+        """Do the part of a run that can happen ahead of time.
+
+        The result is passed to `finish_run`.
+        """
+
+    @abc.abstractmethod
+    def finish_run(self, prepared: T) -> None:
+        """Complete a run prepared by `prepare_run` and record its result."""
+
+    def discard_run(self, prepared: T) -> None:
+        """Drop a run prepared by `prepare_run` that won't be finished.
+
+        Called once the pipeline has stopped, so never concurrently with
+        `prepare_run`. Does nothing by default.
+        """
+        _ = prepared
+
+    @override
+    def run(self) -> None:
+        self.finish_run(self.prepare_run())
+
+
+def _write_atomic(
+    path: AnyPath, content: str | Callable[[], str], *, compressed: bool
+) -> None:
+    """Write `content` to `path` via a temporary file.
+
+    `content` may also be a `snapshot`, which is serialized here.
+    """
+    if callable(content):
+        content = content()
+    destination = Path(path).expanduser()
+    fd, temp_name = tempfile.mkstemp(dir=destination.parent)
+    os.close(fd)
+    with open_text(temp_name, "wt", compressed=compressed) as temp:
+        temp.write(content)
+    os.replace(temp_name, destination)
+
+
+class _Journal:
+    """`run_loop`'s journaled saving, see `SaveConfig.journal`.
+
+    Appends to an existing journal at `path` if it holds exactly the runs the
+    experiment has recorded (i.e. it was just loaded from there), and starts
+    a new one holding the current results otherwise.
+
+    Saving is split in two so the writing can happen on another thread:
+    `record` serializes the new runs, `flush` appends them to the file.
+    """
+
+    _experiment: Experiment
+    _path: Path
+    _recorded: int
+    """How many runs have been serialized, written or not."""
+    _unwritten: list[bytes]
+    _lock: threading.Lock
+
+    def __init__(self, experiment: Experiment, path: AnyPath) -> None:
+        self._experiment = experiment
+        self._path = Path(path).expanduser()
+        self._recorded = experiment.run_count()
+        self._unwritten = []
+        self._lock = threading.Lock()
+
+        if self._path.exists() and is_journal(self._path):
+            meta, _, *runs = read_journal(self._path)
+            if json.loads(meta)["base_runs"] + len(runs) == self._recorded:
+                return
+
+        experiment.save_journal(self._path)
+
+    def record(self) -> None:
+        """Serialize the runs recorded since the last call, for `flush`."""
+        run_count = self._experiment.run_count()
+        records = [
+            self._experiment.serialize_run(index).encode()
+            for index in range(self._recorded, run_count)
+        ]
+        self._recorded = run_count
+        with self._lock:
+            self._unwritten.extend(records)
+
+    def flush(self) -> None:
+        """Append every run serialized by `record` so far to the journal."""
+        with self._lock:
+            records, self._unwritten = self._unwritten, []
+        if records:
+            append_records(self._path, records)
+
+
+class _Checkpointer:
+    """Writes `run_loop`'s saves on a background thread, see `SaveConfig.background`.
+
+    At most one save is written at a time. A save submitted while another is
+    being written replaces any save still waiting, since each one writes
+    everything recorded up to that point. Leaving the context waits for the
+    last save; an error from a save is raised by the next `submit` or when
+    leaving the context.
+    """
+
+    _condition: threading.Condition
+    _pending: Callable[[], None] | None
+    _closing: bool
+    _error: BaseException | None
+    _thread: threading.Thread
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending = None
+        self._closing = False
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._write_loop, name="faultforge-checkpoint", daemon=True
+        )
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None,
+    ) -> None:
+        _ = exc, tb
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._thread.join()
+        if exc_type is None:
+            self._raise_if_failed()
+
+    def submit(self, save: Callable[[], None]) -> None:
+        with self._condition:
+            self._raise_if_failed()
+            self._pending = save
+            self._condition.notify()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closing:
+                    _ = self._condition.wait()
+                if self._pending is None:
+                    return
+                save, self._pending = self._pending, None
+
+            try:
+                save()
+            except BaseException as error:  # noqa: BLE001 - re-raised by `submit`/`__exit__`
+                logger.error(f"Saving in the background failed: {error}")
+                with self._condition:
+                    self._error = error
+
+
+@dataclass(slots=True, frozen=True)
+class _PreparationFailed:
+    """Carries an exception raised by `PipelinedExperiment.prepare_run` to the
+    thread that finishes the runs."""
+
+    error: BaseException
+
+
+class _Pipeline[T]:
+    """Prepares runs of a `PipelinedExperiment` on a background thread.
+
+    Used as a context manager for the duration of `run_loop`: entering starts
+    the thread, exiting stops it, passing any prepared runs that weren't
+    finished to `PipelinedExperiment.discard_run`. At most `depth` prepared
+    runs wait in the queue; the thread blocks until there's room for the next
+    one.
+    """
+
+    def __init__(self, experiment: PipelinedExperiment[T], depth: int) -> None:
+        self._experiment = experiment
+        self._queue: queue.Queue[T | _PreparationFailed] = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._unqueued: T | None = None
+        """A run prepared after the pipeline started stopping."""
+        self._thread = threading.Thread(
+            target=self._prepare_loop, name="faultforge-pipeline", daemon=True
+        )
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: types.TracebackType | None,
+    ) -> None:
+        _ = exc_type, exc, tb
+        self._stop.set()
+        # Keep draining so a thread blocked on a full queue notices the stop
+        # event. A run that's being prepared right now is still completed.
+        unfinished: list[T | _PreparationFailed] = []
+        while self._thread.is_alive():
+            with contextlib.suppress(queue.Empty):
+                unfinished.append(self._queue.get(timeout=_PIPELINE_POLL_SECONDS))
+        self._thread.join()
+        while not self._queue.empty():
+            unfinished.append(self._queue.get_nowait())
+        if self._unqueued is not None:
+            unfinished.append(self._unqueued)
+        for prepared in unfinished:
+            if not isinstance(prepared, _PreparationFailed):
+                self._experiment.discard_run(prepared)
+
+    def _prepare_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                prepared = self._experiment.prepare_run()
+            except BaseException as error:  # noqa: BLE001 - re-raised by `run_next`
+                _ = self._put(_PreparationFailed(error))
+                return
+            if not self._put(prepared):
+                self._unqueued = prepared
+
+    def _put(self, item: T | _PreparationFailed) -> bool:
+        """Queue `item`, returning `False` if the pipeline stopped first."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_PIPELINE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run_next(self) -> None:
+        """Finish the next prepared run, waiting for it if necessary."""
+        prepared = self._queue.get()
+        if isinstance(prepared, _PreparationFailed):
+            raise prepared.error
+        self._experiment.finish_run(prepared)
+
+
+_PIPELINE_POLL_SECONDS = 0.1
+"""How often `_Pipeline`'s threads check whether the pipeline is stopping."""
+
+
 class _Interrupted:
     """A `StopCondition` that fires once Ctrl+C has been received.
 
@@ -424,6 +918,9 @@ class _Interrupted:
         _ = exc_type, exc, tb
         _ = signal.signal(signal.SIGINT, self._original_handler)
 
+    def triggered(self) -> bool:
+        return self._triggered
+
     def _handle(self, sig: int, frame: types.FrameType | None) -> None:
         _ = sig, frame
         self._triggered = True
@@ -507,3 +1004,77 @@ class MaxRuns:
         if experiment.run_count() >= self.total:
             return f"Reached max run count ({self.total})"
         return None
+
+
+@dataclass(slots=True)
+class SequentialTest:
+    """A `StopCondition`: stop once the mean score is shown to be either
+    different from zero or within `margin` of it.
+
+    Meant for scores that are paired differences, like those of a
+    `PairedFaultInjection`: it stops as soon as one side is significantly
+    better than the other, or the difference between them is shown to be
+    negligible. A fixed-sample confidence interval checked after every run
+    would eventually exclude zero by chance alone, so this uses an asymptotic
+    confidence sequence instead (Waudby-Smith et al., "Time-uniform central
+    limit theory and asymptotic confidence sequences"), which holds at every
+    run count at once: the probability of ever stopping on the wrong side is
+    at most `alpha`.
+    """
+
+    margin: float
+    """Differences within ±`margin` (in the unit of the scores) are negligible."""
+    alpha: float = 0.05
+    """The error probability, over every check together."""
+    min_samples: int = 10
+    """Minimum number of runs before checking the stopping criterion, since the
+    sequence relies on the sample variance being a reasonable estimate."""
+    planned_runs: int = 100
+    """The run count around which the sequence is tightest. It's wider than a
+    fixed-sample interval everywhere, least so here."""
+
+    def __post_init__(self) -> None:
+        if self.margin < 0:
+            raise ValueError(f"Expected a non-negative margin, got {self.margin}")
+        if not 0 < self.alpha < 1:
+            raise ValueError(f"Expected 0 < alpha < 1, got {self.alpha}")
+        if self.planned_runs < 1:
+            raise ValueError(
+                f"Expected at least one planned run, got {self.planned_runs}"
+            )
+
+    def interval(self, statistics: ScoreStatistics) -> tuple[float, float] | None:
+        """The confidence sequence's interval for the mean after `statistics`.
+
+        None if there are less than 2 scores.
+        """
+        variance = statistics.variance()
+        if variance is None:
+            return None
+        log_alpha = -2 * math.log(self.alpha)
+        rho_squared = (log_alpha + math.log(log_alpha + 1)) / self.planned_runs
+        scale = statistics.count * rho_squared + 1
+        half_width = math.sqrt(
+            variance
+            * 2
+            * scale
+            / (statistics.count**2 * rho_squared)
+            * math.log(math.sqrt(scale) / self.alpha)
+        )
+        return (statistics.mean - half_width, statistics.mean + half_width)
+
+    def __call__(self, experiment: Experiment) -> str | None:
+        if experiment.run_count() < self.min_samples:
+            return None
+        interval = self.interval(experiment.statistics())
+        if interval is None:
+            return None
+        lower, upper = interval
+        bounds = f"{lower:.4g} to {upper:.4g}"
+        if lower > 0:
+            return f"The mean score is significantly above 0 ({bounds})"
+        if upper < 0:
+            return f"The mean score is significantly below 0 ({bounds})"
+        if -self.margin <= lower and upper <= self.margin:
+            return f"The mean score is within ±{self.margin:g} of 0 ({bounds})"
+        return None
@@ -0,0 +1,349 @@
+"""Choosing the bit error rates of an `EncodedFaultInjection` sweep while recording it.
+
+See `AdaptiveBerSearch`.
+"""
+
+import itertools
+import logging
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import final
+
+from faultforge._internal.common import AnyPath
+from faultforge._internal.experiment import (
+    AdditionalRuns,
+    SaveConfig,
+    StopCondition,
+    _first_stop_reason,
+)
+from faultforge._internal.experiments.encoded_memory import (
+    EncodedFaultInjection,
+    SavedResult,
+    _resolve_fault_count,
+)
+from faultforge._internal.fingerprint import FingerprintError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Point:
+    """A bit error rate chosen by `AdaptiveBerSearch`, with its experiment."""
+
+    bit_error_rate: float
+    experiment: EncodedFaultInjection
+    stop_conditions: Sequence[StopCondition]
+    path: Path | None
+
+    def mean_score(self) -> float:
+        mean = self.experiment.mean_score()
+        assert mean is not None, "every point gets its pilot runs first"
+        return mean
+
+    def is_done(self) -> bool:
+        return _first_stop_reason(self.stop_conditions, self.experiment) is not None
+
+
+@final
+class AdaptiveBerSearch:
+    """Records an `EncodedFaultInjection` at bit error rates chosen from the results so far.
+
+    A fixed grid spends most of its runs where the score is either unchanged
+    or already collapsed. The search instead starts from `initial_points`
+    rates spread evenly in log space between `lower` and `upper`, and then
+    repeatedly bisects (in log space) the interval whose mean scores differ
+    the most, which homes in on the knee of the reliability curve. Every new
+    point gets `pilot_runs` runs. Refining stops at `max_points` points, or
+    once no interval that can still be split (its midpoint has to flip a
+    different number of bits than both ends) changes by more than
+    `flat_threshold` score units.
+
+    The rest of `run_budget` then goes to the points whose mean is the least
+    certain (widest 95% confidence interval), `step_runs` at a time. Flat
+    points, whose mean is within `flat_threshold` of their neighbours', get
+    no more than their pilot runs, and neither does a point once its own
+    `point_stop_conditions()` (e.g. `Stability`) are met.
+
+    Each point is made with `experiment.with_faults`, and with an `output`
+    directory it's saved to `output / file_name(rate)` as a regular result
+    file, so the points can be compared and plotted like any other sweep.
+    Every result file in `output` that was recorded with the same
+    configuration at a rate between `lower` and `upper` is resumed as a point
+    before the search starts, whether or not the search would pick its rate
+    again. `run_budget` counts every recorded run, resumed ones included; a
+    point gets at least one run even if it's already spent.
+
+    A file in `output` that can't be resumed, e.g. because it was recorded
+    with another configuration, is left alone with a warning, and the search
+    doesn't record a point whose file it is. With `overwrite`, such a point is
+    recorded from scratch instead, replacing the file.
+    """
+
+    _experiment: EncodedFaultInjection
+    _lower: float
+    _upper: float
+    _run_budget: int
+    _initial_points: int
+    _pilot_runs: int
+    _max_points: int
+    _step_runs: int
+    _flat_threshold: float
+    _point_stop_conditions: Callable[[], Sequence[StopCondition]]
+    _output: Path | None
+    _file_name: Callable[[float], str]
+    _save_config: Callable[[Path], SaveConfig]
+    _pipeline_depth: int
+    _overwrite: bool
+    _points: list[_Point]
+    _unusable: set[int]
+    """Fault counts whose file can't be resumed and mustn't be overwritten."""
+
+    def __init__(
+        self,
+        experiment: EncodedFaultInjection,
+        lower: float,
+        upper: float,
+        *,
+        run_budget: int,
+        initial_points: int = 3,
+        pilot_runs: int = 5,
+        max_points: int = 8,
+        step_runs: int = 5,
+        flat_threshold: float = 1.0,
+        point_stop_conditions: Callable[[], Sequence[StopCondition]] = tuple,
+        output: AnyPath | None = None,
+        file_name: Callable[[float], str] = lambda rate: f"ber_{rate:g}.json",
+        autosave_seconds: float | None = None,
+        compressed: bool = False,
+        journal: bool = False,
+        pipeline_depth: int = 0,
+        overwrite: bool = False,
+    ) -> None:
+        if not 0.0 < lower < upper <= 1.0:
+            raise ValueError(
+                f"Expected 0 < lower < upper <= 1 for the bit error rates, "
+                f"got {lower} and {upper}"
+            )
+        if initial_points < 2:
+            raise ValueError(f"`initial_points` ({initial_points}) must be at least 2")
+        if max_points < initial_points:
+            raise ValueError(
+                f"`max_points` ({max_points}) must be at least `initial_points` "
+                f"({initial_points})"
+            )
+        if pilot_runs < 2 or step_runs < 1:
+            raise ValueError(
+                f"Expected at least 2 pilot runs ({pilot_runs}) and 1 step run "
+                f"({step_runs})"
+            )
+
+        self._experiment = experiment
+        self._lower = lower
+        self._upper = upper
+        self._run_budget = run_budget
+        self._initial_points = initial_points
+        self._pilot_runs = pilot_runs
+        self._max_points = max_points
+        self._step_runs = step_runs
+        self._flat_threshold = flat_threshold
+        self._point_stop_conditions = point_stop_conditions
+        self._output = None if output is None else Path(output).expanduser()
+        self._file_name = file_name
+        self._save_config = lambda path: SaveConfig(
+            path=path,
+            interval_seconds=autosave_seconds,
+            compressed=compressed,
+            journal=journal,
+        )
+        self._pipeline_depth = pipeline_depth
+        self._overwrite = overwrite
+        self._points = []
+        self._unusable = set()
+
+    def points(self) -> list[tuple[float, EncodedFaultInjection]]:
+        """Every recorded bit error rate with its experiment, in increasing order."""
+        return [(point.bit_error_rate, point.experiment) for point in self._points]
+
+    def run(self) -> bool:
+        """Record until the run budget is spent or no point needs more runs.
+
+        Returns `False` if stopped by Ctrl+C, like `Experiment.run_loop`.
+        """
+        self._resume()
+
+        ratio = self._upper / self._lower
+        steps = self._initial_points - 1
+        for index in range(self._initial_points):
+            rate = _round_rate(self._lower * ratio ** (index / steps))
+            if (point := self._add_point(rate)) is None:
+                continue
+            if not self._record_pilot(point):
+                return False
+
+        while len(self._points) < self._max_points and self._remaining_runs() > 0:
+            split = self._steepest_interval()
+            if split is None:
+                logger.info("Every interval is flat or can't be split further")
+                break
+            if (point := self._add_point(split)) is None:
+                continue
+            if not self._record_pilot(point):
+                return False
+
+        while (remaining := self._remaining_runs()) > 0:
+            candidates = [
+                point
+                for index, point in enumerate(self._points)
+                if not self._is_flat(index) and not point.is_done()
+            ]
+            if not candidates:
+                logger.info("No point needs more runs")
+                break
+            point = max(candidates, key=_uncertainty)
+            if not self._record(point, min(self._step_runs, remaining)):
+                return False
+
+        return True
+
+    def _remaining_runs(self) -> int:
+        recorded = sum(point.experiment.run_count() for point in self._points)
+        return self._run_budget - recorded
+
+    def _resume(self) -> None:
+        """Add a point for every result file in `output` recorded with this
+        configuration, within the searched range."""
+        if self._output is None or not self._output.is_dir():
+            return
+        total_bits = self._experiment.total_bits()
+        for path in sorted(self._output.iterdir()):
+            try:
+                fault_count = int(SavedResult.load(path).fingerprint.scalars["faults"])
+            except ValueError, OSError, KeyError:
+                # Not a result file, e.g. per-sample outcomes.
+                continue
+            rate = fault_count / total_bits
+            if not self._lower <= rate <= self._upper or any(
+                point.experiment.fault_count() == fault_count for point in self._points
+            ):
+                continue
+
+            experiment = self._experiment.with_faults(fault_count)
+            if not _load(experiment, path):
+                continue
+            self._insert(
+                _Point(
+                    bit_error_rate=rate,
+                    experiment=experiment,
+                    stop_conditions=self._point_stop_conditions(),
+                    path=path,
+                )
+            )
+            logger.info(f"Resumed {path} ({fault_count} faults)")
+
+    def _insert(self, point: _Point) -> None:
+        self._points.append(point)
+        self._points.sort(key=lambda point: point.bit_error_rate)
+
+    def _add_point(self, rate: float) -> _Point | None:
+        """Add a point for `rate`, unless one already flips as many bits or
+        its file can't be resumed (see `overwrite`)."""
+        fault_count = _resolve_fault_count(rate, self._experiment.total_bits())
+        if any(point.experiment.fault_count() == fault_count for point in self._points):
+            return None
+
+        experiment = self._experiment.with_faults(rate)
+        path = None
+        if self._output is not None:
+            self._output.mkdir(parents=True, exist_ok=True)
+            path = self._output / self._file_name(rate)
+            if path.exists() and not _load(experiment, path):
+                if not self._overwrite:
+                    self._unusable.add(fault_count)
+                    return None
+                logger.warning(f"Overwriting {path}")
+                experiment = self._experiment.with_faults(rate)
+
+        point = _Point(
+            bit_error_rate=rate,
+            experiment=experiment,
+            stop_conditions=self._point_stop_conditions(),
+            path=path,
+        )
+        self._insert(point)
+        logger.info(f"Recording bit error rate {rate:g} ({fault_count} faults)")
+        return point
+
+    def _record_pilot(self, point: _Point) -> bool:
+        """Top a new point up to `pilot_runs`, counting any it was resumed with."""
+        return self._record(point, self._pilot_runs - point.experiment.run_count())
+
+    def _record(self, point: _Point, runs: int) -> bool:
+        """Record up to `runs` more runs at `point`, fewer if out of budget or
+        its own stop conditions are met."""
+        runs = min(runs, self._remaining_runs())
+        if runs <= 0:
+            if point.experiment.run_count() > 0:
+                return True
+            # Every point needs a mean score to compare against.
+            runs = 1
+        return point.experiment.run_loop(
+            stop_conditions=[AdditionalRuns(runs), *point.stop_conditions],
+            save_config=None if point.path is None else self._save_config(point.path),
+            pipeline_depth=self._pipeline_depth,
+        )
+
+    def _steepest_interval(self) -> float | None:
+        """The log-space midpoint of the interval whose mean scores differ the
+        most, if it's steeper than `flat_threshold` and can be split."""
+        best: tuple[float, float] | None = None
+        for lower, upper in itertools.pairwise(self._points):
+            change = abs(upper.mean_score() - lower.mean_score())
+            if change <= self._flat_threshold:
+                continue
+            midpoint = _round_rate(
+                math.sqrt(lower.bit_error_rate * upper.bit_error_rate)
+            )
+            fault_count = _resolve_fault_count(midpoint, self._experiment.total_bits())
+            if fault_count in self._unusable or not (
+                lower.experiment.fault_count()
+                < fault_count
+                < upper.experiment.fault_count()
+            ):
+                continue
+            if best is None or change > best[0]:
+                best = (change, midpoint)
+        return None if best is None else best[1]
+
+    def _is_flat(self, index: int) -> bool:
+        """Whether the mean at `index` is within `flat_threshold` of its
+        neighbours' means."""
+        if len(self._points) < 2:
+            return False
+        mean = self._points[index].mean_score()
+        neighbours = self._points[max(index - 1, 0) : index + 2]
+        return all(
+            abs(neighbour.mean_score() - mean) <= self._flat_threshold
+            for neighbour in neighbours
+        )
+
+
+def _load(experiment: EncodedFaultInjection, path: Path) -> bool:
+    """Resume `experiment` from `path`, or warn and return `False` if it can't be."""
+    try:
+        experiment.load_from(path)
+    except (FingerprintError, ValueError) as error:
+        logger.warning(f"Not resuming {path}: {error}")
+        return False
+    return True
+
+
+def _round_rate(rate: float) -> float:
+    """`rate` to 3 significant digits, which keeps file names and labels short."""
+    return float(f"{rate:.3g}")
+
+
+def _uncertainty(point: _Point) -> float:
+    margin = point.experiment.margin_of_error()
+    return math.inf if margin is None else margin
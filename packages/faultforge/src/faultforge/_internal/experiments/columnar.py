@@ -0,0 +1,154 @@
+"""A binary columnar container for result files.
+
+A JSON header followed by typed numpy columns that are memory-mapped on read,
+so loading a result doesn't parse (or even read) large per-run data up front.
+
+The layout is:
+
+- an 8 byte magic number followed by the header length as a little-endian
+  `u64`,
+- the UTF-8 JSON header, whose `"columns"` entry maps each column name to its
+  dtype, element count and offset relative to the start of the column data,
+- the column data, starting at the first multiple of `_ALIGNMENT` after the
+  header, each column aligned to `_ALIGNMENT` as well.
+"""
+
+import json
+import mmap
+import os
+import tempfile
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, overload, override
+
+import numpy as np
+
+from faultforge._internal.common import AnyPath
+
+_MAGIC = b"FFCOLUMN"
+_LENGTH_DTYPE = np.dtype("<u8")
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def is_columnar(path: AnyPath) -> bool:
+    """Whether the file at `path` is in the columnar format."""
+    with open(Path(path).expanduser(), "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+def write_columns(
+    path: AnyPath, header: Mapping[str, Any], columns: Mapping[str, np.ndarray]
+) -> None:
+    """Write `header` and `columns` to `path`, atomically.
+
+    `header` must be JSON serializable and may not contain a `"columns"` key.
+    """
+    if "columns" in header:
+        raise ValueError("`columns` is reserved in the header")
+
+    layout: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, column in columns.items():
+        column = np.ascontiguousarray(column)
+        layout[name] = {
+            "dtype": column.dtype.newbyteorder("<").str,
+            "length": len(column),
+            "offset": offset,
+        }
+        offset = _align(offset + column.nbytes)
+
+    encoded_header = json.dumps({**header, "columns": layout}).encode()
+    data_start = _align(len(_MAGIC) + _LENGTH_DTYPE.itemsize + len(encoded_header))
+
+    destination = Path(path).expanduser()
+    fd, temp_name = tempfile.mkstemp(dir=destination.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_MAGIC)
+        f.write(np.array(len(encoded_header), dtype=_LENGTH_DTYPE).tobytes())
+        f.write(encoded_header)
+        for name, column in columns.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(np.ascontiguousarray(column, dtype=layout[name]["dtype"]).tobytes())
+        # Keep trailing alignment padding out of the file.
+        f.truncate(max(f.tell(), data_start))
+    os.replace(temp_name, destination)
+
+
+def read_columns(path: AnyPath) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Read a file written by `write_columns`.
+
+    The header is parsed eagerly, the columns are read-only views into a
+    memory map of the file, so only the parts that are accessed get read.
+    """
+    path = Path(path).expanduser()
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a columnar result file")
+        header_length = int(
+            np.frombuffer(f.read(_LENGTH_DTYPE.itemsize), dtype=_LENGTH_DTYPE)[0]
+        )
+        header = json.loads(f.read(header_length))
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    data_start = _align(len(_MAGIC) + _LENGTH_DTYPE.itemsize + header_length)
+    columns: dict[str, np.ndarray] = {}
+    for name, layout in header.pop("columns").items():
+        dtype = np.dtype(layout["dtype"])
+        length = layout["length"]
+        if length == 0:
+            columns[name] = np.empty(0, dtype=dtype)
+            continue
+        columns[name] = np.frombuffer(
+            data, dtype=dtype, count=length, offset=data_start + layout["offset"]
+        )
+    return header, columns
+
+
+class ColumnView(Sequence[int]):
+    """A read-only `Sequence[int]` over (part of) a column.
+
+    Elements come out as Python `int`s, like they would from a JSON result;
+    `array` gives access to the underlying numpy view for vectorized work.
+    """
+
+    __slots__ = ("_array",)
+
+    _array: np.ndarray
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._array = array
+
+    def array(self) -> np.ndarray:
+        return self._array
+
+    @override
+    def __len__(self) -> int:
+        return len(self._array)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[int]: ...
+    @override
+    def __getitem__(self, index: int | slice) -> int | Sequence[int]:
+        if isinstance(index, slice):
+            return ColumnView(self._array[index])
+        return int(self._array[index])
+
+    @override
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._array.tolist())
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    @override
+    def __repr__(self) -> str:
+        return f"ColumnView({self._array.tolist()!r})"
@@ -5,18 +5,28 @@ See `faultforge.experiments.encoded_memory` for a general overview.
 
 import copy
 import enum
+import io
+import itertools
 import logging
 import os
+import secrets
 import tempfile
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Literal, final, override
+from typing import IO, Annotated, Any, Literal, final, override
 
+import numpy as np
 import torch
 from pydantic import BaseModel, Field
 from torch import Tensor, nn
 
+from faultforge._internal.bits import (
+    bit_array,
+    popcount_counts,
+    popcount_histogram,
+    position_counts,
+)
 from faultforge._internal.common import (
     DEFAULT_BATCH_SIZE,
     DEFAULT_DEVICE,
@@ -24,21 +34,40 @@ from faultforge._internal.common import (
     AnyPath,
     DeviceLike,
     is_compressed,
+    open_binary_reader,
     open_text,
 )
 from faultforge._internal.dataset import BatchedDataset
-from faultforge._internal.dtype import EncodingDtype, FiDtype
+from faultforge._internal.dtype import EncodingDtype
 from faultforge._internal.encoding.abc import Encoder
 from faultforge._internal.encoding.nn import EncodedModule
 from faultforge._internal.experiment import (
     Experiment,
     ExperimentDisplay,
+    PipelinedExperiment,
+    ScoreStatistics,
+    StopCondition,
+    _first_stop_reason,
+)
+from faultforge._internal.experiments.columnar import (
+    ColumnView,
+    is_columnar,
+    read_columns,
+    write_columns,
 )
+from faultforge._internal.experiments.sample_outcomes import (
+    OutcomeWriter,
+    SampleOutcomes,
+)
+from faultforge._internal.experiments.screening import SensitivityScreen
+from faultforge._internal.experiments.strata import FaultSampling, FaultStrata
 from faultforge._internal.fault import BitFlip
 from faultforge._internal.fingerprint import Fingerprint
+from faultforge._internal.journal import is_journal, iter_journal, read_journal
+from faultforge._internal.json_stream import JsonStream
 from faultforge._internal.loading.abc import ModelBundle
 from faultforge._internal.progress import Progress, stage
-from faultforge._internal.tensor import bitwise_xor
+from faultforge._internal.tensor import nonzero_xor
 from faultforge._rust import Picker
 
 logger = logging.getLogger(__name__)
@@ -110,6 +139,41 @@ class BatchReliability:
         )
 
 
+@final
+@dataclass(slots=True)
+class _DeviceReliability:
+    """A `BatchReliability` whose correct count stays on the model's device.
+
+    Accumulating these instead of `BatchReliability` avoids a device sync per
+    batch; `EncodedFaultInjection._infer` syncs once per run instead.
+    """
+
+    correct: Tensor
+    """A 0-dim integer tensor."""
+    total: int
+
+    def __add__(self, other: _DeviceReliability) -> _DeviceReliability:
+        return _DeviceReliability(
+            correct=self.correct + other.correct, total=self.total + other.total
+        )
+
+    def to_host(self) -> BatchReliability:
+        """Copy the correct count to the host. Syncs with the device."""
+        return BatchReliability(correct=int(self.correct.item()), total=self.total)
+
+
+class ResultFormat(enum.StrEnum):
+    """On-disk formats for `SavedResult`."""
+
+    Json = "json"
+    """A single JSON document, optionally zstd-compressed. What
+    `Experiment.save` writes."""
+    Columnar = "columnar"
+    """A JSON header followed by binary columns for the per-run data, which
+    are memory-mapped when loaded. Much faster to load for results with
+    bitmasks."""
+
+
 class SimpleResult(BaseModel):
     """Correct/total accounting only."""
 
@@ -124,9 +188,15 @@ class DetailedRunResult(BaseModel):
     """A single run's correct/total accounting plus its bitwise-comparison data."""
 
     correct_count: int
-    bitmask: list[int]
+    bitmask: Sequence[int]
     """Flat list of nonzero xor values between the faulty and golden parameters,
-    across all parameter tensors."""
+    across all parameter tensors.
+
+    A `list` when loaded from JSON. Runs recorded in this process hold a
+    `ColumnView` over an unsigned numpy array of the dtype's width, and so do
+    runs loaded from a `ResultFormat.Columnar` file, as views into the
+    memory-mapped file. `faultforge.bits` works on either without iterating
+    over Python ints."""
 
 
 class DetailedResult(BaseModel):
@@ -150,6 +220,67 @@ class DetailedResult(BaseModel):
 ExperimentResult = Annotated[SimpleResult | DetailedResult, Field(discriminator="kind")]
 
 
+class BitStatistics(BaseModel):
+    """One run's faulty bits, aggregated into fixed-size histograms.
+
+    See `EncodedFaultInjection`'s `bit_statistics`. Unlike a bitmask, its size
+    doesn't depend on how many elements were affected, so it's cheap to
+    record for every run.
+    """
+
+    positions: list[int]
+    """How many elements had each bit position (0 is the LSB) faulty."""
+    popcounts: list[int]
+    """How many elements had each number of faulty bits, from 0 to the
+    dtype's bit width. Only affected elements are counted, so the first entry
+    is always 0."""
+
+    @classmethod
+    def measure(cls, bitmask: Sequence[int] | np.ndarray, width: int) -> BitStatistics:
+        """Aggregate a bitmask of values at most `width` bits wide."""
+        return cls(
+            positions=position_counts(bitmask, width).tolist(),
+            popcounts=popcount_counts(bitmask, width).tolist(),
+        )
+
+    def position_histogram(self) -> dict[int, int]:
+        """Like `faultforge.bits.bit_position_histogram` on the bitmask."""
+        return {bit: count for bit, count in enumerate(self.positions) if count}
+
+    def popcount_histogram(self) -> dict[int, int]:
+        """Like `faultforge.bits.popcount_histogram` on the bitmask."""
+        return {bits: count for bits, count in enumerate(self.popcounts) if count}
+
+    def residual_fault_count(self) -> int:
+        """Like `faultforge.bits.residual_fault_count` on the bitmask."""
+        return sum(bits * count for bits, count in enumerate(self.popcounts))
+
+
+class MetricCounts(BaseModel):
+    """Per-run correct counts for one of `EncodedFaultInjection`'s `extra_metrics`."""
+
+    total_items: int | None
+    """Like `SavedResult.total_items`, but for this metric."""
+    correct_counts: list[int]
+
+
+class _JournalRun(BaseModel):
+    """A single run as recorded in a journal, see `Experiment.serialize_run`."""
+
+    correct_counts: dict[ReliabilityMetric, int]
+    totals: dict[ReliabilityMetric, int]
+    bitmask: list[int] | None = None
+    bit_statistics: BitStatistics | None = None
+    seed: int | None = None
+    screened_out: bool | None = None
+
+    def reliability(self) -> dict[ReliabilityMetric, BatchReliability]:
+        return {
+            metric: BatchReliability(correct=correct, total=self.totals[metric])
+            for metric, correct in self.correct_counts.items()
+        }
+
+
 class SavedResult(BaseModel):
     """The on-disk shape of an `EncodedFaultInjection`'s results.
 
@@ -169,34 +300,268 @@ class SavedResult(BaseModel):
     it, the same rationale as `total_items`.
     """
     result: ExperimentResult
+    extra_results: dict[ReliabilityMetric, MetricCounts] = {}
+    """Counts for the metrics measured alongside `reliability_metric()` in the
+    same inference pass, see `EncodedFaultInjection`'s `extra_metrics`."""
+    outcomes_file: str | None = None
+    """The per-sample outcome side file, see `EncodedFaultInjection`'s
+    `outcomes_path`."""
+    bit_statistics: list[BitStatistics] | None = None
+    """Every run's `BitStatistics`, in run order, see `EncodedFaultInjection`'s
+    `bit_statistics`."""
+    seeds: list[int] | None = None
+    """The `Picker` seed every run's faulty bits were drawn with, in run order.
+
+    Reproduces a run's fault locations: they're the first `faults` indices
+    returned by `Picker(total_bits, seed)`, or `FaultStrata.draw(faults, seed)`
+    with stratified sampling. `None` for results recorded before seeds were.
+    """
+    screened_out: list[bool] | None = None
+    """Whether every run was screened out and recorded the fault-free model's
+    results instead of running inference, in run order. Only recorded with
+    `EncodedFaultInjection`'s `screening_tolerance`."""
 
     @classmethod
     def load(cls, path: AnyPath) -> SavedResult:
         """Load a single result file previously written by
-        `Experiment.save`/`save_atomic`.
+        `Experiment.save`/`save_atomic` or `SavedResult.save`.
 
         Unlike reconstructing an `EncodedFaultInjection`, this doesn't
         require the model/dataset that produced it - just the file itself.
+        The format (see `ResultFormat`) is detected automatically, and so are
+        journals written with `SaveConfig(journal=True)`.
         """
         path = Path(path).expanduser()
+        if is_columnar(path):
+            return cls._from_columns(*read_columns(path))
+        if is_journal(path):
+            return cls._from_journal(path)
         with open_text(path, "rt", compressed=is_compressed(path)) as f:
             return cls.model_validate_json(f.read())
 
+    def save(
+        self,
+        path: AnyPath,
+        *,
+        format: ResultFormat = ResultFormat.Json,
+        compressed: bool = False,
+    ) -> None:
+        """Save to `path` atomically, in the given `format`.
+
+        `compressed` only applies to `ResultFormat.Json`; columnar files are
+        never compressed so they can be memory-mapped.
+        """
+        destination = Path(path).expanduser()
+        match format:
+            case ResultFormat.Columnar:
+                write_columns(destination, *self._to_columns())
+            case ResultFormat.Json:
+                content = self._materialized().model_dump_json()
+                fd, temp_name = tempfile.mkstemp(dir=destination.parent)
+                os.close(fd)
+                with open_text(temp_name, "wt", compressed=compressed) as temp:
+                    temp.write(content)
+                os.replace(temp_name, destination)
+
+    def _to_columns(self) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        header = self.model_dump(
+            mode="json", exclude={"result", "bit_statistics", "seeds", "screened_out"}
+        )
+        header["result_kind"] = self.result.kind
+        columns = {
+            "correct_counts": np.array(self.result.correct_counts(), dtype=np.int64)
+        }
+
+        if self.bit_statistics is not None:
+            # Fixed-size per run, so they're stored as flattened 2D columns.
+            header["bit_width"] = (
+                len(self.bit_statistics[0].positions) if self.bit_statistics else 0
+            )
+            columns["bit_positions"] = np.array(
+                [stats.positions for stats in self.bit_statistics], dtype=np.int64
+            ).reshape(-1)
+            columns["bit_popcounts"] = np.array(
+                [stats.popcounts for stats in self.bit_statistics], dtype=np.int64
+            ).reshape(-1)
+
+        if self.seeds is not None:
+            columns["seeds"] = np.array(self.seeds, dtype=np.uint64)
+
+        if self.screened_out is not None:
+            columns["screened_out"] = np.array(self.screened_out, dtype=np.bool_)
+
+        if isinstance(self.result, DetailedResult):
+            lengths = [len(run.bitmask) for run in self.result.results]
+            offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+            _ = np.cumsum(lengths, out=offsets[1:])
+            values = np.concatenate(
+                [
+                    bit_array(run.bitmask).astype(np.uint64, copy=False)
+                    for run in self.result.results
+                ]
+                or [np.empty(0, dtype=np.uint64)]
+            )
+            # Bitmask values are at most as wide as the encoded dtype.
+            if values.size == 0 or int(values.max()) <= np.iinfo(np.uint32).max:
+                values = values.astype(np.uint32)
+            columns["bitmask_offsets"] = offsets
+            columns["bitmask_values"] = values
+
+        return header, columns
+
+    @classmethod
+    def _from_columns(
+        cls, header: dict[str, Any], columns: dict[str, np.ndarray]
+    ) -> SavedResult:
+        kind = header.pop("result_kind")
+        correct_counts = columns["correct_counts"].tolist()
+
+        if "bit_width" in header:
+            width = header.pop("bit_width")
+            runs = len(correct_counts)
+            positions = columns["bit_positions"].reshape(runs, width).tolist()
+            popcounts = columns["bit_popcounts"].reshape(runs, width + 1).tolist()
+            header["bit_statistics"] = [
+                {"positions": run_positions, "popcounts": run_popcounts}
+                for run_positions, run_popcounts in zip(
+                    positions, popcounts, strict=True
+                )
+            ]
+        if "seeds" in columns:
+            header["seeds"] = columns["seeds"].tolist()
+        if "screened_out" in columns:
+            header["screened_out"] = columns["screened_out"].tolist()
+
+        result: SimpleResult | DetailedResult
+        match kind:
+            case "simple":
+                result = SimpleResult(results=correct_counts)
+            case "detailed":
+                offsets = columns["bitmask_offsets"].tolist()
+                values = columns["bitmask_values"]
+                # Constructed without validation, which would copy every
+                # bitmask into a list.
+                result = DetailedResult.model_construct(
+                    results=[
+                        DetailedRunResult.model_construct(
+                            correct_count=correct,
+                            bitmask=ColumnView(values[start:end]),
+                        )
+                        for correct, start, end in zip(
+                            correct_counts, offsets[:-1], offsets[1:], strict=True
+                        )
+                    ]
+                )
+            case _:
+                raise ValueError(f"Unknown result kind {kind!r}")
+
+        loaded = cls.model_validate({**header, "result": SimpleResult(results=[])})
+        loaded.result = result
+        return loaded
+
+    @classmethod
+    def _from_journal(cls, path: Path) -> SavedResult:
+        _, base, *runs = read_journal(path)
+        loaded = cls.model_validate_json(base)
+        for content in runs:
+            loaded._append_journal_run(_JournalRun.model_validate_json(content))
+        return loaded
+
+    def _append_journal_run(self, run: _JournalRun) -> None:
+        results = run.reliability()
+        primary = results[self.reliability_metric()]
+        self.total_items = primary.total
+        if isinstance(self.result, DetailedResult):
+            assert run.bitmask is not None
+            self.result.results.append(
+                DetailedRunResult(correct_count=primary.correct, bitmask=run.bitmask)
+            )
+        else:
+            self.result.results.append(primary.correct)
+        if self.bit_statistics is not None:
+            assert run.bit_statistics is not None
+            self.bit_statistics.append(run.bit_statistics)
+        if self.seeds is not None:
+            assert run.seed is not None
+            self.seeds.append(run.seed)
+        if self.screened_out is not None:
+            assert run.screened_out is not None
+            self.screened_out.append(run.screened_out)
+        for metric, counts in self.extra_results.items():
+            counts.total_items = results[metric].total
+            counts.correct_counts.append(results[metric].correct)
+
+    def _journal_runs(self) -> Iterator[_JournalRun]:
+        """Every run, in the shape `_append_journal_run` takes."""
+        counts = {self.reliability_metric(): self.result.correct_counts()}
+        totals = {self.reliability_metric(): self.total_items}
+        for metric, extra in self.extra_results.items():
+            counts[metric] = extra.correct_counts
+            totals[metric] = extra.total_items
+        for index, run in enumerate(self.result.results):
+            yield _JournalRun(
+                correct_counts={
+                    metric: correct[index] for metric, correct in counts.items()
+                },
+                # Only unknown before the first run.
+                totals={metric: total or 0 for metric, total in totals.items()},
+                bitmask=list(run.bitmask)
+                if isinstance(run, DetailedRunResult)
+                else None,
+                bit_statistics=None
+                if self.bit_statistics is None
+                else self.bit_statistics[index],
+                seed=None if self.seeds is None else self.seeds[index],
+                screened_out=(
+                    None if self.screened_out is None else self.screened_out[index]
+                ),
+            )
+
+    def _materialized(self) -> SavedResult:
+        """A copy whose bitmasks are all `list`s, so it can be dumped to JSON."""
+        if not isinstance(self.result, DetailedResult) or all(
+            isinstance(run.bitmask, list) for run in self.result.results
+        ):
+            return self
+        result = DetailedResult(
+            results=[
+                DetailedRunResult(
+                    correct_count=run.correct_count, bitmask=list(run.bitmask)
+                )
+                for run in self.result.results
+            ]
+        )
+        return self.model_copy(update={"result": result})
+
     def reliability_metric(self) -> ReliabilityMetric:
         return ReliabilityMetric(self.fingerprint.scalars["reliability_metric"])
 
-    def scores(self) -> list[float]:
+    def metrics(self) -> list[ReliabilityMetric]:
+        """Every metric with recorded scores, `reliability_metric()` first."""
+        return [self.reliability_metric(), *self.extra_results]
+
+    def scores(self, metric: ReliabilityMetric | None = None) -> list[float]:
         """Every recorded run's score, in run order.
 
-        Empty if `total_items` is `None` (no run has completed yet),
-        mirroring `EncodedFaultInjection.scores()`.
+        Scored by `reliability_metric()` unless another recorded `metric` is
+        given. Raises `KeyError` if `metric` wasn't recorded.
+
+        Empty if no run has completed yet, mirroring
+        `EncodedFaultInjection.scores()`.
         """
-        if self.total_items is None:
+        if metric is None or metric == self.reliability_metric():
+            metric = self.reliability_metric()
+            total_items = self.total_items
+            correct_counts = self.result.correct_counts()
+        else:
+            counts = self.extra_results[metric]
+            total_items = counts.total_items
+            correct_counts = counts.correct_counts
+
+        if total_items is None:
             return []
-        metric = self.reliability_metric()
         return [
-            compute_score(metric, correct, self.total_items)
-            for correct in self.result.correct_counts()
+            compute_score(metric, correct, total_items) for correct in correct_counts
         ]
 
     def bit_error_rate(self) -> float:
@@ -205,6 +570,223 @@ class SavedResult(BaseModel):
         assert isinstance(faults, int)
         return faults / self.total_bits
 
+    def sample_outcomes(self, path: AnyPath | None = None) -> SampleOutcomes:
+        """Load the per-sample outcomes recorded alongside this result.
+
+        Read from `outcomes_file` unless another `path` is given (e.g. if the
+        side file was moved). Runs the side file has beyond the ones in this
+        result are ignored.
+        """
+        if path is None:
+            if self.outcomes_file is None:
+                raise ValueError("No per-sample outcomes were recorded")
+            path = self.outcomes_file
+
+        run_count = len(self.result.results)
+        outcomes = SampleOutcomes.load(path, max_runs=run_count)
+        if outcomes.run_count() != run_count:
+            raise ValueError(
+                f"{path} has outcomes for {outcomes.run_count()} runs, "
+                f"expected {run_count}"
+            )
+        return outcomes
+
+    def outcome_scores(
+        self,
+        metric: ReliabilityMetric,
+        *,
+        target_class: int | None = None,
+        outcomes: SampleOutcomes | None = None,
+    ) -> list[float]:
+        """Every run's score under `metric`, derived from the per-sample outcomes.
+
+        Works for any metric regardless of which ones were measured during
+        the experiment, except `ReliabilityMetric.Sdc`, which compares every
+        logit and can't be derived from top-1 outcomes. `target_class`
+        restricts the score to the samples of one class. `outcomes` defaults
+        to `sample_outcomes()`.
+        """
+        if outcomes is None:
+            outcomes = self.sample_outcomes()
+        mask = None if target_class is None else outcomes.class_mask(target_class)
+        return _outcome_scores(outcomes, metric, mask)
+
+    def class_scores(self, metric: ReliabilityMetric) -> dict[int, list[float]]:
+        """`outcome_scores` for every target class, keyed by class."""
+        outcomes = self.sample_outcomes()
+        return {
+            target_class: _outcome_scores(
+                outcomes, metric, outcomes.class_mask(target_class)
+            )
+            for target_class in outcomes.classes()
+        }
+
+
+class ResultReader:
+    """A saved result read lazily, for files too large to load whole.
+
+    Opening the file parses everything except the bitmasks, which `runs`
+    streams from the file when asked for, one run at a time; `summary` is
+    enough for anything that only needs scores, the bit error rate or the
+    fingerprint. JSON (optionally compressed) is parsed incrementally, so
+    memory use is bounded by the largest single run rather than the file;
+    columnar files and journals are read as well.
+    """
+
+    _path: Path
+    _summary: SavedResult
+    _has_bitmasks: bool
+
+    def __init__(self, path: AnyPath) -> None:
+        self._path = Path(path).expanduser()
+
+        if is_columnar(self._path):
+            loaded = SavedResult._from_columns(*read_columns(self._path))
+            self._has_bitmasks = isinstance(loaded.result, DetailedResult)
+            self._summary = loaded.model_copy(
+                update={"result": SimpleResult(results=loaded.result.correct_counts())}
+            )
+            return
+
+        header: dict[str, Any] = {}
+        if is_journal(self._path):
+            records = iter_journal(self._path)
+            _meta, base = next(records), next(records)
+            counts = [c for c, _ in _stream_json_runs(io.BytesIO(base), header)]
+            journal_runs: Iterable[bytes] = records
+        else:
+            with open_binary_reader(
+                self._path, compressed=is_compressed(self._path)
+            ) as f:
+                counts = [c for c, _ in _stream_json_runs(f, header)]
+            journal_runs = []
+
+        self._has_bitmasks = header["result"]["kind"] == "detailed"
+        self._summary = SavedResult.model_validate(
+            {**header, "result": {"kind": "simple", "results": counts}}
+        )
+        for content in journal_runs:
+            self._summary._append_journal_run(_JournalRun.model_validate_json(content))
+
+    def path(self) -> Path:
+        return self._path
+
+    def summary(self) -> SavedResult:
+        """Everything but the bitmasks, with the runs' correct counts as a
+        `SimpleResult`.
+
+        The fingerprint is kept exactly as recorded (including
+        `compare_bitwise`), so summaries group the same way the full results
+        would.
+        """
+        return self._summary
+
+    def has_bitmasks(self) -> bool:
+        """Whether the result was recorded with bitmasks, i.e. `runs` works."""
+        return self._has_bitmasks
+
+    def run_count(self) -> int:
+        return len(self._summary.result.results)
+
+    def runs(self) -> Iterator[DetailedRunResult]:
+        """Stream every run along with its bitmask, in run order.
+
+        Reads the file again on each call. Raises `ValueError` if no bitmasks
+        were recorded.
+        """
+        if not self._has_bitmasks:
+            raise ValueError(f"{self._path} was recorded without bitmasks")
+
+        if is_columnar(self._path):
+            loaded = SavedResult._from_columns(*read_columns(self._path))
+            assert isinstance(loaded.result, DetailedResult)
+            yield from loaded.result.results
+        elif is_journal(self._path):
+            records = iter_journal(self._path)
+            _meta, base = next(records), next(records)
+            yield from _detailed_runs(io.BytesIO(base))
+            metric = self._summary.reliability_metric()
+            for content in records:
+                run = _JournalRun.model_validate_json(content)
+                assert run.bitmask is not None
+                yield DetailedRunResult.model_construct(
+                    correct_count=run.correct_counts[metric], bitmask=run.bitmask
+                )
+        else:
+            with open_binary_reader(
+                self._path, compressed=is_compressed(self._path)
+            ) as f:
+                yield from _detailed_runs(f)
+
+
+def _stream_json_runs(
+    file: IO[bytes], header: dict[str, Any], *, bitmasks: bool = False
+) -> Iterator[tuple[int, list[int] | None]]:
+    """Walk a JSON `SavedResult`, yielding each run's correct count and (with
+    `bitmasks`) bitmask as it's read.
+
+    Every other field is collected into `header`, with `result` only holding
+    its `kind`; it's complete once the iterator is exhausted. Skipped
+    bitmasks are never decoded.
+    """
+    stream = JsonStream(file)
+    for key in stream.object_keys():
+        if key != "result":
+            header[key] = stream.read_value()
+            continue
+
+        result: dict[str, Any] = {}
+        header["result"] = result
+        for result_key in stream.object_keys():
+            if result_key != "results":
+                result[result_key] = stream.read_value()
+                continue
+
+            for _ in stream.array_items():
+                if stream.peek() != b"{":
+                    yield stream.read_value(), None
+                    continue
+
+                correct: int | None = None
+                bitmask: list[int] | None = None
+                for run_key in stream.object_keys():
+                    if run_key == "correct_count":
+                        correct = stream.read_value()
+                    elif run_key == "bitmask" and bitmasks:
+                        bitmask = stream.read_value()
+                    else:
+                        stream.skip_value()
+                if correct is None:
+                    raise ValueError("A run is missing its `correct_count`")
+                yield correct, bitmask
+
+
+def _detailed_runs(file: IO[bytes]) -> Iterator[DetailedRunResult]:
+    for correct, bitmask in _stream_json_runs(file, {}, bitmasks=True):
+        if bitmask is None:
+            raise ValueError("A run is missing its `bitmask`")
+        # Decoded JSON ints need no validation.
+        yield DetailedRunResult.model_construct(correct_count=correct, bitmask=bitmask)
+
+
+def _outcome_scores(
+    outcomes: SampleOutcomes, metric: ReliabilityMetric, mask: np.ndarray | None
+) -> list[float]:
+    total = outcomes.total(mask)
+    match metric:
+        case ReliabilityMetric.Accuracy:
+            counts = outcomes.correct_counts(mask)
+        case ReliabilityMetric.AccuracyDegradation:
+            counts = outcomes.golden_correct_count(mask) - outcomes.correct_counts(mask)
+        case ReliabilityMetric.Top1Sdc:
+            counts = outcomes.unchanged_counts(mask)
+        case ReliabilityMetric.Sdc:
+            raise ValueError(
+                "SDC compares every output logit and can't be derived from "
+                "per-sample outcomes"
+            )
+    return [compute_score(metric, int(count), total) for count in counts]
+
 
 def _discard_bitmasks(
     result: SimpleResult | DetailedResult, fingerprint: Fingerprint
@@ -219,11 +801,17 @@ def _discard_bitmasks(
     """
     if not isinstance(result, DetailedResult):
         return result, fingerprint
+    return result.discard_bitmasks(), _without_compare_bitwise(fingerprint)
+
 
-    updated_fingerprint = fingerprint.model_copy(
+def _without_compare_bitwise(fingerprint: Fingerprint) -> Fingerprint:
+    return fingerprint.model_copy(
         update={"scalars": {**fingerprint.scalars, "compare_bitwise": False}}
     )
-    return result.discard_bitmasks(), updated_fingerprint
+
+
+def _result_format(path: Path) -> ResultFormat:
+    return ResultFormat.Columnar if is_columnar(path) else ResultFormat.Json
 
 
 def discard_bitmasks_in_file(path: AnyPath) -> None:
@@ -233,35 +821,127 @@ def discard_bitmasks_in_file(path: AnyPath) -> None:
     file previously written by `Experiment.save`/`save_atomic` directly, so it
     doesn't require reconstructing the model/dataset that produced it. Writes
     back atomically, the same way `Experiment.save_atomic` does. Whichever
-    format (zstd-compressed or not) `path` was already in is preserved on
-    write-back. A no-op (besides rewriting the file) if bitmasks weren't
-    recorded in the first place.
+    format (columnar, zstd-compressed JSON or plain JSON) `path` was already
+    in is preserved on write-back (a journal is compacted to JSON). A no-op
+    (besides rewriting the file) if bitmasks weren't recorded in the first
+    place.
+
+    The file is read with a `ResultReader`, which skips over the bitmasks
+    without decoding them, so memory use stays bounded by the largest run
+    plus the per-run counts no matter how large the file is.
     """
     path = Path(path).expanduser()
-    compressed = is_compressed(path)
-    loaded = SavedResult.load(path)
-    result, fingerprint = _discard_bitmasks(loaded.result, loaded.fingerprint)
-    updated = SavedResult(
-        fingerprint=fingerprint,
-        total_items=loaded.total_items,
-        total_bits=loaded.total_bits,
-        result=result,
-    ).model_dump_json()
-
-    fd, temp_name = tempfile.mkstemp()
-    os.close(fd)
-    with open_text(temp_name, "wt", compressed=compressed) as temp:
-        temp.write(updated)
-    os.replace(temp_name, path)
-
-
-def _bit_histogram(bitmask: Sequence[int]) -> dict[int, int]:
-    """Count how many `bitmask` elements have each number of set bits."""
-    histogram: dict[int, int] = {}
-    for value in bitmask:
-        ones = value.bit_count()
-        histogram[ones] = histogram.get(ones, 0) + 1
-    return histogram
+    format = _result_format(path)
+    compressed = format == ResultFormat.Json and is_compressed(path)
+    reader = ResultReader(path)
+    summary = reader.summary()
+    if reader.has_bitmasks():
+        summary = summary.model_copy(
+            update={"fingerprint": _without_compare_bitwise(summary.fingerprint)}
+        )
+    summary.save(path, format=format, compressed=compressed)
+
+
+def compact_journal(
+    path: AnyPath, destination: AnyPath | None = None, *, compressed: bool = False
+) -> None:
+    """Fold a journal (see `SaveConfig.journal`) into a regular JSON result file.
+
+    Writes to `destination`, or replaces `path` if not given. Recording can
+    resume from either a journal or the compacted file.
+    """
+    path = Path(path).expanduser()
+    if not is_journal(path):
+        raise ValueError(f"{path} is not a journal")
+    SavedResult.load(path).save(
+        path if destination is None else destination,
+        format=ResultFormat.Json,
+        compressed=compressed,
+    )
+
+
+def convert_result_file(
+    path: AnyPath,
+    destination: AnyPath | None = None,
+    *,
+    format: ResultFormat,
+    compressed: bool = False,
+) -> None:
+    """Convert a saved result file to another `ResultFormat`.
+
+    Writes to `destination`, or replaces `path` if not given. `compressed`
+    applies to `ResultFormat.Json` only, see `SavedResult.save`.
+    """
+    path = Path(path).expanduser()
+    SavedResult.load(path).save(
+        path if destination is None else destination,
+        format=format,
+        compressed=compressed,
+    )
+
+
+def merge_results(results: Sequence[SavedResult]) -> SavedResult:
+    """Concatenate the runs of results recorded with the same configuration.
+
+    Meant for shards of one experiment recorded separately, e.g. on several
+    machines. Runs are kept in order, shard by shard, and deduplicated by
+    their seed (see `SavedResult.seeds`), so a run that made it into several
+    shards, e.g. because a merged result is merged again, only counts once;
+    if any result was recorded before seeds were, nothing is deduplicated.
+    The per-sample outcome side files aren't merged, the merged result has
+    none.
+
+    Raises `FingerprintError` if the results weren't recorded with the same
+    configuration, or `ValueError` if there are none.
+    """
+    if not results:
+        raise ValueError("Expected at least one result to merge")
+    first = results[0]
+    for result in results[1:]:
+        first.fingerprint.raise_if_differs(result.fingerprint)
+
+    deduplicate = all(result.seeds is not None for result in results)
+    merged = first.model_copy(
+        update={
+            "total_items": None,
+            "result": DetailedResult(results=[])
+            if isinstance(first.result, DetailedResult)
+            else SimpleResult(results=[]),
+            "extra_results": {
+                metric: MetricCounts(total_items=None, correct_counts=[])
+                for metric in first.extra_results
+            },
+            "outcomes_file": None,
+            "bit_statistics": None if first.bit_statistics is None else [],
+            "seeds": [] if deduplicate else None,
+            "screened_out": (
+                []
+                if all(result.screened_out is not None for result in results)
+                else None
+            ),
+        }
+    )
+    seen: set[int] = set()
+    for result in results:
+        for run in result._journal_runs():
+            if deduplicate:
+                assert run.seed is not None
+                if run.seed in seen:
+                    continue
+                seen.add(run.seed)
+            merged._append_journal_run(run)
+    return merged
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """A 64-bit seed for the run at `index` of a sequence seeded with `seed`.
+
+    Derived with numpy's `SeedSequence`, so the seeds of different indices
+    (and of different `seed`s) are statistically independent, unlike e.g.
+    `seed + index`.
+    """
+    sequence = np.random.SeedSequence(seed, spawn_key=(index,))
+    return int(sequence.generate_state(1, dtype=np.uint64)[0])
 
 
 @dataclass(slots=True, frozen=True)
@@ -276,8 +956,8 @@ class _FaultInjectionSummary:
     total_bits: int
     bit_histogram: dict[int, int] | None
     """Maps "faulty bits in one element" -> "how many elements had that many".
-    `None` when bitwise comparison wasn't recorded for this run
-    (`compare_bitwise=False`)."""
+    `None` when neither bitmasks nor bit statistics were recorded for this run
+    (`compare_bitwise=False`, `bit_statistics=False`)."""
 
     def bit_error_rate(self) -> float:
         return self.faults_injected / self.total_bits
@@ -311,10 +991,14 @@ class _Display(ExperimentDisplay):
     """`EncodedFaultInjection`'s display: names/units the score per metric."""
 
     def __init__(
-        self, metric: ReliabilityMetric, fault_summary: _FaultInjectionSummary | None
+        self,
+        metric: ReliabilityMetric,
+        fault_summary: _FaultInjectionSummary | None,
+        skipped_runs: tuple[int, int] | None = None,
     ) -> None:
         self._metric = metric
         self._fault_summary = fault_summary
+        self._skipped_runs = skipped_runs
 
     @override
     def score_name(self) -> str | None:
@@ -326,33 +1010,159 @@ class _Display(ExperimentDisplay):
 
     @override
     def extra(self) -> str | None:
-        if self._fault_summary is None:
-            return None
-        return "\n" + str(self._fault_summary)
+        parts: list[str] = []
+        if self._skipped_runs is not None:
+            skipped, screened = self._skipped_runs
+            parts.append(f" | Skipped inference: {skipped}/{screened} runs")
+        if self._fault_summary is not None:
+            parts.append("\n" + str(self._fault_summary))
+        return "".join(parts) or None
+
+
+@dataclass(slots=True, frozen=True)
+class _PreparedRun:
+    """A faulty model ready for inference, see `EncodedFaultInjection.prepare_run`."""
+
+    model: EncodedModule
+    """The faulty model, already decoded."""
+    bitmask: np.ndarray | None
+    """See `EncodedFaultInjection._compare_bitwise`."""
+    bit_statistics: BitStatistics | None
+    """Aggregated from `bitmask` if `bit_statistics` are recorded."""
+    seed: int
+    """The `Picker` seed the faulty bits were drawn with."""
+    screened_out: bool = False
+    """Whether screening showed that the model predicts like the fault-free
+    one, so its results stand in for inference."""
+
+
+@dataclass(slots=True, frozen=True)
+class _GoldenBatch:
+    """The golden model's output for one batch, as needed by the metrics."""
+
+    classifications: Tensor
+    logits: Tensor | None
+    """Only kept if `ReliabilityMetric.Sdc` is measured."""
+    targets: Tensor
+
+
+@dataclass(slots=True, frozen=True)
+class _InferenceResult:
+    """What `EncodedFaultInjection._infer` measured for one run."""
+
+    reliability: dict[ReliabilityMetric, BatchReliability]
+    outcomes: np.ndarray | None
+    """Boolean, `2 x samples`: whether each sample was classified correctly
+    and whether it kept the golden top-1 prediction. Only measured if
+    outcomes are recorded."""
+
+
+@dataclass(slots=True, frozen=True)
+class ReplayedRun:
+    """A recorded run recomputed from its seed, see `EncodedFaultInjection.replay`."""
+
+    seed: int
+    faulty_bits: np.ndarray
+    """The indices of the flipped bits in the encoded memory, in the order
+    they were drawn."""
+    bitmask: np.ndarray
+    """The nonzero xor values of the decoded faulty parameters and the golden
+    ones, like a `DetailedRunResult.bitmask`, whether or not bitmasks were
+    recorded."""
+    scores: dict[ReliabilityMetric, float]
+    """The score of every measured metric, see `EncodedFaultInjection`'s
+    `extra_metrics`."""
+    correct_count: int
+    """The correct count of the reliability metric, as recorded in
+    `SavedResult.result`."""
+    outcomes: np.ndarray | None
+    """Boolean, `2 x samples`, like the per-sample outcome side file's rows.
+    Only measured if outcomes are recorded."""
 
 
 @final
-class EncodedFaultInjection(Experiment):
-    """An experiment which emulates single-event upsets in the encoded memory that stores model parameters."""
+class EncodedFaultInjection(PipelinedExperiment[_PreparedRun]):
+    """An experiment which emulates single-event upsets in the encoded memory that stores model parameters.
+
+    Fault injection, decoding and the bitwise comparison happen in
+    `prepare_run`, inference in `finish_run`, so a pipelined `run_loop` can
+    prepare the next faulty model while the current one is being scored.
+
+    Besides `reliability_metric`, which is what `scores()` reports, any
+    `extra_metrics` are measured in the same inference pass and saved
+    alongside it (see `SavedResult.scores`). With `outcomes_path`, every run's
+    per-sample outcomes are appended to a binary side file, from which any
+    metric except SDC can be recomputed later (see `SavedResult.outcome_scores`).
+
+    `compare_bitwise` records every run's bitmask of faulty bits, which grows
+    with the number of affected elements. `bit_statistics` instead records
+    fixed-size per-run histograms of faulty bit positions and faulty bits per
+    element (see `BitStatistics`), which is enough for heatmaps and fault
+    summaries; the two can be combined.
+
+    Every run draws its faulty bits from a freshly seeded `Picker` and records
+    the seed (see `SavedResult.seeds`), so any run can be recomputed later with
+    `replay` instead of storing its bitmask. A `NestedFaultSweep` uses the
+    same seeds to record several fault counts at once, and a
+    `PairedFaultInjection` to compare two encoders on the same faults. With a
+    `seed`, run `i` is seeded with `derive_seed(seed, i)` rather than from OS
+    entropy (see `seed_runs`), which makes the recorded runs reproducible
+    regardless of how they're scheduled. With `sampling=FaultSampling.Stratified`, the
+    faulty bits are spread proportionally over bit positions and tensors
+    instead (see `FaultStrata`), which lowers the variance between runs.
+
+    With a `screening_tolerance`, runs that predict like the fault-free model
+    skip inference and record its results instead, which only makes sense
+    for metrics decided by the predictions: anything but SDC. At `0`, those
+    are the runs whose faults left every decoded parameter unchanged (e.g.
+    because they were all corrected), which is exact. A positive tolerance
+    (below `1`, where a prediction could flip) also skips runs whose
+    first-order `SensitivityScreen` bound is at most it; that's an estimate ignoring curvature, which can bias the scores, so
+    the tolerance is part of the fingerprint and every run records whether it
+    was skipped (see `SavedResult.screened_out`). The sensitivities are
+    computed once per encoding, optionally cached in `screening_cache`, and
+    `skipped_runs` reports how many runs were skipped.
+    """
 
+    _bundle: ModelBundle
     _model: EncodedModule
     _dataset: BatchedDataset
     _device: torch.device
     _dtype: torch.dtype
     _reliability_metric: ReliabilityMetric
+    _extra_metrics: list[ReliabilityMetric]
     _faulty_bit_count: int
     _total_bits: int
+    _strata: FaultStrata | None
+    """Only set with `FaultSampling.Stratified`."""
     _progress: Progress | None
     _fingerprint: Fingerprint
     _show_fault_summary: bool
+    _outcomes: OutcomeWriter | None
 
     _unencoded_golden: nn.Module | None
 
     # populated during first run
-    _golden_results: list[Tensor]
+    _golden_results: list[_GoldenBatch]
     _total_items: int | None
     _result: SimpleResult | DetailedResult
+    _statistics: ScoreStatistics
+    _extra_results: dict[ReliabilityMetric, MetricCounts]
     _last_fault_summary: _FaultInjectionSummary | None
+    _bit_statistics: list[BitStatistics] | None
+    _seeds: list[int] | None
+    _seed: int | None
+    _seed_offset: int
+    _next_seed_position: int
+    """The position in the results of the next run to be prepared."""
+    _screening_tolerance: float | None
+    _screening_cache: AnyPath | None
+    _screen: SensitivityScreen | None
+    """Only computed for a positive `_screening_tolerance`, along with
+    `_fault_free`."""
+    _fault_free: _InferenceResult | None
+    """Computed before the first screened run."""
+    _screened_out: list[bool] | None
 
     def __init__(
         self,
@@ -360,9 +1170,15 @@ class EncodedFaultInjection(Experiment):
         encoder: Encoder,
         reliability_metric: ReliabilityMetric,
         *,
+        extra_metrics: Sequence[ReliabilityMetric] = (),
+        outcomes_path: AnyPath | None = None,
         golden_is_encoded: bool = False,
         faults: int | float = 1,
+        sampling: FaultSampling = FaultSampling.Uniform,
+        screening_tolerance: float | None = None,
+        screening_cache: AnyPath | None = None,
         compare_bitwise: bool = False,
+        bit_statistics: bool = False,
         fault_summary: bool = False,
         preload_dataset: bool = True,
         dataset_batch_limit: int | None = None,
@@ -370,6 +1186,7 @@ class EncodedFaultInjection(Experiment):
         device: DeviceLike = DEFAULT_DEVICE,
         dtype: torch.dtype = DEFAULT_DTYPE,
         progress: Progress | None = None,
+        seed: int | None = None,
     ) -> None:
         self._progress = progress
         self._golden_results = []
@@ -377,9 +1194,16 @@ class EncodedFaultInjection(Experiment):
         self._result = (
             DetailedResult(results=[]) if compare_bitwise else SimpleResult(results=[])
         )
+        self._statistics = ScoreStatistics()
+        self._bit_statistics = [] if bit_statistics else None
+        self._seeds = []
+        self._next_seed_position = 0
+        self.seed_runs(seed)
         self._show_fault_summary = fault_summary
         self._last_fault_summary = None
+        self._outcomes = None if outcomes_path is None else OutcomeWriter(outcomes_path)
 
+        self._bundle = bundle
         model = bundle.load_model(device, dtype=dtype, progress=progress)
         if golden_is_encoded:
             self._unencoded_golden = None
@@ -387,9 +1211,36 @@ class EncodedFaultInjection(Experiment):
             self._unencoded_golden = copy.deepcopy(model)
 
         self._model = EncodedModule(model, encoder, progress=progress)
+        self._strata = _strata(self._model, sampling)
         self._device = torch.device(device)
         self._dtype = dtype
         self._reliability_metric = reliability_metric
+        self._extra_metrics = []
+        for metric in extra_metrics:
+            if metric != reliability_metric and metric not in self._extra_metrics:
+                self._extra_metrics.append(metric)
+        self._extra_results = {
+            metric: MetricCounts(total_items=None, correct_counts=[])
+            for metric in self._extra_metrics
+        }
+        if screening_tolerance is not None:
+            # At 1, a run's bound allows some logit to catch up with the top
+            # one, so it could flip a prediction.
+            if not 0 <= screening_tolerance < 1:
+                raise ValueError(
+                    "Expected a screening tolerance in [0, 1), got "
+                    f"{screening_tolerance}"
+                )
+            if ReliabilityMetric.Sdc in self._metrics():
+                raise ValueError(
+                    "Screening only shows that no prediction flips, but SDC "
+                    "counts any change of the logits"
+                )
+        self._screening_tolerance = screening_tolerance
+        self._screening_cache = screening_cache
+        self._screen = None
+        self._fault_free = None
+        self._screened_out = None if screening_tolerance is None else []
 
         self._dataset = bundle.load_dataset(batch_size, device, progress=progress)
         if dataset_batch_limit is not None and not preload_dataset:
@@ -424,25 +1275,21 @@ class EncodedFaultInjection(Experiment):
         if test_image_limit is not None:
             fingerprint.scalars["test_image_limit"] = test_image_limit
 
-        self._total_bits = self._model.bit_count()
-
-        if isinstance(faults, int):
-            if faults > self._total_bits:
-                raise ValueError(
-                    f"`faults` ({faults}) is greater than the number of bits in model parameters ({self._total_bits})"
-                )
-
-            self._faulty_bit_count = faults
-        elif isinstance(faults, float):
-            if faults > 1.0:
-                raise ValueError(
-                    f"`faults` ({faults}) is greater than 1.0 (floats are interpreted as the bit error rate)"
-                )
-
-            self._faulty_bit_count = int(round(faults * self._total_bits))
-            logger.debug(
-                f"Resolved bit error rate {faults} to {self._faulty_bit_count} faults"
+        # Only recorded when set so fingerprints of single-metric results
+        # don't change.
+        if self._extra_metrics:
+            fingerprint.scalars["extra_metrics"] = ",".join(
+                sorted(metric.value for metric in self._extra_metrics)
             )
+        if bit_statistics:
+            fingerprint.scalars["bit_statistics"] = True
+        if sampling != FaultSampling.Uniform:
+            fingerprint.scalars["sampling"] = sampling.value
+        if screening_tolerance is not None:
+            fingerprint.scalars["screening_tolerance"] = screening_tolerance
+
+        self._total_bits = self._model.bit_count()
+        self._faulty_bit_count = _resolve_fault_count(faults, self._total_bits)
 
         # Always store the resolved fault count rather than branching on
         # which of `faults`/`bit_error_rate` the caller passed in, so that
@@ -454,21 +1301,138 @@ class EncodedFaultInjection(Experiment):
 
         self._fingerprint = fingerprint
 
-    def _process_golden(self, golden_result: Tensor) -> Tensor:
-        """Run a function on the golden result after computing it.
+    def with_faults(
+        self, faults: int | float, *, outcomes_path: AnyPath | None = None
+    ) -> EncodedFaultInjection:
+        """A new experiment for another fault count, sharing this one's setup.
+
+        `faults` is interpreted like the constructor's. The encoded model, the
+        dataset and the golden results are shared instead of loaded, encoded
+        and computed again, so sweeping over several fault counts only pays
+        for them once; every other option carries over. The new experiment
+        starts out without results, and only records per-sample outcomes if
+        it's given its own `outcomes_path`. Its runs are seeded like this
+        one's, starting again from the first run index.
+        """
+        # Populated here so every sibling shares them rather than computing
+        # its own.
+        if not self._golden_results and self._requires_golden():
+            self._populate_golden()
+        self._prepare_screening()
+        return self._sibling(faults, outcomes_path)
+
+    def with_encoder(
+        self,
+        encoder: Encoder,
+        faults: int | float,
+        *,
+        dtype: torch.dtype | None = None,
+        outcomes_path: AnyPath | None = None,
+    ) -> EncodedFaultInjection:
+        """A new experiment for another encoder or dtype, sharing this one's dataset.
+
+        The model's parameters are encoded again with `encoder`, from the
+        unencoded golden model if there is one and `dtype` is unchanged, and
+        otherwise from the model loaded again (in `dtype`). The dataset is shared
+        rather than loaded again, and so are the golden results as long as
+        they don't depend on either change, i.e. the golden model is the
+        unencoded one and `dtype` is unchanged. `faults` is resolved against
+        the new encoding's size. Otherwise this works like `with_faults`.
+        """
+        dtype = self._dtype if dtype is None else dtype
+        shares_golden = self._unencoded_golden is not None and dtype == self._dtype
+        if shares_golden and not self._golden_results and self._requires_golden():
+            self._populate_golden()
 
-        This enables processing the results only once. The result will be given to
-        the batch reliability functions.
+        if dtype == self._dtype and self._unencoded_golden is not None:
+            model = copy.deepcopy(self._unencoded_golden)
+        else:
+            # Not decoded from `_model`: lossy encodings like MSET and CEP
+            # overwrite parameter bits, so only a fresh load gives the
+            # original parameters back.
+            model = self._bundle.load_model(
+                self._device, dtype=dtype, progress=self._progress
+            )
+
+        sibling = copy.copy(self)
+        if self._unencoded_golden is not None and not shares_golden:
+            sibling._unencoded_golden = copy.deepcopy(model)
+        sibling._model = EncodedModule(model, encoder, progress=self._progress)
+        if self._strata is not None:
+            sibling._strata = _strata(sibling._model, FaultSampling.Stratified)
+        sibling._total_bits = sibling._model.bit_count()
+        sibling._dtype = dtype
+        sibling._fingerprint = self._fingerprint.model_copy(deep=True)
+        sibling._fingerprint.scalars["dtype"] = EncodingDtype.from_torch(dtype).value
+        sibling._fingerprint.children["encoder"] = [encoder.fingerprint()]
+        if not shares_golden:
+            sibling._golden_results = []
+        sibling._screen = None
+        sibling._fault_free = None
+        return sibling._sibling(faults, outcomes_path)
+
+    def _sibling(
+        self, faults: int | float, outcomes_path: AnyPath | None
+    ) -> EncodedFaultInjection:
+        """A copy sharing this one's setup for `faults`, without any results."""
+        sibling = copy.copy(self)
+        sibling._faulty_bit_count = _resolve_fault_count(faults, self._total_bits)
+        sibling._fingerprint = self._fingerprint.model_copy(deep=True)
+        sibling._fingerprint.scalars["faults"] = sibling._faulty_bit_count
+        sibling._outcomes = (
+            None if outcomes_path is None else OutcomeWriter(outcomes_path)
+        )
+        sibling._total_items = self._total_items if self._golden_results else None
+        sibling._result = (
+            DetailedResult(results=[])
+            if isinstance(self._result, DetailedResult)
+            else SimpleResult(results=[])
+        )
+        sibling._statistics = ScoreStatistics()
+        sibling._extra_results = {
+            metric: MetricCounts(total_items=None, correct_counts=[])
+            for metric in self._extra_metrics
+        }
+        sibling._bit_statistics = None if self._bit_statistics is None else []
+        sibling._seeds = []
+        sibling._seed_offset = 0
+        sibling._next_seed_position = 0
+        sibling._screened_out = None if self._screened_out is None else []
+        sibling._last_fault_summary = None
+        return sibling
+
+    def seed_runs(self, seed: int | None, *, offset: int = 0) -> None:
+        """Seed every following run from `seed`, or from OS entropy if `None`.
+
+        The run at position `p` of the results (resumed ones included) gets
+        its faulty bits from `derive_seed(seed, offset + p)`, so recording
+        the same number of runs with the same seed gives the same results,
+        no matter whether they're pipelined or resumed in between. `offset`
+        places the runs within a larger sequence, e.g. when several shards
+        (see `merge_results`) record disjoint ranges of run indices.
         """
-        match self._reliability_metric:
-            case (
-                ReliabilityMetric.Top1Sdc
-                | ReliabilityMetric.Accuracy
-                | ReliabilityMetric.AccuracyDegradation
-            ):
-                return golden_result.argmax(dim=1)
-            case ReliabilityMetric.Sdc:
-                return golden_result
+        if seed is not None and not 0 <= seed < 2**64:
+            raise ValueError(f"Expected a 64-bit unsigned seed, got {seed}")
+        self._seed = seed
+        self._seed_offset = offset
+
+    def fault_count(self) -> int:
+        """The number of bits flipped in every run, `faults` resolved."""
+        return self._faulty_bit_count
+
+    def total_bits(self) -> int:
+        """The size (in bits) of the encoded memory, see `SavedResult.total_bits`."""
+        return self._total_bits
+
+    def _metrics(self) -> list[ReliabilityMetric]:
+        """Every measured metric, `self._reliability_metric` first."""
+        return [self._reliability_metric, *self._extra_metrics]
+
+    def _requires_golden(self) -> bool:
+        # Per-sample outcomes are compared against the golden predictions.
+        if self._outcomes is not None:
+            return True
+        return any(metric.requires_golden() for metric in self._metrics())
 
     def _populate_golden(self):
         """Populate the golden results.
@@ -478,6 +1442,7 @@ class EncodedFaultInjection(Experiment):
         injected faults.
         """
         total_items = 0
+        keep_logits = ReliabilityMetric.Sdc in self._metrics()
 
         golden: nn.Module = self._unencoded_golden or self._model
 
@@ -492,9 +1457,13 @@ class EncodedFaultInjection(Experiment):
             ):
                 for batch in self._dataset:
                     logits = golden.forward(batch.inputs.to(dtype=self._dtype))
-                    processed = self._process_golden(logits)
-                    total_items += processed.numel()
-                    self._golden_results.append(processed)
+                    golden_batch = _GoldenBatch(
+                        classifications=logits.argmax(dim=1),
+                        logits=logits if keep_logits else None,
+                        targets=batch.targets,
+                    )
+                    total_items += _batch_total(self._reliability_metric, logits)
+                    self._golden_results.append(golden_batch)
                     s.advance()
         finally:
             self._dataset.reset()
@@ -518,9 +1487,28 @@ class EncodedFaultInjection(Experiment):
             return []
         return [self._score(correct) for correct in self._result.correct_counts()]
 
+    @override
+    def statistics(self) -> ScoreStatistics:
+        return self._statistics
+
     @override
     def display(self) -> ExperimentDisplay:
-        return _Display(self._reliability_metric, self._last_fault_summary)
+        return _Display(
+            self._reliability_metric,
+            self._last_fault_summary,
+            skipped_runs=(
+                None
+                if self._screened_out is None
+                else (sum(self._screened_out), len(self._screened_out))
+            ),
+        )
+
+    def skipped_runs(self) -> int | None:
+        """How many of the recorded runs were screened out and skipped
+        inference, resumed ones included. None without screening."""
+        if self._screened_out is None:
+            return None
+        return sum(self._screened_out)
 
     def discard_bitmasks(self) -> None:
         """Drop any recorded bitmasks, converting to the simpler result kind.
@@ -531,14 +1519,55 @@ class EncodedFaultInjection(Experiment):
             self._result, self._fingerprint
         )
 
-    @override
-    def serialize(self) -> str:
+    def _saved_result(self) -> SavedResult:
         return SavedResult(
             fingerprint=self._fingerprint,
             total_items=self._total_items,
             total_bits=self._total_bits,
             result=self._result,
-        ).model_dump_json()
+            extra_results=self._extra_results,
+            outcomes_file=(
+                None if self._outcomes is None else str(self._outcomes.path().resolve())
+            ),
+            bit_statistics=self._bit_statistics,
+            seeds=self._seeds,
+            screened_out=self._screened_out,
+        )
+
+    @override
+    def serialize(self) -> str:
+        return self._saved_result()._materialized().model_dump_json()
+
+    @override
+    def snapshot(self) -> Callable[[], str]:
+        # Recorded runs are never modified, only appended to these lists, so
+        # copying the lists is enough to keep later runs out of the snapshot.
+        saved = self._saved_result()
+        saved.result = saved.result.model_copy(
+            update={"results": list(saved.result.results)}
+        )
+        saved.extra_results = {
+            metric: counts.model_copy(
+                update={"correct_counts": list(counts.correct_counts)}
+            )
+            for metric, counts in saved.extra_results.items()
+        }
+        if saved.bit_statistics is not None:
+            saved.bit_statistics = list(saved.bit_statistics)
+        if saved.seeds is not None:
+            saved.seeds = list(saved.seeds)
+        if saved.screened_out is not None:
+            saved.screened_out = list(saved.screened_out)
+        return lambda: saved._materialized().model_dump_json()
+
+    @override
+    def load_from(self, path: AnyPath) -> None:
+        if is_columnar(path):
+            raise ValueError(
+                f"{path} is in the columnar format, which can't be recorded to. "
+                "Convert it to JSON first (see `convert_result_file`)"
+            )
+        super().load_from(path)
 
     @override
     def deserialize(self, content: str) -> None:
@@ -547,60 +1576,107 @@ class EncodedFaultInjection(Experiment):
         self._total_items = loaded.total_items
         self._total_bits = loaded.total_bits
         self._result = loaded.result
+        self._statistics = ScoreStatistics.of(self.scores())
+        self._extra_results = loaded.extra_results
+        self._bit_statistics = loaded.bit_statistics
+        # Results recorded before seeds were can't be given any.
+        self._seeds = loaded.seeds
+        self._screened_out = loaded.screened_out
+        self._next_seed_position = len(self._result.results)
+        if loaded.outcomes_file is not None and self._outcomes is None:
+            logger.warning(
+                f"Per-sample outcomes were recorded to {loaded.outcomes_file}, "
+                "but aren't recorded anymore; the reference to them is dropped"
+            )
 
-    def _inject_faults(self) -> EncodedModule:
-        """Clone the model and flip `self._faulty_bit_count` unique random bits in it."""
-        picker = Picker(self._model.bit_count())
+    def _truncate(self, run_count: int) -> None:
+        """Drop every recorded run after the first `run_count`."""
+        del self._result.results[run_count:]
+        self._statistics = ScoreStatistics.of(self.scores())
+        for counts in self._extra_results.values():
+            del counts.correct_counts[run_count:]
+        if self._bit_statistics is not None:
+            del self._bit_statistics[run_count:]
+        if self._seeds is not None:
+            del self._seeds[run_count:]
+        if self._screened_out is not None:
+            del self._screened_out[run_count:]
+        self._next_seed_position = len(self._result.results)
+
+    def _inject_faults(self, seed: int) -> EncodedModule:
+        """Clone the model and flip `self._faulty_bit_count` unique bits in it,
+        drawn from a `Picker` seeded with `seed`."""
+        return self._apply_faults(self._faulty_bits(seed))
+
+    def _faulty_bits(self, seed: int) -> list[tuple[BitFlip, int]]:
+        if self._strata is not None:
+            bits = self._strata.draw(self._faulty_bit_count, seed)
+            return [(BitFlip(), bit) for bit in bits]
+        picker = Picker(self._model.bit_count(), seed)
+        return _fault_targets(picker, self._faulty_bit_count)
+
+    def _apply_faults(self, fault_targets: list[tuple[BitFlip, int]]) -> EncodedModule:
         model = self._model.clone()
         with stage(self._progress, "Fault Injection"):
-            fault_targets: list[tuple[BitFlip, int]] = []
-            for _ in range(self._faulty_bit_count):
-                try:
-                    fault_target = next(picker)
-                except StopIteration:
-                    raise RuntimeError(
-                        "Expected fault targets to be within range but picker is exhausted"
-                    )
-                fault_targets.append((BitFlip(), fault_target))
-
             model.apply_faults(fault_targets)
         return model
 
-    def _compare_bitwise(self, model: EncodedModule) -> list[int] | None:
+    def _next_seed(self) -> int:
+        """The seed of the next run to be prepared, see `seed_runs`."""
+        position = self._next_seed_position
+        self._next_seed_position += 1
+        if self._seed is None:
+            return secrets.randbits(64)
+        return derive_seed(self._seed, self._seed_offset + position)
+
+    def _compare_bitwise(self, model: EncodedModule) -> np.ndarray | None:
         """Bitwise-compare `model`'s decoded parameters against the golden ones.
 
-        Returns the flat list of nonzero (unsigned) xor values across all
-        parameter tensors, or `None` when `compare_bitwise=False` (i.e.
-        `self._result` isn't a `DetailedResult`).
+        Returns the nonzero xor values across all parameter tensors as one
+        unsigned array, or `None` when neither bitmasks nor bit statistics are
+        recorded.
         """
-        if not isinstance(self._result, DetailedResult):
+        if (
+            not isinstance(self._result, DetailedResult)
+            and self._bit_statistics is None
+        ):
             return None
+        return self._decoded_difference(model)
 
+    def _decoded_difference(self, model: EncodedModule) -> np.ndarray:
+        """The nonzero xor values of `model`'s decoded parameters and the
+        golden ones, see `_compare_bitwise`."""
         faulty_params = list(model.decode().parameters())
         if self._unencoded_golden is not None:
             golden_params = list(self._unencoded_golden.parameters())
         else:
             golden_params = list(self._model.decode().parameters())
 
-        # `xor` is a bitcast view of a signed dtype (see `bitwise_xor`), so
-        # e.g. an all-ones 32-bit pattern comes back as `-1`. Masking to the
-        # dtype's bit width recovers the true unsigned bit pattern, relying
-        # on Python's arbitrary-precision two's-complement semantics
-        # (`-1 & 0xFFFFFFFF == 0xFFFFFFFF`).
-        mask = (1 << FiDtype.from_torch(self._dtype).bit_width()) - 1
-
         with stage(self._progress, "Bitwise Comparison", total=len(golden_params)) as s:
-            bitmask: list[int] = []
+            parts: list[np.ndarray] = []
             for faulty, golden in zip(faulty_params, golden_params, strict=True):
-                xor = bitwise_xor(faulty, golden)
-                bitmask.extend(value & mask for value in xor[xor != 0].tolist())
+                parts.append(nonzero_xor(faulty, golden))
                 s.advance()
 
-        return bitmask
+        if not parts:
+            return np.empty(0, dtype=np.uint64)
+        return np.concatenate(parts)
 
-    def _infer(self, model: EncodedModule) -> BatchReliability:
-        """Run inference on `model` over the dataset, scored by `self._reliability_metric`."""
-        result = BatchReliability(correct=0, total=0)
+    def _infer(self, model: EncodedModule) -> _InferenceResult:
+        """Run inference on `model` over the dataset, scored by every measured metric.
+
+        The counts (and per-sample outcomes) are accumulated on the device and
+        copied to the host once at the end.
+        """
+        metrics = self._metrics()
+        accumulated = {
+            metric: _DeviceReliability(
+                correct=torch.zeros((), dtype=torch.int64, device=self._device),
+                total=0,
+            )
+            for metric in metrics
+        }
+        outcome_batches: list[Tensor] = []
         with (
             stage(self._progress, "Inference", total=self._dataset.batch_count()) as s,
             torch.no_grad(),
@@ -608,38 +1684,117 @@ class EncodedFaultInjection(Experiment):
             for batch_index, batch in enumerate(self._dataset):
                 # n_batches x n_classes
                 logits = model.forward(batch.inputs.to(dtype=self._dtype))
+                golden = (
+                    self._golden_results[batch_index] if self._golden_results else None
+                )
 
-                match self._reliability_metric:
-                    case ReliabilityMetric.Accuracy:
-                        batch_result = _batch_accuracy(logits, batch.targets)
-                    case ReliabilityMetric.AccuracyDegradation:
-                        batch_result = _batch_accuracy_degradation(
-                            logits, self._golden_results[batch_index], batch.targets
-                        )
-                    case ReliabilityMetric.Sdc:
-                        batch_result = _batch_sdc(
-                            logits, self._golden_results[batch_index]
-                        )
-                    case ReliabilityMetric.Top1Sdc:
-                        batch_result = _batch_critical_sdc(
-                            logits, self._golden_results[batch_index]
-                        )
-
-                result += batch_result
+                for metric in metrics:
+                    accumulated[metric] += _batch_reliability(
+                        metric, logits, golden, batch.targets
+                    )
+                if self._outcomes is not None:
+                    assert golden is not None
+                    outcome_batches.append(
+                        _batch_outcomes(logits, golden.classifications, batch.targets)
+                    )
                 s.advance()
 
         self._dataset.reset()
-        return result
+
+        # A single sync for all metrics.
+        corrects = torch.stack([r.correct for r in accumulated.values()]).tolist()
+        return _InferenceResult(
+            reliability={
+                metric: BatchReliability(correct=int(correct), total=result.total)
+                for (metric, result), correct in zip(
+                    accumulated.items(), corrects, strict=True
+                )
+            },
+            outcomes=(
+                torch.cat(outcome_batches, dim=1).cpu().numpy()
+                if outcome_batches
+                else None
+            ),
+        )
+
+    def _record_outcomes(self, outcomes: np.ndarray | None) -> None:
+        """Append a run's per-sample outcomes to the side file, if recorded."""
+        if self._outcomes is None:
+            return
+        assert outcomes is not None
+
+        if not self._outcomes.is_open():
+            targets = torch.cat([golden.targets for golden in self._golden_results])
+            golden_classifications = torch.cat(
+                [golden.classifications for golden in self._golden_results]
+            )
+            self._outcomes.open(
+                targets.cpu().numpy(),
+                (golden_classifications == targets).cpu().numpy(),
+                run_count=len(self._result.results),
+            )
+
+        self._outcomes.append(correct=outcomes[0], unchanged=outcomes[1])
+
+    @override
+    def serialize_run(self, index: int) -> str:
+        bitmask: list[int] | None = None
+        if isinstance(self._result, DetailedResult):
+            run = self._result.results[index]
+            correct, bitmask = run.correct_count, list(run.bitmask)
+        else:
+            correct = self._result.results[index]
+
+        assert self._total_items is not None
+        correct_counts = {self._reliability_metric: correct}
+        totals = {self._reliability_metric: self._total_items}
+        for metric, counts in self._extra_results.items():
+            assert counts.total_items is not None
+            correct_counts[metric] = counts.correct_counts[index]
+            totals[metric] = counts.total_items
+
+        return _JournalRun(
+            correct_counts=correct_counts,
+            totals=totals,
+            bitmask=bitmask,
+            bit_statistics=(
+                None if self._bit_statistics is None else self._bit_statistics[index]
+            ),
+            seed=None if self._seeds is None else self._seeds[index],
+            screened_out=(
+                None if self._screened_out is None else self._screened_out[index]
+            ),
+        ).model_dump_json()
+
+    @override
+    def deserialize_run(self, content: str) -> None:
+        run = _JournalRun.model_validate_json(content)
+        self._record_result(
+            run.reliability(),
+            run.bitmask,
+            run.bit_statistics,
+            run.seed,
+            run.screened_out,
+            summarize=False,
+        )
 
     def _record_result(
-        self, result: BatchReliability, bitmask: list[int] | None
+        self,
+        results: dict[ReliabilityMetric, BatchReliability],
+        bitmask: Sequence[int] | None,
+        bit_statistics: BitStatistics | None,
+        seed: int | None,
+        screened_out: bool | None,
+        *,
+        summarize: bool = True,
     ) -> None:
-        """Validate `result`'s totals, then append it (and `bitmask`) to `self._result`."""
+        """Validate the totals in `results`, then append them (and `bitmask`/`bit_statistics`/`seed`/`screened_out`) to the recorded results.
+
+        `summarize` updates the fault summary shown for the latest run.
+        """
+        result = results[self._reliability_metric]
         if self._total_items is None:
             self._total_items = result.total
-            assert not self._reliability_metric.requires_golden(), (
-                "_total_items should be set by _populate_golden"
-            )
 
         if result.total != self._total_items:
             raise RuntimeError(
@@ -647,82 +1802,707 @@ class EncodedFaultInjection(Experiment):
                 f"model returned {result.total}"
             )
 
+        for metric, counts in self._extra_results.items():
+            extra = results[metric]
+            if counts.total_items is None:
+                counts.total_items = extra.total
+            elif extra.total != counts.total_items:
+                raise RuntimeError(
+                    f"Expected {counts.total_items} elements for {metric.value}, "
+                    f"model returned {extra.total}"
+                )
+
         if isinstance(self._result, DetailedResult):
             assert bitmask is not None
+            # Constructed without validation, which would copy an array
+            # bitmask into a list.
             self._result.results.append(
-                DetailedRunResult(correct_count=result.correct, bitmask=bitmask)
+                DetailedRunResult.model_construct(
+                    correct_count=result.correct, bitmask=bitmask
+                )
             )
         else:
             self._result.results.append(result.correct)
+        self._statistics.add(self._score(result.correct))
+
+        if self._bit_statistics is not None:
+            assert bit_statistics is not None
+            self._bit_statistics.append(bit_statistics)
+
+        if self._seeds is not None:
+            assert seed is not None
+            self._seeds.append(seed)
+
+        if self._screened_out is not None:
+            assert screened_out is not None
+            self._screened_out.append(screened_out)
+
+        for metric, counts in self._extra_results.items():
+            counts.correct_counts.append(results[metric].correct)
 
-        if self._show_fault_summary:
+        if summarize and self._show_fault_summary:
+            bit_histogram = None
+            if bit_statistics is not None:
+                bit_histogram = bit_statistics.popcount_histogram()
+            elif bitmask is not None:
+                bit_histogram = popcount_histogram(bitmask)
             self._last_fault_summary = _FaultInjectionSummary(
                 faults_injected=self._faulty_bit_count,
-                total_bits=self._model.bit_count(),
-                bit_histogram=(
-                    _bit_histogram(bitmask) if bitmask is not None else None
-                ),
+                total_bits=self._total_bits,
+                bit_histogram=bit_histogram,
             )
 
     @override
-    def run(self) -> None:
-        if not self._golden_results and self._reliability_metric.requires_golden():
+    def prepare_run(self) -> _PreparedRun:
+        # Everything that touches `self._model` happens here, `finish_run` only
+        # works with the clone.
+        if not self._golden_results and self._requires_golden():
             self._populate_golden()
 
-        model = self._inject_faults()
+        seed = self._next_seed()
+        return self._prepare(self._inject_faults(seed), seed)
+
+    def _prepare(self, model: EncodedModule, seed: int) -> _PreparedRun:
+        """Compare and decode a faulty `model` whose faults were drawn with `seed`."""
+        self._prepare_screening()
         bitmask = self._compare_bitwise(model)
-        result = self._infer(model)
-        self._record_result(result, bitmask)
+        bit_statistics = None
+        if self._bit_statistics is not None:
+            assert bitmask is not None
+            bit_statistics = BitStatistics.measure(
+                bitmask, EncodingDtype.from_torch(self._dtype).bit_count()
+            )
+        if not isinstance(self._result, DetailedResult):
+            # Only needed for the statistics, which are already aggregated.
+            bitmask = None
+        with stage(self._progress, "Decoding"):
+            _ = model.decode()
+        return _PreparedRun(
+            model=model,
+            bitmask=bitmask,
+            bit_statistics=bit_statistics,
+            seed=seed,
+            screened_out=self._is_screened_out(model),
+        )
+
+    def _prepare_screening(self) -> None:
+        """Compute the fault-free results screening needs, and the
+        sensitivities for a positive tolerance, once."""
+        if self._screening_tolerance is None or self._fault_free is not None:
+            return
+        if not self._golden_results and self._requires_golden():
+            self._populate_golden()
+
+        # Both are taken at the decoded fault-free encoding, which skipped
+        # runs stand in for; it differs from the unencoded golden model if
+        # the encoding is lossy.
+        reference = self._model.decode()
+        if self._screening_tolerance > 0:
+            self._screen = self._sensitivity_screen(reference)
+        self._fault_free = self._infer(self._model)
+
+    def _sensitivity_screen(self, reference: nn.Module) -> SensitivityScreen:
+        """The sensitivities of the decoded fault-free `reference`, loaded from
+        or saved to the `screening_cache` if there is one."""
+        if self._screening_cache is None:
+            return SensitivityScreen.compute(
+                reference, self._dataset, dtype=self._dtype, progress=self._progress
+            )
+        fingerprint = self._fingerprint
+        return SensitivityScreen.cached(
+            self._screening_cache,
+            Fingerprint(
+                kind="sensitivity_screen",
+                scalars={
+                    key: fingerprint.scalars[key]
+                    for key in ("dtype", "test_image_limit")
+                    if key in fingerprint.scalars
+                },
+                children={
+                    key: fingerprint.children[key] for key in ("bundle", "encoder")
+                },
+            ),
+            reference,
+            self._dataset,
+            dtype=self._dtype,
+            progress=self._progress,
+        )
+
+    def _is_screened_out(self, model: EncodedModule) -> bool:
+        """Whether screening shows that the decoded faulty `model` predicts
+        like the fault-free one: exactly if its parameters didn't change, or
+        to first order within a positive tolerance."""
+        if self._screening_tolerance is None:
+            return False
+        with stage(self._progress, "Screening"):
+            reference = list(self._model.decode().parameters())
+            faulty = list(model.decode().parameters())
+            if all(
+                torch.equal(ours, theirs)
+                for ours, theirs in zip(reference, faulty, strict=True)
+            ):
+                return True
+            if self._screen is None:
+                return False
+            bound = self._screen.change_bound(reference, faulty)
+        return bound <= self._screening_tolerance
+
+    @override
+    def finish_run(self, prepared: _PreparedRun) -> None:
+        if prepared.screened_out:
+            assert self._fault_free is not None
+            inferred = self._fault_free
+        else:
+            inferred = self._infer(prepared.model)
+        # Appended first, so the side file never has fewer runs than the saved
+        # results. Any extra runs are dropped when resuming.
+        self._record_outcomes(inferred.outcomes)
+        assert self._total_items is not None or not self._requires_golden(), (
+            "_total_items should be set by _populate_golden"
+        )
+        self._record_result(
+            inferred.reliability,
+            None if prepared.bitmask is None else ColumnView(prepared.bitmask),
+            prepared.bit_statistics,
+            prepared.seed,
+            prepared.screened_out,
+        )
+
+    @override
+    def discard_run(self, prepared: _PreparedRun) -> None:
+        # Discarded runs are always the last ones prepared, so the next run
+        # gets the first discarded one's seed.
+        _ = prepared
+        self._next_seed_position -= 1
+
+    def replay(self, run_index: int) -> ReplayedRun:
+        """Recompute the recorded run at `run_index` from its seed.
+
+        The faults are injected again into a clone of the encoded model, so
+        this needs the same setup the run was recorded with (which loading its
+        result file checks, see `load_from`), and as long as inference is
+        deterministic the outcome matches the recorded one. Raises
+        `IndexError` for a run that wasn't recorded and `ValueError` for
+        results recorded before seeds were.
+        """
+        if self._seeds is None:
+            raise ValueError(
+                "These results were recorded before seeds were, so their runs "
+                "can't be replayed"
+            )
+        if not 0 <= run_index < self.run_count():
+            raise IndexError(
+                f"Run {run_index} wasn't recorded, there are {self.run_count()} runs"
+            )
+        seed = self._seeds[run_index]
+        if not self._golden_results and self._requires_golden():
+            self._populate_golden()
+
+        fault_targets = self._faulty_bits(seed)
+        model = self._apply_faults(fault_targets)
+        bitmask = self._decoded_difference(model)
+        inferred = self._infer(model)
+        return ReplayedRun(
+            seed=seed,
+            faulty_bits=np.array(
+                [index for _, index in fault_targets], dtype=np.uint64
+            ),
+            bitmask=bitmask,
+            scores={
+                metric: compute_score(metric, result.correct, result.total)
+                for metric, result in inferred.reliability.items()
+            },
+            correct_count=inferred.reliability[self._reliability_metric].correct,
+            outcomes=inferred.outcomes,
+        )
+
+
+class _PointFiles(PipelinedExperiment[list[_PreparedRun]]):
+    """Several `EncodedFaultInjection`s recorded on the same seeds, saved as a
+    directory holding a regular result file per point, keyed by its name.
+
+    Every point can be loaded, plotted or resumed on its own as well.
+    Journals aren't supported.
+    """
+
+    _points: list[tuple[str, EncodedFaultInjection]]
+
+    def points(self) -> list[EncodedFaultInjection]:
+        """The points, in the order they're saved and prepared in."""
+        return [point for _, point in self._points]
+
+    @override
+    def serialize(self) -> str:
+        raise NotImplementedError(self._files_message())
+
+    @override
+    def deserialize(self, content: str) -> None:
+        raise NotImplementedError(self._files_message())
+
+    def _files_message(self) -> str:
+        return (
+            f"A {type(self).__name__} is saved as a directory with a file per "
+            f"point, see `{type(self).__name__}.save_atomic`/`load_from`"
+        )
+
+    def _paths(self, directory: AnyPath) -> list[tuple[EncodedFaultInjection, Path]]:
+        directory = Path(directory).expanduser()
+        return [(point, directory / name) for name, point in self._points]
+
+    @override
+    def save(self, path: AnyPath, *, compressed: bool = False) -> None:
+        """Save every point's results to its file in the directory `path`."""
+        Path(path).expanduser().mkdir(parents=True, exist_ok=True)
+        for point, point_path in self._paths(path):
+            point.save(point_path, compressed=compressed)
+
+    @override
+    def save_atomic(self, path: AnyPath, *, compressed: bool = False) -> None:
+        """Like `save`, but every file is written atomically."""
+        Path(path).expanduser().mkdir(parents=True, exist_ok=True)
+        for point, point_path in self._paths(path):
+            point.save_atomic(point_path, compressed=compressed)
+
+    @override
+    def checkpoint(self, path: AnyPath, *, compressed: bool) -> Callable[[], None]:
+        Path(path).expanduser().mkdir(parents=True, exist_ok=True)
+        writes = [
+            point.checkpoint(point_path, compressed=compressed)
+            for point, point_path in self._paths(path)
+        ]
+
+        def write() -> None:
+            for point_write in writes:
+                point_write()
+
+        return write
+
+    @override
+    def load_from(self, path: AnyPath) -> None:
+        """Resume from the point files in the directory `path`.
+
+        Points without a file start out empty. The points are saved one file
+        at a time, so if recording was stopped in between, their files don't
+        hold the same runs; every point then resumes from the runs they all
+        start with, dropping the rest with a warning. Raises `ValueError` for
+        results recorded before seeds were, whose runs can't be matched up.
+        """
+        for point, point_path in self._paths(path):
+            if point_path.exists():
+                point.load_from(point_path)
+
+        seeds: list[list[int]] = []
+        for point in self.points():
+            if point._seeds is None:
+                raise ValueError(
+                    f"The points in {path} were recorded before seeds were, so "
+                    f"they can't be resumed as a {type(self).__name__}"
+                )
+            seeds.append(point._seeds)
+        shared = 0
+        for runs in zip(*seeds, strict=False):
+            if any(seed != runs[0] for seed in runs[1:]):
+                break
+            shared += 1
+        if any(len(point_seeds) != shared for point_seeds in seeds):
+            logger.warning(
+                f"The points in {path} don't hold the same runs, e.g. because "
+                f"recording was stopped between saving them; resuming from the "
+                f"{shared} runs they share and dropping the rest"
+            )
+            for point in self.points():
+                point._truncate(shared)
+
+    def _next_shared_seed(self) -> int:
+        """The seed of the next run, drawn like the first point's and shared by all."""
+        for _, point in self._points:
+            if not point._golden_results and point._requires_golden():
+                point._populate_golden()
+        seed = self._points[0][1]._next_seed()
+        for _, point in self._points[1:]:
+            point._next_seed_position += 1
+        return seed
+
+    @override
+    def finish_run(self, prepared: list[_PreparedRun]) -> None:
+        for (_, point), run in zip(self._points, prepared, strict=True):
+            point.finish_run(run)
+
+    @override
+    def discard_run(self, prepared: list[_PreparedRun]) -> None:
+        for (_, point), run in zip(self._points, prepared, strict=True):
+            point.discard_run(run)
+
+
+@final
+class NestedFaultSweep(_PointFiles):
+    """Several `EncodedFaultInjection`s at increasing fault counts, recorded on common random numbers.
+
+    Every run draws one seeded sequence of bits to flip and gives each point
+    the first `faults` of them, so a point's faulty bits are a subset of those
+    of every point with more faults. They're injected incrementally: each
+    point's faulty model is a clone of the previous point's with only the
+    additional faults applied, so decoding only redoes the regions those
+    touched (see `EncodedModule`). A faulty model per point is kept in memory
+    until the run is finished.
+
+    Each point records the same seeds (see `SavedResult.seeds`), and on its
+    own its results are distributed like an independent
+    `EncodedFaultInjection`'s. Across points they're correlated instead: every
+    run's curve over the fault count is monotone in the faults, and the
+    differences between points have a much lower variance.
+
+    The points are made with `EncodedFaultInjection.with_faults` from the same
+    experiment and keyed by the name of their result file. `scores()`, and
+    with it `run_loop`'s status line, follow the point with the most faults.
+    Each point is checked against its own `point_stop_conditions()`, and the
+    sweep stops once every point would.
+
+    The sweep is saved to a directory holding a regular result file per
+    point, which can be loaded, plotted or resumed on its own as well.
+    Journals aren't supported.
+    """
+
+    _stop_conditions: list[Sequence[StopCondition]]
+
+    def __init__(
+        self,
+        points: Mapping[str, EncodedFaultInjection],
+        *,
+        point_stop_conditions: Callable[[], Sequence[StopCondition]] = tuple,
+    ) -> None:
+        if not points:
+            raise ValueError("A nested fault sweep needs at least one point")
+        ordered = sorted(points.items(), key=lambda item: item[1]._faulty_bit_count)
+        for (lower_name, lower), (higher_name, higher) in itertools.pairwise(ordered):
+            if lower._faulty_bit_count == higher._faulty_bit_count:
+                raise ValueError(
+                    f"{lower_name} and {higher_name} both flip "
+                    f"{lower._faulty_bit_count} bits"
+                )
+        model = ordered[0][1]._model
+        if any(point._model is not model for _, point in ordered):
+            raise ValueError(
+                "Every point must be made with `with_faults` from the same experiment"
+            )
+        if any(point._strata is not None for _, point in ordered):
+            raise ValueError(
+                "Nested faults are a prefix of one uniform sequence, which "
+                "stratified sampling doesn't draw"
+            )
+
+        self._points = ordered
+        self._stop_conditions = [point_stop_conditions() for _ in ordered]
+
+    @override
+    def points(self) -> list[EncodedFaultInjection]:
+        """The points, by increasing fault count."""
+        return super().points()
+
+    def _most_faults(self) -> EncodedFaultInjection:
+        return self._points[-1][1]
+
+    @override
+    def scores(self) -> Sequence[float]:
+        return self._most_faults().scores()
+
+    @override
+    def statistics(self) -> ScoreStatistics:
+        return self._most_faults().statistics()
+
+    @override
+    def display(self) -> ExperimentDisplay:
+        return self._most_faults().display()
+
+    @override
+    def stop_conditions(self) -> Sequence[StopCondition]:
+        return (self._every_point_stopped,)
+
+    def _every_point_stopped(self, experiment: Experiment) -> str | None:
+        _ = experiment
+        # Every point is checked each time, since conditions like
+        # `AdditionalRuns` start counting when they're first checked.
+        reasons = [
+            (name, _first_stop_reason(conditions, point))
+            for (name, point), conditions in zip(
+                self._points, self._stop_conditions, strict=True
+            )
+        ]
+        if any(reason is None for _, reason in reasons):
+            return None
+        return "Every point is done - " + "; ".join(
+            f"{name}: {reason}" for name, reason in reasons
+        )
+
+    @override
+    def prepare_run(self) -> list[_PreparedRun]:
+        seed = self._next_shared_seed()
+        model = self._points[0][1]._model
+        picker = Picker(model.bit_count(), seed)
+        injected = 0
+        prepared: list[_PreparedRun] = []
+        for _, point in self._points:
+            model = model.clone()
+            with stage(point._progress, "Fault Injection"):
+                model.apply_faults(
+                    _fault_targets(picker, point._faulty_bit_count - injected)
+                )
+            injected = point._faulty_bit_count
+            prepared.append(point._prepare(model, seed))
+        return prepared
+
+
+@final
+class PairedFaultInjection(_PointFiles):
+    """Two `EncodedFaultInjection`s with different encoders, recorded on the same faults.
+
+    Telling which of two encodings is more reliable from independently
+    recorded results takes enough runs to make each of them precise on its
+    own. Here every run instead draws one pattern of faulty bits and injects
+    it into both encodings, so the variance they share (e.g. how many faults
+    hit high exponent bits) cancels out of their difference, and far fewer
+    runs tell them apart. `scores()` are these paired differences, the first
+    point's score minus the second's, to be stopped by a `SequentialTest`.
+
+    A pattern is drawn like the first point's runs (see `FaultSampling`) as
+    bit indices into its encoded memory, where an index is a bit position of
+    an element of a tensor (see `FaultStrata`), and is injected at the same
+    bit of the same element in the second encoding. Both therefore have to
+    be `TensorEncoding`s with the same layout, i.e. storing the parameters'
+    elements at the same width, like MSET and CEP, and flip the same number
+    of bits. SECDED, whose codewords interleave data and parity bits across
+    elements, has no such mapping.
+
+    The points are made with `EncodedFaultInjection.with_encoder` from the
+    same experiment, so they share the dataset and golden results, and are
+    keyed by the name of their result file. Each point records the shared
+    seeds (see `SavedResult.seeds`), and on its own its results are
+    distributed like an independent `EncodedFaultInjection`'s. The comparison
+    is saved to a directory holding a regular result file per point, which
+    can be loaded, plotted or resumed on its own as well. Journals aren't
+    supported.
+    """
+
+    _statistics: ScoreStatistics
+
+    def __init__(self, points: Mapping[str, EncodedFaultInjection]) -> None:
+        if len(points) != 2:
+            raise ValueError(f"A paired comparison needs 2 points, got {len(points)}")
+        (first_name, first), (second_name, second) = points.items()
+        if first._dataset is not second._dataset:
+            raise ValueError(
+                "Both points must be made with `with_encoder` from the same experiment"
+            )
+        layouts: list[FaultStrata] = []
+        for name, point in points.items():
+            try:
+                layouts.append(FaultStrata.of(point._model.encoding()))
+            except (TypeError, ValueError) as error:
+                raise ValueError(f"Can't map faults into {name}: {error}") from error
+        if layouts[0] != layouts[1]:
+            raise ValueError(
+                f"{first_name} and {second_name} don't lay out the parameters alike"
+            )
+        if first._faulty_bit_count != second._faulty_bit_count:
+            raise ValueError(
+                f"{first_name} flips {first._faulty_bit_count} bits but "
+                f"{second_name} flips {second._faulty_bit_count}"
+            )
+        if (first._strata is None) != (second._strata is None):
+            raise ValueError(
+                f"{first_name} and {second_name} sample faults differently"
+            )
+
+        self._points = list(points.items())
+        self._statistics = ScoreStatistics.of(self._differences())
+
+    @override
+    def points(self) -> list[EncodedFaultInjection]:
+        """The two points, in the order of the differences."""
+        return super().points()
+
+    def _differences(self) -> list[float]:
+        first, second = self.points()
+        return [
+            ours - theirs
+            for ours, theirs in zip(first.scores(), second.scores(), strict=True)
+        ]
+
+    @override
+    def scores(self) -> Sequence[float]:
+        return self._differences()
+
+    @override
+    def statistics(self) -> ScoreStatistics:
+        return self._statistics
+
+    @override
+    def display(self) -> ExperimentDisplay:
+        return _PairedDisplay(self._points[0][1]._reliability_metric, None)
+
+    @override
+    def load_from(self, path: AnyPath) -> None:
+        super().load_from(path)
+        self._statistics = ScoreStatistics.of(self._differences())
+
+    @override
+    def prepare_run(self) -> list[_PreparedRun]:
+        seed = self._next_shared_seed()
+        fault_targets = self._points[0][1]._faulty_bits(seed)
+        return [
+            point._prepare(point._apply_faults(fault_targets), seed)
+            for _, point in self._points
+        ]
+
+    @override
+    def finish_run(self, prepared: list[_PreparedRun]) -> None:
+        super().finish_run(prepared)
+        first, second = (point.statistics().last for point in self.points())
+        assert first is not None and second is not None
+        self._statistics.add(first - second)
+
+
+class _PairedDisplay(_Display):
+    """`PairedFaultInjection`'s display: the score is a difference of two."""
+
+    @override
+    def score_name(self) -> str | None:
+        return f"{self._metric.score_name()} difference"
+
+
+def _strata(model: EncodedModule, sampling: FaultSampling) -> FaultStrata | None:
+    match sampling:
+        case FaultSampling.Uniform:
+            return None
+        case FaultSampling.Stratified:
+            return FaultStrata.of(model.encoding())
+
+
+def _fault_targets(picker: Picker, count: int) -> list[tuple[BitFlip, int]]:
+    """Bit flips at the next `count` indices returned by `picker`."""
+    fault_targets: list[tuple[BitFlip, int]] = []
+    for _ in range(count):
+        try:
+            fault_target = next(picker)
+        except StopIteration:
+            raise RuntimeError(
+                "Expected fault targets to be within range but picker is exhausted"
+            )
+        fault_targets.append((BitFlip(), fault_target))
+    return fault_targets
+
+
+def _resolve_fault_count(faults: int | float, total_bits: int) -> int:
+    """The number of bits to flip for `EncodedFaultInjection`'s `faults`.
+
+    An int is an exact count, a float the bit error rate.
+    """
+    if isinstance(faults, int):
+        if faults > total_bits:
+            raise ValueError(
+                f"`faults` ({faults}) is greater than the number of bits in model parameters ({total_bits})"
+            )
+        return faults
+
+    if faults > 1.0:
+        raise ValueError(
+            f"`faults` ({faults}) is greater than 1.0 (floats are interpreted as the bit error rate)"
+        )
+    count = int(round(faults * total_bits))
+    logger.debug(f"Resolved bit error rate {faults} to {count} faults")
+    return count
+
+
+def _batch_total(metric: ReliabilityMetric, logits: Tensor) -> int:
+    """The number of items `metric` scores in a batch with the given `logits`."""
+    match metric:
+        case ReliabilityMetric.Sdc:
+            return logits.numel()
+        case (
+            ReliabilityMetric.Accuracy
+            | ReliabilityMetric.AccuracyDegradation
+            | ReliabilityMetric.Top1Sdc
+        ):
+            return logits.shape[0]
+
+
+def _batch_reliability(
+    metric: ReliabilityMetric,
+    logits: Tensor,
+    golden: _GoldenBatch | None,
+    targets: Tensor,
+) -> _DeviceReliability:
+    """Score a batch under `metric`. `golden` is required by golden-based metrics."""
+    if metric == ReliabilityMetric.Accuracy:
+        return _batch_accuracy(logits, targets)
+
+    assert golden is not None, f"{metric.value} requires golden results"
+    match metric:
+        case ReliabilityMetric.AccuracyDegradation:
+            return _batch_accuracy_degradation(logits, golden.classifications, targets)
+        case ReliabilityMetric.Sdc:
+            assert golden.logits is not None
+            return _batch_sdc(logits, golden.logits)
+        case ReliabilityMetric.Top1Sdc:
+            return _batch_critical_sdc(logits, golden.classifications)
+
+
+def _batch_outcomes(
+    logits: Tensor, golden_classifications: Tensor, targets: Tensor
+) -> Tensor:
+    """Per-sample outcomes of a batch, see `_InferenceResult.outcomes`."""
+    classifications = logits.argmax(dim=1)
+    return torch.stack(
+        [classifications == targets, classifications == golden_classifications]
+    )
 
 
 def _batch_critical_sdc(
     logits: Tensor, golden_classifications: Tensor
-) -> BatchReliability:
+) -> _DeviceReliability:
     """Compute the critical SDC of a result. Used for ReliabilityMetric.CriticalSdc."""
 
     classifications = logits.argmax(dim=1)
 
     assert golden_classifications.shape == classifications.shape
-    # bool is a subclass of int, so sum converts bools to ints.
-    correct = int((classifications == golden_classifications).sum().item())
+    correct = (classifications == golden_classifications).sum()
     total = golden_classifications.numel()
 
-    return BatchReliability(correct=correct, total=total)
+    return _DeviceReliability(correct=correct, total=total)
 
 
-def _batch_sdc(logits: Tensor, golden_logits: Tensor) -> BatchReliability:
+def _batch_sdc(logits: Tensor, golden_logits: Tensor) -> _DeviceReliability:
     """Compute the SDC of a result. Used for ReliabilityMetric.Sdc."""
 
     assert golden_logits.shape == logits.shape
-    # bool is a subclass of int, so sum converts bools to ints.
-    correct = int((logits == golden_logits).sum().item())
+    correct = (logits == golden_logits).sum()
     total = golden_logits.numel()
 
-    return BatchReliability(correct=correct, total=total)
+    return _DeviceReliability(correct=correct, total=total)
 
 
 def _batch_accuracy_degradation(
     logits: Tensor,
     golden_classifications: Tensor,
     targets: Tensor,
-) -> BatchReliability:
+) -> _DeviceReliability:
     """Compute the accuracy degradation of a result. Used for ReliabilityMetric.AccuracyDegradation."""
 
     classifications = logits.argmax(dim=1)
     assert golden_classifications.shape == classifications.shape
 
-    correct = int((classifications == targets).sum().item())
-    golden_correct = int((golden_classifications == targets).sum().item())
+    correct = (classifications == targets).sum()
+    golden_correct = (golden_classifications == targets).sum()
     total = classifications.numel()
 
-    return BatchReliability(correct=golden_correct - correct, total=total)
+    return _DeviceReliability(correct=golden_correct - correct, total=total)
 
 
-def _batch_accuracy(logits: Tensor, targets: Tensor) -> BatchReliability:
+def _batch_accuracy(logits: Tensor, targets: Tensor) -> _DeviceReliability:
     """Compute the accuracy of a result. Used for ReliabilityMetric.Accuracy."""
     classifications = logits.argmax(dim=1)
 
-    correct = int((classifications == targets).sum().item())
+    correct = (classifications == targets).sum()
     total = classifications.numel()
 
-    return BatchReliability(correct=correct, total=total)
+    return _DeviceReliability(correct=correct, total=total)
@@ -0,0 +1,261 @@
+"""Per-sample outcomes of `EncodedFaultInjection` runs, stored in a binary side file.
+
+A result file only keeps one correct count per run and metric. The side file
+additionally keeps, for every run, which samples were classified correctly
+and which kept the golden model's top-1 prediction, so metrics and per-class
+breakdowns can be computed afterwards without re-running inference.
+
+The file is little-endian and append-only:
+
+- an 8 byte magic number followed by the sample count as a `u64`,
+- every sample's target class as an `i64`,
+- a bitset of the samples the golden model classified correctly,
+- for each run, a bitset of correctly classified samples followed by a bitset
+  of samples whose top-1 prediction matches the golden model's.
+
+Bitsets are `numpy.packbits(..., bitorder="little")` output, one bit per
+sample.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from faultforge._internal.common import AnyPath
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FFOUTC01"
+_COUNT_DTYPE = np.dtype("<u8")
+_TARGET_DTYPE = np.dtype("<i8")
+
+
+def _bitset_bytes(sample_count: int) -> int:
+    return (sample_count + 7) // 8
+
+
+def _header_size(sample_count: int) -> int:
+    return (
+        len(_MAGIC)
+        + _COUNT_DTYPE.itemsize
+        + sample_count * _TARGET_DTYPE.itemsize
+        + _bitset_bytes(sample_count)
+    )
+
+
+def _record_size(sample_count: int) -> int:
+    return 2 * _bitset_bytes(sample_count)
+
+
+def _pack(flags: np.ndarray) -> np.ndarray:
+    return np.packbits(flags.astype(np.bool_), axis=-1, bitorder="little")
+
+
+def _header(targets: np.ndarray, golden_correct: np.ndarray) -> bytes:
+    return b"".join(
+        [
+            _MAGIC,
+            np.array(len(targets), dtype=_COUNT_DTYPE).tobytes(),
+            targets.astype(_TARGET_DTYPE).tobytes(),
+            _pack(golden_correct).tobytes(),
+        ]
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class SampleOutcomes:
+    """Which samples each recorded run got right, loaded from a side file.
+
+    The counting methods take an optional boolean `mask` over the samples to
+    restrict them to a subset, e.g. `class_mask(c)` for a per-class
+    breakdown. Counting works on the packed bitsets directly.
+    """
+
+    targets: np.ndarray
+    """Every sample's target class, in dataset order."""
+    golden_correct: np.ndarray
+    """Boolean, whether the golden model classified each sample correctly."""
+    _correct: np.ndarray
+    """Packed bitsets, `run_count() x ceil(sample_count() / 8)`."""
+    _unchanged: np.ndarray
+    """Packed bitsets, like `_correct`."""
+
+    @classmethod
+    def load(cls, path: AnyPath, *, max_runs: int | None = None) -> SampleOutcomes:
+        """Load a side file, keeping at most the first `max_runs` runs.
+
+        A trailing partially written run is ignored.
+        """
+        data = Path(path).expanduser().read_bytes()
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not a sample outcome file")
+
+        offset = len(_MAGIC)
+        sample_count = int(np.frombuffer(data, _COUNT_DTYPE, count=1, offset=offset)[0])
+        offset += _COUNT_DTYPE.itemsize
+        if len(data) < _header_size(sample_count):
+            raise ValueError(f"{path} has a truncated header")
+
+        targets = np.frombuffer(data, _TARGET_DTYPE, count=sample_count, offset=offset)
+        offset += sample_count * _TARGET_DTYPE.itemsize
+
+        width = _bitset_bytes(sample_count)
+        golden_correct = np.unpackbits(
+            np.frombuffer(data, np.uint8, count=width, offset=offset),
+            count=sample_count,
+            bitorder="little",
+        ).astype(np.bool_)
+        offset += width
+
+        run_count = (len(data) - offset) // _record_size(sample_count)
+        if max_runs is not None:
+            run_count = min(run_count, max_runs)
+        records = np.frombuffer(
+            data, np.uint8, count=run_count * 2 * width, offset=offset
+        ).reshape(run_count, 2, width)
+
+        return cls(
+            targets=targets,
+            golden_correct=golden_correct,
+            _correct=records[:, 0],
+            _unchanged=records[:, 1],
+        )
+
+    def run_count(self) -> int:
+        return self._correct.shape[0]
+
+    def sample_count(self) -> int:
+        return len(self.targets)
+
+    def classes(self) -> list[int]:
+        """Every target class present in the dataset, sorted."""
+        return [int(c) for c in np.unique(self.targets)]
+
+    def class_mask(self, target_class: int) -> np.ndarray:
+        """A mask selecting the samples of `target_class`."""
+        return self.targets == target_class
+
+    def correct(self, run: int) -> np.ndarray:
+        """Boolean, whether each sample was classified correctly in `run`."""
+        return self._unpack(self._correct[run])
+
+    def unchanged(self, run: int) -> np.ndarray:
+        """Boolean, whether each sample kept the golden top-1 prediction in `run`."""
+        return self._unpack(self._unchanged[run])
+
+    def correct_counts(self, mask: np.ndarray | None = None) -> np.ndarray:
+        """Correctly classified samples per run."""
+        return self._count(self._correct, mask)
+
+    def unchanged_counts(self, mask: np.ndarray | None = None) -> np.ndarray:
+        """Samples that kept the golden top-1 prediction, per run."""
+        return self._count(self._unchanged, mask)
+
+    def golden_correct_count(self, mask: np.ndarray | None = None) -> int:
+        """Samples the golden model classified correctly."""
+        golden_correct = self.golden_correct
+        if mask is not None:
+            golden_correct = golden_correct & mask
+        return int(golden_correct.sum())
+
+    def total(self, mask: np.ndarray | None = None) -> int:
+        """The number of samples selected by `mask`."""
+        return self.sample_count() if mask is None else int(mask.sum())
+
+    def flip_rates(self) -> np.ndarray:
+        """The fraction of runs in which each sample's top-1 prediction changed.
+
+        Useful for finding the inputs that are most fragile under faults.
+        """
+        if self.run_count() == 0:
+            return np.zeros(self.sample_count())
+        unchanged = np.zeros(self.sample_count(), dtype=np.int64)
+        for run in range(self.run_count()):
+            unchanged += self.unchanged(run)
+        return 1 - unchanged / self.run_count()
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        return np.unpackbits(
+            packed, count=self.sample_count(), bitorder="little"
+        ).astype(np.bool_)
+
+    def _count(self, bitsets: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+        if mask is not None:
+            bitsets = bitsets & _pack(mask)
+        return np.bitwise_count(bitsets).sum(axis=1, dtype=np.int64)
+
+
+class OutcomeWriter:
+    """Appends runs to a sample outcome side file, see `SampleOutcomes`."""
+
+    _path: Path
+    _sample_count: int | None
+
+    def __init__(self, path: AnyPath) -> None:
+        self._path = Path(path).expanduser()
+        self._sample_count = None
+
+    def path(self) -> Path:
+        return self._path
+
+    def is_open(self) -> bool:
+        return self._sample_count is not None
+
+    def open(
+        self, targets: np.ndarray, golden_correct: np.ndarray, run_count: int
+    ) -> None:
+        """Prepare the file for appending after `run_count` recorded runs.
+
+        Starts a new file if no runs were recorded yet. Otherwise checks that
+        the existing file was recorded on the same samples and drops any runs
+        past `run_count`, which were appended after the result file was last
+        saved.
+        """
+        header = _header(targets, golden_correct)
+        sample_count = len(targets)
+        expected_size = len(header) + run_count * _record_size(sample_count)
+
+        if run_count == 0:
+            with open(self._path, "wb") as f:
+                f.write(header)
+            self._sample_count = sample_count
+            return
+
+        if not self._path.exists():
+            raise RuntimeError(
+                f"{self._path} is missing but {run_count} runs were already recorded"
+            )
+
+        with open(self._path, "r+b") as f:
+            if f.read(len(header)) != header:
+                raise RuntimeError(
+                    f"{self._path} was recorded on different samples or golden results"
+                )
+            size = f.seek(0, 2)
+            if size < expected_size:
+                raise RuntimeError(
+                    f"{self._path} has fewer than the {run_count} recorded runs"
+                )
+            if size > expected_size:
+                logger.info(
+                    f"Dropping runs past {run_count} from {self._path}, "
+                    "they weren't saved in the result file"
+                )
+                f.truncate(expected_size)
+
+        self._sample_count = sample_count
+
+    def append(self, correct: np.ndarray, unchanged: np.ndarray) -> None:
+        """Append a run, given boolean per-sample outcomes."""
+        if self._sample_count is None:
+            raise RuntimeError("`open` must be called before appending")
+        if correct.shape != (self._sample_count,) or unchanged.shape != correct.shape:
+            raise ValueError(
+                f"Expected outcomes for {self._sample_count} samples, "
+                f"got {correct.shape} and {unchanged.shape}"
+            )
+
+        with open(self._path, "ab") as f:
+            f.write(_pack(correct).tobytes() + _pack(unchanged).tobytes())
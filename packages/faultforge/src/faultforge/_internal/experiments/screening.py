@@ -0,0 +1,243 @@
+"""Screening out runs whose faults can't flip a prediction, see `SensitivityScreen`."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import torch
+from torch import Tensor, nn
+
+from faultforge._internal.common import AnyPath
+from faultforge._internal.dataset import BatchedDataset
+from faultforge._internal.fingerprint import Fingerprint
+from faultforge._internal.progress import Progress, stage
+
+logger = logging.getLogger(__name__)
+
+_JACOBIAN_ELEMENTS = 2**27
+"""How many gradient elements `SensitivityScreen.compute` holds in memory at
+once: each gradient is one logit's for one sample, with respect to a group of
+parameters."""
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SensitivityScreen:
+    """How much each parameter can move a model's predictions, to skip runs whose faults can't.
+
+    A sample's prediction only flips once some logit gains on the top one by
+    its margin `m` (the top logit minus the runner-up), which takes a change
+    of at least `m / 2` in some logit. To first order, changing the
+    parameters by `delta` changes logit `k` by `grad(z_k) · delta`, so no
+    prediction flips as long as, for every sample,
+    `sum(max_k |grad(z_k)| * |delta|) * 2 / m < 1`. `sensitivities` holds, per
+    parameter element, the largest `max_k |grad(z_k)| * 2 / m` over the
+    dataset, which bounds that sum for every sample at once (see
+    `change_bound`). The gradients are taken at the fault-free model, a
+    backward pass per sample and class, so they're meant to be computed once
+    and cached.
+
+    The bound only holds for models that are linear in their parameters.
+    Otherwise it's a first-order estimate that ignores curvature, even when
+    it's `0` (e.g. for a dead ReLU unit that a large change revives), which is
+    why `EncodedFaultInjection` only uses it with a positive
+    `screening_tolerance`, well under `1`, and records which runs it skipped.
+    Faults that make a parameter non-finite are never skipped.
+    """
+
+    sensitivities: np.ndarray
+    """float32, one per element of the model's parameters, in the order of
+    `nn.Module.parameters` with each one flattened. Memory-mapped if loaded."""
+
+    @classmethod
+    def compute(
+        cls,
+        module: nn.Module,
+        dataset: BatchedDataset,
+        *,
+        dtype: torch.dtype,
+        progress: Progress | None = None,
+    ) -> SensitivityScreen:
+        """The sensitivities of `module`'s predictions over `dataset`.
+
+        The gradients of every sample's logits are batched with
+        `torch.func.vmap`, in chunks of samples, classes and parameters that
+        keep at most `_JACOBIAN_ELEMENTS` gradient elements in memory at once.
+        Raises `ValueError` for a model with a parameter larger than that.
+        """
+        params = {name: param.detach() for name, param in module.named_parameters()}
+        buffers = {name: buffer.detach() for name, buffer in module.named_buffers()}
+        groups = _parameter_groups(params)
+
+        def logits(group: dict[str, Tensor], inputs: Tensor) -> Tensor:
+            return torch.func.functional_call(
+                module, ({**params, **group}, buffers), (inputs.unsqueeze(0),)
+            )[0]
+
+        def class_gradients(
+            group: dict[str, Tensor], inputs: Tensor, basis: Tensor
+        ) -> dict[str, Tensor]:
+            """The gradients of one sample's logits selected by the rows of
+            `basis` with respect to `group`."""
+            _, pullback = torch.func.vjp(lambda group: logits(group, inputs), group)
+            return torch.func.vmap(pullback)(basis)[0]
+
+        sample_gradients = torch.func.vmap(class_gradients, in_dims=(None, 0, None))
+        sensitivities = {
+            name: torch.zeros_like(param, dtype=torch.float32)
+            for name, param in params.items()
+        }
+
+        try:
+            with stage(
+                progress, "Computing sensitivities", total=dataset.batch_count()
+            ) as s:
+                for batch in dataset:
+                    inputs = batch.inputs.to(dtype=dtype)
+                    with torch.no_grad():
+                        batch_logits = module(inputs)
+                    top_two = batch_logits.topk(2, dim=1)
+                    margins = (top_two.values[:, 0] - top_two.values[:, 1]).float()
+                    classes = batch_logits.shape[1]
+                    basis = torch.eye(
+                        classes, dtype=batch_logits.dtype, device=inputs.device
+                    )
+                    for group in groups:
+                        group_size = sum(param.numel() for param in group.values())
+                        rows = _JACOBIAN_ELEMENTS // group_size
+                        class_chunk = min(classes, rows)
+                        sample_chunk = max(1, rows // class_chunk)
+                        for start in range(0, len(inputs), sample_chunk):
+                            samples = slice(start, start + sample_chunk)
+                            for first in range(0, classes, class_chunk):
+                                gradients = sample_gradients(
+                                    group,
+                                    inputs[samples],
+                                    basis[first : first + class_chunk],
+                                )
+                                _update(sensitivities, gradients, margins[samples])
+                    s.advance()
+        finally:
+            dataset.reset()
+
+        return cls(
+            torch.cat([tensor.flatten() for tensor in sensitivities.values()])
+            .cpu()
+            .numpy()
+        )
+
+    @classmethod
+    def load(cls, path: AnyPath) -> SensitivityScreen:
+        """Memory-map sensitivities saved with `save`."""
+        sensitivities = np.load(Path(path).expanduser(), mmap_mode="r")
+        if sensitivities.dtype != np.float32 or sensitivities.ndim != 1:
+            raise ValueError(f"{path} doesn't hold saved sensitivities")
+        return cls(sensitivities)
+
+    def save(self, path: AnyPath) -> None:
+        """Save the sensitivities to `path` atomically, as a `.npy` file."""
+        destination = Path(path).expanduser()
+        fd, temp_name = tempfile.mkstemp(dir=destination.parent, suffix=".npy")
+        with os.fdopen(fd, "wb") as temp:
+            np.save(temp, self.sensitivities)
+        os.replace(temp_name, destination)
+
+    @classmethod
+    def cached(
+        cls,
+        directory: AnyPath,
+        fingerprint: Fingerprint,
+        module: nn.Module,
+        dataset: BatchedDataset,
+        *,
+        dtype: torch.dtype,
+        progress: Progress | None = None,
+    ) -> SensitivityScreen:
+        """Load the sensitivities for `fingerprint` from `directory`, or compute and save them.
+
+        `fingerprint` identifies what they depend on (the model, its encoding,
+        the dtype and the dataset) and names the file, so several setups can
+        share a directory.
+        """
+        directory = Path(directory).expanduser()
+        key = json.dumps(fingerprint.model_dump(mode="json"), sort_keys=True)
+        path = directory / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.npy"
+        if path.exists():
+            logger.info(f"Loading sensitivities from {path}")
+            return cls.load(path)
+
+        screen = cls.compute(module, dataset, dtype=dtype, progress=progress)
+        directory.mkdir(parents=True, exist_ok=True)
+        screen.save(path)
+        return screen
+
+    def change_bound(
+        self, reference: Sequence[Tensor], faulty: Sequence[Tensor]
+    ) -> float:
+        """A first-order bound on how far the parameters changing from
+        `reference` to `faulty` move any sample's logits, relative to half its
+        margin.
+
+        To first order, predictions can only flip when it's at least `1`; it's
+        `inf` if any changed parameter isn't finite.
+        """
+        parameter_count = sum(tensor.numel() for tensor in reference)
+        if parameter_count != len(self.sensitivities):
+            raise ValueError(
+                f"Expected {len(self.sensitivities)} parameters, got {parameter_count}"
+            )
+        bound = 0.0
+        offset = 0
+        for ours, theirs in zip(reference, faulty, strict=True):
+            with torch.no_grad():
+                delta = (theirs.float() - ours.float()).flatten()
+                changed = delta.nonzero().squeeze(1)
+                if len(changed) > 0:
+                    changes = delta[changed].abs().cpu().numpy()
+                    if not np.isfinite(changes).all():
+                        return float("inf")
+                    indices = changed.cpu().numpy() + offset
+                    bound += float(self.sensitivities[indices] @ changes)
+            offset += ours.numel()
+        return bound
+
+
+def _parameter_groups(params: dict[str, Tensor]) -> list[dict[str, Tensor]]:
+    """Split `params` into consecutive groups of at most `_JACOBIAN_ELEMENTS`
+    elements, so a gradient with respect to one group fits the budget."""
+    groups: list[dict[str, Tensor]] = []
+    size = _JACOBIAN_ELEMENTS
+    for name, param in params.items():
+        if param.numel() > _JACOBIAN_ELEMENTS:
+            raise ValueError(
+                f"Can't screen a model whose parameter {name} has "
+                f"{param.numel()} elements, more than the {_JACOBIAN_ELEMENTS} "
+                "gradient elements computed at once"
+            )
+        if size + param.numel() > _JACOBIAN_ELEMENTS:
+            groups.append({})
+            size = 0
+        groups[-1][name] = param
+        size += param.numel()
+    return groups
+
+
+def _update(
+    sensitivities: dict[str, Tensor],
+    gradients: dict[str, Tensor],
+    margins: Tensor,
+) -> None:
+    """Raise `sensitivities` to the relative gradients of a chunk of samples
+    with `margins`, whose `gradients` are `samples x classes x parameter`."""
+    for name, gradient in gradients.items():
+        worst = gradient.float().abs().amax(dim=1)
+        sample_margins = margins.view(-1, *([1] * (worst.dim() - 1)))
+        # A tied sample flips with any change, unless the parameter doesn't
+        # affect its logits at all.
+        relative = torch.where(worst == 0, 0.0, worst * 2 / sample_margins)
+        sensitivities[name] = torch.maximum(sensitivities[name], relative.amax(dim=0))
@@ -1,5 +1,6 @@
 """Structural fingerprints for identifying experiments and their components."""
 
+from collections.abc import Hashable
 from dataclasses import dataclass
 from typing import override
 
@@ -53,6 +54,22 @@ class Fingerprint(BaseModel):
         collect_differences(self, other, [], differences)
         return differences
 
+    def canonical_key(self) -> Hashable:
+        """A hashable key that's equal for two fingerprints exactly when `diff`
+        finds no differences between them.
+
+        For grouping many fingerprints with a `dict` instead of comparing
+        each pair with `diff`.
+        """
+        return (
+            self.kind,
+            tuple(sorted(self.scalars.items())),
+            tuple(
+                (key, tuple(child.canonical_key() for child in group))
+                for key, group in sorted(self.children.items())
+            ),
+        )
+
     def raise_if_differs(self, other: Fingerprint) -> None:
         """Raise `FingerprintError` if `other` differs from `self`.
 
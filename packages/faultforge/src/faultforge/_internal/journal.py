@@ -0,0 +1,120 @@
+"""Append-only journal files.
+
+A journal is an 8 byte magic number followed by framed records, each a
+little-endian `u32` payload length and `u32` CRC-32 of the payload, then the
+payload itself. Records are only ever appended, so a crash can at worst leave
+a partially written record at the end, which readers detect and drop.
+"""
+
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
+from faultforge._internal.common import AnyPath
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FFJOURN1"
+_FRAME = struct.Struct("<II")
+
+
+def _frame(record: bytes) -> bytes:
+    return _FRAME.pack(len(record), zlib.crc32(record)) + record
+
+
+def is_journal(path: AnyPath) -> bool:
+    """Whether the file at `path` is a journal."""
+    with open(Path(path).expanduser(), "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+def create_journal(path: AnyPath, records: Iterable[bytes]) -> None:
+    """Write a new journal holding `records` to `path`, atomically."""
+    destination = Path(path).expanduser()
+    fd, temp_name = tempfile.mkstemp(dir=destination.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_MAGIC)
+        for record in records:
+            f.write(_frame(record))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_name, destination)
+
+
+def append_records(path: AnyPath, records: Iterable[bytes]) -> None:
+    """Append `records` to the journal at `path` and flush them to disk."""
+    with open(Path(path).expanduser(), "ab") as f:
+        f.write(b"".join(_frame(record) for record in records))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_frames(f: IO[bytes]) -> Iterator[tuple[bytes, int]]:
+    """Yield every intact record in `f` along with the offset just past it.
+
+    Stops at the first incomplete or corrupt record. `f` has to be positioned
+    just past the magic number.
+    """
+    offset = len(_MAGIC)
+    while len(frame := f.read(_FRAME.size)) == _FRAME.size:
+        length, checksum = _FRAME.unpack(frame)
+        record = f.read(length)
+        if len(record) != length or zlib.crc32(record) != checksum:
+            return
+        offset += _FRAME.size + length
+        yield record, offset
+
+
+def _check_magic(f: IO[bytes], path: Path) -> None:
+    if f.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError(f"{path} is not a journal")
+
+
+def _warn_on_incomplete(path: Path, offset: int, size: int) -> None:
+    if offset != size:
+        logger.warning(
+            f"Ignoring {size - offset} bytes of incomplete records at the end of {path}"
+        )
+
+
+def iter_journal(path: AnyPath) -> Iterator[bytes]:
+    """Yield the intact records of the journal at `path` one at a time.
+
+    Like `read_journal`, but only one record is held in memory at a time.
+    """
+    path = Path(path).expanduser()
+    with open(path, "rb") as f:
+        _check_magic(f, path)
+        offset = len(_MAGIC)
+        for record, offset in _read_frames(f):
+            yield record
+        _warn_on_incomplete(path, offset, os.fstat(f.fileno()).st_size)
+
+
+def read_journal(path: AnyPath, *, repair: bool = False) -> list[bytes]:
+    """Read every intact record from the journal at `path`.
+
+    Reading stops at the first incomplete or corrupt record, which can only
+    be the result of an interrupted append. With `repair`, the file is
+    truncated there so new records can be appended after the intact ones.
+    """
+    path = Path(path).expanduser()
+    records: list[bytes] = []
+    with open(path, "rb") as f:
+        _check_magic(f, path)
+        offset = len(_MAGIC)
+        for record, offset in _read_frames(f):
+            records.append(record)
+        size = os.fstat(f.fileno()).st_size
+
+    _warn_on_incomplete(path, offset, size)
+    if repair and offset != size:
+        with open(path, "r+b") as f:
+            _ = f.truncate(offset)
+
+    return records
@@ -0,0 +1,164 @@
+"""Incremental reading of large JSON documents.
+
+`JsonStream` walks a document piece by piece from a binary file, reading it
+in chunks, so the caller decides which values to decode and which to skip.
+Only the value currently being read is kept in memory in full, which bounds
+memory use by the largest single value rather than the whole document.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+_CHUNK_SIZE = 1 << 20
+
+_NON_WHITESPACE = re.compile(rb"\S")
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_REST = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class JsonStream:
+    """A cursor over a JSON document read from `file` in chunks.
+
+    Containers are walked with `object_keys`/`array_items`, which position
+    the cursor on each value in turn; the caller then consumes that value
+    with `read_value` or `skip_value` before advancing the iterator.
+    """
+
+    _file: IO[bytes]
+    _buffer: bytearray
+    _position: int
+    _eof: bool
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self._file = file
+        self._buffer = bytearray()
+        self._position = 0
+        self._eof = False
+
+    def peek(self) -> bytes:
+        """The first byte of the next value, e.g. `b"{"` for an object."""
+        self._skip_whitespace()
+        return bytes(self._buffer[self._position : self._position + 1])
+
+    def read_value(self) -> Any:
+        """Decode and consume the next value."""
+        end = self._value_end()
+        value = json.loads(self._buffer[self._position : end])
+        self._consume(end)
+        return value
+
+    def skip_value(self) -> None:
+        """Consume the next value without decoding it."""
+        self._consume(self._value_end())
+
+    def object_keys(self) -> Iterator[str]:
+        """Consume the next object, yielding each key with the cursor on its value.
+
+        The value has to be consumed before the next key is requested.
+        """
+        self._expect(b"{")
+        if self.peek() == b"}":
+            self._consume(self._position + 1)
+            return
+        while True:
+            if self.peek() != b'"':
+                raise ValueError(
+                    f"Expected an object key, got {self.peek()!r} in the JSON document"
+                )
+            key: str = self.read_value()
+            self._expect(b":")
+            yield key
+            if self._next_byte(b",}") == b"}":
+                return
+
+    def array_items(self) -> Iterator[None]:
+        """Consume the next array, yielding once with the cursor on each item.
+
+        The item has to be consumed before advancing.
+        """
+        self._expect(b"[")
+        if self.peek() == b"]":
+            self._consume(self._position + 1)
+            return
+        while True:
+            yield
+            if self._next_byte(b",]") == b"]":
+                return
+
+    def _fill(self) -> bool:
+        """Read another chunk into the buffer, returning `False` at the end."""
+        if self._eof:
+            return False
+        chunk = self._file.read(_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _consume(self, end: int) -> None:
+        self._position = end
+        # Dropping the consumed prefix is a copy, so only do it once it's
+        # grown past a chunk.
+        if self._position > _CHUNK_SIZE:
+            del self._buffer[: self._position]
+            self._position = 0
+
+    def _skip_whitespace(self) -> None:
+        while (match := _NON_WHITESPACE.search(self._buffer, self._position)) is None:
+            self._position = len(self._buffer)
+            if not self._fill():
+                return
+        self._position = match.start()
+
+    def _next_byte(self, expected: bytes) -> bytes:
+        byte = self.peek()
+        if not byte or byte not in expected:
+            raise ValueError(
+                f"Expected one of {expected!r}, got {byte!r} in the JSON document"
+            )
+        self._consume(self._position + 1)
+        return byte
+
+    def _expect(self, byte: bytes) -> None:
+        _ = self._next_byte(byte)
+
+    def _value_end(self) -> int:
+        """The buffer index just past the next value, reading as needed."""
+        if self.peek() == b"":
+            raise ValueError("Unexpected end of the JSON document")
+        start = self._position
+
+        if self._buffer[start] not in b'[{"':
+            while (match := _SCALAR_END.search(self._buffer, start)) is None:
+                if not self._fill():
+                    return len(self._buffer)
+            return match.start()
+
+        depth = 0
+        position = start
+        while True:
+            match = _STRUCTURAL.search(self._buffer, position)
+            if match is None:
+                position = len(self._buffer)
+                if not self._fill():
+                    raise ValueError("Unexpected end of the JSON document")
+                continue
+
+            position = match.end()
+            token = match.group()
+            if token == b'"':
+                while (rest := _STRING_REST.match(self._buffer, position)) is None:
+                    if not self._fill():
+                        raise ValueError("Unterminated string in the JSON document")
+                position = rest.end()
+            elif token in b"[{":
+                depth += 1
+            else:
+                depth -= 1
+
+            if depth == 0:
+                return position
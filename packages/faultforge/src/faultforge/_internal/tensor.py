@@ -33,6 +33,32 @@ def bitwise_xor(a: Tensor, b: Tensor) -> Tensor:
             return torch.bitwise_xor(a, b)
 
 
+def nonzero_xor(a: Tensor, b: Tensor) -> np.ndarray:
+    """The nonzero elements of `bitwise_xor(a, b)`, flattened into an unsigned
+    numpy array of the same bit width (on the host).
+
+    `bitwise_xor` returns a signed view for floats, where e.g. an all-ones
+    32-bit pattern reads as `-1`; reinterpreting the values as unsigned
+    recovers the true bit patterns.
+    """
+    xor = bitwise_xor(a, b)
+    nonzero = xor[xor != 0].numpy(force=True)
+    return nonzero.view(np.dtype(f"uint{nonzero.dtype.itemsize * 8}"))
+
+
+def is_host_contiguous(t: Tensor) -> bool:
+    """Whether `t` is stored in contiguous CPU memory.
+
+    Such tensors can be shared with numpy, and therefore Rust, without a copy.
+    """
+    return t.device.type == "cpu" and t.is_contiguous()
+
+
+def host_copy(t: Tensor) -> Tensor:
+    """Copy `t` into a new contiguous CPU tensor."""
+    return t.detach().to("cpu", memory_format=torch.contiguous_format, copy=True)
+
+
 def tensor_list_dtype(ts: list[torch.Tensor]) -> torch.dtype | None:
     """Confirms that all tensors in `ts` have the same datatype.
 
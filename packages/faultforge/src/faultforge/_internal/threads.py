@@ -0,0 +1,102 @@
+"""CPU thread budgeting for the Rust codecs and torch.
+
+See `faultforge.threads` for a general overview.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+
+import torch
+
+from faultforge._rust import set_thread_count
+
+logger = logging.getLogger(__name__)
+
+
+def available_threads() -> int:
+    """The number of CPU threads this process is allowed to use."""
+    return os.process_cpu_count() or 1
+
+
+def _split_evenly(total: int, parts: int) -> list[int]:
+    """Split `total` into `parts` near-equal shares of at least 1 each.
+
+    Earlier shares get the remainder. If there are more parts than `total`,
+    every part still gets 1, oversubscribing rather than starving a part.
+    """
+    base, remainder = divmod(total, parts)
+    return [max(1, base + (1 if index < remainder else 0)) for index in range(parts)]
+
+
+@dataclass(slots=True, frozen=True)
+class ThreadBudget:
+    """How many CPU threads the Rust codecs and torch may use.
+
+    Both the thread pool used by the Rust encoding/decoding functions and
+    torch's intra-op thread pool default to all cores. That's fine while they
+    take turns, but once they run at the same time (a pipelined
+    `Experiment.run_loop`) or several processes run side by side, the machine
+    is oversubscribed. `apply` sizes both pools from a single budget.
+    """
+
+    codec_threads: int
+    """Threads for the Rust encoding and decoding functions."""
+    torch_threads: int
+    """Threads for torch's intra-op parallelism (`torch.set_num_threads`)."""
+
+    def __post_init__(self) -> None:
+        if self.codec_threads < 1 or self.torch_threads < 1:
+            raise ValueError(
+                f"A thread budget needs at least one thread for each pool, got {self}"
+            )
+
+    @classmethod
+    def from_total(cls, threads: int, *, overlapping: bool = False) -> ThreadBudget:
+        """Budget `threads` CPU threads.
+
+        If `overlapping` is set, codec work runs at the same time as torch
+        work (e.g. with a pipelined `run_loop`), so the threads are split
+        between the two. Otherwise both get all of them.
+        """
+        if threads < 1:
+            raise ValueError(f"`threads` ({threads}) must be at least 1")
+
+        if not overlapping:
+            return cls(codec_threads=threads, torch_threads=threads)
+
+        codec_threads, torch_threads = _split_evenly(threads, 2)
+        return cls(codec_threads=codec_threads, torch_threads=torch_threads)
+
+    @classmethod
+    def detect(cls, *, overlapping: bool = False) -> ThreadBudget:
+        """Budget all threads available to this process, see `from_total`."""
+        return cls.from_total(available_threads(), overlapping=overlapping)
+
+    def split(self, workers: int) -> list[ThreadBudget]:
+        """Split this budget between `workers` processes running side by side."""
+        if workers < 1:
+            raise ValueError(f"`workers` ({workers}) must be at least 1")
+
+        return [
+            ThreadBudget(codec_threads=codec_threads, torch_threads=torch_threads)
+            for codec_threads, torch_threads in zip(
+                _split_evenly(self.codec_threads, workers),
+                _split_evenly(self.torch_threads, workers),
+                strict=True,
+            )
+        ]
+
+    def for_worker(self, index: int, workers: int) -> ThreadBudget:
+        """The share of this budget for worker `index` out of `workers`."""
+        if not 0 <= index < workers:
+            raise ValueError(f"Worker index {index} is out of range for {workers}")
+        return self.split(workers)[index]
+
+    def apply(self) -> None:
+        """Resize the codec and torch thread pools for this process."""
+        logger.debug(
+            f"Using {self.codec_threads} codec threads and {self.torch_threads} torch threads"
+        )
+        set_thread_count(self.codec_threads)
+        torch.set_num_threads(self.torch_threads)
@@ -51,6 +51,17 @@ class Picker:
     def __iter__(self) -> Picker: ...
     def __next__(self) -> int: ...
 
+def set_thread_count(threads: int | None = None) -> None:
+    """Set the number of threads used by the parallel encoding and decoding functions.
+
+    `None` restores the default, which uses all available cores unless
+    overridden by the `RAYON_NUM_THREADS` environment variable. Work that is
+    already running keeps using the previous pool.
+    """
+
+def thread_count() -> int:
+    """The number of threads used by the parallel encoding and decoding functions."""
+
 def list_of_array_fault_f32(
     input: ListOfArray[np.float32],
     fault: Fault,
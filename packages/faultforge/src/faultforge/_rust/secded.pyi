@@ -1,9 +1,16 @@
 import numpy as np
 import numpy.typing as npt
 from faultforge._rust import Fault
+from faultforge._rust.cep import Scheme
 
 type ListOfArray[T: np.generic] = list[npt.NDArray[T]]
 
+class Head:
+    @staticmethod
+    def mset() -> Head: ...
+    @staticmethod
+    def cep(scheme: Scheme) -> Head: ...
+
 class Encoding:
     def decode_f32(
         self,
@@ -11,6 +18,18 @@ class Encoding:
     def decode_u16(
         self,
     ) -> tuple[ListOfArray[np.uint16], list[bool]]: ...
+    def decode_into_f32(
+        self,
+        outputs: ListOfArray[np.float32],
+        head: Head | None = None,
+        only_dirty: bool = False,
+    ) -> list[int]: ...
+    def decode_into_u16(
+        self,
+        outputs: ListOfArray[np.uint16],
+        head: Head | None = None,
+        only_dirty: bool = False,
+    ) -> list[int]: ...
     def apply_fault(self, fault: Fault, target_bit: int) -> None: ...
     def apply_faults(self, faults: list[tuple[Fault, int]]) -> None: ...
     def clone(self) -> Encoding: ...
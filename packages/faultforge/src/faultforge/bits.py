@@ -0,0 +1,23 @@
+"""Vectorized analytics over bitmasks of xor values.
+
+Used for `EncodedFaultInjection`'s fault summaries and the CLI's plots; see
+`faultforge.experiments.encoded_memory.DetailedRunResult.bitmask`.
+"""
+
+from faultforge._internal.bits import (
+    bit_array,
+    bit_position_histogram,
+    popcount_counts,
+    popcount_histogram,
+    position_counts,
+    residual_fault_count,
+)
+
+__all__ = [
+    "bit_array",
+    "bit_position_histogram",
+    "popcount_counts",
+    "popcount_histogram",
+    "position_counts",
+    "residual_fault_count",
+]
@@ -8,7 +8,10 @@ from faultforge._internal.experiment import (
     Experiment,
     ExperimentDisplay,
     MaxRuns,
+    PipelinedExperiment,
     SaveConfig,
+    ScoreStatistics,
+    SequentialTest,
     Stability,
     StopCondition,
     relative_margin_of_error,
@@ -19,7 +22,10 @@ __all__ = [
     "Experiment",
     "ExperimentDisplay",
     "MaxRuns",
+    "PipelinedExperiment",
     "SaveConfig",
+    "ScoreStatistics",
+    "SequentialTest",
     "Stability",
     "StopCondition",
     "relative_margin_of_error",
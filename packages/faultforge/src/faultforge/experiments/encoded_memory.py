@@ -5,22 +5,55 @@
 scores the result according to a `ReliabilityMetric`.
 """
 
+from faultforge._internal.experiments.ber_search import AdaptiveBerSearch
+from faultforge._internal.experiments.columnar import ColumnView
 from faultforge._internal.experiments.encoded_memory import (
+    BitStatistics,
     DetailedResult,
     DetailedRunResult,
     EncodedFaultInjection,
+    MetricCounts,
+    NestedFaultSweep,
+    PairedFaultInjection,
     ReliabilityMetric,
+    ReplayedRun,
+    ResultFormat,
+    ResultReader,
     SavedResult,
     SimpleResult,
+    compact_journal,
+    convert_result_file,
+    derive_seed,
     discard_bitmasks_in_file,
+    merge_results,
 )
+from faultforge._internal.experiments.sample_outcomes import SampleOutcomes
+from faultforge._internal.experiments.screening import SensitivityScreen
+from faultforge._internal.experiments.strata import FaultSampling, FaultStrata
 
 __all__ = [
+    "AdaptiveBerSearch",
+    "BitStatistics",
+    "ColumnView",
     "DetailedResult",
     "DetailedRunResult",
     "EncodedFaultInjection",
+    "FaultSampling",
+    "FaultStrata",
+    "MetricCounts",
+    "NestedFaultSweep",
+    "PairedFaultInjection",
     "ReliabilityMetric",
+    "ReplayedRun",
+    "ResultFormat",
+    "ResultReader",
+    "SampleOutcomes",
     "SavedResult",
+    "SensitivityScreen",
     "SimpleResult",
+    "compact_journal",
+    "convert_result_file",
+    "derive_seed",
     "discard_bitmasks_in_file",
+    "merge_results",
 ]
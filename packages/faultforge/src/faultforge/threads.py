@@ -0,0 +1,15 @@
+"""CPU thread budgeting.
+
+The Rust encoding/decoding functions and torch's intra-op parallelism each
+use their own thread pool, and both default to all cores. `ThreadBudget`
+sizes both from a single number, splitting it between them when they run at
+the same time (`Experiment.run_loop(pipeline_depth=...)`) and between
+processes running side by side (`ThreadBudget.split`/`for_worker`).
+"""
+
+from faultforge._internal.threads import ThreadBudget, available_threads
+
+__all__ = [
+    "ThreadBudget",
+    "available_threads",
+]
@@ -1,6 +1,7 @@
 """Shared test doubles for the faultforge encoded_memory experiment tests."""
 
 import json
+from pathlib import Path
 from typing import override
 
 import torch
@@ -9,9 +10,10 @@ from faultforge._internal.common import DeviceLike
 from faultforge._internal.dataset import BatchedDataset
 from faultforge._internal.loading.abc import ModelBundle
 from faultforge._internal.progress import Progress
-from faultforge.encoding import IdentityEncoder
+from faultforge.encoding import Encoder, IdentityEncoder
 from faultforge.experiments.encoded_memory import (
     EncodedFaultInjection,
+    FaultSampling,
     ReliabilityMetric,
 )
 from torch import nn
@@ -39,9 +41,13 @@ class _FakeBundle(ModelBundle):
         dtype: torch.dtype = torch.float32,
         progress: Progress | None = None,
     ) -> nn.Module:
-        return nn.Linear(self._in_features, self._out_features).to(
-            device=device, dtype=dtype
-        )
+        # The same parameters on every load, like a real checkpoint.
+        model = nn.Linear(self._in_features, self._out_features)
+        generator = torch.Generator().manual_seed(0)
+        with torch.no_grad():
+            for parameter in model.parameters():
+                parameter.copy_(torch.rand(parameter.shape, generator=generator) - 0.5)
+        return model.to(device=device, dtype=dtype)
 
     @override
     def load_dataset(
@@ -61,25 +67,40 @@ class _FakeBundle(ModelBundle):
 def _make_experiment(
     *,
     compare_bitwise: bool,
+    bit_statistics: bool = False,
     faults: int | float = 1,
     golden_is_encoded: bool = False,
     dataset_batch_limit: int | None = None,
     reliability_metric: ReliabilityMetric = ReliabilityMetric.Accuracy,
+    extra_metrics: tuple[ReliabilityMetric, ...] = (),
+    outcomes_path: Path | None = None,
     dtype: torch.dtype = torch.float32,
     fault_summary: bool = False,
+    encoder: Encoder | None = None,
+    seed: int | None = None,
+    sampling: FaultSampling = FaultSampling.Uniform,
+    screening_tolerance: float | None = None,
+    screening_cache: Path | None = None,
 ) -> EncodedFaultInjection:
     bundle = _FakeBundle(in_features=4, out_features=3, batch_size=2, num_batches=2)
     return EncodedFaultInjection(
         bundle,
-        IdentityEncoder(),
+        IdentityEncoder() if encoder is None else encoder,
         reliability_metric,
+        extra_metrics=extra_metrics,
+        outcomes_path=outcomes_path,
         golden_is_encoded=golden_is_encoded,
         faults=faults,
+        sampling=sampling,
+        screening_tolerance=screening_tolerance,
+        screening_cache=screening_cache,
         compare_bitwise=compare_bitwise,
+        bit_statistics=bit_statistics,
         fault_summary=fault_summary,
         dataset_batch_limit=dataset_batch_limit,
         batch_size=2,
         dtype=dtype,
+        seed=seed,
     )
 
 
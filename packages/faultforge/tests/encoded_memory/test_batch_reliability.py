@@ -3,10 +3,14 @@
 import torch
 from faultforge._internal.experiments.encoded_memory import (
     BatchReliability,
+    ReliabilityMetric,
     _batch_accuracy,
     _batch_accuracy_degradation,
     _batch_critical_sdc,
+    _batch_reliability,
     _batch_sdc,
+    _batch_total,
+    _GoldenBatch,
 )
 
 
@@ -20,7 +24,9 @@ def test_batch_accuracy_counts_matching_predictions():
     )
     targets = torch.tensor([1, 0, 0])  # last one is wrong
 
-    assert _batch_accuracy(logits, targets) == BatchReliability(correct=2, total=3)
+    assert _batch_accuracy(logits, targets).to_host() == BatchReliability(
+        correct=2, total=3
+    )
 
 
 def test_batch_accuracy_degradation_is_golden_minus_faulty_correct():
@@ -32,7 +38,7 @@ def test_batch_accuracy_degradation_is_golden_minus_faulty_correct():
     # golden correct: [1, 0, 0] vs [1, 0, 0] -> 3
     # degradation: golden_correct - correct = 1
     result = _batch_accuracy_degradation(logits, golden_classifications, targets)
-    assert result == BatchReliability(correct=1, total=3)
+    assert result.to_host() == BatchReliability(correct=1, total=3)
 
 
 def test_batch_sdc_counts_matching_logits_elementwise():
@@ -41,7 +47,7 @@ def test_batch_sdc_counts_matching_logits_elementwise():
 
     # elementwise equality: [[T, F], [T, F]] -> 2 correct out of 4
     result = _batch_sdc(logits, golden_logits)
-    assert result == BatchReliability(correct=2, total=4)
+    assert result.to_host() == BatchReliability(correct=2, total=4)
 
 
 def test_batch_critical_sdc_counts_matching_top1_predictions():
@@ -49,4 +55,24 @@ def test_batch_critical_sdc_counts_matching_top1_predictions():
     golden_classifications = torch.tensor([1, 0, 0])  # matches the first two only
 
     result = _batch_critical_sdc(logits, golden_classifications)
-    assert result == BatchReliability(correct=2, total=3)
+    assert result.to_host() == BatchReliability(correct=2, total=3)
+
+
+def test_batch_reliability_dispatches_on_metric():
+    logits = torch.tensor([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]])  # predicts 1, 0, 1
+    golden = _GoldenBatch(
+        classifications=torch.tensor([1, 0, 0]),
+        logits=torch.tensor([[0.1, 0.9], [0.8, 0.2], [0.7, 0.3]]),
+    )
+    targets = torch.tensor([1, 0, 0])
+
+    expected = {
+        ReliabilityMetric.Accuracy: BatchReliability(correct=2, total=3),
+        ReliabilityMetric.AccuracyDegradation: BatchReliability(correct=1, total=3),
+        ReliabilityMetric.Sdc: BatchReliability(correct=4, total=6),
+        ReliabilityMetric.Top1Sdc: BatchReliability(correct=2, total=3),
+    }
+    for metric, reliability in expected.items():
+        result = _batch_reliability(metric, logits, golden, targets)
+        assert result.to_host() == reliability
+        assert _batch_total(metric, logits) == reliability.total
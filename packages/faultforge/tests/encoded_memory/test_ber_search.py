@@ -0,0 +1,133 @@
+"""Tests for `AdaptiveBerSearch`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.experiment import MaxRuns
+from faultforge.experiments.encoded_memory import AdaptiveBerSearch, SavedResult
+
+from .conftest import _make_experiment
+
+
+def test_starts_from_a_log_spaced_grid():
+    # Nothing is steeper than the threshold, so nothing is refined.
+    search = AdaptiveBerSearch(
+        _make_experiment(compare_bitwise=False),
+        0.01,
+        1.0,
+        run_budget=15,
+        flat_threshold=1000.0,
+    )
+    assert search.run()
+
+    points = search.points()
+    assert [rate for rate, _ in points] == [0.01, 0.1, 1.0]
+    assert [experiment.run_count() for _, experiment in points] == [5, 5, 5]
+
+
+def test_bisects_steep_intervals_within_the_budget():
+    # A negative threshold makes every interval steep and no point flat.
+    search = AdaptiveBerSearch(
+        _make_experiment(compare_bitwise=False),
+        0.01,
+        1.0,
+        run_budget=40,
+        max_points=5,
+        pilot_runs=2,
+        flat_threshold=-1.0,
+    )
+    assert search.run()
+
+    points = search.points()
+    assert len(points) == 5
+    assert sum(experiment.run_count() for _, experiment in points) == 40
+    fault_counts = [experiment.fault_count() for _, experiment in points]
+    assert fault_counts == sorted(set(fault_counts))
+
+
+def test_points_stop_on_their_own_conditions():
+    search = AdaptiveBerSearch(
+        _make_experiment(compare_bitwise=False),
+        0.01,
+        1.0,
+        run_budget=100,
+        pilot_runs=2,
+        max_points=3,
+        flat_threshold=-1.0,
+        point_stop_conditions=lambda: [MaxRuns(4)],
+    )
+    assert search.run()
+
+    assert [experiment.run_count() for _, experiment in search.points()] == [4] * 3
+
+
+def test_saves_result_files_and_resumes_them(tmp_path: Path):
+    def search(run_budget: int) -> AdaptiveBerSearch:
+        return AdaptiveBerSearch(
+            _make_experiment(compare_bitwise=False),
+            0.01,
+            1.0,
+            run_budget=run_budget,
+            max_points=3,
+            flat_threshold=-1.0,
+            output=tmp_path,
+        )
+
+    assert search(15).run()
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ["ber_0.01.json", "ber_0.1.json", "ber_1.json"]
+    assert SavedResult.load(tmp_path / "ber_0.1.json").bit_error_rate() == 48 / 480
+
+    # An unrelated result in the directory is left alone.
+    _make_experiment(compare_bitwise=True, faults=7).save(tmp_path / "other.json")
+
+    resumed = search(21)
+    assert resumed.run()
+    runs = [experiment.run_count() for _, experiment in resumed.points()]
+    assert len(runs) == 3
+    assert sum(runs) == 21
+
+
+def test_skips_or_overwrites_files_it_cant_resume(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    def search(*, overwrite: bool) -> AdaptiveBerSearch:
+        return AdaptiveBerSearch(
+            _make_experiment(compare_bitwise=False),
+            0.01,
+            1.0,
+            run_budget=15,
+            max_points=3,
+            flat_threshold=-1.0,
+            output=tmp_path,
+            overwrite=overwrite,
+        )
+
+    # Recorded at the middle rate, but with another configuration.
+    path = tmp_path / "ber_0.1.json"
+    _make_experiment(compare_bitwise=True, faults=48).save(path)
+    original = path.read_bytes()
+
+    skipping = search(overwrite=False)
+    assert skipping.run()
+    assert [rate for rate, _ in skipping.points()] == [0.01, 1.0]
+    assert path.read_bytes() == original
+    assert f"Not resuming {path}" in caplog.text
+
+    overwriting = search(overwrite=True)
+    assert overwriting.run()
+    assert [rate for rate, _ in overwriting.points()] == [0.01, 0.1, 1.0]
+    # The resumed ends already spent the budget, so the new point gets one run.
+    resumed = _make_experiment(compare_bitwise=False, faults=48)
+    resumed.load_from(path)
+    assert resumed.run_count() == 1
+
+
+def test_rejects_invalid_ranges():
+    experiment = _make_experiment(compare_bitwise=False)
+    with pytest.raises(ValueError, match="0 < lower < upper <= 1"):
+        AdaptiveBerSearch(experiment, 0.0, 0.1, run_budget=10)
+    with pytest.raises(ValueError, match="0 < lower < upper <= 1"):
+        AdaptiveBerSearch(experiment, 0.1, 0.01, run_budget=10)
+    with pytest.raises(ValueError, match="must be at least `initial_points`"):
+        AdaptiveBerSearch(experiment, 0.01, 0.1, run_budget=10, max_points=2)
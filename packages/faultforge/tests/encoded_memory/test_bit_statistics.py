@@ -0,0 +1,123 @@
+"""Tests for `EncodedFaultInjection`'s per-run `bit_statistics`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.bits import (
+    bit_position_histogram,
+    popcount_histogram,
+    residual_fault_count,
+)
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    ResultFormat,
+    ResultReader,
+    SavedResult,
+    SimpleResult,
+    convert_result_file,
+    discard_bitmasks_in_file,
+)
+
+from .conftest import _make_experiment
+
+
+def _saved(tmp_path: Path, *, compare_bitwise: bool = True, runs: int = 3) -> Path:
+    experiment = _make_experiment(
+        compare_bitwise=compare_bitwise, bit_statistics=True, faults=20
+    )
+    for _ in range(runs):
+        experiment.run()
+    path = tmp_path / "result.json"
+    experiment.save(path)
+    return path
+
+
+def test_statistics_match_the_bitmasks(tmp_path: Path):
+    saved = SavedResult.load(_saved(tmp_path))
+
+    assert isinstance(saved.result, DetailedResult)
+    assert saved.bit_statistics is not None
+    assert len(saved.bit_statistics) == 3
+    for run, stats in zip(saved.result.results, saved.bit_statistics, strict=True):
+        assert len(stats.positions) == 32
+        assert len(stats.popcounts) == 33
+        assert stats.position_histogram() == bit_position_histogram(run.bitmask)
+        assert stats.popcount_histogram() == popcount_histogram(run.bitmask)
+        assert stats.residual_fault_count() == residual_fault_count(run.bitmask)
+
+
+def test_statistics_without_bitmasks(tmp_path: Path):
+    saved = SavedResult.load(_saved(tmp_path, compare_bitwise=False))
+
+    assert isinstance(saved.result, SimpleResult)
+    assert saved.bit_statistics is not None
+    # Identity encoding: every injected fault is measured.
+    assert [stats.residual_fault_count() for stats in saved.bit_statistics] == [20] * 3
+
+
+def test_statistics_are_only_fingerprinted_when_recorded():
+    plain = _make_experiment(compare_bitwise=False)
+    recorded = _make_experiment(compare_bitwise=False, bit_statistics=True)
+
+    assert "bit_statistics" not in plain._fingerprint.scalars
+    assert recorded._fingerprint.scalars["bit_statistics"] is True
+
+
+def test_fault_summary_uses_statistics():
+    experiment = _make_experiment(
+        compare_bitwise=False, bit_statistics=True, fault_summary=True, faults=1.0
+    )
+    experiment.run()
+
+    extra = experiment.display().extra()
+    assert extra is not None
+    assert "15 parameters had 32 faulty bits" in extra
+
+
+def test_resume_appends_statistics(tmp_path: Path):
+    path = _saved(tmp_path, runs=2)
+    experiment = _make_experiment(compare_bitwise=True, bit_statistics=True, faults=20)
+    experiment.load_from(path)
+    experiment.run()
+    experiment.save(path)
+
+    saved = SavedResult.load(path)
+    assert saved.bit_statistics is not None
+    assert len(saved.bit_statistics) == len(saved.result.results) == 3
+
+
+def test_journal_round_trip(tmp_path: Path):
+    path = tmp_path / "journal"
+    experiment = _make_experiment(compare_bitwise=False, bit_statistics=True, faults=5)
+    experiment.run()
+    experiment.save_journal(path)
+    experiment.run()
+    experiment.append_to_journal(path, 1)
+
+    loaded = SavedResult.load(path)
+    assert loaded.bit_statistics is not None
+    assert len(loaded.bit_statistics) == 2
+    assert ResultReader(path).summary().bit_statistics == loaded.bit_statistics
+
+
+@pytest.mark.parametrize("compare_bitwise", [False, True])
+def test_columnar_round_trip(tmp_path: Path, compare_bitwise: bool):
+    json_path = _saved(tmp_path, compare_bitwise=compare_bitwise)
+    columnar_path = tmp_path / "result.columnar"
+    convert_result_file(json_path, columnar_path, format=ResultFormat.Columnar)
+
+    original = SavedResult.load(json_path)
+    assert SavedResult.load(columnar_path).bit_statistics == original.bit_statistics
+    reader = ResultReader(columnar_path)
+    assert reader.summary().bit_statistics == original.bit_statistics
+    assert reader.has_bitmasks() == compare_bitwise
+
+
+def test_statistics_survive_discarding_bitmasks(tmp_path: Path):
+    path = _saved(tmp_path)
+    original = SavedResult.load(path)
+    discard_bitmasks_in_file(path)
+
+    discarded = SavedResult.load(path)
+    assert isinstance(discarded.result, SimpleResult)
+    assert discarded.bit_statistics == original.bit_statistics
@@ -0,0 +1,82 @@
+"""Tests for the columnar result file format."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.experiments.encoded_memory import (
+    ColumnView,
+    DetailedResult,
+    ResultFormat,
+    SavedResult,
+    convert_result_file,
+    discard_bitmasks_in_file,
+)
+
+from .conftest import _make_experiment
+
+
+def _saved_json(tmp_path: Path, *, compare_bitwise: bool) -> Path:
+    experiment = _make_experiment(compare_bitwise=compare_bitwise, faults=5)
+    experiment.run()
+    experiment.run()
+    path = tmp_path / "result.json"
+    experiment.save(path)
+    return path
+
+
+@pytest.mark.parametrize("compare_bitwise", [False, True])
+def test_columnar_round_trip(tmp_path: Path, compare_bitwise: bool):
+    json_path = _saved_json(tmp_path, compare_bitwise=compare_bitwise)
+    columnar_path = tmp_path / "result.columnar"
+
+    convert_result_file(json_path, columnar_path, format=ResultFormat.Columnar)
+    original = SavedResult.load(json_path)
+    loaded = SavedResult.load(columnar_path)
+
+    assert loaded.fingerprint == original.fingerprint
+    assert loaded.total_bits == original.total_bits
+    assert loaded.scores() == original.scores()
+    assert loaded.bit_error_rate() == original.bit_error_rate()
+
+    # And back to JSON, byte for byte.
+    back_path = tmp_path / "back.json"
+    convert_result_file(columnar_path, back_path, format=ResultFormat.Json)
+    assert back_path.read_text() == json_path.read_text()
+
+
+def test_columnar_bitmasks_are_memory_mapped_views(tmp_path: Path):
+    json_path = _saved_json(tmp_path, compare_bitwise=True)
+    original = SavedResult.load(json_path)
+    convert_result_file(json_path, format=ResultFormat.Columnar)
+
+    loaded = SavedResult.load(json_path)
+    assert isinstance(original.result, DetailedResult)
+    assert isinstance(loaded.result, DetailedResult)
+    for run, original_run in zip(
+        loaded.result.results, original.result.results, strict=True
+    ):
+        assert isinstance(run.bitmask, ColumnView)
+        assert all(isinstance(value, int) for value in run.bitmask)
+        assert run.bitmask == original_run.bitmask
+        assert run.bitmask.array().tolist() == original_run.bitmask
+
+
+def test_discard_bitmasks_in_columnar_file_keeps_format(tmp_path: Path):
+    path = _saved_json(tmp_path, compare_bitwise=True)
+    convert_result_file(path, format=ResultFormat.Columnar)
+    scores = SavedResult.load(path).scores()
+
+    discard_bitmasks_in_file(path)
+
+    loaded = SavedResult.load(path)
+    assert loaded.result.kind == "simple"
+    assert loaded.scores() == scores
+    assert path.read_bytes().startswith(b"FFCOLUMN")
+
+
+def test_experiment_refuses_to_resume_columnar_file(tmp_path: Path):
+    path = _saved_json(tmp_path, compare_bitwise=False)
+    convert_result_file(path, format=ResultFormat.Columnar)
+
+    with pytest.raises(ValueError, match="columnar"):
+        _make_experiment(compare_bitwise=False).load_from(path)
@@ -0,0 +1,73 @@
+"""Tests for measuring several reliability metrics in one inference pass."""
+
+import pytest
+from faultforge.experiments.encoded_memory import ReliabilityMetric, SavedResult
+
+from .conftest import _make_experiment
+
+
+def _saved(experiment) -> SavedResult:
+    return SavedResult.model_validate_json(experiment.serialize())
+
+
+def test_extra_metrics_are_recorded_per_run():
+    experiment = _make_experiment(
+        compare_bitwise=False,
+        extra_metrics=(ReliabilityMetric.Sdc, ReliabilityMetric.Top1Sdc),
+    )
+    experiment.run()
+    experiment.run()
+
+    saved = _saved(experiment)
+    assert saved.metrics() == [
+        ReliabilityMetric.Accuracy,
+        ReliabilityMetric.Sdc,
+        ReliabilityMetric.Top1Sdc,
+    ]
+    assert saved.scores() == experiment.scores()
+    assert saved.scores(ReliabilityMetric.Accuracy) == experiment.scores()
+    for metric in (ReliabilityMetric.Sdc, ReliabilityMetric.Top1Sdc):
+        scores = saved.scores(metric)
+        assert len(scores) == 2
+        assert all(0.0 <= score <= 100.0 for score in scores)
+
+    # 2 batches of 2 images with 3 classes each.
+    assert saved.extra_results[ReliabilityMetric.Sdc].total_items == 12
+    assert saved.extra_results[ReliabilityMetric.Top1Sdc].total_items == 4
+
+
+def test_unrecorded_metric_raises():
+    experiment = _make_experiment(compare_bitwise=False)
+    experiment.run()
+
+    with pytest.raises(KeyError):
+        _ = _saved(experiment).scores(ReliabilityMetric.Sdc)
+
+
+def test_extra_metrics_skip_primary_and_duplicates():
+    experiment = _make_experiment(
+        compare_bitwise=False,
+        extra_metrics=(
+            ReliabilityMetric.Accuracy,
+            ReliabilityMetric.Sdc,
+            ReliabilityMetric.Sdc,
+        ),
+    )
+    experiment.run()
+
+    assert _saved(experiment).metrics() == [
+        ReliabilityMetric.Accuracy,
+        ReliabilityMetric.Sdc,
+    ]
+
+
+def test_extra_metrics_round_trip():
+    extra_metrics = (ReliabilityMetric.AccuracyDegradation,)
+    experiment = _make_experiment(compare_bitwise=True, extra_metrics=extra_metrics)
+    experiment.run()
+    serialized = experiment.serialize()
+
+    reloaded = _make_experiment(compare_bitwise=True, extra_metrics=extra_metrics)
+    reloaded.deserialize(serialized)
+
+    assert reloaded.serialize() == serialized
@@ -76,3 +76,17 @@ def test_fingerprint_records_test_image_limit_from_batch_limit():
     )
     # batch_size=2 (fixed in `_make_experiment`) * dataset_batch_limit=1
     assert scalars["test_image_limit"] == 2
+
+
+def test_fingerprint_records_extra_metrics_only_when_set():
+    assert "extra_metrics" not in _fingerprint_scalars(
+        _make_experiment(compare_bitwise=False)
+    )
+
+    scalars = _fingerprint_scalars(
+        _make_experiment(
+            compare_bitwise=False,
+            extra_metrics=(ReliabilityMetric.Top1Sdc, ReliabilityMetric.Sdc),
+        )
+    )
+    assert scalars["extra_metrics"] == "sdc,top1_sdc"
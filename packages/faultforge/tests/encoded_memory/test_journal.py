@@ -0,0 +1,51 @@
+"""Tests for journaled EncodedFaultInjection results."""
+
+from pathlib import Path
+
+from faultforge.experiments.encoded_memory import (
+    ReliabilityMetric,
+    SavedResult,
+    compact_journal,
+)
+
+from .conftest import _make_experiment
+
+
+def _journaled(path: Path):
+    experiment = _make_experiment(
+        compare_bitwise=True, extra_metrics=(ReliabilityMetric.Top1Sdc,)
+    )
+    experiment.run()
+    experiment.save_journal(path)
+    experiment.run()
+    experiment.run()
+    experiment.append_to_journal(path, 1)
+    return experiment
+
+
+def test_saved_result_folds_journal(tmp_path: Path):
+    path = tmp_path / "journal"
+    experiment = _journaled(path)
+
+    assert SavedResult.load(path).model_dump_json() == experiment.serialize()
+
+
+def test_experiment_resumes_from_journal(tmp_path: Path):
+    path = tmp_path / "journal"
+    experiment = _journaled(path)
+
+    reloaded = _make_experiment(
+        compare_bitwise=True, extra_metrics=(ReliabilityMetric.Top1Sdc,)
+    )
+    reloaded.load_from(path)
+
+    assert reloaded.serialize() == experiment.serialize()
+
+
+def test_compact_journal(tmp_path: Path):
+    path = tmp_path / "journal"
+    experiment = _journaled(path)
+
+    compact_journal(path)
+
+    assert path.read_text() == experiment.serialize()
@@ -0,0 +1,86 @@
+"""Tests for `merge_results`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    ReliabilityMetric,
+    SavedResult,
+    merge_results,
+)
+from faultforge.fingerprint import FingerprintError
+
+from .conftest import _make_experiment
+
+
+def _shard(tmp_path: Path, name: str, runs: int, **kwargs) -> SavedResult:
+    experiment = _make_experiment(compare_bitwise=True, faults=5, **kwargs)
+    for _ in range(runs):
+        experiment.run()
+    experiment.save(tmp_path / name)
+    return SavedResult.load(tmp_path / name)
+
+
+def test_concatenates_shards(tmp_path: Path):
+    first = _shard(
+        tmp_path,
+        "a.json",
+        2,
+        bit_statistics=True,
+        extra_metrics=(ReliabilityMetric.Sdc,),
+    )
+    second = _shard(
+        tmp_path,
+        "b.json",
+        3,
+        bit_statistics=True,
+        extra_metrics=(ReliabilityMetric.Sdc,),
+    )
+    merged = merge_results([first, second])
+
+    assert merged.fingerprint == first.fingerprint
+    assert merged.scores() == first.scores() + second.scores()
+    assert merged.scores(ReliabilityMetric.Sdc) == (
+        first.scores(ReliabilityMetric.Sdc) + second.scores(ReliabilityMetric.Sdc)
+    )
+    assert merged.seeds == [*(first.seeds or []), *(second.seeds or [])]
+    assert merged.bit_statistics == [
+        *(first.bit_statistics or []),
+        *(second.bit_statistics or []),
+    ]
+    assert isinstance(merged.result, DetailedResult)
+    assert isinstance(second.result, DetailedResult)
+    assert merged.result.results[2:] == second.result.results
+
+    merged.save(tmp_path / "merged.json")
+    assert SavedResult.load(tmp_path / "merged.json") == merged
+
+
+def test_deduplicates_by_seed(tmp_path: Path):
+    first = _shard(tmp_path, "a.json", 2)
+    second = _shard(tmp_path, "b.json", 1)
+    merged = merge_results([first, second])
+
+    again = merge_results([merged, first, second])
+    assert again.seeds == merged.seeds
+    assert again.scores() == merged.scores()
+
+
+def test_keeps_every_run_without_seeds(tmp_path: Path):
+    first = _shard(tmp_path, "a.json", 2)
+    first.seeds = None
+
+    assert len(merge_results([first, first]).scores()) == 4
+
+
+def test_rejects_other_configurations(tmp_path: Path):
+    first = _shard(tmp_path, "a.json", 1)
+    other = _make_experiment(compare_bitwise=True, faults=6)
+    other.run()
+    other.save(tmp_path / "b.json")
+
+    with pytest.raises(FingerprintError):
+        merge_results([first, SavedResult.load(tmp_path / "b.json")])
+    with pytest.raises(ValueError, match="at least one"):
+        merge_results([])
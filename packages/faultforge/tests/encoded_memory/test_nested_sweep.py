@@ -0,0 +1,154 @@
+"""Tests for `NestedFaultSweep` and the per-run seeds it's built on."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.bits import residual_fault_count
+from faultforge.experiment import MaxRuns, SaveConfig
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    NestedFaultSweep,
+    ResultFormat,
+    SavedResult,
+    convert_result_file,
+)
+
+from .conftest import _make_experiment
+
+
+def _sweep(
+    *, faults: tuple[int, ...] = (2, 8, 20), stop_after: int = 3
+) -> NestedFaultSweep:
+    base = _make_experiment(compare_bitwise=True, faults=faults[0])
+    points = {f"faults_{count}.json": base.with_faults(count) for count in faults}
+    return NestedFaultSweep(points, point_stop_conditions=lambda: [MaxRuns(stop_after)])
+
+
+def test_every_run_seed_is_recorded(tmp_path: Path):
+    experiment = _make_experiment(compare_bitwise=False, faults=5)
+    experiment.run()
+    experiment.run()
+    experiment.save(tmp_path / "result.json")
+
+    seeds = SavedResult.load(tmp_path / "result.json").seeds
+    assert seeds is not None
+    assert len(seeds) == 2
+    assert seeds[0] != seeds[1]
+
+
+def test_seeds_survive_journals_and_columnar_files(tmp_path: Path):
+    experiment = _make_experiment(compare_bitwise=False, faults=5)
+    experiment.run()
+    experiment.save_journal(tmp_path / "journal")
+    experiment.run()
+    experiment.append_to_journal(tmp_path / "journal", 1)
+    convert_result_file(
+        tmp_path / "journal", tmp_path / "columnar", format=ResultFormat.Columnar
+    )
+
+    assert SavedResult.load(tmp_path / "journal").seeds == experiment._seeds
+    assert SavedResult.load(tmp_path / "columnar").seeds == experiment._seeds
+
+
+def test_points_share_seeds():
+    sweep = _sweep()
+    sweep.run_loop()
+
+    points = sweep.points()
+    assert [point.run_count() for point in points] == [3, 3, 3]
+    assert points[0]._seeds == points[1]._seeds == points[2]._seeds
+
+
+def test_faults_are_nested_and_reproducible_from_the_seed():
+    sweep = _sweep()
+    sweep.run_loop()
+
+    for point in sweep.points():
+        assert point._seeds is not None
+        assert isinstance(point._result, DetailedResult)
+        for seed, run in zip(point._seeds, point._result.results, strict=True):
+            # Injecting a point's faults from scratch gives the same faulty
+            # bits as adding them on top of the previous point's.
+            replayed = point._compare_bitwise(point._inject_faults(seed))
+            assert replayed is not None
+            assert replayed.tolist() == list(run.bitmask)
+            # Identity encoding: every injected fault is measured.
+            assert residual_fault_count(run.bitmask) == point._faulty_bit_count
+
+
+def test_points_are_ordered_by_fault_count():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    sweep = NestedFaultSweep({"b": base.with_faults(10), "a": base.with_faults(3)})
+
+    assert [point._faulty_bit_count for point in sweep.points()] == [3, 10]
+
+
+def test_rejects_points_of_separate_experiments():
+    with pytest.raises(ValueError, match="same experiment"):
+        NestedFaultSweep(
+            {
+                "a": _make_experiment(compare_bitwise=False, faults=1),
+                "b": _make_experiment(compare_bitwise=False, faults=2),
+            }
+        )
+
+
+def test_rejects_duplicate_fault_counts():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    with pytest.raises(ValueError, match="both flip 4 bits"):
+        NestedFaultSweep({"a": base.with_faults(4), "b": base.with_faults(4)})
+
+
+def test_stops_once_every_point_would():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    conditions = iter([[MaxRuns(2)], [MaxRuns(4)]])
+    sweep = NestedFaultSweep(
+        {"a": base.with_faults(1), "b": base.with_faults(2)},
+        point_stop_conditions=lambda: next(conditions),
+    )
+    sweep.run_loop()
+
+    assert [point.run_count() for point in sweep.points()] == [4, 4]
+
+
+def test_saves_a_file_per_point_and_resumes(tmp_path: Path):
+    directory = tmp_path / "sweep"
+    assert _sweep().run_loop(save_config=SaveConfig(directory, interval_seconds=None))
+
+    files = sorted(path.name for path in directory.iterdir())
+    assert files == ["faults_2.json", "faults_20.json", "faults_8.json"]
+    first = SavedResult.load(directory / "faults_8.json")
+    assert first.bit_error_rate() == 8 / 480
+
+    resumed = _sweep(stop_after=5)
+    resumed.load_from(directory)
+    resumed.run_loop(save_config=SaveConfig(directory, interval_seconds=None))
+    seeds = SavedResult.load(directory / "faults_20.json").seeds
+    assert seeds is not None
+    assert seeds[:3] == first.seeds
+    assert len(seeds) == 5
+
+
+def test_resumes_points_saved_by_an_interrupted_save(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    directory = tmp_path / "sweep"
+    sweep = _sweep()
+    sweep.run_loop(save_config=SaveConfig(directory, interval_seconds=None))
+    # Stopped after saving one more run to only one of the points.
+    sweep.run()
+    low, _, _ = sweep.points()
+    low.save(directory / "faults_2.json")
+
+    resumed = _sweep(stop_after=4)
+    resumed.load_from(directory)
+    assert "resuming from the 3 runs they share" in caplog.text
+    assert [point.run_count() for point in resumed.points()] == [3, 3, 3]
+    resumed.run_loop(save_config=SaveConfig(directory, interval_seconds=None))
+    seeds = [
+        SavedResult.load(directory / name).seeds
+        for name in ("faults_2.json", "faults_8.json", "faults_20.json")
+    ]
+    assert seeds[0] is not None
+    assert len(seeds[0]) == 4
+    assert seeds[1] == seeds[2] == seeds[0]
@@ -0,0 +1,110 @@
+"""Tests for `PairedFaultInjection`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.encoding import CepEncoder, MsetEncoder, SecdedEncoder
+from faultforge.experiment import MaxRuns, SaveConfig, SequentialTest
+from faultforge.experiments.encoded_memory import (
+    EncodedFaultInjection,
+    PairedFaultInjection,
+    SavedResult,
+)
+
+from .conftest import _make_experiment
+
+
+def _paired(base: EncodedFaultInjection | None = None) -> PairedFaultInjection:
+    base = _make_experiment(compare_bitwise=False, faults=1) if base is None else base
+    return PairedFaultInjection(
+        {
+            "cep.json": base.with_encoder(CepEncoder(), 6),
+            "mset.json": base.with_encoder(MsetEncoder(), 6),
+        }
+    )
+
+
+def test_points_get_the_same_faults():
+    paired = _paired()
+    paired.run_loop(stop_conditions=[MaxRuns(3)])
+
+    cep, mset = paired.points()
+    assert cep.run_count() == mset.run_count() == 3
+    assert cep._seeds == mset._seeds
+    for index in range(3):
+        assert (
+            cep.replay(index).faulty_bits.tolist()
+            == mset.replay(index).faulty_bits.tolist()
+        )
+
+
+def test_scores_are_the_paired_differences():
+    paired = _paired()
+    paired.run_loop(stop_conditions=[MaxRuns(4)])
+
+    cep, mset = paired.points()
+    differences = [
+        ours - theirs for ours, theirs in zip(cep.scores(), mset.scores(), strict=True)
+    ]
+    assert list(paired.scores()) == differences
+    assert paired.statistics().count == 4
+    assert paired.mean_score() == pytest.approx(sum(differences) / 4)
+
+
+def test_identical_encoders_stop_as_negligible():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    paired = PairedFaultInjection(
+        {"a.json": base.with_faults(6), "b.json": base.with_faults(6)}
+    )
+    paired.run_loop(stop_conditions=[SequentialTest(margin=1.0, min_samples=3)])
+
+    assert paired.run_count() == 3
+    assert list(paired.scores()) == [0.0, 0.0, 0.0]
+
+
+def test_rejects_encodings_without_a_common_layout():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    with pytest.raises(ValueError, match="Can't map faults into secded.json"):
+        PairedFaultInjection(
+            {
+                "mset.json": base.with_encoder(MsetEncoder(), 6),
+                "secded.json": base.with_encoder(SecdedEncoder(64), 6),
+            }
+        )
+
+
+def test_rejects_mismatched_points():
+    base = _make_experiment(compare_bitwise=False, faults=1)
+    with pytest.raises(ValueError, match="needs 2 points"):
+        PairedFaultInjection({"a.json": base.with_faults(6)})
+    with pytest.raises(ValueError, match="a.json flips 6 bits but b.json flips 7"):
+        PairedFaultInjection(
+            {"a.json": base.with_faults(6), "b.json": base.with_faults(7)}
+        )
+    with pytest.raises(ValueError, match="same experiment"):
+        PairedFaultInjection(
+            {
+                "a.json": base.with_faults(6),
+                "b.json": _make_experiment(compare_bitwise=False, faults=6),
+            }
+        )
+
+
+def test_saves_a_file_per_point_and_resumes(tmp_path: Path):
+    directory = tmp_path / "paired"
+    paired = _paired()
+    paired.run_loop(
+        stop_conditions=[MaxRuns(2)],
+        save_config=SaveConfig(directory, interval_seconds=None),
+    )
+
+    files = sorted(path.name for path in directory.iterdir())
+    assert files == ["cep.json", "mset.json"]
+    assert SavedResult.load(directory / "cep.json").seeds == paired.points()[0]._seeds
+
+    resumed = _paired()
+    resumed.load_from(directory)
+    assert list(resumed.scores()) == list(paired.scores())
+    assert resumed.statistics().count == 2
+    resumed.run_loop(stop_conditions=[MaxRuns(3)])
+    assert resumed.run_count() == 3
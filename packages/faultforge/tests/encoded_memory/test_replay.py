@@ -0,0 +1,107 @@
+"""Tests for seeded runs and `EncodedFaultInjection.replay`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.experiment import AdditionalRuns, SaveConfig
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    ReliabilityMetric,
+    derive_seed,
+)
+
+from .conftest import _make_experiment
+
+
+def test_seeded_runs_are_reproducible():
+    first = _make_experiment(compare_bitwise=True, faults=5, seed=7)
+    second = _make_experiment(compare_bitwise=True, faults=5, seed=7)
+    for experiment in (first, second):
+        experiment.run()
+        experiment.run()
+
+    assert first._seeds == second._seeds == [derive_seed(7, i) for i in range(2)]
+    assert first.serialize() == second.serialize()
+
+
+def test_seeds_follow_the_run_index_when_pipelined_and_resumed(tmp_path: Path):
+    path = tmp_path / "result.json"
+    experiment = _make_experiment(compare_bitwise=False, faults=5, seed=7)
+    experiment.run_loop(
+        stop_conditions=[AdditionalRuns(3)],
+        save_config=SaveConfig(path=path),
+        pipeline_depth=2,
+    )
+
+    resumed = _make_experiment(compare_bitwise=False, faults=5, seed=7)
+    resumed.load_from(path)
+    resumed.run_loop(stop_conditions=[AdditionalRuns(2)], pipeline_depth=2)
+
+    assert resumed._seeds == [derive_seed(7, i) for i in range(5)]
+
+
+def test_siblings_and_offsets():
+    base = _make_experiment(compare_bitwise=False, faults=5, seed=7)
+    base.run()
+    sibling = base.with_faults(9)
+    sibling.run()
+    assert sibling._seeds == base._seeds
+
+    sibling.seed_runs(7, offset=10)
+    sibling.run()
+    assert sibling._seeds == [derive_seed(7, 0), derive_seed(7, 11)]
+
+
+def test_replays_a_recorded_run():
+    experiment = _make_experiment(
+        compare_bitwise=True,
+        faults=5,
+        extra_metrics=(ReliabilityMetric.Sdc,),
+    )
+    experiment.run()
+    experiment.run()
+
+    replayed = experiment.replay(1)
+    assert experiment._seeds is not None
+    assert replayed.seed == experiment._seeds[1]
+    assert len(set(replayed.faulty_bits.tolist())) == 5
+    assert isinstance(experiment._result, DetailedResult)
+    run = experiment._result.results[1]
+    assert replayed.bitmask.tolist() == list(run.bitmask)
+    assert replayed.correct_count == run.correct_count
+    assert replayed.scores[ReliabilityMetric.Accuracy] == experiment.scores()[1]
+    assert ReliabilityMetric.Sdc in replayed.scores
+    assert replayed.outcomes is None
+
+
+def test_replays_without_recorded_bitmasks(tmp_path: Path):
+    experiment = _make_experiment(compare_bitwise=False, faults=5, seed=3)
+    experiment.run()
+    experiment.save(tmp_path / "result.json")
+
+    loaded = _make_experiment(compare_bitwise=False, faults=5)
+    loaded.load_from(tmp_path / "result.json")
+    replayed = loaded.replay(0)
+    assert replayed.seed == derive_seed(3, 0)
+    # Identity encoding: every injected fault shows up in the decoded values.
+    assert len(replayed.bitmask) > 0
+    assert replayed.correct_count == experiment._result.results[0]
+
+
+def test_only_recorded_runs_can_be_replayed():
+    experiment = _make_experiment(compare_bitwise=False)
+    experiment.run()
+    with pytest.raises(IndexError, match="Run 1 wasn't recorded"):
+        _ = experiment.replay(1)
+    with pytest.raises(IndexError, match="Run -1 wasn't recorded"):
+        _ = experiment.replay(-1)
+
+
+def test_results_without_seeds_cant_be_replayed():
+    experiment = _make_experiment(compare_bitwise=False)
+    experiment.run()
+    experiment._seeds = None
+    with pytest.raises(ValueError, match="before seeds were"):
+        _ = experiment.replay(0)
+    with pytest.raises(ValueError, match="64-bit"):
+        experiment.seed_runs(-1)
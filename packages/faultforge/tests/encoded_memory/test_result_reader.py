@@ -0,0 +1,92 @@
+"""Tests for `ResultReader`, the lazy saved result reader."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    ReliabilityMetric,
+    ResultFormat,
+    ResultReader,
+    SavedResult,
+    convert_result_file,
+)
+
+from .conftest import _make_experiment
+
+
+def _experiment(*, compare_bitwise: bool = True):
+    experiment = _make_experiment(
+        compare_bitwise=compare_bitwise,
+        faults=5,
+        extra_metrics=(ReliabilityMetric.Top1Sdc,),
+    )
+    experiment.run()
+    experiment.run()
+    return experiment
+
+
+def _json(path: Path) -> Path:
+    _experiment().save(path)
+    return path
+
+
+def _compressed(path: Path) -> Path:
+    _experiment().save(path, compressed=True)
+    return path
+
+
+def _columnar(path: Path) -> Path:
+    _experiment().save(path)
+    convert_result_file(path, format=ResultFormat.Columnar)
+    return path
+
+
+def _journal(path: Path) -> Path:
+    experiment = _experiment()
+    experiment.save_journal(path)
+    experiment.run()
+    experiment.append_to_journal(path, 2)
+    return path
+
+
+_WRITERS: list[Callable[[Path], Path]] = [_json, _compressed, _columnar, _journal]
+
+
+@pytest.mark.parametrize("write", _WRITERS)
+def test_summary_matches_full_load(tmp_path: Path, write: Callable[[Path], Path]):
+    path = write(tmp_path / "result")
+    full = SavedResult.load(path)
+    summary = ResultReader(path).summary()
+
+    assert summary.result.kind == "simple"
+    assert summary.fingerprint == full.fingerprint
+    assert summary.total_items == full.total_items
+    assert summary.bit_error_rate() == full.bit_error_rate()
+    for metric in full.metrics():
+        assert summary.scores(metric) == full.scores(metric)
+
+
+@pytest.mark.parametrize("write", _WRITERS)
+def test_runs_stream_the_bitmasks(tmp_path: Path, write: Callable[[Path], Path]):
+    path = write(tmp_path / "result")
+    full = SavedResult.load(path)
+    reader = ResultReader(path)
+
+    assert isinstance(full.result, DetailedResult)
+    assert reader.has_bitmasks()
+    assert reader.run_count() == len(full.result.results)
+    for run, expected in zip(reader.runs(), full.result.results, strict=True):
+        assert run.correct_count == expected.correct_count
+        assert list(run.bitmask) == list(expected.bitmask)
+
+
+def test_runs_require_bitmasks(tmp_path: Path):
+    path = tmp_path / "result.json"
+    _experiment(compare_bitwise=False).save(path)
+    reader = ResultReader(path)
+
+    assert not reader.has_bitmasks()
+    with pytest.raises(ValueError, match="without bitmasks"):
+        next(reader.runs())
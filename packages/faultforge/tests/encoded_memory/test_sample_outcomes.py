@@ -0,0 +1,116 @@
+"""Tests for recording per-sample outcomes and deriving scores from them."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from faultforge._internal.experiments.sample_outcomes import OutcomeWriter
+from faultforge.experiments.encoded_memory import (
+    ReliabilityMetric,
+    SampleOutcomes,
+    SavedResult,
+)
+
+from .conftest import _make_experiment
+
+
+def test_outcome_scores_match_measured_scores(tmp_path: Path):
+    experiment = _make_experiment(
+        compare_bitwise=False,
+        extra_metrics=(
+            ReliabilityMetric.AccuracyDegradation,
+            ReliabilityMetric.Top1Sdc,
+        ),
+        outcomes_path=tmp_path / "result.outcomes",
+    )
+    for _ in range(3):
+        experiment.run()
+
+    saved = SavedResult.model_validate_json(experiment.serialize())
+    outcomes = saved.sample_outcomes()
+    assert outcomes.run_count() == 3
+    assert outcomes.sample_count() == 4
+
+    for metric in saved.metrics():
+        assert saved.outcome_scores(metric, outcomes=outcomes) == pytest.approx(
+            saved.scores(metric)
+        )
+
+    with pytest.raises(ValueError, match="SDC"):
+        _ = saved.outcome_scores(ReliabilityMetric.Sdc, outcomes=outcomes)
+
+
+def test_class_scores_cover_every_sample(tmp_path: Path):
+    experiment = _make_experiment(
+        compare_bitwise=False, outcomes_path=tmp_path / "result.outcomes"
+    )
+    experiment.run()
+
+    saved = SavedResult.model_validate_json(experiment.serialize())
+    outcomes = saved.sample_outcomes()
+    class_scores = saved.class_scores(ReliabilityMetric.Accuracy)
+    assert list(class_scores) == outcomes.classes()
+
+    correct = sum(
+        score / 100 * int(outcomes.class_mask(target_class).sum())
+        for target_class, (score,) in class_scores.items()
+    )
+    assert correct == pytest.approx(outcomes.correct_counts()[0])
+
+
+def test_sample_outcomes_require_a_side_file():
+    experiment = _make_experiment(compare_bitwise=False)
+    experiment.run()
+
+    saved = SavedResult.model_validate_json(experiment.serialize())
+    assert saved.outcomes_file is None
+    with pytest.raises(ValueError):
+        _ = saved.sample_outcomes()
+
+
+def _write_runs(path: Path, runs: list[tuple[list[bool], list[bool]]], start: int):
+    writer = OutcomeWriter(path)
+    writer.open(np.array([0, 1, 1]), np.array([True, False, True]), run_count=start)
+    for correct, unchanged in runs:
+        writer.append(np.array(correct), np.array(unchanged))
+
+
+def test_writer_round_trip_and_resume(tmp_path: Path):
+    path = tmp_path / "outcomes"
+    _write_runs(
+        path,
+        [([True, False, True], [True, True, False]), ([False] * 3, [True] * 3)],
+        start=0,
+    )
+
+    # Resuming after one saved run drops the unsaved second one.
+    _write_runs(path, [([True] * 3, [False] * 3)], start=1)
+
+    outcomes = SampleOutcomes.load(path)
+    assert outcomes.run_count() == 2
+    assert outcomes.targets.tolist() == [0, 1, 1]
+    assert outcomes.golden_correct.tolist() == [True, False, True]
+    assert outcomes.correct(0).tolist() == [True, False, True]
+    assert outcomes.correct(1).tolist() == [True] * 3
+    assert outcomes.unchanged_counts().tolist() == [2, 0]
+    assert outcomes.correct_counts(outcomes.class_mask(1)).tolist() == [1, 2]
+    assert outcomes.flip_rates().tolist() == [0.5, 0.5, 1.0]
+
+    assert SampleOutcomes.load(path, max_runs=1).run_count() == 1
+
+
+def test_writer_rejects_missing_runs(tmp_path: Path):
+    path = tmp_path / "outcomes"
+    _write_runs(path, [], start=0)
+
+    with pytest.raises(RuntimeError):
+        _write_runs(path, [], start=1)
+
+
+def test_partial_trailing_run_is_ignored(tmp_path: Path):
+    path = tmp_path / "outcomes"
+    _write_runs(path, [([True] * 3, [True] * 3)], start=0)
+    with open(path, "ab") as f:
+        f.write(b"\x01")
+
+    assert SampleOutcomes.load(path).run_count() == 1
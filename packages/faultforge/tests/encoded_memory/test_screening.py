@@ -0,0 +1,181 @@
+"""Tests for skipping inference with a `SensitivityScreen`."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+from faultforge._internal.experiments import screening
+from faultforge.encoding import MsetEncoder
+from faultforge.experiments.encoded_memory import (
+    ReliabilityMetric,
+    ResultFormat,
+    ResultReader,
+    SavedResult,
+    SensitivityScreen,
+    convert_result_file,
+    merge_results,
+)
+
+from .conftest import _FakeBundle, _make_experiment
+
+
+def test_fault_free_runs_are_skipped():
+    experiment = _make_experiment(
+        compare_bitwise=False, faults=0, screening_tolerance=0.0
+    )
+    experiment.run()
+    experiment.run()
+
+    assert experiment.skipped_runs() == 2
+    replayed = experiment.replay(0).scores[ReliabilityMetric.Accuracy]
+    assert list(experiment.scores()) == [replayed, replayed]
+
+
+def test_exact_screening_only_skips_unchanged_parameters():
+    experiment = _make_experiment(
+        compare_bitwise=False, faults=2, screening_tolerance=0.0
+    )
+    experiment.run()
+
+    # Identity encoding: every fault changes a parameter.
+    assert experiment.skipped_runs() == 0
+    assert experiment._screen is None
+
+
+def test_skipped_runs_match_full_inference():
+    # The fake model is linear, so the first-order bound is exact: a skipped
+    # run can't have flipped a prediction.
+    for metric in (ReliabilityMetric.Accuracy, ReliabilityMetric.Top1Sdc):
+        experiment = _make_experiment(
+            compare_bitwise=False,
+            faults=2,
+            reliability_metric=metric,
+            screening_tolerance=0.9,
+            seed=3,
+        )
+        for _ in range(20):
+            experiment.run()
+
+        for index, score in enumerate(experiment.scores()):
+            assert experiment.replay(index).scores[metric] == score
+
+
+def test_without_screening_nothing_is_skipped():
+    experiment = _make_experiment(compare_bitwise=False, faults=0)
+    experiment.run()
+
+    assert experiment.skipped_runs() is None
+    assert "screening_tolerance" not in experiment._fingerprint.scalars
+
+
+@pytest.mark.parametrize("tolerance", [-0.1, 1.0, 2.0])
+def test_rejects_tolerances_outside_zero_to_one(tolerance: float):
+    with pytest.raises(ValueError, match=r"in \[0, 1\)"):
+        _make_experiment(compare_bitwise=False, screening_tolerance=tolerance)
+
+
+def test_rejects_sdc():
+    with pytest.raises(ValueError, match="SDC"):
+        _make_experiment(
+            compare_bitwise=False,
+            reliability_metric=ReliabilityMetric.Sdc,
+            screening_tolerance=0.1,
+        )
+    with pytest.raises(ValueError, match="SDC"):
+        _make_experiment(
+            compare_bitwise=False,
+            extra_metrics=(ReliabilityMetric.Sdc,),
+            screening_tolerance=0.1,
+        )
+
+
+def test_sensitivities_are_cached_and_memory_mapped(tmp_path: Path):
+    experiment = _make_experiment(
+        compare_bitwise=False,
+        faults=0,
+        screening_tolerance=0.1,
+        screening_cache=tmp_path,
+    )
+    experiment.run()
+    (path,) = tmp_path.iterdir()
+    assert path.suffix == ".npy"
+    screen = experiment._screen
+    assert screen is not None
+
+    loaded = SensitivityScreen.load(path)
+    assert isinstance(loaded.sensitivities, np.memmap)
+    assert np.array_equal(loaded.sensitivities, screen.sensitivities)
+
+    # Another fault count shares the screen, another encoding gets its own.
+    assert experiment.with_faults(3)._screen is screen
+    sibling = experiment.with_encoder(MsetEncoder(), 0)
+    sibling.run()
+    assert sibling._screen is not None
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # A new experiment with the same setup loads the cached file.
+    same = experiment.with_faults(0)
+    same._screen = None
+    same._fault_free = None
+    same.run()
+    assert same._screen is not None
+    assert isinstance(same._screen.sensitivities, np.memmap)
+
+
+def test_skipped_runs_are_saved(tmp_path: Path):
+    experiment = _make_experiment(
+        compare_bitwise=False, faults=0, screening_tolerance=0.0
+    )
+    experiment.run()
+    journal = tmp_path / "journal"
+    experiment.save_journal(journal)
+    experiment.run()
+    experiment.append_to_journal(journal, 1)
+    json_path = tmp_path / "result.json"
+    experiment.save(json_path)
+    columnar_path = tmp_path / "result.columnar"
+    convert_result_file(json_path, columnar_path, format=ResultFormat.Columnar)
+
+    for path in (journal, json_path, columnar_path):
+        assert SavedResult.load(path).screened_out == [True, True]
+        assert ResultReader(path).summary().screened_out == [True, True]
+
+    resumed = _make_experiment(compare_bitwise=False, faults=0, screening_tolerance=0.0)
+    resumed.load_from(json_path)
+    assert resumed.skipped_runs() == 2
+    resumed.run()
+    assert resumed.skipped_runs() == 3
+
+    merged = merge_results([SavedResult.load(json_path), resumed._saved_result()])
+    assert merged.screened_out == [True, True, True]
+
+
+def test_sensitivities_are_computed_in_chunks(monkeypatch: pytest.MonkeyPatch):
+    bundle = _FakeBundle(8, 4, 4, 2)
+    module = bundle.load_model("cpu")
+    dataset = bundle.load_dataset(4, "cpu")
+    whole = SensitivityScreen.compute(module, dataset, dtype=torch.float32)
+
+    # The 32 weights and 4 biases in separate groups, the weights' gradients
+    # one sample and class at a time.
+    monkeypatch.setattr(screening, "_JACOBIAN_ELEMENTS", 33)
+    chunked = SensitivityScreen.compute(module, dataset, dtype=torch.float32)
+    assert np.allclose(chunked.sensitivities, whole.sensitivities)
+
+    monkeypatch.setattr(screening, "_JACOBIAN_ELEMENTS", 16)
+    with pytest.raises(ValueError, match="parameter weight has 32 elements"):
+        SensitivityScreen.compute(module, dataset, dtype=torch.float32)
+
+
+def test_change_bound():
+    screen = SensitivityScreen(np.array([1.0, 2.0, 0.0, 4.0], dtype=np.float32))
+    reference = [torch.zeros(2), torch.zeros(2)]
+
+    assert screen.change_bound(reference, [torch.zeros(2), torch.zeros(2)]) == 0.0
+    faulty = [torch.tensor([0.5, -0.25]), torch.tensor([3.0, 0.0])]
+    assert screen.change_bound(reference, faulty) == pytest.approx(1.0)
+    faulty = [torch.tensor([float("nan"), 0.0]), torch.zeros(2)]
+    assert screen.change_bound(reference, faulty) == float("inf")
+    with pytest.raises(ValueError, match="Expected 4 parameters"):
+        screen.change_bound([torch.zeros(3)], [torch.zeros(3)])
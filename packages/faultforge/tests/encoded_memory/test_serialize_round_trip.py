@@ -1,5 +1,7 @@
 """Tests for EncodedFaultInjection.serialize/deserialize round-trip behavior."""
 
+import pytest
+
 from .conftest import _make_experiment
 
 
@@ -23,3 +25,18 @@ def test_serialize_deserialize_round_trip_simple():
     reloaded.deserialize(serialized)
 
     assert reloaded.serialize() == serialized
+
+
+def test_deserialize_restores_statistics():
+    experiment = _make_experiment(compare_bitwise=False, faults=5)
+    for _ in range(3):
+        experiment.run()
+
+    reloaded = _make_experiment(compare_bitwise=False, faults=5)
+    reloaded.deserialize(experiment.serialize())
+
+    assert reloaded.statistics() == experiment.statistics()
+    assert reloaded.run_count() == 3
+    assert reloaded.mean_score() == pytest.approx(
+        sum(experiment.scores()) / len(experiment.scores())
+    )
@@ -0,0 +1,80 @@
+"""Tests for stratified fault sampling (`FaultSampling.Stratified`)."""
+
+import numpy as np
+import pytest
+from faultforge.encoding import SecdedEncoder
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    FaultSampling,
+    FaultStrata,
+    NestedFaultSweep,
+)
+
+from .conftest import _make_experiment
+
+
+@pytest.mark.parametrize("faults", [0, 1, 7, 40, 12 * 32])
+def test_draws_distinct_bits_spread_over_bit_positions(faults: int):
+    strata = FaultStrata(element_bits=32, tensor_sizes=(8, 0, 3, 1))
+    for seed in range(20):
+        bits = strata.draw(faults, seed)
+        assert len(set(bits)) == len(bits) == faults
+        assert all(0 <= bit < strata.bit_count() for bit in bits)
+        per_position = np.bincount(np.array(bits, dtype=np.int64) % 32, minlength=32)
+        assert per_position.max() - per_position.min() <= 1
+
+
+def test_draws_are_reproducible_and_unbiased():
+    strata = FaultStrata(element_bits=16, tensor_sizes=(5, 11))
+    assert strata.draw(9, 3) == strata.draw(9, 3)
+
+    # Every bit is equally likely to be drawn, like with uniform sampling.
+    hits = np.zeros(strata.bit_count())
+    for seed in range(8000):
+        hits[strata.draw(4, seed)] += 1
+    expected = 8000 * 4 / strata.bit_count()
+    assert np.abs(hits - expected).max() < 0.5 * expected
+
+
+def test_strata_follow_the_encoded_tensors():
+    experiment = _make_experiment(
+        compare_bitwise=True, faults=16, sampling=FaultSampling.Stratified
+    )
+    assert experiment._strata == FaultStrata(element_bits=32, tensor_sizes=(12, 3))
+    assert experiment._fingerprint.scalars["sampling"] == "stratified"
+    assert (
+        "sampling" not in _make_experiment(compare_bitwise=False)._fingerprint.scalars
+    )
+
+    experiment.run()
+    assert isinstance(experiment._result, DetailedResult)
+    bitmask = experiment._result.results[0].bitmask
+    # Identity encoding: half the bit positions, each flipped once.
+    assert experiment.replay(0).bitmask.tolist() == list(bitmask)
+    assert len(experiment.replay(0).faulty_bits) == 16
+
+
+def test_siblings_sample_the_same_way():
+    experiment = _make_experiment(
+        compare_bitwise=False, faults=4, sampling=FaultSampling.Stratified
+    )
+    assert experiment.with_faults(8)._strata == experiment._strata
+    with pytest.raises(TypeError, match="SecdedEncoding"):
+        _ = experiment.with_encoder(SecdedEncoder(64), 4)
+
+
+def test_needs_a_tensor_encoding():
+    with pytest.raises(TypeError, match="SecdedEncoding"):
+        _ = _make_experiment(
+            compare_bitwise=False,
+            encoder=SecdedEncoder(64),
+            sampling=FaultSampling.Stratified,
+        )
+
+
+def test_cant_be_nested():
+    base = _make_experiment(
+        compare_bitwise=False, faults=2, sampling=FaultSampling.Stratified
+    )
+    with pytest.raises(ValueError, match="stratified"):
+        _ = NestedFaultSweep({"a.json": base, "b.json": base.with_faults(4)})
@@ -0,0 +1,93 @@
+"""Tests for `EncodedFaultInjection.with_encoder`."""
+
+import pytest
+import torch
+from faultforge.encoding import (
+    CepEncoder,
+    Encoder,
+    IdentityEncoder,
+    MsetEncoder,
+    SecdedEncoder,
+)
+from faultforge.experiments.encoded_memory import ReliabilityMetric
+
+from .conftest import _make_experiment
+
+
+def test_shares_the_dataset_and_golden_results():
+    base = _make_experiment(
+        compare_bitwise=False, reliability_metric=ReliabilityMetric.Sdc, faults=1
+    )
+    sibling = base.with_encoder(SecdedEncoder(64), 0.01)
+
+    assert sibling._model is not base._model
+    assert sibling._dataset is base._dataset
+    assert base._golden_results
+    assert sibling._golden_results is base._golden_results
+    # The parameters are the same, only encoded differently.
+    for ours, theirs in zip(
+        sibling._model.force_decode().parameters(),
+        base._model.force_decode().parameters(),
+        strict=True,
+    ):
+        assert torch.equal(ours, theirs)
+
+
+def test_matches_a_fresh_experiment():
+    sibling = _make_experiment(compare_bitwise=False, faults=1).with_encoder(
+        SecdedEncoder(64), 0.01
+    )
+    fresh = _make_experiment(
+        compare_bitwise=False, faults=0.01, encoder=SecdedEncoder(64)
+    )
+
+    assert sibling.total_bits() == fresh.total_bits() > 480
+    assert sibling._fingerprint == fresh._fingerprint
+    sibling.run()
+    assert sibling.run_count() == 1
+
+
+def test_another_dtype_has_its_own_golden_results():
+    base = _make_experiment(
+        compare_bitwise=False, reliability_metric=ReliabilityMetric.Sdc, faults=1
+    )
+    sibling = base.with_encoder(SecdedEncoder(64), 4, dtype=torch.float16)
+
+    assert sibling._dataset is base._dataset
+    assert sibling._golden_results is not base._golden_results
+    assert sibling._fingerprint.scalars["dtype"] == "f16"
+    sibling.run()
+    assert sibling._golden_results
+    assert base.total_bits() == 480
+
+
+def test_an_encoded_golden_model_is_not_shared():
+    base = _make_experiment(
+        compare_bitwise=False,
+        reliability_metric=ReliabilityMetric.Sdc,
+        golden_is_encoded=True,
+    )
+    base.run()
+    sibling = base.with_encoder(SecdedEncoder(64), 1)
+
+    assert sibling._golden_results is not base._golden_results
+    sibling.run()
+    assert sibling.run_count() == 1
+
+
+@pytest.mark.parametrize("encoder", [MsetEncoder(), CepEncoder()])
+def test_encodes_the_loaded_parameters_after_a_lossy_encoding(encoder: Encoder):
+    # MSET and CEP store parity in the low mantissa bits, so the base
+    # experiment's model doesn't decode to the loaded parameters.
+    base = _make_experiment(
+        compare_bitwise=False, golden_is_encoded=True, encoder=encoder
+    )
+    sibling = base.with_encoder(IdentityEncoder(), 1)
+    fresh = _make_experiment(compare_bitwise=False, golden_is_encoded=True)
+
+    for ours, theirs in zip(
+        sibling._model.force_decode().parameters(),
+        fresh._model.force_decode().parameters(),
+        strict=True,
+    ):
+        assert torch.equal(ours, theirs)
@@ -0,0 +1,58 @@
+"""Tests for `EncodedFaultInjection.with_faults`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.experiments.encoded_memory import (
+    DetailedResult,
+    ReliabilityMetric,
+    SavedResult,
+)
+
+from .conftest import _make_experiment
+
+
+def test_shares_the_setup():
+    base = _make_experiment(
+        compare_bitwise=True, reliability_metric=ReliabilityMetric.Sdc, faults=1
+    )
+    sibling = base.with_faults(0.05)
+
+    assert sibling._model is base._model
+    assert sibling._dataset is base._dataset
+    # Computed once, up front, for all siblings.
+    assert base._golden_results
+    assert sibling._golden_results is base._golden_results
+
+
+def test_records_its_own_results(tmp_path: Path):
+    base = _make_experiment(compare_bitwise=True, faults=1)
+    base.run()
+    sibling = base.with_faults(10)
+    sibling.run()
+    sibling.run()
+
+    assert base.run_count() == 1
+    assert sibling.run_count() == 2
+    assert sibling._fingerprint.scalars["faults"] == 10
+    assert base._fingerprint.scalars["faults"] == 1
+
+    sibling.save(tmp_path / "sibling.json")
+    saved = SavedResult.load(tmp_path / "sibling.json")
+    assert isinstance(saved.result, DetailedResult)
+    assert saved.bit_error_rate() == 10 / 480
+
+
+def test_matches_a_fresh_experiment():
+    sibling = _make_experiment(compare_bitwise=False, faults=1).with_faults(0.5)
+    fresh = _make_experiment(compare_bitwise=False, faults=0.5)
+
+    assert sibling._fingerprint == fresh._fingerprint
+
+
+def test_rejects_invalid_fault_counts():
+    base = _make_experiment(compare_bitwise=False)
+    with pytest.raises(ValueError, match="greater than the number of bits"):
+        base.with_faults(481)
+    with pytest.raises(ValueError, match="greater than 1.0"):
+        base.with_faults(1.5)
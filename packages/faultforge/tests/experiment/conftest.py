@@ -1,11 +1,13 @@
 """Shared test doubles for the faultforge.experiment tests."""
 
+import json
+import time
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import override
 
 from faultforge import Fingerprint
-from faultforge.experiment import Experiment, StopCondition
+from faultforge.experiment import Experiment, PipelinedExperiment, StopCondition
 from pydantic import BaseModel
 
 # The following classes are `_` prefixed to not interpret them as Test classes.
@@ -72,6 +74,53 @@ class _TestExperiment(Experiment):
             key: _TestResult(value=value) for key, value in loaded.results.items()
         }
 
+    @override
+    def serialize_run(self, index: int) -> str:
+        return json.dumps(self._results[index].value)
+
+    @override
+    def deserialize_run(self, content: str) -> None:
+        self._results[len(self._results)] = _TestResult(value=json.loads(content))
+
+
+class _TestPipelinedExperiment(PipelinedExperiment[int], _TestExperiment):
+    """Prepares the index of each run; `finish_run` records it like `run` would.
+
+    Tracks how far preparation got ahead of the recorded results, and which
+    prepared runs were discarded.
+    """
+
+    prepared: int
+    max_ahead: int
+    fail_at: int | None
+    discarded: list[int]
+
+    def __init__(self, fail_at: int | None = None) -> None:
+        _TestExperiment.__init__(self)
+        self.prepared = 0
+        self.max_ahead = 0
+        self.fail_at = fail_at
+        self.discarded = []
+
+    @override
+    def prepare_run(self) -> int:
+        index = self.prepared
+        if index == self.fail_at:
+            raise RuntimeError(f"failed to prepare run {index}")
+        self.prepared += 1
+        return index
+
+    @override
+    def finish_run(self, prepared: int) -> None:
+        # Give the preparation thread a chance to fill the queue.
+        time.sleep(0.01)
+        self.max_ahead = max(self.max_ahead, self.prepared - len(self._results))
+        self._results[len(self._results)] = _TestResult(value=float(prepared + 1))
+
+    @override
+    def discard_run(self, prepared: int) -> None:
+        self.discarded.append(prepared)
+
 
 def make(values: list[float] | None = None, name: str = "test") -> _TestExperiment:
     """Create a test experiment with existing results"""
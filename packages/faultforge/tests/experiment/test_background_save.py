@@ -0,0 +1,133 @@
+"""Tests for `run_loop`'s background saving (`SaveConfig.background`)."""
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import override
+
+import pytest
+from faultforge import AnyPath
+from faultforge.experiment import AdditionalRuns, SaveConfig
+
+from .conftest import _TestExperiment, make
+
+
+class _SlowSaveExperiment(_TestExperiment):
+    """Takes a while to serialize a snapshot and records how often it did."""
+
+    writes: int
+    write_threads: set[str]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.write_threads = set()
+
+    @override
+    def snapshot(self) -> Callable[[], str]:
+        content = self.serialize()
+
+        def write() -> str:
+            time.sleep(0.02)
+            self.writes += 1
+            self.write_threads.add(threading.current_thread().name)
+            return content
+
+        return write
+
+
+class _FailingSaveExperiment(_TestExperiment):
+    @override
+    def snapshot(self) -> Callable[[], str]:
+        def write() -> str:
+            raise OSError("disk full")
+
+        return write
+
+
+def _values(path: Path) -> list[float]:
+    loaded = make()
+    loaded.load_from(path)
+    return list(loaded.scores())
+
+
+def test_final_save_is_written_before_returning(tmp_path: Path):
+    path = tmp_path / "result.json"
+    exp = make()
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(5)],
+        save_config=SaveConfig(path=path, interval_seconds=0),
+    )
+    assert path.read_text() == exp.serialize()
+
+
+def test_saves_are_written_off_the_main_thread_and_coalesced(tmp_path: Path):
+    path = tmp_path / "result.json"
+    exp = _SlowSaveExperiment()
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(20)],
+        save_config=SaveConfig(path=path, interval_seconds=0),
+    )
+
+    assert exp.write_threads == {"faultforge-checkpoint"}
+    # A save is requested after every run, but the ones that queued up behind
+    # a slow write were replaced by newer ones.
+    assert 0 < exp.writes < 20
+    assert _values(path) == [float(i + 1) for i in range(20)]
+
+
+def test_foreground_saving_still_works(tmp_path: Path):
+    path = tmp_path / "result.json"
+    exp = _SlowSaveExperiment()
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(3)],
+        save_config=SaveConfig(path=path, interval_seconds=0, background=False),
+    )
+    # `save_atomic` serializes directly, bypassing `snapshot`.
+    assert exp.writes == 0
+    assert path.read_text() == exp.serialize()
+
+
+def test_background_save_errors_are_raised(tmp_path: Path):
+    exp = _FailingSaveExperiment()
+    with pytest.raises(OSError, match="disk full"):
+        exp.run_loop(
+            stop_conditions=[AdditionalRuns(3)],
+            save_config=SaveConfig(path=tmp_path / "result.json", interval_seconds=0),
+        )
+
+
+def test_journal_is_flushed_in_the_background(tmp_path: Path):
+    path = tmp_path / "journal"
+    exp = make()
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(10)],
+        save_config=SaveConfig(path=path, interval_seconds=0, journal=True),
+    )
+    assert _values(path) == [float(i + 1) for i in range(10)]
+
+
+class _DirectoryExperiment(_TestExperiment):
+    """Saves every score to its own file in a directory."""
+
+    @override
+    def checkpoint(self, path: AnyPath, *, compressed: bool) -> Callable[[], None]:
+        scores = list(self.scores())
+
+        def write() -> None:
+            Path(path).mkdir(exist_ok=True)
+            for index, score in enumerate(scores):
+                (Path(path) / f"{index}.txt").write_text(str(score))
+
+        return write
+
+
+def test_background_saves_go_through_checkpoint(tmp_path: Path):
+    path = tmp_path / "scores"
+    exp = _DirectoryExperiment()
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(3)],
+        save_config=SaveConfig(path=path, interval_seconds=0),
+    )
+    assert sorted(file.name for file in path.iterdir()) == ["0.txt", "1.txt", "2.txt"]
@@ -0,0 +1,94 @@
+"""Tests for journaled saving (`Experiment.save_journal`, `SaveConfig.journal`)."""
+
+import json
+from pathlib import Path
+
+from faultforge._internal.journal import is_journal, read_journal
+from faultforge.experiment import AdditionalRuns, SaveConfig
+
+from .conftest import make
+
+
+def _values(path: Path) -> list[float]:
+    loaded = make()
+    loaded.load_from(path)
+    return list(loaded.scores())
+
+
+def test_journal_round_trip(tmp_path: Path):
+    exp = make([1.0, 2.0])
+    path = tmp_path / "journal"
+    exp.save_journal(path)
+    exp.run()
+    exp.run()
+    exp.append_to_journal(path, 2)
+
+    assert is_journal(path)
+    assert _values(path) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_incomplete_last_record_is_dropped_and_truncated(tmp_path: Path):
+    exp = make([1.0])
+    path = tmp_path / "journal"
+    exp.save_journal(path)
+    exp.run()
+    exp.append_to_journal(path, 1)
+    intact_size = path.stat().st_size
+
+    # A crash partway through appending the next run.
+    exp.run()
+    exp.append_to_journal(path, 2)
+    with open(path, "r+b") as f:
+        f.truncate(path.stat().st_size - 1)
+
+    assert _values(path) == [1.0, 2.0]
+    assert path.stat().st_size == intact_size
+
+
+def test_corrupt_last_record_is_dropped(tmp_path: Path):
+    exp = make([1.0])
+    path = tmp_path / "journal"
+    exp.save_journal(path)
+    exp.run()
+    exp.append_to_journal(path, 1)
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    assert _values(path) == [1.0]
+
+
+def test_run_loop_appends_to_loaded_journal(tmp_path: Path):
+    path = tmp_path / "journal"
+    config = SaveConfig(path=path, interval_seconds=None, journal=True)
+
+    first = make()
+    first.run_loop(stop_conditions=[AdditionalRuns(2)], save_config=config)
+    assert is_journal(path)
+
+    second = make()
+    second.load_from(path)
+    second.run_loop(stop_conditions=[AdditionalRuns(3)], save_config=config)
+
+    meta, _, *runs = read_journal(path)
+    # Still the original journal, with only the new runs appended.
+    assert json.loads(meta)["base_runs"] == 0
+    assert len(runs) == 5
+    assert _values(path) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_run_loop_starts_new_journal_over_regular_file(tmp_path: Path):
+    path = tmp_path / "out.json"
+    exp = make([1.0])
+    exp.save_atomic(path)
+
+    exp.run_loop(
+        stop_conditions=[AdditionalRuns(1)],
+        save_config=SaveConfig(path=path, interval_seconds=None, journal=True),
+    )
+
+    meta, _, *runs = read_journal(path)
+    assert json.loads(meta)["base_runs"] == 1
+    assert len(runs) == 1
+    assert _values(path) == [1.0, 2.0]
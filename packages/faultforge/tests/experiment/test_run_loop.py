@@ -1,8 +1,12 @@
 """Tests for Experiment.run_loop."""
 
+import os
+import signal
+
+import pytest
 from faultforge.experiment import AdditionalRuns, MaxRuns, Stability
 
-from .conftest import make
+from .conftest import _TestPipelinedExperiment, make
 
 
 def test_run_loop_stops_at_additional_runs():
@@ -91,3 +95,50 @@ def test_run_loop_additional_runs_and_max_runs_combined_max_wins():
     exp = make([1.0, 2.0])
     exp.run_loop(stop_conditions=[AdditionalRuns(10), MaxRuns(4)])
     assert exp.run_count() == 4
+
+
+def test_pipelined_run_loop_records_runs_in_order():
+    exp = _TestPipelinedExperiment()
+    exp.run_loop(stop_conditions=[AdditionalRuns(10)], pipeline_depth=2)
+    assert exp.scores() == [float(i + 1) for i in range(10)]
+
+
+def test_pipelined_run_loop_bounds_prepared_runs():
+    # At most the run being finished, `pipeline_depth` queued runs and one
+    # that's waiting for room in the queue.
+    depth = 2
+    exp = _TestPipelinedExperiment()
+    exp.run_loop(stop_conditions=[AdditionalRuns(10)], pipeline_depth=depth)
+    assert exp.max_ahead <= depth + 2
+
+
+def test_pipelined_run_loop_discards_unfinished_runs_in_order():
+    exp = _TestPipelinedExperiment()
+    exp.run_loop(stop_conditions=[AdditionalRuns(5)], pipeline_depth=3)
+    assert exp.run_count() == 5
+    assert exp.discarded == list(range(5, exp.prepared))
+
+
+def test_pipelined_run_loop_reraises_preparation_errors():
+    exp = _TestPipelinedExperiment(fail_at=3)
+    with pytest.raises(RuntimeError, match="failed to prepare run 3"):
+        exp.run_loop(stop_conditions=[AdditionalRuns(10)], pipeline_depth=2)
+    assert exp.run_count() == 3
+
+
+def test_pipelined_run_loop_requires_pipelined_experiment():
+    exp = make()
+    with pytest.raises(TypeError):
+        exp.run_loop(stop_conditions=[AdditionalRuns(1)], pipeline_depth=1)
+
+
+def test_run_loop_reports_whether_it_was_interrupted():
+    exp = make()
+    assert exp.run_loop(stop_conditions=[AdditionalRuns(2)]) is True
+
+    def interrupt_after_one_more_run(experiment) -> None:
+        if experiment.run_count() == 3:
+            os.kill(os.getpid(), signal.SIGINT)
+
+    assert exp.run_loop(stop_conditions=[interrupt_after_one_more_run]) is False
+    assert exp.run_count() == 3
@@ -0,0 +1,72 @@
+"""Tests for `ScoreStatistics` and `Experiment.statistics`."""
+
+from collections.abc import Sequence
+from typing import override
+
+import numpy as np
+import pytest
+import scipy.stats
+from faultforge.experiment import AdditionalRuns, ScoreStatistics, Stability
+
+from .conftest import _TestExperiment
+
+_SCORES = [91.5, 88.0, 93.25, 90.0, 87.5, 92.0]
+
+
+def test_matches_direct_computation():
+    statistics = ScoreStatistics.of(_SCORES)
+
+    n = len(_SCORES)
+    assert statistics.count == n
+    assert statistics.last == _SCORES[-1]
+    assert statistics.mean == pytest.approx(np.mean(_SCORES))
+    assert statistics.variance() == pytest.approx(np.var(_SCORES, ddof=1))
+    expected = scipy.stats.t.ppf(0.975, df=n - 1) * scipy.stats.sem(_SCORES)
+    assert statistics.margin_of_error() == pytest.approx(expected)
+
+
+def test_empty_and_single_score():
+    empty = ScoreStatistics()
+    assert empty.count == 0
+    assert empty.last is None
+    assert empty.margin_of_error() is None
+
+    single = ScoreStatistics.of([5.0])
+    assert single.mean == 5.0
+    assert single.variance() is None
+    assert single.margin_of_error() is None
+
+
+class _IncrementalExperiment(_TestExperiment):
+    """Maintains its statistics as runs are recorded, and fails if anything
+    falls back to going over `scores()`."""
+
+    _statistics: ScoreStatistics
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._statistics = ScoreStatistics()
+
+    @override
+    def run(self) -> None:
+        super().run()
+        self._statistics.add(float(len(self._results)))
+
+    @override
+    def scores(self) -> Sequence[float]:
+        raise AssertionError("scores() shouldn't be needed")
+
+    @override
+    def statistics(self) -> ScoreStatistics:
+        return self._statistics
+
+
+def test_run_loop_only_uses_statistics():
+    experiment = _IncrementalExperiment()
+    experiment.run_loop(
+        stop_conditions=[AdditionalRuns(5), Stability(min_samples=100, threshold=0)]
+    )
+
+    assert experiment.run_count() == 5
+    assert experiment.mean_score() == 3.0
+    assert experiment.format_status() is not None
@@ -0,0 +1,52 @@
+"""Tests for the `SequentialTest` stop condition."""
+
+import pytest
+from faultforge.experiment import ScoreStatistics, SequentialTest
+
+from .conftest import make
+
+
+def test_waits_for_min_samples():
+    condition = SequentialTest(margin=1.0, min_samples=5)
+    assert condition(make([0.0] * 4)) is None
+    assert condition(make([0.0] * 5)) is not None
+
+
+def test_stops_on_a_significant_difference():
+    reason = SequentialTest(margin=0.1)(make([5.0, 6.0] * 10))
+    assert reason is not None
+    assert "significantly above 0" in reason
+
+    reason = SequentialTest(margin=0.1)(make([-5.0, -6.0] * 10))
+    assert reason is not None
+    assert "significantly below 0" in reason
+
+
+def test_stops_on_a_negligible_difference():
+    reason = SequentialTest(margin=1.0)(make([0.1, -0.1] * 10))
+    assert reason is not None
+    assert "within ±1 of 0" in reason
+
+
+def test_continues_while_undecided():
+    assert SequentialTest(margin=0.1)(make([2.0, -2.0] * 10)) is None
+
+
+def test_interval_is_wider_than_the_fixed_sample_one():
+    statistics = ScoreStatistics.of([1.0, 3.0] * 50)
+    interval = SequentialTest(margin=0.0).interval(statistics)
+    assert interval is not None
+    lower, upper = interval
+    assert lower == pytest.approx(2.0 - (upper - 2.0))
+    margin_of_error = statistics.margin_of_error()
+    assert margin_of_error is not None
+    assert upper - 2.0 > margin_of_error
+
+
+def test_rejects_invalid_parameters():
+    with pytest.raises(ValueError, match="margin"):
+        SequentialTest(margin=-1.0)
+    with pytest.raises(ValueError, match="alpha"):
+        SequentialTest(margin=1.0, alpha=1.0)
+    with pytest.raises(ValueError, match="planned run"):
+        SequentialTest(margin=1.0, planned_runs=0)
@@ -0,0 +1,88 @@
+"""Tests for faultforge.bits."""
+
+import numpy as np
+import pytest
+from faultforge.bits import (
+    bit_array,
+    bit_position_histogram,
+    popcount_counts,
+    popcount_histogram,
+    position_counts,
+    residual_fault_count,
+)
+from faultforge.experiments.encoded_memory import ColumnView
+
+_VALUES = [0b1, 0b11, 0b10, 0b1011, 1 << 31]
+
+
+def _as_list(values: list[int]) -> list[int]:
+    return values
+
+
+def _as_array(values: list[int]) -> np.ndarray:
+    return np.array(values, dtype=np.uint32)
+
+
+def _as_view(values: list[int]) -> ColumnView:
+    return ColumnView(np.array(values, dtype=np.uint32))
+
+
+_FORMS = [_as_list, _as_array, _as_view]
+
+
+def _reference_positions(values: list[int], *, skip_multi_bit: bool) -> dict[int, int]:
+    histogram: dict[int, int] = {}
+    for value in values:
+        if skip_multi_bit and value.bit_count() > 1:
+            continue
+        for position in range(value.bit_length()):
+            if value >> position & 1:
+                histogram[position] = histogram.get(position, 0) + 1
+    return histogram
+
+
+def test_bit_array_keeps_unsigned_arrays():
+    array = np.array(_VALUES, dtype=np.uint32)
+    assert bit_array(array) is array
+    assert bit_array(ColumnView(array)) is array
+    assert bit_array(_VALUES).dtype == np.uint64
+
+
+@pytest.mark.parametrize("form", _FORMS)
+def test_popcount_histogram(form):
+    assert popcount_histogram(form(_VALUES)) == {1: 3, 2: 1, 3: 1}
+
+
+@pytest.mark.parametrize("form", _FORMS)
+@pytest.mark.parametrize("skip_multi_bit", [False, True])
+def test_bit_position_histogram(form, skip_multi_bit: bool):
+    assert bit_position_histogram(
+        form(_VALUES), skip_multi_bit=skip_multi_bit
+    ) == _reference_positions(_VALUES, skip_multi_bit=skip_multi_bit)
+
+
+@pytest.mark.parametrize("form", _FORMS)
+def test_residual_fault_count(form):
+    assert residual_fault_count(form(_VALUES)) == 8
+
+
+@pytest.mark.parametrize("form", _FORMS)
+def test_fixed_size_counts(form):
+    positions = position_counts(form(_VALUES), 32)
+    popcounts = popcount_counts(form(_VALUES), 32)
+
+    assert positions.shape == (32,)
+    assert popcounts.shape == (33,)
+    assert {
+        position: int(count) for position, count in enumerate(positions) if count
+    } == _reference_positions(_VALUES, skip_multi_bit=False)
+    assert popcounts[:4].tolist() == [0, 3, 1, 1]
+    assert popcounts[4:].sum() == 0
+
+
+def test_empty_bitmask():
+    assert popcount_histogram([]) == {}
+    assert bit_position_histogram([]) == {}
+    assert residual_fault_count([]) == 0
+    assert position_counts([], 16).tolist() == [0] * 16
+    assert popcount_counts([], 16).tolist() == [0] * 17
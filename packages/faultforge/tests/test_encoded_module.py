@@ -1,6 +1,7 @@
 """Property tests for EncodedModule: forward output must match the plain module."""
 
 import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import hypothesis.strategies as st
 import pytest
@@ -10,7 +11,10 @@ from faultforge.encoding import (
     CepEncoder,
     EncodedModule,
     Encoder,
+    EncoderSequence,
+    EncodingSequence,
     IdentityEncoder,
+    InPlaceEncoder,
     MsetEncoder,
     SecdedEncoder,
 )
@@ -175,3 +179,142 @@ def test_apply_faults_matches_sequential_apply_fault(
         assert torch.equal(
             batched_param.view(int_dtype), sequential_param.view(int_dtype)
         )
+
+
+@pytest.mark.parametrize("head", [MsetEncoder(), CepEncoder()])
+@given(
+    bits_per_chunk=st.sampled_from([7, 16, 64]),
+    dtype=_DTYPES,
+    data=st.data(),
+)
+def test_fused_sequence_decode_matches_stepwise(
+    head: InPlaceEncoder,
+    bits_per_chunk: int,
+    dtype: torch.dtype,
+    data: st.DataObject,
+) -> None:
+    ts = [torch.randn(5, 3, dtype=dtype), torch.randn(11, dtype=dtype)]
+    head_encoding = head.encode([t.clone() for t in ts])
+    tail = SecdedEncoder(bits_per_chunk=bits_per_chunk).encode(
+        [t.clone() for t in head_encoding.encoded_tensors()]
+    )
+    sequence = EncodingSequence([head_encoding.clone()], tail.clone())
+    int_dtype = torch.int32 if dtype == torch.float32 else torch.int16
+
+    # Multiple rounds so the later decodes only update the faulted chunks.
+    for _ in range(3):
+        target_bits = data.draw(
+            st.lists(
+                st.integers(min_value=0, max_value=tail.bit_count() - 1),
+                max_size=4,
+                unique=True,
+            )
+        )
+        faults = [(BitFlip(), bit) for bit in target_bits]
+        tail.apply_faults(faults)
+        sequence.apply_faults(faults)
+
+        for encoded, decoded in zip(
+            head_encoding.encoded_tensors(), tail.decode(), strict=True
+        ):
+            _ = encoded.copy_(decoded)
+        head_encoding.trigger_recompute()
+
+        for expected, actual in zip(
+            head_encoding.decode(), sequence.clone().decode(), strict=True
+        ):
+            assert torch.equal(expected.view(int_dtype), actual.view(int_dtype))
+        for expected, actual in zip(
+            head_encoding.decode(), sequence.decode(), strict=True
+        ):
+            assert torch.equal(expected.view(int_dtype), actual.view(int_dtype))
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        IdentityEncoder(),
+        SecdedEncoder(bits_per_chunk=64),
+        CepEncoder(),
+        MsetEncoder(),
+        EncoderSequence([MsetEncoder()], SecdedEncoder(bits_per_chunk=16)),
+        EncoderSequence([CepEncoder(), MsetEncoder()], SecdedEncoder(bits_per_chunk=7)),
+    ],
+)
+@given(
+    in_features=st.integers(min_value=1, max_value=16),
+    out_features=st.integers(min_value=1, max_value=16),
+    dtype=_DTYPES,
+    data=st.data(),
+)
+def test_incremental_clone_decode_matches_full_decode(
+    encoder: Encoder,
+    in_features: int,
+    out_features: int,
+    dtype: torch.dtype,
+    data: st.DataObject,
+) -> None:
+    module = nn.Linear(in_features, out_features).to(dtype=dtype)
+    reference = copy.deepcopy(module)
+    encoded = EncodedModule(module, encoder)
+    _ = encoded.decode()
+
+    bit_count = encoded.bit_count()
+    target_bits = data.draw(
+        st.lists(
+            st.integers(min_value=0, max_value=bit_count - 1),
+            min_size=1,
+            max_size=min(bit_count, 8),
+            unique=True,
+        )
+    )
+    faults = [(BitFlip(), bit) for bit in target_bits]
+
+    # Cloned from a decoded module, so only the faulted regions are decoded.
+    incremental = encoded.clone()
+    incremental.apply_faults(faults)
+
+    full = EncodedModule(reference, encoder)
+    full.apply_faults(faults)
+
+    int_dtype = torch.int32 if dtype == torch.float32 else torch.int16
+    for incremental_param, full_param in zip(
+        incremental.decode().parameters(), full.decode().parameters(), strict=True
+    ):
+        assert torch.equal(
+            incremental_param.view(int_dtype), full_param.view(int_dtype)
+        )
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        SecdedEncoder(bits_per_chunk=64),
+        CepEncoder(),
+        EncoderSequence([MsetEncoder()], SecdedEncoder(bits_per_chunk=16)),
+    ],
+)
+def test_clones_decode_concurrently(encoder: Encoder) -> None:
+    torch.manual_seed(0)
+    module = nn.Linear(32, 16)
+    encoded = EncodedModule(module, encoder)
+    _ = encoded.decode()
+    bit_count = encoded.bit_count()
+
+    def faulted_run(run: int) -> list[torch.Tensor]:
+        clone = encoded.clone()
+        clone.apply_faults([(BitFlip(), (run * 7919) % bit_count)])
+        return [p.detach().clone() for p in clone.decode().parameters()]
+
+    runs = range(16)
+    expected = [faulted_run(run) for run in runs]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = list(executor.map(faulted_run, runs))
+
+    for expected_params, actual_params in zip(expected, actual, strict=True):
+        for expected_param, actual_param in zip(
+            expected_params, actual_params, strict=True
+        ):
+            assert torch.equal(
+                expected_param.view(torch.int32), actual_param.view(torch.int32)
+            )
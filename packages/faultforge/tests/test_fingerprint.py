@@ -208,3 +208,22 @@ def test_format_differences_renders_one_line_per_difference():
 
 def test_absent_has_readable_repr():
     assert repr(ABSENT) == "<absent>"
+
+
+def test_canonical_key_matches_structural_diff():
+    def build(bits: int, order: list[str]) -> Fingerprint:
+        return Fingerprint(
+            kind="sequence",
+            scalars={key: 1 for key in order},
+            children={"encoders": [Fingerprint(kind="secded", scalars={"bits": bits})]},
+        )
+
+    one = build(8, ["a", "b"])
+    reordered = build(8, ["b", "a"])
+    changed = build(16, ["a", "b"])
+
+    assert one.diff(reordered) == []
+    assert one.canonical_key() == reordered.canonical_key()
+    assert hash(one.canonical_key()) == hash(reordered.canonical_key())
+    assert one.diff(changed) != []
+    assert one.canonical_key() != changed.canonical_key()
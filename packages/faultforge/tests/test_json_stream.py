@@ -0,0 +1,56 @@
+"""Tests for faultforge._internal.json_stream."""
+
+import io
+import json
+from typing import Any
+
+import pytest
+from faultforge._internal import json_stream
+from faultforge._internal.json_stream import JsonStream
+
+
+def _walk(stream: JsonStream) -> Any:
+    match stream.peek():
+        case b"{":
+            return {key: _walk(stream) for key in stream.object_keys()}
+        case b"[":
+            items: list[Any] = []
+            for _ in stream.array_items():
+                items.append(_walk(stream))
+            return items
+        case _:
+            return stream.read_value()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_walk_matches_json_across_chunk_boundaries(
+    monkeypatch: pytest.MonkeyPatch, indent: int | None
+):
+    monkeypatch.setattr(json_stream, "_CHUNK_SIZE", 7)
+    document = {
+        "numbers": [1, -2, 3.5e3, [4, {"tricky": 'x]\\"}'}]],
+        "empty": [{}, []],
+        "literals": [None, True, False],
+        "text": "ünïcode",
+    }
+    content = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+
+    assert _walk(JsonStream(io.BytesIO(content))) == document
+
+
+def test_skip_value_skips_nested_containers():
+    stream = JsonStream(io.BytesIO(b'{"skip": [1, [2, "]"], {"a": 3}], "keep": 4}'))
+    kept: dict[str, Any] = {}
+    for key in stream.object_keys():
+        if key == "skip":
+            stream.skip_value()
+        else:
+            kept[key] = stream.read_value()
+
+    assert kept == {"keep": 4}
+
+
+@pytest.mark.parametrize("content", [b"not json", b'{"a": [1, 2', b'{"a" 1}'])
+def test_malformed_documents_raise(content: bytes):
+    with pytest.raises(ValueError):
+        _walk(JsonStream(io.BytesIO(content)))
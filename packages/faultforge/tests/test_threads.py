@@ -0,0 +1,48 @@
+"""Tests for CPU thread budgeting (faultforge.threads)."""
+
+import pytest
+from faultforge.threads import ThreadBudget
+
+
+def test_from_total_shares_all_threads_when_not_overlapping():
+    budget = ThreadBudget.from_total(8)
+    assert budget == ThreadBudget(codec_threads=8, torch_threads=8)
+
+
+def test_from_total_splits_threads_when_overlapping():
+    budget = ThreadBudget.from_total(7, overlapping=True)
+    assert budget == ThreadBudget(codec_threads=4, torch_threads=3)
+
+
+def test_from_total_overlapping_single_thread_gives_both_one():
+    budget = ThreadBudget.from_total(1, overlapping=True)
+    assert budget == ThreadBudget(codec_threads=1, torch_threads=1)
+
+
+def test_split_divides_threads_between_workers():
+    budgets = ThreadBudget(codec_threads=10, torch_threads=4).split(3)
+    assert [b.codec_threads for b in budgets] == [4, 3, 3]
+    assert [b.torch_threads for b in budgets] == [2, 1, 1]
+
+
+def test_split_never_gives_a_worker_zero_threads():
+    budgets = ThreadBudget(codec_threads=2, torch_threads=2).split(4)
+    assert all(b.codec_threads == 1 and b.torch_threads == 1 for b in budgets)
+
+
+def test_for_worker_matches_split():
+    budget = ThreadBudget(codec_threads=10, torch_threads=6)
+    assert [budget.for_worker(i, 4) for i in range(4)] == budget.split(4)
+
+
+@pytest.mark.parametrize("threads", [0, -1])
+def test_rejects_non_positive_thread_counts(threads: int):
+    with pytest.raises(ValueError):
+        _ = ThreadBudget.from_total(threads)
+    with pytest.raises(ValueError):
+        _ = ThreadBudget(codec_threads=threads, torch_threads=1)
+
+
+def test_for_worker_rejects_out_of_range_index():
+    with pytest.raises(ValueError):
+        _ = ThreadBudget.from_total(4).for_worker(4, 4)
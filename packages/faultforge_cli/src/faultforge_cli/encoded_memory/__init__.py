@@ -1,7 +1,9 @@
 """The `encoded-memory` CLI: recording experiments and plotting their results.
 
 `commands` holds the `typer` commands; `results` and `plots` hold the
-`compare`/`heatmap` workflow (see `results`' module docstring for a tour).
+`compare`/`heatmap` workflow (see `results`' module docstring for a tour), and
+`campaign` and `work_queue` the plan files and the shared queue of the
+`campaign` command.
 """
 
 from faultforge_cli.encoded_memory.commands import app
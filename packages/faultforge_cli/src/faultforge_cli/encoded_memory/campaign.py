@@ -0,0 +1,251 @@
+"""Expanding a `campaign` plan file into the jobs `commands.campaign` records.
+
+A plan is a TOML file naming the models, encoders, dtypes and bit error rates
+(or fault counts) of a campaign; every combination of them is a job, recorded
+like a single `record` invocation would. What's expensive about a job is its
+setup rather than its runs: loading the model and the dataset, encoding the
+parameters and computing the golden results. `CampaignPlan.groups` therefore
+orders the jobs so that each of those is shared by as many as possible:
+
+- one group per model, recorded in a single process, which loads the model
+  and the dataset once;
+- within a group, jobs are ordered by dtype (the golden results are shared
+  within a dtype), then by encoder (the encoding is shared within an encoder),
+  then by bit error rate (see `EncodedFaultInjection.with_encoder` and
+  `with_faults`).
+
+A minimal plan:
+
+```toml
+output = "results"
+dataset = "cifar10"
+models = ["resnet20", "vgg11_bn"]
+dtypes = ["f32", "f16"]
+bit_error_rates = [1e-7, 1e-6, 1e-5]
+max_runs = 200
+
+[encoders.unprotected]
+
+[encoders.secded64]
+secded = 64
+```
+"""
+
+import itertools
+import logging
+import tomllib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self, final, override
+
+from faultforge import DEFAULT_BATCH_SIZE
+from faultforge.dtype import EncodingDtype
+from faultforge.encoding import CepScheme
+from faultforge.experiment import Experiment, MaxRuns, Stability, StopCondition
+from faultforge.experiments.encoded_memory import (
+    FaultSampling,
+    ReliabilityMetric,
+    ResultReader,
+)
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+logger = logging.getLogger(__name__)
+
+
+class EncoderSpec(BaseModel):
+    """One of a plan's `encoders`, with the `record` command's encoding settings."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    secded: int | None = Field(default=None, ge=1)
+    mset: bool = False
+    cep: bool = False
+    cep_scheme: CepScheme = CepScheme.D3P1
+
+    @model_validator(mode="after")
+    def _check(self) -> Self:
+        if self.mset and self.cep:
+            raise ValueError("Using MSET and CEP together is not allowed.")
+        return self
+
+
+class CampaignPlan(BaseModel):
+    """The contents of a campaign plan file, see the module docstring.
+
+    Apart from the lists spanning the campaign, the fields are the `record`
+    command's options of the same name and apply to every job.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    output: Path
+    """The root directory for the results, see `CampaignJob.directory`."""
+    dataset: str
+    imagenet_root: str | None = None
+    models: list[str] = Field(min_length=1)
+    encoders: dict[str, EncoderSpec] = Field(min_length=1)
+    dtypes: list[EncodingDtype] = [EncodingDtype.F32]
+    bit_error_rates: list[float] = []
+    faults: list[int] = []
+    sampling: FaultSampling = FaultSampling.Uniform
+    screening_tolerance: float | None = Field(default=None, ge=0.0, lt=1.0)
+    screening_cache: Path | None = None
+    """Relative to the plan's directory, like `output`."""
+    reliability_metric: ReliabilityMetric = ReliabilityMetric.Accuracy
+    extra_metrics: list[ReliabilityMetric] = []
+    golden_is_encoded: bool = False
+    compare_bitwise: bool = False
+    bit_statistics: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE
+    batch_limit: int | None = None
+    preload_batches: bool = True
+    max_runs: int | None = Field(default=None, ge=1)
+    min_runs: int | None = None
+    stability_threshold: float | None = Field(default=None, ge=0.0, le=100.0)
+    compress: bool = False
+    journal: bool = False
+    autosave: float | None = None
+    device: str = "cpu"
+    pipeline_depth: int = Field(default=0, ge=0)
+    seed: int | None = Field(default=None, ge=0, lt=2**64)
+    """Seeds every job's runs by their run index (see `record --seed`), so
+    the same plan records the same runs, with or without `--queue`."""
+
+    @model_validator(mode="after")
+    def _check(self) -> Self:
+        if bool(self.bit_error_rates) == bool(self.faults):
+            raise ValueError("Expected either `bit_error_rates` or `faults`")
+        if not all(0.0 <= rate <= 1.0 for rate in self.bit_error_rates):
+            raise ValueError("Bit error rates must be between 0 and 1")
+        if not all(count >= 0 for count in self.faults):
+            raise ValueError("Fault counts must not be negative")
+        if self.sampling == FaultSampling.Stratified and any(
+            spec.secded is not None for spec in self.encoders.values()
+        ):
+            raise ValueError("Stratified sampling doesn't support SECDED encoders")
+        if self.screening_tolerance is not None and ReliabilityMetric.Sdc in [
+            self.reliability_metric,
+            *self.extra_metrics,
+        ]:
+            raise ValueError("Screening doesn't support the sdc metric")
+        if self.max_runs is None and self.stability_threshold is None:
+            # Nothing would ever finish a job.
+            raise ValueError("Expected `max_runs` and/or `stability_threshold`")
+        return self
+
+    @classmethod
+    def load(cls, path: Path) -> CampaignPlan:
+        """Read a plan file; a relative `output` or `screening_cache` is relative
+        to the plan's directory.
+
+        Raises `OSError`, `tomllib.TOMLDecodeError` or a pydantic
+        `ValidationError`.
+        """
+        with path.open("rb") as file:
+            plan = cls.model_validate(tomllib.load(file))
+        plan.output = path.parent / plan.output.expanduser()
+        if plan.screening_cache is not None:
+            plan.screening_cache = path.parent / plan.screening_cache.expanduser()
+        return plan
+
+    def points(self) -> list[int] | list[float]:
+        """The bit error rates or fault counts, in increasing order."""
+        if self.faults:
+            return sorted(set(self.faults))
+        return sorted(set(self.bit_error_rates))
+
+    def stop_conditions(self) -> list[StopCondition]:
+        """A fresh copy of every job's stop conditions."""
+        conditions: list[StopCondition] = []
+        if self.stability_threshold is not None:
+            conditions.append(
+                Stability(
+                    min_samples=self.min_runs or 0,
+                    threshold=self.stability_threshold,
+                )
+            )
+        if self.max_runs is not None:
+            conditions.append(MaxRuns(self.max_runs))
+        return conditions
+
+    def groups(self) -> list[list[CampaignJob]]:
+        """Every job, one group per model, each ordered to share its setup."""
+        return [
+            [
+                CampaignJob(
+                    model=model,
+                    dtype=dtype,
+                    encoder=encoder,
+                    point=point,
+                    directory=self.output / f"{model}-{dtype.value}-{encoder}",
+                )
+                for dtype, encoder, point in itertools.product(
+                    self.dtypes, self.encoders, self.points()
+                )
+            ]
+            for model in self.models
+        ]
+
+
+@dataclass(slots=True, frozen=True)
+class CampaignJob:
+    """One combination of a plan's models, dtypes, encoders and points."""
+
+    model: str
+    dtype: EncodingDtype
+    encoder: str
+    """The name of one of the plan's `encoders`."""
+    point: int | float
+    """A bit error rate if a `float`, a fault count otherwise."""
+    directory: Path
+    """Where the job's result file goes, shared by every point of the same
+    model, dtype and encoder, like a `record` sweep's `--output`."""
+
+    def setup(self) -> tuple[str, EncodingDtype, str]:
+        """What the job shares with others with the same setup: everything but the point."""
+        return (self.model, self.dtype, self.encoder)
+
+
+def is_done(path: Path, conditions: Sequence[StopCondition]) -> bool:
+    """Whether the result file at `path` already meets any of `conditions`.
+
+    Only reads the file's scores, so a finished job can be skipped without
+    loading its model. A missing or unreadable file isn't done; `record`
+    deals with it like it normally would.
+    """
+    if not path.exists():
+        return False
+    try:
+        scores = ResultReader(path).summary().scores()
+    except (OSError, ValueError) as error:
+        logger.debug(f"Couldn't read {path}: {error}")
+        return False
+    recorded = _RecordedScores(scores)
+    return any(condition(recorded) is not None for condition in conditions)
+
+
+@final
+class _RecordedScores(Experiment):
+    """The scores of a result file, to check stop conditions against."""
+
+    _scores: list[float]
+
+    def __init__(self, scores: list[float]) -> None:
+        self._scores = scores
+
+    @override
+    def run(self) -> None:
+        raise NotImplementedError("Recorded scores can't be extended")
+
+    @override
+    def scores(self) -> Sequence[float]:
+        return self._scores
+
+    @override
+    def serialize(self) -> str:
+        raise NotImplementedError("Recorded scores can't be saved")
+
+    @override
+    def deserialize(self, content: str) -> None:
+        raise NotImplementedError("Recorded scores can't be loaded")
@@ -1,16 +1,21 @@
 """The `encoded-memory` CLI commands (recording and plotting)."""
 
 import enum
+import itertools
 import logging
+import multiprocessing
+import socket
+import tomllib
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import matplotlib.pyplot as plt
 import torch
 import typer
-from matplotlib.backends.registry import BackendFilter, backend_registry
-from matplotlib.figure import Figure
 from faultforge import DEFAULT_BATCH_SIZE, is_compressed
+from faultforge.dtype import EncodingDtype
 from faultforge.encoding import (
     CepEncoder,
     CepScheme,
@@ -28,10 +33,18 @@ from faultforge.experiment import (
     StopCondition,
 )
 from faultforge.experiments.encoded_memory import (
-    DetailedResult,
+    AdaptiveBerSearch,
     EncodedFaultInjection,
+    FaultSampling,
+    NestedFaultSweep,
     ReliabilityMetric,
+    ResultFormat,
+    ResultReader,
+    SavedResult,
+    compact_journal,
+    convert_result_file,
     discard_bitmasks_in_file,
+    merge_results,
 )
 from faultforge.fingerprint import FingerprintError
 from faultforge.loading import (
@@ -43,16 +56,26 @@ from faultforge.loading import (
     ModelBundle,
 )
 from faultforge.progress import Progress
+from faultforge.threads import ThreadBudget
+from matplotlib.backends.registry import BackendFilter, backend_registry
+from matplotlib.figure import Figure
+from pydantic import ValidationError
+
+from faultforge_cli.encoded_memory.campaign import CampaignJob, CampaignPlan, is_done
 from faultforge_cli.encoded_memory.plots import (
     GroupBy,
     build_compare_figure,
     build_heatmap_figure,
+    has_heatmap_data,
+    heatmap_requirement,
 )
 from faultforge_cli.encoded_memory.results import (
     build_configurations,
     discover_result_files,
     load_results,
 )
+from faultforge_cli.encoded_memory.work_queue import WorkQueue
+from faultforge_cli.logging import setup_logging
 
 app = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]})
 logger = logging.getLogger(__name__)
@@ -219,22 +242,31 @@ def record(
             rich_help_panel="Model Setup",
         ),
     ] = ReliabilityMetric.Accuracy,
+    extra_metric: Annotated[
+        list[ReliabilityMetric] | None,
+        typer.Option(
+            help="Also measure this metric in the same inference pass and save its "
+            "scores alongside --reliability-metric. Can be repeated.",
+            rich_help_panel="Model Setup",
+        ),
+    ] = None,
     bit_error_rate: Annotated[
-        float | None,
+        list[str] | None,
         typer.Option(
             "--bit-error-rate",
             "--ber",
-            min=0.0,
-            max=1.0,
-            help="The bit error rate to use. Mutually exclusive with --faults.",
+            help="The bit error rate to use. Several (comma-separated or "
+            "repeated) sweep over them, see --output. Mutually exclusive with "
+            "--faults.",
             rich_help_panel="Fault Injection",
         ),
     ] = None,
     faults: Annotated[
-        int | None,
+        list[str] | None,
         typer.Option(
-            min=0,
-            help="The number of faults to inject. Mutually exclusive with --bit-error-rate.",
+            help="The number of faults to inject. Several (comma-separated or "
+            "repeated) sweep over them, see --output. Mutually exclusive with "
+            "--bit-error-rate.",
             rich_help_panel="Fault Injection",
         ),
     ] = None,
@@ -247,15 +279,122 @@ def record(
             rich_help_panel="Fault Injection",
         ),
     ] = False,
+    bit_statistics: Annotated[
+        bool,
+        typer.Option(
+            help="Additionally record fixed-size per-run histograms of faulty "
+            "bit positions and faulty bits per element. Enough for heatmap "
+            "without the size cost of --compare-bitwise.",
+            rich_help_panel="Fault Injection",
+        ),
+    ] = False,
+    nested: Annotated[
+        bool,
+        typer.Option(
+            help="Record all --bit-error-rate/--faults values together on common "
+            "random numbers: each run's faulty bits at a value are a subset of "
+            "those at every higher one and are injected incrementally. Gives "
+            "monotone, lower-variance curves for less work than recording the "
+            "values one after another. Every value gets the same runs, and "
+            "recording stops once the stop conditions are met for all of them. "
+            "Saves to the --output directory; incompatible with --journal.",
+            rich_help_panel="Fault Injection",
+        ),
+    ] = False,
+    adaptive: Annotated[
+        bool,
+        typer.Option(
+            help="Choose the bit error rates while recording, between the two "
+            "--bit-error-rate values given: bisect (in log space) where the "
+            "score changes the most, then spend the rest of --run-budget on the "
+            "least certain values, skipping flat regions. Saves one file per "
+            "value to the --output directory.",
+            rich_help_panel="Adaptive Search",
+        ),
+    ] = False,
+    run_budget: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The total number of runs an --adaptive search may record, "
+            "including any resumed from --output.",
+            rich_help_panel="Adaptive Search",
+        ),
+    ] = None,
+    max_points: Annotated[
+        int,
+        typer.Option(
+            min=3,
+            help="The most bit error rates an --adaptive search records.",
+            rich_help_panel="Adaptive Search",
+        ),
+    ] = 8,
+    flat_threshold: Annotated[
+        float,
+        typer.Option(
+            help="Score difference (e.g. accuracy in percentage points) below "
+            "which neighbouring --adaptive values count as flat.",
+            rich_help_panel="Adaptive Search",
+        ),
+    ] = 1.0,
     fault_summary: Annotated[
         bool,
         typer.Option(
             help="Print a per-run fault-injection summary (bits flipped, BER, and "
-            "- if --compare-bitwise is also set - affected/masked counts and a "
+            "- if --compare-bitwise or --bit-statistics is also set - "
+            "affected/masked counts and a "
             "faulty-bit histogram) after each run.",
             rich_help_panel="Fault Injection",
         ),
     ] = False,
+    sampling: Annotated[
+        FaultSampling,
+        typer.Option(
+            help="How each run picks its faulty bits. stratified gives every bit "
+            "position and parameter tensor its proportional share of the faults, "
+            "which lowers the variance between runs so --stability-threshold is "
+            "met sooner. Not supported with --secded or --nested.",
+            rich_help_panel="Fault Injection",
+        ),
+    ] = FaultSampling.Uniform,
+    screening_tolerance: Annotated[
+        float | None,
+        typer.Option(
+            min=0.0,
+            help="Skip inference for runs that predict like the fault-free "
+            "model, recording its results instead. At 0, only runs whose "
+            "decoded parameters didn't change are skipped, which is exact. "
+            "Above 0, per-parameter sensitivities, computed once from "
+            "per-sample gradients of the fault-free model, also estimate how "
+            "far each run's decoded parameter changes move any sample's top-1 "
+            "margin relative to it (to first order), and runs are skipped "
+            "while that is at most N, e.g. 0.1; this ignores curvature and can "
+            "bias the scores. Must be below 1. Not supported with the sdc "
+            "metric.",
+            rich_help_panel="Fault Injection",
+        ),
+    ] = None,
+    screening_cache: Annotated[
+        Path | None,
+        typer.Option(
+            help="A directory to keep --screening-tolerance's sensitivities in, "
+            "one memory-mapped file per model, encoding, dtype and dataset, so "
+            "they're only computed once.",
+            rich_help_panel="Fault Injection",
+        ),
+    ] = None,
+    seed: Annotated[
+        int | None,
+        typer.Option(
+            help="Derive every run's fault seed from this seed and the run's "
+            "index instead of drawing it at random, so the same runs are "
+            "recorded again with the same seed, e.g. to replay them later. "
+            "Resuming a file continues at its next run index.",
+            min=0,
+            max=2**64 - 1,
+            rich_help_panel="Fault Injection",
+        ),
+    ] = None,
     secded: Annotated[
         int | None,
         typer.Option(
@@ -295,7 +434,10 @@ def record(
     output: Annotated[
         Path | None,
         typer.Option(
-            help="A file path to save results to.",
+            help="A file path to save results to. When sweeping over several "
+            "--bit-error-rate/--faults values, a directory to save one file "
+            "per value to (ber_<rate>.json or faults_<count>.json, with .zst "
+            "appended if compressed, or .journal as a journal).",
             rich_help_panel="Recording Settings",
         ),
     ] = None,
@@ -315,6 +457,27 @@ def record(
             rich_help_panel="Recording Settings",
         ),
     ] = False,
+    journal: Annotated[
+        bool,
+        typer.Option(
+            help="Save --output as an append-only journal: each save appends "
+            "only the runs recorded since the last one instead of rewriting the "
+            "whole file. A run cut off by a crash is dropped when resuming. "
+            "Ignores --compress; see the compact command.",
+            rich_help_panel="Recording Settings",
+        ),
+    ] = False,
+    record_outcomes: Annotated[
+        bool,
+        typer.Option(
+            help="Additionally record which test images each run classified "
+            "correctly and which kept the golden prediction, in a binary side "
+            "file next to --output (<output>.outcomes). Lets other metrics and "
+            "per-class scores be computed afterwards without re-running. "
+            "Requires --output.",
+            rich_help_panel="Recording Settings",
+        ),
+    ] = False,
     overwrite: Annotated[
         bool,
         typer.Option(
@@ -359,8 +522,36 @@ def record(
             rich_help_panel="Misc Settings",
         ),
     ] = "cpu",
+    pipeline_depth: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help="Prepare up to N upcoming runs (fault injection and decoding) on a background thread while the current run is being scored. Each prepared run holds a copy of the model in memory. 0 runs everything sequentially.",
+            rich_help_panel="Misc Settings",
+        ),
+    ] = 0,
+    threads: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The number of CPU threads to use for encoding/decoding and PyTorch together. Split between the two when --pipeline-depth is set. Defaults to all available threads.",
+            rich_help_panel="Misc Settings",
+        ),
+    ] = None,
 ) -> None:
-    """Run an encoded memory fault injection experiment and record the results."""
+    """Run an encoded memory fault injection experiment and record the results.
+
+    Several --bit-error-rate/--faults values are recorded one after another
+    in the same process, reusing the loaded model and dataset, the encoding
+    and the golden results. Each one gets its own result file and its own
+    copy of the stop conditions.
+    """
+    overlapping = pipeline_depth > 0
+    if threads is not None:
+        ThreadBudget.from_total(threads, overlapping=overlapping).apply()
+    elif overlapping:
+        ThreadBudget.detect(overlapping=True).apply()
+
     bundle = _init_model_bundle(
         dataset, model, imagenet_root, batch_size, preload_batches, device
     )
@@ -377,30 +568,117 @@ def record(
     if runs is not None and min_runs is not None:
         raise typer.BadParameter("Cannot specify both --runs and --min-runs")
 
+    points: list[int] | list[float]
     match (faults, bit_error_rate):
         case (None, None):
-            faults_ = 0
+            points = [0]
         case (None, _):
-            assert bit_error_rate is not None
-            # Need to make sure it's a float as only floats are treated as BER.
-            faults_ = float(bit_error_rate)
+            # Need to make sure they're floats as only floats are treated as BER.
+            points = _parse_points(bit_error_rate, float, "--bit-error-rate")
+            if not all(0.0 <= point <= 1.0 for point in points):
+                raise typer.BadParameter(
+                    "Bit error rates must be between 0 and 1",
+                    param_hint="--bit-error-rate",
+                )
         case (_, None):
-            assert faults is not None
-            faults_ = faults
+            points = _parse_points(faults, int, "--faults")
+            if not all(point >= 0 for point in points):
+                raise typer.BadParameter(
+                    "Fault counts must not be negative", param_hint="--faults"
+                )
         case _:
             raise typer.BadParameter(
                 "Only one of --faults or --bit-error-rate can be specified"
             )
 
+    if nested and journal:
+        raise typer.BadParameter("--nested can't be combined with --journal")
+    if screening_tolerance is not None and screening_tolerance >= 1:
+        raise typer.BadParameter(
+            "At 1 or above, runs that could flip a prediction are skipped too",
+            param_hint="--screening-tolerance",
+        )
+    if screening_tolerance is not None and ReliabilityMetric.Sdc in [
+        reliability_metric,
+        *(extra_metric or ()),
+    ]:
+        raise typer.BadParameter(
+            "Screening can't be combined with the sdc metric",
+            param_hint="--screening-tolerance",
+        )
+    if sampling == FaultSampling.Stratified and (nested or secded is not None):
+        raise typer.BadParameter(
+            "Stratified sampling can't be combined with --nested or --secded",
+            param_hint="--sampling",
+        )
+    if adaptive:
+        if nested or runs is not None:
+            raise typer.BadParameter(
+                "--adaptive can't be combined with --nested or --runs"
+            )
+        if faults is not None or len(points) != 2:
+            raise typer.BadParameter(
+                "--adaptive searches between exactly two --bit-error-rate values",
+                param_hint="--bit-error-rate",
+            )
+        if run_budget is None:
+            raise typer.BadParameter("--adaptive requires --run-budget")
+        if record_outcomes:
+            raise typer.BadParameter(
+                "--adaptive can't be combined with --record-outcomes"
+            )
+
+    outputs: list[Path | None] = [None] * len(points)
+    if output is not None:
+        output = Path(output).expanduser()
+        if len(points) == 1 and not nested and not adaptive:
+            outputs = [output]
+        else:
+            outputs = [
+                output / _sweep_file_name(point, compress=compress, journal=journal)
+                for point in points
+            ]
+
     dtype = torch.float16 if f16 else torch.float32
 
+    def outcomes_path(output: Path | None) -> Path | None:
+        if not record_outcomes:
+            return None
+        if output is None:
+            raise typer.BadParameter("--record-outcomes requires --output")
+        return Path(f"{output}.outcomes")
+
+    def stop_conditions() -> list[StopCondition]:
+        conditions: list[StopCondition] = []
+        if stability_threshold is not None:
+            if min_runs is None:
+                min_samples = 0
+            else:
+                min_samples = min_runs
+            conditions.append(
+                Stability(min_samples=min_samples, threshold=stability_threshold)
+            )
+
+        if runs is not None:
+            conditions.append(AdditionalRuns(runs))
+
+        if max_runs is not None:
+            conditions.append(MaxRuns(max_runs))
+        return conditions
+
     experiment = EncodedFaultInjection(
         bundle,
         encoder,
         reliability_metric,
+        extra_metrics=extra_metric or (),
+        outcomes_path=outcomes_path(outputs[0]),
         golden_is_encoded=golden_is_encoded,
-        faults=faults_,
+        faults=points[0],
+        sampling=sampling,
+        screening_tolerance=screening_tolerance,
+        screening_cache=screening_cache,
         compare_bitwise=compare_bitwise,
+        bit_statistics=bit_statistics,
         fault_summary=fault_summary,
         preload_dataset=preload_batches,
         dataset_batch_limit=batch_limit,
@@ -408,13 +686,144 @@ def record(
         device=device,
         dtype=dtype,
         progress=Progress(),
+        seed=seed,
     )
-    stop_conditions: list[StopCondition] = []
 
+    if adaptive:
+        assert run_budget is not None
+        lower, upper = sorted(points)
+        try:
+            search = AdaptiveBerSearch(
+                experiment,
+                lower,
+                upper,
+                run_budget=run_budget,
+                max_points=max_points,
+                flat_threshold=flat_threshold,
+                point_stop_conditions=stop_conditions,
+                output=output,
+                file_name=lambda rate: _sweep_file_name(
+                    rate, compress=compress, journal=journal
+                ),
+                autosave_seconds=autosave,
+                compressed=compress,
+                journal=journal,
+                pipeline_depth=pipeline_depth,
+                overwrite=overwrite,
+            )
+        except ValueError as error:
+            raise typer.BadParameter(str(error)) from None
+        try:
+            _ = search.run()
+        except FingerprintError as error:
+            logger.error(str(error))
+            raise typer.Exit(1) from None
+        return
+
+    if nested:
+        base = experiment
+
+        def make_sweep() -> NestedFaultSweep:
+            return NestedFaultSweep(
+                {
+                    _sweep_file_name(point, compress=compress, journal=False): (
+                        base.with_faults(
+                            point, outcomes_path=outcomes_path(point_output)
+                        )
+                    )
+                    for point, point_output in zip(points, outputs, strict=True)
+                },
+                point_stop_conditions=stop_conditions,
+            )
+
+        _ = _record_nested(
+            make_sweep,
+            output,
+            autosave=autosave,
+            compress=compress,
+            overwrite=overwrite,
+            pipeline_depth=pipeline_depth,
+        )
+        return
+
+    for index, (point, point_output) in enumerate(zip(points, outputs, strict=True)):
+        if index > 0:
+            experiment = experiment.with_faults(
+                point, outcomes_path=outcomes_path(point_output)
+            )
+        if len(points) > 1:
+            logger.info(f"Recording {_point_label(point)}")
+
+        finished = _record_point(
+            experiment,
+            point_output,
+            stop_conditions=stop_conditions(),
+            autosave=autosave,
+            compress=compress,
+            journal=journal,
+            overwrite=overwrite,
+            pipeline_depth=pipeline_depth,
+        )
+        if not finished:
+            break
+
+
+def _parse_points[T: (int, float)](
+    values: list[str], convert: Callable[[str], T], param_hint: str
+) -> list[T]:
+    """Parse repeated and/or comma-separated `--bit-error-rate`/`--faults`
+    values, in order and without duplicates."""
+    points: list[T] = []
+    for value in values:
+        for part in value.split(","):
+            if not part.strip():
+                continue
+            try:
+                point = convert(part.strip())
+            except ValueError:
+                raise typer.BadParameter(
+                    f"{part.strip()!r} is not a valid number", param_hint=param_hint
+                ) from None
+            if point not in points:
+                points.append(point)
+    if not points:
+        raise typer.BadParameter("No values given", param_hint=param_hint)
+    return points
+
+
+def _point_label(point: int | float) -> str:
+    if isinstance(point, float):
+        return f"bit error rate {point:g}"
+    return f"{point} faults"
+
+
+def _sweep_file_name(point: int | float, *, compress: bool, journal: bool) -> str:
+    """The name of one sweep point's result file within the `--output` directory."""
+    stem = f"ber_{point:g}" if isinstance(point, float) else f"faults_{point}"
+    if journal:
+        return f"{stem}.journal"
+    return f"{stem}.json.zst" if compress else f"{stem}.json"
+
+
+def _record_point(
+    experiment: EncodedFaultInjection,
+    output: Path | None,
+    *,
+    stop_conditions: list[StopCondition],
+    autosave: float | None,
+    compress: bool,
+    journal: bool,
+    overwrite: bool,
+    pipeline_depth: int,
+) -> bool:
+    """Resume `experiment` from `output` if it exists, then run it until a stop
+    condition is met, saving to `output`.
+
+    Returns `False` if stopped by Ctrl+C, see `Experiment.run_loop`.
+    """
     save_config: SaveConfig | None = None
     output_exists = False
     if output is not None:
-        output = Path(output).expanduser()
         output_exists = output.exists()
         if not output.parent.exists():
             logger.info(f"Creating output parent directory {output.parent}")
@@ -424,24 +833,12 @@ def record(
 
         effective_compressed = is_compressed(output) if output_exists else compress
         save_config = SaveConfig(
-            path=output, interval_seconds=autosave, compressed=effective_compressed
-        )
-
-    if stability_threshold is not None:
-        if min_runs is None:
-            min_samples = 0
-        else:
-            min_samples = min_runs
-        stop_conditions.append(
-            Stability(min_samples=min_samples, threshold=stability_threshold)
+            path=output,
+            interval_seconds=autosave,
+            compressed=effective_compressed,
+            journal=journal,
         )
 
-    if runs is not None:
-        stop_conditions.append(AdditionalRuns(runs))
-
-    if max_runs is not None:
-        stop_conditions.append(MaxRuns(max_runs))
-
     if output is not None and output_exists:
         try:
             experiment.load_from(output)
@@ -453,7 +850,562 @@ def record(
                 f"{output} was recorded with a different configuration and will be overwritten:\n{error}"
             )
 
-    experiment.run_loop(stop_conditions=stop_conditions, save_config=save_config)
+    return experiment.run_loop(
+        stop_conditions=stop_conditions,
+        save_config=save_config,
+        pipeline_depth=pipeline_depth,
+    )
+
+
+def _record_nested(
+    make_sweep: Callable[[], NestedFaultSweep],
+    output: Path | None,
+    *,
+    autosave: float | None,
+    compress: bool,
+    overwrite: bool,
+    pipeline_depth: int,
+) -> bool:
+    """Like `_record_point`, but for a `NestedFaultSweep` saved to the `output`
+    directory."""
+    try:
+        sweep = make_sweep()
+    except ValueError as error:
+        # E.g. two bit error rates flipping the same number of bits.
+        raise typer.BadParameter(str(error)) from None
+    save_config: SaveConfig | None = None
+    if output is not None:
+        save_config = SaveConfig(
+            path=output, interval_seconds=autosave, compressed=compress
+        )
+        if output.is_dir():
+            try:
+                sweep.load_from(output)
+            except (FingerprintError, ValueError) as error:
+                if not overwrite:
+                    logger.error(str(error))
+                    raise typer.Exit(1) from None
+                logger.warning(
+                    f"The results in {output} can't be resumed and will be overwritten:\n{error}"
+                )
+                # Some points may have been loaded already.
+                sweep = make_sweep()
+
+    return sweep.run_loop(save_config=save_config, pipeline_depth=pipeline_depth)
+
+
+@app.command(no_args_is_help=True)
+def campaign(
+    plan: Annotated[
+        Path,
+        typer.Argument(
+            help="A TOML file naming the models, encoders, dtypes and bit error "
+            "rates (or fault counts) to record every combination of, along with "
+            "the record options they share. See the docs for the format."
+        ),
+    ],
+    workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Record up to N models at the same time, each in its own "
+            "process. All jobs of a model run in the same process.",
+        ),
+    ] = 1,
+    threads: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The number of CPU threads to use in total, split between the "
+            "workers. Defaults to all available threads.",
+        ),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            help="Only list the jobs in the order they would be recorded, and "
+            "which of them are already done.",
+        ),
+    ] = False,
+    queue: Annotated[
+        Path | None,
+        typer.Option(
+            help="Record together with every other campaign using the same "
+            "queue directory, e.g. on a filesystem shared between machines: "
+            "the runs each job still needs are split into tasks of "
+            "--batch-runs, which the workers claim from the queue, recording "
+            "them into their own shard files inside it. Requires max_runs in "
+            "the plan; stability_threshold and journal aren't supported.",
+            rich_help_panel="Work Queue",
+        ),
+    ] = None,
+    node: Annotated[
+        str,
+        typer.Option(
+            help="This machine's name in the --queue, unique among the "
+            "machines sharing it. Restarting with the same name resumes the "
+            "tasks it had claimed. Defaults to the host name.",
+            rich_help_panel="Work Queue",
+        ),
+    ] = socket.gethostname(),
+    batch_runs: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="The number of runs in each --queue task.",
+            rich_help_panel="Work Queue",
+        ),
+    ] = 10,
+    merge: Annotated[
+        bool,
+        typer.Option(
+            help="Once every --queue task is done, merge each job's shards "
+            "into its result file under the plan's output directory, where "
+            "compare finds it. Safe to repeat.",
+            rich_help_panel="Work Queue",
+        ),
+    ] = False,
+) -> None:
+    """Record every combination of a campaign plan's models, encoders, dtypes and bit error rates.
+
+    Jobs are ordered to share their setup: each model's dataset is loaded
+    once, each encoding is computed once, and the golden results are computed
+    once per model and dtype. Every job saves to its own result file under the
+    plan's output directory, which is resumed if it exists; jobs whose file
+    already meets the stop conditions are skipped without loading anything, so
+    an interrupted campaign can simply be started again.
+    """
+    try:
+        campaign_plan = CampaignPlan.load(plan)
+    except (OSError, tomllib.TOMLDecodeError, ValidationError) as error:
+        raise typer.BadParameter(str(error), param_hint="PLAN") from None
+
+    try:
+        dataset = DatasetChoice(campaign_plan.dataset)
+    except ValueError:
+        choices = ", ".join(choice.value for choice in DatasetChoice)
+        raise typer.BadParameter(
+            f"Unknown dataset {campaign_plan.dataset!r}. Choices: {choices}",
+            param_hint="PLAN",
+        ) from None
+    # Only describes what to load, so any unknown model fails here rather than
+    # in a worker.
+    bundles = [
+        _init_model_bundle(
+            dataset,
+            model,
+            campaign_plan.imagenet_root,
+            campaign_plan.batch_size,
+            campaign_plan.preload_batches,
+            campaign_plan.device,
+        )
+        for model in campaign_plan.models
+    ]
+
+    groups = campaign_plan.groups()
+    if dry_run:
+        for job in itertools.chain.from_iterable(groups):
+            output = _campaign_job_output(campaign_plan, job)
+            done = is_done(output, campaign_plan.stop_conditions())
+            typer.echo(f"{output} {'done' if done else 'pending'}")
+        return
+
+    overlapping = campaign_plan.pipeline_depth > 0
+    if threads is None:
+        budget = ThreadBudget.detect(overlapping=overlapping)
+    else:
+        budget = ThreadBudget.from_total(threads, overlapping=overlapping)
+
+    if queue is not None:
+        _campaign_queue(
+            campaign_plan,
+            dict(zip(campaign_plan.models, bundles, strict=True)),
+            queue.expanduser(),
+            node=node,
+            workers=workers,
+            batch_runs=batch_runs,
+            merge=merge,
+            budget=budget,
+        )
+        return
+
+    workers = min(workers, len(groups))
+    if workers == 1:
+        budget.apply()
+        for bundle, group in zip(bundles, groups, strict=True):
+            if not _record_campaign_group(campaign_plan, bundle, group):
+                break
+        return
+
+    # Spawned rather than forked, which isn't safe with torch's threads.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=setup_logging,
+    ) as pool:
+        futures = [
+            pool.submit(
+                _record_campaign_group,
+                campaign_plan,
+                bundle,
+                group,
+                budget.for_worker(index % workers, workers),
+            )
+            for index, (bundle, group) in enumerate(zip(bundles, groups, strict=True))
+        ]
+        try:
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        except KeyboardInterrupt:
+            # The workers received it too and save before stopping.
+            logger.warning("Interrupted, waiting for the workers to stop")
+            _ = pool.shutdown(cancel_futures=True)
+            raise typer.Exit(130) from None
+        for future in done:
+            # Reraises a worker's error.
+            _ = future.result()
+
+
+def _campaign_queue(
+    plan: CampaignPlan,
+    bundles: dict[str, ModelBundle],
+    root: Path,
+    *,
+    node: str,
+    workers: int,
+    batch_runs: int,
+    merge: bool,
+    budget: ThreadBudget,
+) -> None:
+    """`campaign --queue`: work on the queue at `root` with `workers` local
+    workers, then `merge` the shards if every task is done."""
+    if plan.max_runs is None or plan.stability_threshold is not None:
+        raise typer.BadParameter(
+            "--queue splits the plan's max_runs into tasks, and needs max_runs "
+            "without stability_threshold",
+            param_hint="--queue",
+        )
+    if plan.journal:
+        raise typer.BadParameter(
+            "--queue records shards, which can't be journals", param_hint="--queue"
+        )
+    jobs = list(itertools.chain.from_iterable(plan.groups()))
+    _create_campaign_queue(plan, jobs, root, batch_runs)
+
+    if workers == 1:
+        budget.apply()
+        finished = _work_on_campaign_queue(plan, bundles, root, node)
+    else:
+        # Several local workers are just like several machines, see
+        # `work_queue`.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_logging,
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _work_on_campaign_queue,
+                    plan,
+                    bundles,
+                    root,
+                    f"{node}-{index}",
+                    budget.for_worker(index, workers),
+                )
+                for index in range(workers)
+            ]
+            try:
+                finished = all(future.result() for future in futures)
+            except KeyboardInterrupt:
+                logger.warning("Interrupted, waiting for the workers to stop")
+                raise typer.Exit(130) from None
+    if not finished:
+        return
+
+    if not WorkQueue(root, node).is_finished():
+        logger.info("Other workers are still recording")
+    elif merge:
+        _merge_campaign_shards(plan, root)
+
+
+def _campaign_job_output(plan: CampaignPlan, job: CampaignJob) -> Path:
+    return job.directory / _sweep_file_name(
+        job.point, compress=plan.compress, journal=plan.journal
+    )
+
+
+def _record_campaign_group(
+    plan: CampaignPlan,
+    bundle: ModelBundle,
+    jobs: list[CampaignJob],
+    budget: ThreadBudget | None = None,
+) -> bool:
+    """Record `jobs`, which all use the model of `bundle`, each experiment
+    derived from the previous one so they share whatever setup they can.
+
+    Runs in a worker process with `campaign --workers`. Returns `False` if
+    stopped by Ctrl+C.
+    """
+    if budget is not None:
+        budget.apply()
+
+    pending = [
+        job
+        for job in jobs
+        if not is_done(_campaign_job_output(plan, job), plan.stop_conditions())
+    ]
+    if not pending:
+        logger.info(f"Every job of {jobs[0].model} is done")
+        return True
+
+    setups = _CampaignSetups(plan, {jobs[0].model: bundle})
+    for job in pending:
+        experiment = setups.experiment(job)
+        logger.info(
+            f"Recording {job.model} ({job.dtype.value}, {job.encoder}) at "
+            f"{_point_label(job.point)}"
+        )
+        finished = _record_point(
+            experiment,
+            _campaign_job_output(plan, job),
+            stop_conditions=plan.stop_conditions(),
+            autosave=plan.autosave,
+            compress=plan.compress,
+            journal=plan.journal,
+            overwrite=False,
+            pipeline_depth=plan.pipeline_depth,
+        )
+        if not finished:
+            return False
+    return True
+
+
+class _CampaignSetups:
+    """Makes each campaign job's experiment from the previous job's, sharing
+    whatever setup they have in common (see `campaign.CampaignPlan.groups`)."""
+
+    _plan: CampaignPlan
+    _bundles: dict[str, ModelBundle]
+    _setup: EncodedFaultInjection | None
+    """The experiment of the current setup, which the ones for its other
+    points and for the next dtype or encoder are derived from."""
+    _setup_key: tuple[str, EncodingDtype, str] | None
+
+    def __init__(self, plan: CampaignPlan, bundles: dict[str, ModelBundle]) -> None:
+        self._plan = plan
+        self._bundles = bundles
+        self._setup = None
+        self._setup_key = None
+
+    def model(self) -> str | None:
+        """The model whose setup is loaded."""
+        return None if self._setup_key is None else self._setup_key[0]
+
+    def experiment(self, job: CampaignJob) -> EncodedFaultInjection:
+        spec = self._plan.encoders[job.encoder]
+        encoder = _resolve_encoder(
+            mset=spec.mset, cep=spec.cep, cep_scheme=spec.cep_scheme, secded=spec.secded
+        )
+        dtype = job.dtype.to_torch()
+        if self._setup is None or job.model != self.model():
+            # Frees the previous model's setup before loading the next.
+            self._setup = None
+            self._setup = experiment = EncodedFaultInjection(
+                self._bundles[job.model],
+                encoder,
+                self._plan.reliability_metric,
+                extra_metrics=self._plan.extra_metrics,
+                golden_is_encoded=self._plan.golden_is_encoded,
+                faults=job.point,
+                sampling=self._plan.sampling,
+                screening_tolerance=self._plan.screening_tolerance,
+                screening_cache=self._plan.screening_cache,
+                compare_bitwise=self._plan.compare_bitwise,
+                bit_statistics=self._plan.bit_statistics,
+                preload_dataset=self._plan.preload_batches,
+                dataset_batch_limit=self._plan.batch_limit,
+                batch_size=self._plan.batch_size,
+                device=self._plan.device,
+                dtype=dtype,
+                progress=Progress(),
+                seed=self._plan.seed,
+            )
+        elif job.setup() != self._setup_key:
+            self._setup = experiment = self._setup.with_encoder(
+                encoder, job.point, dtype=dtype
+            )
+        else:
+            experiment = self._setup.with_faults(job.point)
+        self._setup_key = job.setup()
+        return experiment
+
+
+def _queue_task_name(job_index: int, batch: int) -> str:
+    # Zero-padded so tasks are claimed in the campaign's order.
+    return f"{job_index:06d}-{batch:06d}"
+
+
+def _queue_task_job(name: str) -> int:
+    return int(name.split("-")[0])
+
+
+def _create_campaign_queue(
+    plan: CampaignPlan, jobs: list[CampaignJob], root: Path, batch_runs: int
+) -> None:
+    """Split the runs every job still needs into tasks of up to `batch_runs`,
+    unless the queue at `root` already exists."""
+    assert plan.max_runs is not None
+    tasks: dict[str, dict[str, Any]] = {}
+    for index, job in enumerate(jobs):
+        output = _campaign_job_output(plan, job)
+        recorded = _recorded_runs(output)
+        remaining = plan.max_runs - recorded
+        for batch, start in enumerate(range(0, remaining, batch_runs)):
+            tasks[_queue_task_name(index, batch)] = {
+                "job": index,
+                "output": str(output),
+                "runs": min(batch_runs, remaining - start),
+                # The job's run index of its first run, see `CampaignPlan.seed`.
+                "first_run": recorded + start,
+            }
+    if WorkQueue.create(root, tasks):
+        logger.info(f"Created a queue of {len(tasks)} tasks in {root}")
+
+
+def _recorded_runs(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return ResultReader(path).run_count()
+
+
+def _shard_path(plan: CampaignPlan, job: CampaignJob, root: Path, worker: str) -> Path:
+    """Where `worker` records its runs of `job` in the queue at `root`."""
+    output = _campaign_job_output(plan, job)
+    suffix = ".json.zst" if plan.compress else ".json"
+    return root / "shards" / job.directory.name / output.name / f"{worker}{suffix}"
+
+
+def _work_on_campaign_queue(
+    plan: CampaignPlan,
+    bundles: dict[str, ModelBundle],
+    root: Path,
+    worker: str,
+    budget: ThreadBudget | None = None,
+) -> bool:
+    """Record the tasks of the queue at `root` as `worker` until none are
+    left, each into this worker's shard of its job.
+
+    Tasks this worker claimed before being stopped are resumed first, and
+    the worker prefers tasks of the model it has loaded. Runs in a worker
+    process with `campaign --workers`. Returns `False` if stopped by Ctrl+C,
+    giving the interrupted task's remaining runs back to the queue.
+    """
+    if budget is not None:
+        budget.apply()
+
+    jobs = list(itertools.chain.from_iterable(plan.groups()))
+    queue = WorkQueue(root, worker)
+    setups = _CampaignSetups(plan, bundles)
+    resumed = queue.claimed()
+    while True:
+        if resumed:
+            name = resumed.pop(0)
+        else:
+            name = queue.claim(
+                prefer=lambda name: jobs[_queue_task_job(name)].model == setups.model()
+            )
+        if name is None:
+            return True
+
+        task = queue.read(name)
+        job = jobs[task["job"]]
+        if task["output"] != str(_campaign_job_output(plan, job)):
+            raise typer.BadParameter(
+                f"The queue in {root} was created for another plan",
+                param_hint="--queue",
+            )
+        shard = _shard_path(plan, job, root, worker)
+        if "start" not in task:
+            # Recorded before the first run, so it's exact even if this worker
+            # is stopped and resumes the task.
+            task["start"] = _recorded_runs(shard)
+            queue.update(name, task)
+
+        logger.info(
+            f"{worker}: recording {task['runs']} runs of {job.model} "
+            f"({job.dtype.value}, {job.encoder}) at {_point_label(job.point)}"
+        )
+        experiment = setups.experiment(job)
+        # Seeded by the job's run index rather than the shard's, so the runs
+        # don't depend on which worker records them.
+        experiment.seed_runs(plan.seed, offset=task["first_run"] - task["start"])
+        finished = _record_point(
+            experiment,
+            shard,
+            stop_conditions=[MaxRuns(task["start"] + task["runs"])],
+            autosave=plan.autosave,
+            compress=plan.compress,
+            journal=False,
+            overwrite=False,
+            pipeline_depth=plan.pipeline_depth,
+        )
+        if not finished:
+            recorded = _recorded_runs(shard) - task.pop("start")
+            task["runs"] -= recorded
+            task["first_run"] += recorded
+            queue.update(name, task)
+            queue.release(name)
+            return False
+        queue.finish(name)
+
+
+def _merge_campaign_shards(plan: CampaignPlan, root: Path) -> None:
+    """Merge every job's shards in the queue at `root` into its result file."""
+    for job in itertools.chain.from_iterable(plan.groups()):
+        output = _campaign_job_output(plan, job)
+        directory = root / "shards" / job.directory.name / output.name
+        # Leaves out any temporary file of an interrupted save.
+        paths = sorted(directory.glob("*.json*"))
+        if output.exists():
+            # Deduplicated by seed, so merging again is harmless.
+            paths.insert(0, output)
+        if not paths:
+            continue
+        merged = merge_results([SavedResult.load(path) for path in paths])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        merged.save(output, compressed=plan.compress)
+        logger.info(f"Merged {len(paths)} files into {output}")
+
+
+@app.command(no_args_is_help=True)
+def merge(
+    output: Annotated[
+        Path,
+        typer.Argument(help="Where to save the merged result."),
+    ],
+    shards: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Result files recorded with the same configuration, e.g. the "
+            "shards of a campaign --queue. OUTPUT itself may be one of them."
+        ),
+    ],
+    compress: Annotated[
+        bool,
+        typer.Option(help="Save the merged result zstd-compressed."),
+    ] = False,
+) -> None:
+    """Concatenate the runs of result files recorded with the same configuration.
+
+    Runs are deduplicated by their seed, so a run that's in several of the
+    files (e.g. because OUTPUT is merged into again) only counts once.
+    """
+    try:
+        merged = merge_results([SavedResult.load(path) for path in shards])
+    except FingerprintError as error:
+        logger.error(str(error))
+        raise typer.Exit(1) from None
+    merged.save(output, compressed=compress)
+    logger.info(f"Merged {len(merged.scores())} runs into {output}")
 
 
 @app.command()
@@ -473,6 +1425,53 @@ def discard_bitmasks(
     discard_bitmasks_in_file(path)
 
 
+@app.command(no_args_is_help=True)
+def compact(
+    path: Annotated[
+        Path,
+        typer.Argument(help="Path to a journal recorded with --journal."),
+    ],
+    destination: Annotated[
+        Path | None,
+        typer.Argument(help="Where to write the compacted file. Defaults to PATH."),
+    ] = None,
+    compress: Annotated[
+        bool,
+        typer.Option(help="Compress the output with zstd."),
+    ] = False,
+) -> None:
+    """Fold a journal recorded with --journal into a regular JSON result file."""
+    compact_journal(path, destination, compressed=compress)
+
+
+@app.command(no_args_is_help=True)
+def convert(
+    path: Annotated[
+        Path,
+        typer.Argument(help="Path to a saved result file, in any format."),
+    ],
+    destination: Annotated[
+        Path | None,
+        typer.Argument(help="Where to write the converted file. Defaults to PATH."),
+    ] = None,
+    to: Annotated[
+        ResultFormat,
+        typer.Option(help="The format to convert to."),
+    ] = ResultFormat.Columnar,
+    compress: Annotated[
+        bool,
+        typer.Option(help="Compress the output with zstd. Only applies to json."),
+    ] = False,
+) -> None:
+    """Convert a saved result file between the JSON and columnar formats.
+
+    Columnar files load much faster when they contain bitmasks (see
+    --compare-bitwise) and are read by every other command, but `record`
+    can only resume JSON files.
+    """
+    convert_result_file(path, destination, format=to, compressed=compress)
+
+
 def _split_path_argument(raw: str) -> tuple[Path, str | None]:
     """Splits `raw` on the first literal '=', separating a path from an
     optional legend-label override. Safe since paths never contain '=' on
@@ -568,6 +1567,14 @@ def compare(
             rich_help_panel="Output",
         ),
     ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="Processes to read result files with. Defaults to one per CPU core.",
+            rich_help_panel="Loading",
+        ),
+    ] = None,
 ) -> None:
     """Plot reliability score vs bit error rate, one line per configuration.
 
@@ -599,7 +1606,7 @@ def compare(
             for file in discover_result_files(path):
                 label_overrides[file] = label
 
-    loaded = load_results(source_paths)
+    loaded = load_results(source_paths, bitmasks=False, workers=jobs)
     if not loaded:
         logger.error("no result files found")
         raise typer.Exit(1)
@@ -628,7 +1635,7 @@ def heatmap(
         typer.Argument(
             help="Result file(s) to plot, or director(ies) recursively "
             "containing them. All merged into one figure. Requires results "
-            "recorded with --compare-bitwise.",
+            "recorded with --bit-statistics or --compare-bitwise.",
         ),
     ],
     bins: Annotated[
@@ -665,7 +1672,8 @@ def heatmap(
     skip_multi_bit_faults: Annotated[
         bool,
         typer.Option(
-            help="Exclude elements with more than one faulty bit.",
+            help="Exclude elements with more than one faulty bit. Requires "
+            "results recorded with --compare-bitwise.",
             rich_help_panel="Filtering",
         ),
     ] = False,
@@ -677,26 +1685,51 @@ def heatmap(
             rich_help_panel="Output",
         ),
     ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="Processes to read result files with. Defaults to one per CPU core.",
+            rich_help_panel="Loading",
+        ),
+    ] = None,
 ) -> None:
     """Plot per-run score density against faulty bit position."""
-    loaded = load_results(paths)
+    # Bit statistics are part of the summaries, so only the files that have
+    # to be plotted from their bitmasks are read in full.
+    loaded = load_results(paths, bitmasks=False, workers=jobs)
     if not loaded:
         logger.error("no result files found")
         raise typer.Exit(1)
 
-    results = [result for _, result in loaded]
-    if not all(isinstance(result.result, DetailedResult) for result in results):
-        offenders = [
-            str(path)
-            for path, result in loaded
-            if not isinstance(result.result, DetailedResult)
-        ]
+    offenders = [
+        str(path)
+        for path, result in loaded
+        if not has_heatmap_data(result, skip_multi_bit_faults=skip_multi_bit_faults)
+    ]
+    if offenders:
+        requirement = heatmap_requirement(skip_multi_bit_faults=skip_multi_bit_faults)
         logger.error(
-            "heatmap requires results recorded with --compare-bitwise; "
-            f"missing bitmasks in: {', '.join(offenders)}"
+            f"heatmap requires results recorded with {requirement}; "
+            f"missing in: {', '.join(offenders)}"
         )
         raise typer.Exit(1) from None
 
+    needs_bitmasks = [
+        path
+        for path, result in loaded
+        if result.bit_statistics is None or skip_multi_bit_faults
+    ]
+    results = [
+        result
+        for path, result in loaded
+        if result.bit_statistics is not None and not skip_multi_bit_faults
+    ]
+    if needs_bitmasks:
+        results.extend(
+            result for _, result in load_results(needs_bitmasks, workers=jobs)
+        )
+
     try:
         fig = build_heatmap_figure(
             results,
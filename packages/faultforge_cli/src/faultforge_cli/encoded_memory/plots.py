@@ -13,12 +13,13 @@ which keeps editor tooling useful in the rest of the function.
 
 import enum
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 import matplotlib
 import numpy as np
 from faultforge import Fingerprint
+from faultforge.bits import residual_fault_count
 from faultforge.dtype import EncodingDtype
 from faultforge.experiments.encoded_memory import (
     DetailedResult,
@@ -241,15 +242,6 @@ def build_compare_figure(
     return fig
 
 
-def _residual_faults(run_bitmask: Sequence[int]) -> int:
-    """Total bits that differ from golden post-decode, across one run.
-
-    The count of bits actually flipped after decoding, which can be less than
-    the injected fault count if the encoding masked some of them.
-    """
-    return sum(value.bit_count() for value in run_bitmask)
-
-
 def _histogram_range(values: Sequence[float]) -> tuple[float, float]:
     """A valid (non-zero-width) range for `numpy.histogram2d`."""
     low = min(values)
@@ -280,6 +272,45 @@ def _colorbar_ticks(vmax: float) -> list[int]:
     return ticks if ticks else [1]
 
 
+def has_heatmap_data(result: SavedResult, *, skip_multi_bit_faults: bool) -> bool:
+    """Whether `result` has the per-run data `build_heatmap_figure` needs.
+
+    Looks at the fingerprint for bitmasks, so it works on a
+    `ResultReader.summary` too.
+    """
+    if result.bit_statistics is not None and not skip_multi_bit_faults:
+        return True
+    return result.fingerprint.scalars.get("compare_bitwise") is True
+
+
+def heatmap_requirement(*, skip_multi_bit_faults: bool) -> str:
+    """The `record` flag(s) `has_heatmap_data` asks for, for error messages."""
+    if skip_multi_bit_faults:
+        return "--compare-bitwise (--skip-multi-bit-faults needs per-run bitmasks)"
+    return "--bit-statistics or --compare-bitwise"
+
+
+def _run_bit_counts(
+    result: SavedResult, *, skip_multi_bit: bool
+) -> Iterator[tuple[dict[int, int], int]]:
+    """Each run's faulty bit position histogram and residual fault count.
+
+    Taken from the recorded bit statistics when possible, since they're
+    already aggregated, and computed from the bitmasks otherwise.
+    """
+    if result.bit_statistics is not None and not skip_multi_bit:
+        for stats in result.bit_statistics:
+            yield stats.position_histogram(), stats.residual_fault_count()
+        return
+
+    assert isinstance(result.result, DetailedResult)
+    for run in result.result.results:
+        yield (
+            bit_position_histogram(run.bitmask, skip_multi_bit=skip_multi_bit),
+            residual_fault_count(run.bitmask),
+        )
+
+
 def build_heatmap_figure(
     results: Sequence[SavedResult],
     *,
@@ -290,7 +321,8 @@ def build_heatmap_figure(
     skip_multi_bit_faults: bool = False,
 ) -> Figure:
     """A figure of per-run score density against faulty bit position (built
-    from `bit_position_histogram`) - shows which bit positions correlate with
+    from each run's `BitStatistics` where recorded, `bit_position_histogram`
+    of its bitmask otherwise) - shows which bit positions correlate with
     reliability loss.
 
     Bins with no data are filled with the colormap's minimum color rather
@@ -298,21 +330,22 @@ def build_heatmap_figure(
     masks it, which would otherwise show through as plain white.
 
     Raises:
-        ValueError: If `results` is empty, any entry isn't a `DetailedResult`
-            (a heatmap fundamentally needs per-run `bitmask` data), they don't
-            all share a `dtype`/`reliability_metric` (both affect axis
-            semantics/bounds, not just cosmetics), or no runs remain after
-            filtering.
+        ValueError: If `results` is empty, any entry has neither per-run bit
+            statistics nor bitmasks (only bitmasks with
+            `skip_multi_bit_faults`, which the statistics can't tell apart),
+            they don't all share a `dtype`/`reliability_metric` (both affect
+            axis semantics/bounds, not just cosmetics), or no runs remain
+            after filtering.
     """
     if not results:
         raise ValueError("no results to plot")
 
     for result in results:
-        if not isinstance(result.result, DetailedResult):
-            raise ValueError(
-                "heatmap requires results recorded with --compare-bitwise "
-                "(a per-run bitmask)"
+        if not has_heatmap_data(result, skip_multi_bit_faults=skip_multi_bit_faults):
+            requirement = heatmap_requirement(
+                skip_multi_bit_faults=skip_multi_bit_faults
             )
+            raise ValueError(f"heatmap requires results recorded with {requirement}")
 
     metrics = {result.reliability_metric() for result in results}
     if len(metrics) > 1:
@@ -330,21 +363,18 @@ def build_heatmap_figure(
     weights: list[int] = []
 
     for result in results:
-        assert isinstance(result.result, DetailedResult)
-        for run, score in zip(result.result.results, result.scores(), strict=True):
+        runs = _run_bit_counts(result, skip_multi_bit=skip_multi_bit_faults)
+        for (histogram, residual), score in zip(runs, result.scores(), strict=True):
             if min_score is not None and score < min_score:
                 continue
             if max_score is not None and score > max_score:
                 continue
 
-            if max_total_faults is not None:
-                residual = _residual_faults(run.bitmask)
-                if residual > max_total_faults:
-                    continue
+            # Bits actually flipped after decoding, which can be fewer than
+            # the injected faults if the encoding masked some.
+            if max_total_faults is not None and residual > max_total_faults:
+                continue
 
-            histogram = bit_position_histogram(
-                run.bitmask, skip_multi_bit=skip_multi_bit_faults
-            )
             for position, count in histogram.items():
                 scores.append(score)
                 positions.append(position)
@@ -25,54 +25,212 @@ The `compare` pipeline, end to end:
    `=LABEL` override.
 2. `load_results` discovers and loads every file under those paths into one
    flat pool of `(path, result)` pairs, skipping anything that fails to load.
+   Files are read on a process pool, and directories keep a `ResultIndex` of
+   summaries so unchanged files aren't read again next time.
 3. `build_configurations` clusters that pool into `Configuration`s and names
    each one.
 4. `plots.build_compare_figure` places each configuration in its grid cell and
    draws its line.
 """
 
+import functools
+import json
 import logging
-from collections.abc import Mapping, Sequence
+import os
+import tempfile
+from collections.abc import Hashable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import numpy as np
-from faultforge import Fingerprint
-from faultforge.experiments.encoded_memory import SavedResult
+from faultforge import Fingerprint, bits
+from faultforge.experiments.encoded_memory import ResultReader, SavedResult
 
 logger = logging.getLogger(__name__)
 
 
+INDEX_FILE_NAME = ".faultforge-index.json"
+"""The `ResultIndex` sidecar `load_results` keeps in each directory it loads."""
+
+_INDEX_VERSION = 1
+
+_MIN_PARALLEL_FILES = 32
+"""Below this many files to read, starting worker processes (each importing
+torch) costs more than it saves."""
+
+
 def discover_result_files(path: Path) -> list[Path]:
     """Resolve `path` to the result file(s) it names.
 
     A file resolves to itself; a directory resolves to every regular file
-    found recursively within it, sorted for determinism.
+    found recursively within it (except `ResultIndex` files), sorted for
+    determinism.
     """
     resolved = path.expanduser()
     if resolved.is_dir():
-        return sorted(p for p in resolved.rglob("*") if p.is_file())
+        return sorted(
+            p for p in resolved.rglob("*") if p.is_file() and p.name != INDEX_FILE_NAME
+        )
     return [resolved]
 
 
-def load_results(paths: Sequence[Path]) -> list[tuple[Path, SavedResult]]:
+class ResultIndex:
+    """A sidecar cache of result summaries for the files under a directory.
+
+    Entries are keyed by the file's path relative to the directory and
+    remember the file's modification time and size, so they're only used
+    while those still match. Each holds the file's `ResultReader.summary`
+    (the fingerprint plus per-run correct counts, from which the scores and
+    bit error rate follow), or the reason it failed to load so stray
+    non-result files aren't read again either.
+    """
+
+    _directory: Path
+    _path: Path
+    _entries: dict[str, dict[str, Any]]
+    _dirty: bool
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory.expanduser()
+        self._path = self._directory / INDEX_FILE_NAME
+        self._entries = {}
+        self._dirty = False
+
+        try:
+            content = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as error:
+            logger.warning(f"Ignoring unreadable index {self._path}\n-> {error}")
+            return
+        if content.get("version") == _INDEX_VERSION:
+            self._entries = content["entries"]
+
+    def get(self, file: Path) -> SavedResult | str | None:
+        """The cached summary of `file` or why it failed to load, `None` if
+        there's no entry or the file changed since it was made."""
+        entry = self._entries.get(self._key(file))
+        if entry is None or entry["stat"] != _stat(file):
+            return None
+        if "error" in entry:
+            return entry["error"]
+        return SavedResult.model_validate(entry["summary"])
+
+    def put(self, file: Path, loaded: SavedResult | str) -> None:
+        entry: dict[str, Any] = {"stat": _stat(file)}
+        if isinstance(loaded, str):
+            entry["error"] = loaded
+        else:
+            entry["summary"] = loaded.model_dump(mode="json")
+        self._entries[self._key(file)] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index back if anything changed, dropping the entries of
+        files that no longer exist. Failing to write is only logged."""
+        if not self._dirty:
+            return
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if (self._directory / key).is_file()
+        }
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=self._directory)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": _INDEX_VERSION, "entries": self._entries}, f)
+            os.replace(temp_name, self._path)
+        except OSError as error:
+            logger.warning(f"Failed to write the index {self._path}\n-> {error}")
+        self._dirty = False
+
+    def _key(self, file: Path) -> str:
+        return file.relative_to(self._directory).as_posix()
+
+
+def _stat(file: Path) -> list[int]:
+    stat = file.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_one(file: Path, *, bitmasks: bool) -> SavedResult | str:
+    """Load `file`, or return why it failed. Runs in the pool's workers."""
+    try:
+        return SavedResult.load(file) if bitmasks else ResultReader(file).summary()
+    except Exception as error:
+        return str(error)
+
+
+def _load_many(
+    files: Sequence[Path], *, bitmasks: bool, workers: int | None
+) -> list[SavedResult | str]:
+    load = functools.partial(_load_one, bitmasks=bitmasks)
+    if workers == 1 or len(files) < _MIN_PARALLEL_FILES:
+        return [load(file) for file in files]
+
+    workers = workers or os.process_cpu_count() or 1
+    chunk_size = max(1, len(files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(load, files, chunksize=chunk_size))
+
+
+def load_results(
+    paths: Sequence[Path], *, bitmasks: bool = True, workers: int | None = None
+) -> list[tuple[Path, SavedResult]]:
     """Step 2 of the `compare` pipeline: load every result file found across
     all of `paths` (recursing into any directories) into one flat pool of
     `(path, result)` pairs.
 
+    With `bitmasks=False`, each file is only read up to its
+    `ResultReader.summary`, skipping over (rather than parsing) any recorded
+    bitmasks - all `compare` needs are the scores and bit error rate. Those
+    summaries are cached in a `ResultIndex` in every directory in `paths`, so
+    later calls only read new or modified files.
+
+    Files that do have to be read are loaded on a pool of `workers` processes
+    (one per core by default, `1` to load in this process).
+
     Skips (with a `logger.warning`) any file that isn't a valid saved
     result - e.g. a stray non-result file living alongside real ones in a
     directory - rather than failing the whole load.
     """
-    loaded: list[tuple[Path, SavedResult]] = []
+    files: list[Path] = []
+    indexes: dict[Path, ResultIndex] = {}
+    index_of: dict[Path, ResultIndex] = {}
+    loaded_files: dict[Path, SavedResult | str] = {}
     for path in paths:
+        index: ResultIndex | None = None
+        if not bitmasks and path.expanduser().is_dir():
+            index = indexes.setdefault(path, ResultIndex(path))
         for file in discover_result_files(path):
-            try:
-                loaded.append((file, SavedResult.load(file)))
-            except Exception as error:
-                logger.warning(
-                    f"Failed to load a result from {file} - skipping\n-> {error}"
-                )
+            files.append(file)
+            if index is None:
+                continue
+            index_of[file] = index
+            if (cached := index.get(file)) is not None:
+                loaded_files[file] = cached
+
+    to_read = [file for file in dict.fromkeys(files) if file not in loaded_files]
+    for file, result in zip(
+        to_read, _load_many(to_read, bitmasks=bitmasks, workers=workers), strict=True
+    ):
+        loaded_files[file] = result
+        if file in index_of:
+            index_of[file].put(file, result)
+    for index in indexes.values():
+        index.save()
+
+    loaded: list[tuple[Path, SavedResult]] = []
+    for file in files:
+        result = loaded_files[file]
+        if isinstance(result, str):
+            logger.warning(
+                f"Failed to load a result from {file} - skipping\n-> {result}"
+            )
+        else:
+            loaded.append((file, result))
     return loaded
 
 
@@ -109,18 +267,15 @@ def _cluster_by_fingerprint(
     """Group entries whose fingerprints agree on everything except `faults`.
 
     Driven entirely by `Fingerprint` structural equality (via
-    `Fingerprint.diff`), not by how the caller organized files on disk.
+    `Fingerprint.canonical_key`, which agrees with `Fingerprint.diff`), not by
+    how the caller organized files on disk. Clusters keep the order of their
+    first entries.
     """
-    clusters: list[tuple[Fingerprint, list[tuple[Path, SavedResult]]]] = []
+    clusters: dict[Hashable, list[tuple[Path, SavedResult]]] = {}
     for path, result in loaded:
-        key = _fingerprint_without_faults(result.fingerprint)
-        for representative, entries in clusters:
-            if not representative.diff(key):
-                entries.append((path, result))
-                break
-        else:
-            clusters.append((key, [(path, result)]))
-    return [entries for _, entries in clusters]
+        key = _fingerprint_without_faults(result.fingerprint).canonical_key()
+        clusters.setdefault(key, []).append((path, result))
+    return list(clusters.values())
 
 
 def build_configurations(
@@ -191,22 +346,11 @@ def bit_position_histogram(
     """Count how many `bitmask` elements had each bit position flipped.
 
     Maps bit position (0-indexed from the LSB) to how many elements had that
-    position differ from the golden value, by decomposing each stored xor value
-    bit-by-bit. This is the "which bit index gets hit" view the `heatmap`
-    command's bottom panel is built from.
+    position differ from the golden value. This is the "which bit index gets
+    hit" view the `heatmap` command's bottom panel is built from, computed by
+    `faultforge.bits.bit_position_histogram` on the bitmask as an array.
 
     Pass `skip_multi_bit=True` to exclude elements with more than one faulty
     bit, isolating cases where a single bit flip's position is unambiguous.
     """
-    histogram: dict[int, int] = {}
-    for value in bitmask:
-        if skip_multi_bit and value.bit_count() > 1:
-            continue
-        position = 0
-        remaining = value
-        while remaining:
-            if remaining & 1:
-                histogram[position] = histogram.get(position, 0) + 1
-            remaining >>= 1
-            position += 1
-    return histogram
+    return bits.bit_position_histogram(bitmask, skip_multi_bit=skip_multi_bit)
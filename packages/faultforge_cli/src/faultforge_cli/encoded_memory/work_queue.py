@@ -0,0 +1,135 @@
+"""A work queue shared through a directory, for `campaign --queue`.
+
+Several processes, on one machine or on several sharing a network filesystem,
+record a campaign together by claiming its tasks from the same directory:
+
+```text
+<root>/pending/<task>            waiting to be claimed
+<root>/claimed/<worker>/<task>   being worked on by `worker`
+<root>/done/<task>               finished
+```
+
+Every state change is a `rename`, which is atomic within a filesystem (NFS
+included): when several workers try to claim the same task, exactly one
+rename succeeds and the others move on to the next task. A task's file holds
+its JSON description, which its worker may update while it holds the claim.
+Nothing depends on the workers' clocks or on locks being released, so several
+local processes behave exactly like as many machines.
+"""
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MARKER = ".queue"
+
+
+class WorkQueue:
+    """One worker's view of a queue directory, see the module docstring."""
+
+    _root: Path
+    _worker: str
+
+    def __init__(self, root: Path, worker: str) -> None:
+        if not worker or "/" in worker or worker.startswith("."):
+            raise ValueError(f"Invalid worker name {worker!r}")
+        self._root = root
+        self._worker = worker
+
+    @staticmethod
+    def create(root: Path, tasks: Mapping[str, Any]) -> bool:
+        """Fill the queue at `root` with `tasks`, unless it already exists.
+
+        Tasks are claimed in the order of their names. Returns whether this
+        call created the queue; if several workers race to create it, the
+        tasks of exactly one of them are used.
+        """
+        (root / "done").mkdir(parents=True, exist_ok=True)
+        staging = root / f".pending-{uuid.uuid4().hex}"
+        staging.mkdir()
+        # Renaming a directory replaces an empty one, so `pending` never is.
+        (staging / _MARKER).touch()
+        for name, task in tasks.items():
+            (staging / name).write_text(json.dumps(task))
+        try:
+            staging.rename(root / "pending")
+        except OSError:
+            # Another worker created it first.
+            shutil.rmtree(staging)
+            return False
+        return True
+
+    def read(self, name: str) -> Any:
+        """The description of a task this worker has claimed."""
+        return json.loads(self._claimed_dir().joinpath(name).read_text())
+
+    def update(self, name: str, task: Any) -> None:
+        """Replace the description of a task this worker has claimed."""
+        path = self._claimed_dir() / name
+        staging = path.with_name(f".{name}.tmp")
+        staging.write_text(json.dumps(task))
+        os.replace(staging, path)
+
+    def claimed(self) -> list[str]:
+        """Tasks this worker claimed but didn't finish, e.g. before a crash."""
+        directory = self._claimed_dir()
+        if not directory.is_dir():
+            return []
+        return sorted(
+            path.name for path in directory.iterdir() if not path.name.startswith(".")
+        )
+
+    def claim(self, prefer: Callable[[str], bool] | None = None) -> str | None:
+        """Claim the first pending task, or `None` if there are none left.
+
+        Tasks for which `prefer` returns `True` are claimed before any others,
+        e.g. the ones sharing state this worker has already loaded.
+        """
+        pending = sorted(
+            path.name
+            for path in (self._root / "pending").iterdir()
+            if not path.name.startswith(".")
+        )
+        if prefer is not None:
+            pending.sort(key=lambda name: not prefer(name))
+        self._claimed_dir().mkdir(parents=True, exist_ok=True)
+        for name in pending:
+            try:
+                (self._root / "pending" / name).rename(self._claimed_dir() / name)
+            except FileNotFoundError:
+                # Claimed by another worker in the meantime.
+                continue
+            logger.debug(f"{self._worker} claimed {name}")
+            return name
+        return None
+
+    def finish(self, name: str) -> None:
+        """Mark a task this worker has claimed as done."""
+        (self._claimed_dir() / name).rename(self._root / "done" / name)
+
+    def release(self, name: str) -> None:
+        """Give a claimed task back, for any worker to claim again."""
+        (self._claimed_dir() / name).rename(self._root / "pending" / name)
+
+    def is_finished(self) -> bool:
+        """Whether every task is done, by any worker."""
+        if any(
+            not path.name.startswith(".") for path in (self._root / "pending").iterdir()
+        ):
+            return False
+        claimed = self._root / "claimed"
+        return not claimed.is_dir() or not any(
+            not path.name.startswith(".")
+            for directory in claimed.iterdir()
+            for path in directory.iterdir()
+        )
+
+    def _claimed_dir(self) -> Path:
+        return self._root / "claimed" / self._worker
@@ -0,0 +1,102 @@
+"""Tests for `faultforge_cli.encoded_memory.campaign`."""
+
+from pathlib import Path
+
+import pytest
+from faultforge.dtype import EncodingDtype
+from faultforge.experiment import MaxRuns, Stability
+from faultforge_cli.encoded_memory.campaign import CampaignPlan, is_done
+from pydantic import ValidationError
+
+_PLAN = """
+output = "results"
+dataset = "cifar10"
+models = ["resnet20", "vgg11_bn"]
+dtypes = ["f32", "f16"]
+bit_error_rates = [1e-5, 1e-7]
+max_runs = 10
+
+[encoders.unprotected]
+
+[encoders.secded64]
+secded = 64
+"""
+
+
+def _plan(tmp_path: Path, content: str = _PLAN) -> CampaignPlan:
+    path = tmp_path / "plan.toml"
+    path.write_text(content)
+    return CampaignPlan.load(path)
+
+
+def test_output_is_relative_to_the_plan(tmp_path):
+    assert _plan(tmp_path).output == tmp_path / "results"
+
+
+def test_screening_cache_is_relative_to_the_plan(tmp_path):
+    plan = _plan(
+        tmp_path, 'screening_tolerance = 0.1\nscreening_cache = "cache"\n' + _PLAN
+    )
+    assert plan.screening_cache == tmp_path / "cache"
+
+
+def test_groups_jobs_by_model_to_share_the_setup(tmp_path):
+    groups = _plan(tmp_path).groups()
+
+    assert [{job.model for job in group} for group in groups] == [
+        {"resnet20"},
+        {"vgg11_bn"},
+    ]
+    jobs = [(job.dtype, job.encoder, job.point) for job in groups[0]]
+    assert jobs == [
+        (EncodingDtype.F32, "unprotected", 1e-7),
+        (EncodingDtype.F32, "unprotected", 1e-5),
+        (EncodingDtype.F32, "secded64", 1e-7),
+        (EncodingDtype.F32, "secded64", 1e-5),
+        (EncodingDtype.F16, "unprotected", 1e-7),
+        (EncodingDtype.F16, "unprotected", 1e-5),
+        (EncodingDtype.F16, "secded64", 1e-7),
+        (EncodingDtype.F16, "secded64", 1e-5),
+    ]
+    assert groups[0][2].directory == tmp_path / "results" / "resnet20-f32-secded64"
+
+
+def test_rejects_incomplete_plans(tmp_path):
+    with pytest.raises(ValidationError, match="`bit_error_rates` or `faults`"):
+        _plan(tmp_path, "faults = [1]\n" + _PLAN)
+    with pytest.raises(ValidationError, match="max_runs"):
+        _plan(tmp_path, _PLAN.replace("max_runs = 10", ""))
+    with pytest.raises(ValidationError, match="MSET and CEP"):
+        _plan(tmp_path, _PLAN + "\n[encoders.both]\nmset = true\ncep = true\n")
+    with pytest.raises(ValidationError, match="Extra inputs"):
+        _plan(tmp_path, "runs = 5\n" + _PLAN)
+    with pytest.raises(ValidationError, match="seed"):
+        _plan(tmp_path, "seed = -1\n" + _PLAN)
+    with pytest.raises(ValidationError, match="SECDED"):
+        _plan(tmp_path, 'sampling = "stratified"\n' + _PLAN)
+    with pytest.raises(ValidationError, match="less than 1"):
+        _plan(tmp_path, "screening_tolerance = 1.0\n" + _PLAN)
+    with pytest.raises(ValidationError, match="sdc metric"):
+        _plan(
+            tmp_path,
+            'screening_tolerance = 0.1\nreliability_metric = "sdc"\n' + _PLAN,
+        )
+
+
+def test_stop_conditions_follow_the_plan(tmp_path):
+    plan = _plan(tmp_path, "stability_threshold = 1.0\nmin_runs = 3\n" + _PLAN)
+
+    assert plan.stop_conditions() == [
+        Stability(min_samples=3, threshold=1.0),
+        MaxRuns(10),
+    ]
+
+
+def test_is_done_reads_the_result_file(tmp_path, save_result):
+    path = save_result(tmp_path / "ber_0.05.json", runs=3)
+
+    assert is_done(path, [MaxRuns(3)])
+    assert not is_done(path, [MaxRuns(4)])
+    assert not is_done(tmp_path / "missing.json", [MaxRuns(1)])
+    (tmp_path / "broken.json").write_text("not a result")
+    assert not is_done(tmp_path / "broken.json", [MaxRuns(1)])
@@ -0,0 +1,59 @@
+"""Tests for `campaign --queue`, recording a plan through a work queue."""
+
+from pathlib import Path
+
+from faultforge.experiments.encoded_memory import ResultReader
+from faultforge_cli.encoded_memory.commands import app
+from typer.testing import CliRunner
+
+_PLAN = """
+output = "results"
+dataset = "cifar10"
+models = ["toynet"]
+bit_error_rates = [0.05]
+max_runs = {max_runs}
+
+[encoders.unprotected]
+"""
+
+_OUTPUT = "results/toynet-f32-unprotected/ber_0.05.json"
+
+
+def _campaign(tmp_path: Path, queue: str, max_runs: int, *options: str) -> None:
+    plan = tmp_path / "plan.toml"
+    plan.write_text(_PLAN.format(max_runs=max_runs))
+    result = CliRunner().invoke(
+        app,
+        [
+            "campaign",
+            str(plan),
+            "--queue",
+            str(tmp_path / queue),
+            "--node",
+            "a",
+            "--batch-runs",
+            "2",
+            *options,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+
+def test_records_several_tasks_per_job_into_one_shard(tmp_path, fake_models):
+    _campaign(tmp_path, "queue", 5)
+
+    shard = tmp_path / "queue/shards/toynet-f32-unprotected/ber_0.05.json/a.json"
+    assert ResultReader(shard).run_count() == 5
+    assert not (tmp_path / _OUTPUT).exists()
+
+    # Resuming the finished queue records nothing more, and merges the shard.
+    _campaign(tmp_path, "queue", 5, "--merge")
+    assert ResultReader(shard).run_count() == 5
+    assert ResultReader(tmp_path / _OUTPUT).run_count() == 5
+
+
+def test_resumes_existing_outputs(tmp_path, fake_models):
+    _campaign(tmp_path, "first", 3, "--merge")
+    _campaign(tmp_path, "second", 6, "--merge")
+
+    assert ResultReader(tmp_path / _OUTPUT).run_count() == 6
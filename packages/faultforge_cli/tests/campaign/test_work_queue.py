@@ -0,0 +1,84 @@
+"""Tests for `faultforge_cli.encoded_memory.work_queue.WorkQueue`."""
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+from faultforge_cli.encoded_memory.work_queue import WorkQueue
+
+
+def _tasks(count: int) -> dict[str, dict[str, int]]:
+    return {f"{index:03d}": {"index": index} for index in range(count)}
+
+
+def _drain(root: Path, worker: str) -> list[str]:
+    """Claim and finish tasks until none are left. Runs in other processes."""
+    queue = WorkQueue(root, worker)
+    finished: list[str] = []
+    while (name := queue.claim()) is not None:
+        queue.finish(name)
+        finished.append(name)
+    return finished
+
+
+def test_claims_tasks_in_order(tmp_path: Path):
+    assert WorkQueue.create(tmp_path, _tasks(3))
+    queue = WorkQueue(tmp_path, "a")
+
+    assert queue.claim() == "000"
+    assert queue.read("000") == {"index": 0}
+    assert queue.claim(prefer=lambda name: name == "002") == "002"
+    assert queue.claimed() == ["000", "002"]
+    assert not queue.is_finished()
+
+    queue.finish("000")
+    queue.finish("002")
+    assert _drain(tmp_path, "b") == ["001"]
+    assert queue.claim() is None
+    assert queue.is_finished()
+
+
+def test_is_only_created_once(tmp_path: Path):
+    assert WorkQueue.create(tmp_path, _tasks(1))
+    # Even once every task has been claimed.
+    assert WorkQueue(tmp_path, "a").claim() == "000"
+    assert not WorkQueue.create(tmp_path, _tasks(5))
+
+    assert WorkQueue(tmp_path, "a").claim() is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "claimed",
+        "done",
+        "pending",
+    ]
+
+
+def test_released_tasks_can_be_claimed_again(tmp_path: Path):
+    WorkQueue.create(tmp_path, _tasks(1))
+    first = WorkQueue(tmp_path, "a")
+    name = first.claim()
+    assert name is not None
+    first.update(name, {"index": 0, "left": 3})
+    first.release(name)
+
+    second = WorkQueue(tmp_path, "b")
+    assert second.claim() == name
+    assert second.read(name) == {"index": 0, "left": 3}
+    assert first.claimed() == []
+
+
+def test_processes_claim_every_task_exactly_once(tmp_path: Path):
+    WorkQueue.create(tmp_path, _tasks(200))
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(4) as pool:
+        finished = pool.starmap(
+            _drain, [(tmp_path, f"worker-{index}") for index in range(4)]
+        )
+
+    claimed = [name for names in finished for name in names]
+    assert sorted(claimed) == sorted(_tasks(200))
+    assert WorkQueue(tmp_path, "worker-0").is_finished()
+
+
+def test_rejects_invalid_worker_names(tmp_path: Path):
+    with pytest.raises(ValueError, match="Invalid worker name"):
+        WorkQueue(tmp_path, "a/b")
@@ -3,7 +3,8 @@
 `_FakeBundle` is a tiny in-memory model/dataset bundle, just enough to drive a
 real `EncodedFaultInjection` so tests exercise the genuine save/load path rather
 than hand-crafted fingerprints. The `save_result`/`make_configuration` factory
-fixtures wrap it so tests can lay out real result files on disk cheaply.
+fixtures wrap it so tests can lay out real result files on disk cheaply, and
+`fake_models` makes the CLI commands load it in place of any model.
 """
 
 from pathlib import Path
@@ -20,6 +21,7 @@ from faultforge.experiments.encoded_memory import (
     EncodedFaultInjection,
     ReliabilityMetric,
 )
+from faultforge_cli.encoded_memory import commands
 from faultforge_cli.encoded_memory.results import (
     Configuration,
     build_configurations,
@@ -93,6 +95,7 @@ def save_result():
         dtype: torch.dtype = torch.float32,
         metric: ReliabilityMetric = ReliabilityMetric.Accuracy,
         compare_bitwise: bool = True,
+        bit_statistics: bool = False,
     ) -> Path:
         bundle = _FakeBundle(8, 4, 4, 4, model=model, dataset=dataset)
         experiment = EncodedFaultInjection(
@@ -101,6 +104,7 @@ def save_result():
             metric,
             faults=faults,
             compare_bitwise=compare_bitwise,
+            bit_statistics=bit_statistics,
             batch_size=4,
             dtype=dtype,
         )
@@ -113,6 +117,16 @@ def save_result():
     return _save
 
 
+@pytest.fixture
+def fake_models(monkeypatch):
+    """Make the CLI commands load a `_FakeBundle` for whichever model they're given."""
+
+    def _init_model_bundle(dataset, model, *args) -> ModelBundle:
+        return _FakeBundle(8, 4, 4, 2, model=model, dataset=dataset.value)
+
+    monkeypatch.setattr(commands, "_init_model_bundle", _init_model_bundle)
+
+
 @pytest.fixture
 def make_configuration(save_result):
     """Factory: save several bit error rates under `directory` and return the
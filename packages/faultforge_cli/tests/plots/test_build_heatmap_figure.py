@@ -1,6 +1,7 @@
 """Tests for `faultforge_cli.encoded_memory.plots.build_heatmap_figure`."""
 
 import pytest
+from faultforge.experiments.encoded_memory import SimpleResult
 from faultforge_cli.encoded_memory.plots import build_heatmap_figure
 from faultforge_cli.encoded_memory.results import load_results
 from matplotlib.figure import Figure
@@ -25,3 +26,35 @@ def test_build_heatmap_figure_raises_without_compare_bitwise(tmp_path, save_resu
 
     with pytest.raises(ValueError, match="compare-bitwise"):
         build_heatmap_figure(results)
+
+
+def _heatmap_counts(fig: Figure):
+    return fig.axes[0].collections[0].get_array()
+
+
+def test_build_heatmap_figure_from_bit_statistics(tmp_path, save_result):
+    save_result(tmp_path / "both.json", faults=0.05, runs=3, bit_statistics=True)
+    (result,) = [result for _, result in load_results([tmp_path])]
+    bitmasks_only = result.model_copy(update={"bit_statistics": None})
+    statistics_only = result.model_copy(
+        update={"result": SimpleResult(results=result.result.correct_counts())}
+    )
+
+    assert (
+        _heatmap_counts(build_heatmap_figure([statistics_only]))
+        == _heatmap_counts(build_heatmap_figure([bitmasks_only]))
+    ).all()
+
+
+def test_build_heatmap_figure_skip_multi_bit_requires_bitmasks(tmp_path, save_result):
+    save_result(
+        tmp_path / "stats.json",
+        faults=0.05,
+        compare_bitwise=False,
+        bit_statistics=True,
+    )
+    results = [result for _, result in load_results([tmp_path])]
+
+    build_heatmap_figure(results)
+    with pytest.raises(ValueError, match="compare-bitwise"):
+        build_heatmap_figure(results, skip_multi_bit_faults=True)
@@ -1,6 +1,9 @@
 """Tests for `faultforge_cli.encoded_memory.results.discover_result_files`."""
 
-from faultforge_cli.encoded_memory.results import discover_result_files
+from faultforge_cli.encoded_memory.results import (
+    INDEX_FILE_NAME,
+    discover_result_files,
+)
 
 
 def test_discover_result_files_single_file(tmp_path):
@@ -18,3 +21,10 @@ def test_discover_result_files_recurses_directories(tmp_path):
     found = discover_result_files(tmp_path)
     assert found == sorted(found)
     assert {p.name for p in found} == {"one.json", "two.json"}
+
+
+def test_discover_result_files_skips_the_index(tmp_path):
+    (tmp_path / "one.json").write_text("{}")
+    (tmp_path / INDEX_FILE_NAME).write_text("{}")
+
+    assert discover_result_files(tmp_path) == [tmp_path / "one.json"]
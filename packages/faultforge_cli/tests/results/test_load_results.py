@@ -1,5 +1,6 @@
 """Tests for `faultforge_cli.encoded_memory.results.load_results`."""
 
+from faultforge_cli.encoded_memory import results
 from faultforge_cli.encoded_memory.results import load_results
 
 
@@ -25,3 +26,50 @@ def test_load_results_skips_invalid_files_with_a_warning(tmp_path, save_result,
     assert len(loaded) == 1
     assert loaded[0][0].name == "good.json"
     assert any("skipping" in message for message in caplog.messages)
+
+
+def test_load_results_without_bitmasks_loads_summaries(tmp_path, save_result):
+    save_result(tmp_path / "result.json", faults=1)
+
+    [(_, full)] = load_results([tmp_path])
+    [(_, summary)] = load_results([tmp_path], bitmasks=False)
+
+    assert summary.fingerprint == full.fingerprint
+    assert summary.scores() == full.scores()
+    assert summary.bit_error_rate() == full.bit_error_rate()
+
+
+def test_load_results_indexes_summaries(tmp_path, save_result, monkeypatch):
+    save_result(tmp_path / "a.json", faults=1)
+    path = save_result(tmp_path / "b.json", faults=2)
+    (tmp_path / "not_a_result.json").write_text("this is not a result file")
+
+    first = load_results([tmp_path], bitmasks=False)
+    assert (tmp_path / results.INDEX_FILE_NAME).is_file()
+
+    # Nothing changed, so nothing is read again.
+    def fail(*args, **kwargs):
+        raise AssertionError("a file was read despite the index")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(results, "_load_one", fail)
+        cached = load_results([tmp_path], bitmasks=False)
+    assert [(p, r.scores()) for p, r in cached] == [(p, r.scores()) for p, r in first]
+
+    # A modified file is read again.
+    save_result(path, faults=3, runs=2)
+    [_, (_, reloaded)] = load_results([tmp_path], bitmasks=False)
+    assert len(reloaded.scores()) == 2
+
+
+def test_load_results_in_worker_processes(tmp_path, save_result, monkeypatch):
+    for faults in range(1, 4):
+        save_result(tmp_path / f"{faults}.json", faults=faults)
+    monkeypatch.setattr(results, "_MIN_PARALLEL_FILES", 1)
+
+    parallel = load_results([tmp_path], workers=2)
+    serial = load_results([tmp_path], workers=1)
+
+    assert [(p, r.scores()) for p, r in parallel] == [
+        (p, r.scores()) for p, r in serial
+    ]